@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Nivel de Detalle de la IA
+======================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Mide el coste por tick de EnemyManager.update con hordas
+repartidas por el mundo de 5000x5000, con los niveles de detalle configurados
+y con un único nivel de IA completa (comportamiento anterior).
+
+Uso:
+    python dev-tools/benchmarks/bench_enemy_lod.py [--counts 8 80 200] [--ticks N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from entities.enemy_lod import EnemyLODScheduler, LODTier
+from entities.enemy_manager import EnemyManager
+from utils.animation_manager import IntelligentAnimationManager
+
+WORLD_SIZE = 5000
+PLAYER_POS = (WORLD_SIZE / 2, WORLD_SIZE / 2)
+VIEW_RECT = pygame.Rect(PLAYER_POS[0] - 640, PLAYER_POS[1] - 360, 1280, 720)
+
+
+def _horde(animation_manager, count: int, full_ai: bool) -> EnemyManager:
+    """Gestor con ``count`` enemigos en posiciones fijas y sin nuevos spawns."""
+    manager = EnemyManager(animation_manager)
+    manager.max_enemies = count
+    manager.spawn_delay = float("inf")
+    if full_ai:
+        manager.lod = EnemyLODScheduler((LODTier("completo"),))
+    rng = random.Random(7)
+    for index in range(count):
+        manager.spawn_enemy(
+            ("zombiemale", "zombieguirl")[index % 2],
+            rng.uniform(0, WORLD_SIZE),
+            rng.uniform(0, WORLD_SIZE),
+        )
+    return manager
+
+
+def _tick_cost(manager: EnemyManager, ticks: int) -> float:
+    """Milisegundos medios por tick."""
+    started = time.perf_counter()
+    for _ in range(ticks):
+        manager.update(1 / 60, PLAYER_POS, VIEW_RECT)
+    return (time.perf_counter() - started) * 1000 / ticks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=[8, 80, 200])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.init()
+    animation_manager = IntelligentAnimationManager()
+
+    print(f"{'enemigos':>8} {'IA completa ms':>15} {'LOD ms':>8}  niveles")
+    for count in args.counts:
+        full = _tick_cost(_horde(animation_manager, count, True), args.ticks)
+        manager = _horde(animation_manager, count, False)
+        lod = _tick_cost(manager, args.ticks)
+        print(f"{count:>8} {full:>15.3f} {lod:>8.3f}  {manager.get_lod_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Huella de Entidades
+================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Mide con tracemalloc la memoria retenida por entidad y el ritmo de
+creación (spawns por segundo) de proyectiles, powerups y una entidad mínima.
+Las superficies de pygame se reservan fuera del intérprete y no cuentan en la
+huella; sí cuenta todo el estado Python de la entidad y sus componentes.
+
+Uso:
+    python dev-tools/benchmarks/bench_entity_footprint.py [--count N] [--runs N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from entities.entity import Entity, EntityType
+from entities.powerup import Powerup
+from entities.powerup_types import PowerupType
+from entities.projectile import Projectile
+
+
+class _Config:
+    """Configuración mínima para los proyectiles."""
+
+    def get(self, section, key, default=None):
+        return default
+
+
+class _Marker(Entity):
+    """Entidad mínima sin estado propio."""
+
+    def _update_logic(self, delta_time: float):
+        pass
+
+
+FACTORIES = {
+    "Entity": lambda i: _Marker(EntityType.TILE, i, i, 10, 10),
+    "Projectile": lambda i: Projectile(i, i, i + 100, i, 10, 8, _Config()),
+    "Powerup": lambda i: Powerup(i, i, PowerupType.SPEED),
+}
+
+
+def _footprint(factory, count: int) -> float:
+    """Bytes retenidos por entidad con ``count`` entidades vivas."""
+    factory(0)  # Calentar cachés compartidas (sprites, loggers)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    entities = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+
+def _spawn_rate(factory, count: int, runs: int) -> float:
+    """Mejor ritmo de creación (entidades por segundo) en ``runs`` intentos."""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        entities = [factory(i) for i in range(count)]
+        best = min(best, time.perf_counter() - started)
+        del entities
+    return count / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'Entidad':<12} {'bytes/entidad':>14} {'spawns/s':>12}")
+    for name, factory in FACTORIES.items():
+        footprint = _footprint(factory, args.count)
+        rate = _spawn_rate(factory, args.count, args.runs)
+        print(f"{name:<12} {footprint:>14.0f} {rate:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Campo de Flujo
+============================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Mide, para varios tamaños de celda, el tiempo de recalcular el
+campo de flujo sobre el mundo por defecto (1280x720 x4) con obstáculos
+repartidos como los de WorldGenerator, y el coste de consultar la dirección
+de un enemigo.
+
+Uso:
+    python dev-tools/benchmarks/bench_flow_field.py [--cells 128 64 32 16] [--runs N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.flow_field import FlowField
+
+WORLD_SIZE = (1280 * 4, 720 * 4)
+# Tamaños de los tiles con colisión (árbol, roca, altar)
+OBSTACLE_SIZES = ((80, 120), (60, 40), (100, 80))
+
+
+def _obstacles(count: int, seed: int = 7) -> np.ndarray:
+    """Obstáculos aleatorios con las medidas de los tiles con colisión."""
+    rng = random.Random(seed)
+    bounds = []
+    for _ in range(count):
+        width, height = rng.choice(OBSTACLE_SIZES)
+        bounds.append(
+            (
+                rng.uniform(0, WORLD_SIZE[0] - width),
+                rng.uniform(0, WORLD_SIZE[1] - height),
+                width,
+                height,
+            )
+        )
+    return np.array(bounds, dtype=np.float64)
+
+
+def _recompute_ms(field: FlowField, runs: int) -> float:
+    """Mejor tiempo de recálculo moviendo el objetivo de celda en cada intento."""
+    rng = random.Random(3)
+    best = float("inf")
+    for _ in range(runs):
+        field.target_cell = None
+        target = (rng.uniform(0, WORLD_SIZE[0]), rng.uniform(0, WORLD_SIZE[1]))
+        started = time.perf_counter()
+        field.update(*target)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _sample_ns(field: FlowField, samples: int = 100_000) -> float:
+    """Nanosegundos por consulta de dirección."""
+    rng = random.Random(5)
+    points = [
+        (rng.uniform(0, WORLD_SIZE[0]), rng.uniform(0, WORLD_SIZE[1]))
+        for _ in range(samples)
+    ]
+    sample = field.sample
+    started = time.perf_counter()
+    for x, y in points:
+        sample(x, y)
+    return (time.perf_counter() - started) * 1e9 / samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--cells", type=int, nargs="+", default=[128, 64, 32, 16])
+    parser.add_argument("--obstacles", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    bounds = _obstacles(args.obstacles)
+    print(f"{'celda':>6} {'rejilla':>10} {'recálculo ms':>13} {'consulta ns':>12}")
+    for cell_size in args.cells:
+        field = FlowField(*WORLD_SIZE, cell_size=cell_size)
+        field.set_obstacles(bounds)
+        recompute = _recompute_ms(field, args.runs)
+        grid = f"{field.cols}x{field.rows}"
+        print(
+            f"{cell_size:>6} {grid:>10} {recompute:>13.2f} {_sample_ns(field):>12.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
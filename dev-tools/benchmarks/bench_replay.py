@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Repeticiones Deterministas
+=======================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Reproduce una partida grabada (``game.grabar_repeticion``) sin
+ventana y a máxima velocidad a través de GameScene.update y el renderizado.
+Informa del coste por tick (media, p95, máximo y los ticks más lentos) y del
+primer tick cuyo hash de estado no coincide con el grabado. Sin archivo,
+genera una partida sintética, la graba y la reproduce para comprobar que la
+simulación es determinista.
+
+Uso:
+    python dev-tools/benchmarks/bench_replay.py [partida.sikr] [--no-render]
+    python dev-tools/benchmarks/bench_replay.py --synthetic 1800 [--seed 7]
+"""
+
+import argparse
+import math
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.game_state import GameState
+from scenes.game_scene_core import GameScene
+from utils.config_manager import ConfigManager
+from utils.input_manager import ACTION_BITS, InputAction
+from utils.replay import Replay, play_replay
+from utils.seed_set import SeedSet
+
+MOVE_BITS = (
+    (InputAction.MOVE_RIGHT, 1, 0),
+    (InputAction.MOVE_DOWN, 0, 1),
+    (InputAction.MOVE_LEFT, -1, 0),
+    (InputAction.MOVE_UP, 0, -1),
+)
+
+
+def _build_scene(replay: Replay, config: ConfigManager) -> GameScene:
+    """GameScene nueva con las semillas y el personaje de la grabación."""
+    width, height = replay.meta.get("screen", (1280, 720))
+    screen = pygame.display.set_mode((width, height))
+    game_state = GameState()
+    # Flujos sin consumir: cada pasada empieza desde la semilla maestra
+    game_state.seeds = SeedSet(replay.seeds.master)
+    game_state.selected_character = replay.meta.get("character")
+    return GameScene(screen, config, game_state, save_manager=None)
+
+
+def _synthetic(ticks: int, seed: int) -> Replay:
+    """Partida guionizada: recorre el mundo en cuadrado y ataca a intervalos."""
+    replay = Replay(SeedSet(seed), {"character": "guerrero", "screen": [1280, 720]})
+    for tick in range(ticks):
+        action, move_x, move_y = MOVE_BITS[(tick // 120) % len(MOVE_BITS)]
+        actions = ACTION_BITS[action]
+        if tick % 45 < 5:
+            actions |= ACTION_BITS[InputAction.ATTACK]
+        aim_x = 300 * math.cos(tick / 40)
+        mouse = (int(640 + aim_x), 360)
+        replay.ticks.append((actions, move_x, move_y, aim_x, 0.0, *mouse, 0))
+    return replay
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _report(label: str, timings: list[float]):
+    print(
+        f"{label:>8}: media {sum(timings) / len(timings):7.3f} ms  "
+        f"p95 {_percentile(timings, 0.95):7.3f} ms  máx {max(timings):7.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("replay", nargs="?", help="Archivo .sikr grabado")
+    parser.add_argument("--synthetic", type=int, default=1800, metavar="TICKS")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-render", action="store_true")
+    parser.add_argument("--worst", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    config = ConfigManager()
+    render = not args.no_render
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+    else:
+        # Grabar los hashes de una primera pasada y reproducir contra ellos
+        replay = _synthetic(args.synthetic, args.seed)
+        first = play_replay(_build_scene(replay, config), replay, render=False)
+        replay.ticks = [
+            (*entry[:-1], state_hash)
+            for entry, state_hash in zip(replay.ticks, first["hashes"], strict=True)
+        ]
+
+    result = play_replay(_build_scene(replay, config), replay, render=render)
+    total = [
+        u + r for u, r in zip(result["update_ms"], result["render_ms"], strict=True)
+    ]
+    print(f"Ticks: {result['ticks']}  semilla maestra: {replay.seeds.master}")
+    _report("update", result["update_ms"])
+    if render:
+        _report("render", result["render_ms"])
+    _report("total", total)
+    worst = sorted(range(len(total)), key=total.__getitem__, reverse=True)
+    print(
+        "Ticks más lentos:",
+        ", ".join(f"{i + 1} ({total[i]:.2f} ms)" for i in worst[: args.worst]),
+    )
+
+    if result["divergence"] is not None:
+        print(f"DIVERGENCIA en el tick {result['divergence']}")
+        return 1
+    print("Hashes de estado idénticos en todos los ticks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
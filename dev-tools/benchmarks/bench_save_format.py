@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Formatos de Guardado
+=================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Compara tamaño y tiempo de carga del formato binario de guardado
+frente a los formatos anteriores (pickle + zlib + XOR en archivo y paquete JSON
+cifrado dentro de JSON en SQLite).
+
+Uso:
+    python dev-tools/benchmarks/bench_save_format.py [--entities N [N ...]] [--runs N]
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import time
+import zlib
+from pathlib import Path
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils import save_format
+from utils.save_encryption import SaveEncryption
+
+
+class _Config:
+    """Configuración mínima para generar la clave de cifrado."""
+
+    def get(self, section, key, default=None):
+        return default
+
+
+class _State:
+    """Estado de juego sintético con N entidades."""
+
+    def __init__(self, entities: int):
+        self.state = {
+            "status": "playing",
+            "score": 123456,
+            "lives": 3,
+            "level": 7,
+            "player_name": "Benchmark",
+            "selected_character": "guerrero",
+            "settings": {"volume": 0.8, "fullscreen": False},
+            "entities": [
+                {"id": i, "tipo": "zombie_male", "x": i * 1.5, "y": i * 0.5, "vida": 50}
+                for i in range(entities)
+            ],
+        }
+
+    def get_state_dict(self):
+        return self.state
+
+
+def _legacy_xor(crypto, data: bytes) -> bytes:
+    """XOR byte a byte, tal como lo hacían los formatos anteriores."""
+    key_bytes = crypto.encryption_key.encode()
+    return bytes(b ^ key_bytes[i % len(key_bytes)] for i, b in enumerate(data))
+
+
+def _legacy_file(state, crypto):
+    data = {"game_state": state.get_state_dict(), "additional_data": {}}
+    blob = _legacy_xor(crypto, zlib.compress(pickle.dumps(data)))
+    return blob, lambda: pickle.loads(zlib.decompress(_legacy_xor(crypto, blob)))
+
+
+def _legacy_sqlite(state, crypto):
+    data = {"game_state": state.get_state_dict(), "additional_data": {}}
+    raw = json.dumps(data).encode()
+    # El paquete original no era serializable; latin-1 es su forma textual más cercana
+    package = {
+        "encrypted_data": _legacy_xor(crypto, raw).decode("latin-1"),
+        "checksum": crypto.generate_data_checksum(raw),
+    }
+    text = json.dumps(package)
+
+    def load():
+        restored = json.loads(text)
+        decrypted = _legacy_xor(crypto, restored["encrypted_data"].encode("latin-1"))
+        assert crypto.verify_data_checksum(decrypted, restored["checksum"])
+        return json.loads(decrypted)
+
+    return text.encode(), load
+
+
+def _binary(state, crypto):
+    blob = save_format.encode_game_save(state, {}, {"slot": 1}, crypto.encrypt_data)
+    return blob, lambda: save_format.decode_game_save(blob, crypto.decrypt_data)
+
+
+def _time_ms(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def run(entities: int, runs: int) -> None:
+    """Ejecuta el benchmark y muestra una tabla de resultados."""
+    crypto = SaveEncryption(_Config())
+    state = _State(entities)
+    print(f"\nEntidades: {entities} - repeticiones: {runs}")
+    print(f"{'formato':<18}{'bytes':>10}{'carga ms':>12}")
+    for name, builder in (
+        ("pickle+zlib+XOR", _legacy_file),
+        ("JSON en SQLite", _legacy_sqlite),
+        ("binario SIKS", _binary),
+    ):
+        blob, load = builder(state, crypto)
+        assert load()["game_state"]["score"] == 123456
+        print(f"{name:<18}{len(blob):>10}{_time_ms(load, runs):>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, nargs="+", default=[0, 2000])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    for count in args.entities:
+        run(count, args.runs)
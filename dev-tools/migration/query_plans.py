@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Diagnóstico de Planes de Consulta - Sistema Mixto
+=================================================
+
+Aplica las migraciones pendientes y muestra el EXPLAIN QUERY PLAN de las
+consultas frecuentes del juego, para comprobar que usan índices en lugar de
+recorrer tablas completas.
+
+Uso:
+    python dev-tools/migration/query_plans.py [ruta_bd] [--output archivo.json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.database_manager import DatabaseManager
+from utils.schema_manager import SchemaManager
+
+
+def show_query_plans(db_path: str, output: str | None = None) -> bool:
+    """Muestra (y opcionalmente guarda) los planes de las consultas frecuentes."""
+    db_manager = DatabaseManager(db_path)
+    try:
+        schema_manager = SchemaManager(db_manager)
+        schema_manager.create_all_tables()
+        print(f"Esquema: {schema_manager.get_current_version()} ({db_path})")
+
+        plans = schema_manager.get_query_plans()
+        full_scans = 0
+        for name, steps in plans.items():
+            print(f"\n{name}:")
+            for step in steps:
+                scan = step.startswith("SCAN") and "INDEX" not in step
+                full_scans += scan
+                print(f"  {'⚠️' if scan else '✓'} {step}")
+
+        if output:
+            Path(output).write_text(
+                json.dumps(plans, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+            print(f"\nPlanes guardados en {output}")
+
+        print(f"\nConsultas: {len(plans)} - recorridos completos: {full_scans}")
+        return full_scans == 0
+    finally:
+        db_manager.close_all_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("db_path", nargs="?", default="data/game.db")
+    parser.add_argument("--output", help="Archivo JSON donde registrar los planes")
+    args = parser.parse_args()
+    sys.exit(0 if show_query_plans(args.db_path, args.output) else 1)
@@ -0,0 +1,76 @@
+"""
+Prueba del pool de conexiones SQLite
+====================================
+
+Verifica el pool compartido por ruta, la separación lectura/escritura y que
+solo se emiten commits cuando la conexión abrió una transacción.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.database_manager import DatabaseManager
+
+
+def test_pool_shared_per_path_and_commit_accounting():
+    """Dos gestores sobre el mismo archivo comparten pool y métricas."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "pool.db")
+        first = DatabaseManager(db_path)
+        second = DatabaseManager(db_path)
+        try:
+            assert first._connection is second._connection
+
+            with first.transaction() as conn:
+                conn.execute("CREATE TABLE datos (id INTEGER PRIMARY KEY, v TEXT)")
+                conn.execute("INSERT INTO datos (v) VALUES ('a')")
+            commits = first.get_pool_stats()["commits"]
+            assert commits == 1
+
+            # Lecturas puras: ningún commit adicional
+            for _ in range(5):
+                assert second.execute_query("SELECT v FROM datos") == [{"v": "a"}]
+            stats = second.get_pool_stats()
+            assert stats["commits"] == commits
+            assert stats["checkouts_read"] >= 5
+            assert stats["active"] == 0
+            assert stats["connections_created"] <= 2
+        finally:
+            first.close_all_connections()
+
+
+def test_read_only_connection_rejects_writes():
+    """Las conexiones de lectura no pueden modificar la base de datos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "ro.db"))
+        try:
+            db_manager.execute_query("CREATE TABLE t (x INTEGER)", fetch_results=False)
+            with pytest.raises(sqlite3.OperationalError):
+                with db_manager.get_connection(read_only=True) as conn:
+                    conn.execute("INSERT INTO t VALUES (1)")
+            assert db_manager.execute_query("SELECT COUNT(*) AS n FROM t") == [{"n": 0}]
+        finally:
+            db_manager.close_all_connections()
+
+
+def test_failed_transaction_rolls_back():
+    """Una excepción dentro de la transacción revierte todos los cambios."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "tx.db"))
+        try:
+            db_manager.execute_query("CREATE TABLE t (x INTEGER)", fetch_results=False)
+            with pytest.raises(ValueError):
+                with db_manager.transaction() as conn:
+                    conn.execute("INSERT INTO t VALUES (1)")
+                    raise ValueError("abortar")
+            assert db_manager.execute_query("SELECT COUNT(*) AS n FROM t") == [{"n": 0}]
+            assert db_manager.get_pool_stats()["rollbacks"] == 1
+        finally:
+            db_manager.close_all_connections()
@@ -0,0 +1,104 @@
+"""
+Prueba de la revisión 2.0.0 del esquema SQLite
+==============================================
+
+Crea una base de datos con el esquema 1.0.0 (stats solo en JSON), comprueba que
+las filas antiguas migran a columnas tipadas y que las consultas frecuentes usan
+índices.
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.config_database import ConfigDatabase
+from utils.database_manager import DatabaseManager
+from utils.schema_manager import SchemaManager
+
+LEGACY_SCHEMA = [
+    """CREATE TABLE schema_metadata (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, version TEXT NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP, description TEXT, checksum TEXT)""",
+    """CREATE TABLE personajes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, nombre TEXT UNIQUE NOT NULL,
+        nombre_mostrar TEXT NOT NULL, tipo TEXT NOT NULL, descripcion TEXT,
+        stats TEXT NOT NULL, ataques TEXT NOT NULL, sprite_config TEXT,
+        activo BOOLEAN DEFAULT 1, creado_en DATETIME DEFAULT CURRENT_TIMESTAMP)""",
+    """CREATE TABLE enemigos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, tipo TEXT UNIQUE NOT NULL,
+        nombre_mostrar TEXT NOT NULL, stats TEXT NOT NULL, comportamiento TEXT NOT NULL,
+        animaciones TEXT NOT NULL, variantes TEXT, activo BOOLEAN DEFAULT 1,
+        creado_en DATETIME DEFAULT CURRENT_TIMESTAMP)""",
+    "INSERT INTO schema_metadata (version, description) VALUES ('1.0.0', 'legacy')",
+]
+
+
+def _create_legacy_database(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+    for statement in LEGACY_SCHEMA:
+        conn.execute(statement)
+    conn.execute(
+        "INSERT INTO personajes (nombre, nombre_mostrar, tipo, stats, ataques) "
+        "VALUES (?, ?, ?, ?, ?)",
+        ("guerrero", "Kava", "Melee", json.dumps({"vida": 200, "daño": 50}), "[]"),
+    )
+    conn.execute(
+        "INSERT INTO enemigos (tipo, nombre_mostrar, stats, comportamiento, animaciones) "
+        "VALUES (?, ?, ?, ?, ?)",
+        ("zombie_male", "Zombie", json.dumps({"vida": 50}), "perseguir", "{}"),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_rows_migrate_forward():
+    """Las filas JSON del esquema 1.0.0 se migran al abrir ConfigDatabase."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "legacy.db"
+        _create_legacy_database(db_path)
+
+        db_manager = DatabaseManager(str(db_path), pool_size=1)
+        try:
+            config_db = ConfigDatabase(db_manager)
+
+            rows = db_manager.execute_query(
+                "SELECT vida, dano FROM personajes WHERE nombre = 'guerrero'"
+            )
+            assert rows == [{"vida": 200, "dano": 50}]
+            assert config_db.get_characters_by_type("Melee")[0]["vida"] == 200
+            assert config_db.get_enemies_by_rarity("normal") == [
+                {"tipo": "zombie_male", "probabilidad_spawn": 1.0}
+            ]
+
+            schema_manager = SchemaManager(db_manager)
+            assert schema_manager.get_current_version() == "2.0.0"
+        finally:
+            db_manager.close_all_connections()
+
+
+def test_hot_queries_use_indexes():
+    """Ninguna consulta frecuente recorre una tabla completa."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "fresh.db"), pool_size=1)
+        try:
+            schema_manager = SchemaManager(db_manager)
+            assert schema_manager.create_all_tables()
+
+            for name, steps in schema_manager.get_query_plans().items():
+                for step in steps:
+                    assert not (step.startswith("SCAN") and "INDEX" not in step), (
+                        f"{name}: {step}"
+                    )
+        finally:
+            db_manager.close_all_connections()
+
+
+if __name__ == "__main__":
+    test_legacy_rows_migrate_forward()
+    test_hot_queries_use_indexes()
+    print("¡Revisión de esquema verificada!")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Build Texture Atlases - Generador offline de atlas de personajes
+================================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Empaqueta los fotogramas de cada personaje y enemigo (PNG sueltos
+según ``sprite_paths`` de config/animations.json, o el zip del personaje con su
+manifest.json) en pocas hojas con un manifiesto de rectángulos. El juego usa el
+atlas si existe y, si no, sigue cargando los PNG uno a uno.
+
+Uso:
+    python dev-tools/scripts/build_texture_atlases.py [--characters N [N ...]]
+        [--output assets/characters/atlas] [--max-size 2048]
+"""
+
+import argparse
+import json
+import sys
+import time
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pygame
+
+# Añadir src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.texture_atlas import MAX_SHEET_SIZE, build_atlas, save_atlas
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def _scaled(image: pygame.Surface, scale: float) -> pygame.Surface:
+    """Aplica la misma escala que CharacterAssetsLoader en tiempo de ejecución."""
+    if scale == 1.0:
+        return image
+    size = (int(image.get_width() * scale), int(image.get_height() * scale))
+    return pygame.transform.scale(image, size)
+
+
+def _frames_from_zip(assets: Path, character: str) -> dict[str, list] | None:
+    """Fotogramas desde ``characters/{players,enemies}/<personaje>.zip``."""
+    for category in ("players", "enemies"):
+        zip_path = assets / "characters" / category / f"{character}.zip"
+        if not zip_path.exists():
+            continue
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
+            return {
+                anim: [
+                    pygame.image.load(BytesIO(zf.read(name)))
+                    for name in sorted(filenames)
+                ]
+                for anim, filenames in manifest["animations"].items()
+            }
+    return None
+
+
+def _frames_from_files(
+    assets: Path, character: str, char_config: dict, sprite_paths: list[str]
+) -> dict[str, list]:
+    """Fotogramas desde PNG sueltos, con las mismas rutas que el juego."""
+    animations = {}
+    for animation in char_config.get("animations", []):
+        frames = []
+        for frame in range(1, char_config.get("total_frames", 10) + 1):
+            paths = [
+                assets
+                / path.format(
+                    character=character,
+                    animation=animation.capitalize(),
+                    frame=frame,
+                )
+                for path in sprite_paths
+            ]
+            found = next((p for p in paths if p.exists()), None)
+            if found is None:
+                break
+            frames.append(pygame.image.load(str(found)))
+        if frames:
+            animations[animation] = frames
+    return animations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--characters", nargs="+", help="Por defecto, todos")
+    parser.add_argument("--assets", type=Path, default=ROOT / "assets")
+    parser.add_argument(
+        "--config", type=Path, default=ROOT / "config" / "animations.json"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--max-size", type=int, default=MAX_SHEET_SIZE)
+    args = parser.parse_args()
+
+    config = json.loads(args.config.read_text(encoding="utf-8"))
+    output = args.output or args.assets / "characters" / "atlas"
+    characters = args.characters or list(config["characters"])
+
+    for character in characters:
+        char_config = config["characters"].get(character, {})
+        scale = char_config.get("escala_sprite", 1.0)
+        started = time.perf_counter()
+
+        animations = _frames_from_zip(args.assets, character)
+        source = "zip"
+        if animations is None:
+            animations = _frames_from_files(
+                args.assets, character, char_config, config.get("sprite_paths", [])
+            )
+            source = "png"
+        animations = {
+            name: [_scaled(frame, scale) for frame in frames]
+            for name, frames in animations.items()
+        }
+        frame_count = sum(len(frames) for frames in animations.values())
+        if not frame_count:
+            print(f"⚠️  {character}: sin fotogramas, se omite")
+            continue
+
+        sheets, manifest = build_atlas(character, animations, scale, args.max_size)
+        manifest_path = save_atlas(output, sheets, manifest)
+        print(
+            f"✅ {character}: {frame_count} fotogramas ({source}) -> "
+            f"{len(sheets)} hojas en {manifest_path} "
+            f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
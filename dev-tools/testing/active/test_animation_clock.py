@@ -0,0 +1,91 @@
+"""
+Prueba del reloj de animaciones
+===============================
+
+Verifica que los frames dependen solo del tiempo de simulación (congelados en
+pausa), que el horario precalculado coincide con la fórmula por división y que
+las fórmulas de FPS son una sola.
+"""
+
+import gc
+import sys
+from pathlib import Path
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.animation_core import AnimationCore
+from utils.animation_player import AnimationClock, AnimationPlayer, frame_schedule
+
+
+def _animations():
+    return {
+        "Idle": {
+            "frames": [f"idle{i}" for i in range(6)],
+            "frame_count": 6,
+            "fps": 12,
+            "frame_duration": 1000 / 12,
+        },
+        "Dead": {
+            "frames": [f"dead{i}" for i in range(4)],
+            "frame_count": 4,
+            "fps": 8,
+            "frame_duration": 125.0,
+        },
+    }
+
+
+def test_clock_drives_frames_and_pause():
+    """El frame avanza con el reloj, se congela sin ticks y coincide con la fórmula."""
+    clock = AnimationClock()
+    player = AnimationPlayer("zombie", _animations(), "Idle", clock)
+    other = AnimationPlayer("zombie", _animations(), "Dead", clock)
+
+    duration = 1000 / 12
+    elapsed = 0.0
+    for _ in range(200):
+        clock.advance(1000 / 60)
+        elapsed += 1000 / 60
+        expected = int((elapsed // duration) % 6)
+        assert player.current_frame_index == expected
+        assert player.get_current_frame() == f"idle{expected}"
+
+    # En pausa no hay ticks: el frame no cambia aunque pase tiempo real
+    frozen = player.current_frame_index
+    clock.advance(0)
+    assert player.current_frame_index == frozen
+
+    # Un solo paso del reloj avanza todos los reproductores
+    other.restart_animation()
+    clock.advance(499)
+    assert other.current_frame_index == 3 and not other.is_animation_completed()
+    clock.advance(1)
+    assert other.is_animation_completed()
+
+    other.set_animation("Idle")
+    assert other.current_frame_index == 0 and not other.is_animation_completed()
+
+    del other
+    gc.collect()
+    assert len(clock.players) == 1
+
+
+def test_schedule_shared_and_single_fps_formula():
+    """Horarios compartidos por (frames, duración) y una única fórmula de FPS."""
+    assert frame_schedule(6, 1000 / 12) is frame_schedule(6, 1000 / 12)
+    assert frame_schedule(4, 125.0)[-1] == 500.0
+
+    core = AnimationCore()
+    for anim in ("Idle", "Run", "Attack", "Dead", "Desconocida"):
+        for frames in (2, 6, 10, 16):
+            fps = core.get_optimal_fps(anim, frames)
+            assert fps == core.calculate_optimal_fps(frames, anim)
+            assert fps == core.get_optimal_fps(anim.lower(), frames)
+    # Las velocidades por tipo se aplican (antes se ignoraban con mayúsculas)
+    assert core.get_optimal_fps("Attack", 10) > core.get_optimal_fps("Idle", 10)
+
+
+if __name__ == "__main__":
+    test_clock_drives_frames_and_pause()
+    test_schedule_shared_and_single_fps_formula()
+    print("✅ Reloj de animaciones OK")
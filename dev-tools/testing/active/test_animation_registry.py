@@ -0,0 +1,123 @@
+"""
+Prueba del registro de reproductores de animación
+=================================================
+
+Verifica que miles de spawns y muertes mantienen acotados los reproductores
+vivos y libres, que se reciclan, y que los fotogramas de personajes no
+precargados se sueltan al liberar su último reproductor.
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.animation_player import AnimationClock
+from utils.animation_registry import AnimationPlayerRegistry
+
+
+class _FakeLoader:
+    """Cargador mínimo con la misma caché que AnimationLoader."""
+
+    def __init__(self):
+        self.animation_cache = {}
+        self.loads = 0
+
+    def load_character_animations(self, character_name):
+        key = f"{character_name}_animations"
+        if key not in self.animation_cache:
+            self.loads += 1
+            self.animation_cache[key] = {
+                name: {
+                    "frames": [pygame.Surface((8, 8)) for _ in range(4)],
+                    "frame_count": 4,
+                    "fps": 8,
+                    "frame_duration": 125.0,
+                }
+                for name in ("Idle", "Dead")
+            }
+        return self.animation_cache[key]
+
+    def evict_character(self, character_name):
+        self.animation_cache.pop(f"{character_name}_animations", None)
+
+
+def test_spawn_death_cycles_stay_flat():
+    """Los reproductores vivos y libres no crecen con spawns y muertes."""
+    loader = _FakeLoader()
+    clock = AnimationClock()
+    registry = AnimationPlayerRegistry(loader, clock, max_pooled=16)
+    registry.pin(["zombiemale"])
+
+    alive = []
+    peak = None
+    for wave in range(200):
+        alive.extend(registry.acquire("zombiemale") for _ in range(10))
+        clock.advance(16)
+        for player in alive[:10]:
+            registry.release(player)
+        del alive[:10]
+        stats = registry.get_stats()
+        if wave == 10:
+            peak = (stats["live_players"], stats["pooled_players"], len(clock.players))
+        if wave > 10:
+            assert peak == (
+                stats["live_players"],
+                stats["pooled_players"],
+                len(clock.players),
+            )
+
+    stats = registry.get_stats()
+    assert stats["created"] <= 20
+    assert stats["recycled"] > 1900
+    assert loader.loads == 1
+    assert stats["cached_frames"] == 8
+
+
+def test_recycled_player_restarts_and_double_release():
+    """Un reproductor reciclado empieza de cero; liberar dos veces no hace nada."""
+    loader = _FakeLoader()
+    registry = AnimationPlayerRegistry(loader, AnimationClock())
+    registry.pin(["zombieguirl"])
+
+    player = registry.acquire("zombieguirl")
+    player.set_animation("Dead")
+    registry.clock.advance(300)
+    registry.release(player)
+    registry.release(player)
+    assert registry.get_stats()["released"] == 1
+
+    again = registry.acquire("zombieguirl", "Idle")
+    assert again is player
+    assert again.current_animation == "Idle" and again.elapsed_ms == 0.0
+    assert again in registry.clock.players
+
+
+def test_unpinned_character_frames_evicted():
+    """Sin referencias, los fotogramas de un personaje no fijado se liberan."""
+    loader = _FakeLoader()
+    registry = AnimationPlayerRegistry(loader, AnimationClock())
+    registry.pin(["guerrero"])
+
+    a = registry.acquire("adventureguirl")
+    b = registry.acquire("adventureguirl")
+    registry.acquire("guerrero")
+    registry.release(a)
+    assert "adventureguirl_animations" in loader.animation_cache
+    registry.release(b)
+
+    stats = registry.get_stats()
+    assert "adventureguirl_animations" not in loader.animation_cache
+    assert "guerrero_animations" in loader.animation_cache
+    assert stats["evicted"] == 1 and stats["pooled_players"] == 0
+    assert stats["frame_bytes"] == 8 * 8 * 8 * 4
+
+
+if __name__ == "__main__":
+    test_spawn_death_cycles_stay_flat()
+    test_recycled_player_restarts_and_double_release()
+    test_unpinned_character_frames_evicted()
+    print("✅ Registro de reproductores de animación OK")
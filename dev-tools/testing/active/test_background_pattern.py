@@ -0,0 +1,67 @@
+"""
+Prueba del patrón de fondo prerenderizado
+=========================================
+
+Verifica que el mosaico no tiene costuras, que el fondo se dibuja anclado al
+mundo (un desplazamiento de un periodo no cambia la imagen) y que el patrón se
+construye una vez por resolución y paleta.
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.background_pattern import (
+    BackgroundPalette,
+    get_background_pattern,
+    pattern_period,
+)
+from utils.simple_desert_background import SimpleDesertBackground
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def test_pattern_is_world_anchored_and_seamless():
+    """Un periodo de cámara da la misma imagen; un píxel la desplaza un píxel."""
+    background = SimpleDesertBackground(320, 200)
+    period_x, period_y = pattern_period(background.palette)
+    assert (period_x, period_y) == (100, 100)
+
+    first = pygame.Surface((320, 200))
+    second = pygame.Surface((320, 200))
+    background.render(first, 37, 1234)
+    background.render(second, 37 + 3 * period_x, 1234 - period_y)
+    assert _pixels(first) == _pixels(second)
+
+    shifted = pygame.Surface((320, 200))
+    background.render(shifted, 38, 1234)
+    for x in range(319):
+        assert first.get_at((x + 1, 57)) == shifted.get_at((x, 57))
+
+
+def test_pattern_cached_per_resolution_and_palette():
+    """Mismo patrón para la misma clave; otro para otra resolución o paleta."""
+    palette = BackgroundPalette(base=(10, 20, 30), grid=(40, 50, 60), cell_size=64)
+    pattern = get_background_pattern((256, 128), palette)
+    assert get_background_pattern((256, 128), palette) is pattern
+    assert get_background_pattern((128, 128), palette) is not pattern
+    other = palette._replace(grid=(0, 0, 0))
+    assert get_background_pattern((256, 128), other) is not pattern
+
+    screen = pygame.Surface((256, 128))
+    pattern.render(screen, 0, 0)
+    assert screen.get_at((0, 5))[:3] == (40, 50, 60)
+    assert screen.get_at((10, 10))[:3] == (10, 20, 30)
+    assert screen.get_at((64, 10))[:3] == (40, 50, 60)
+
+
+if __name__ == "__main__":
+    test_pattern_is_world_anchored_and_seamless()
+    test_pattern_cached_per_resolution_and_palette()
+    print("✅ Patrón de fondo OK")
@@ -0,0 +1,80 @@
+"""
+Prueba de las consultas en lote de la cámara
+============================================
+
+Verifica que el recorte y la transformación en lote coinciden con is_visible y
+world_to_screen objeto a objeto, con y sin índice espacial.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.camera import Camera, pack_bounds
+from utils.spatial_grid import SpatialGrid
+
+
+class _Box:
+    def __init__(self, x, y, width, height):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+
+def _boxes(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        _Box(
+            rng.uniform(-200, 5200),
+            rng.uniform(-200, 3000),
+            rng.randint(10, 300),
+            rng.randint(10, 300),
+        )
+        for _ in range(count)
+    ]
+
+
+def _expected(camera, boxes):
+    return [
+        (i, camera.world_to_screen(b.x, b.y))
+        for i, b in enumerate(boxes)
+        if camera.is_visible(b.x, b.y, b.width, b.height)
+    ]
+
+
+def test_batch_matches_scalar():
+    """Máscara y coordenadas iguales a las consultas por objeto."""
+    camera = Camera(1280, 720, 5120, 2880)
+    boxes = _boxes(2000)
+    bounds = pack_bounds(boxes)
+    grid = SpatialGrid(bounds[:, :2], bounds[:, 2:], cell_size=200)
+
+    for cam_x, cam_y in ((0, 0), (1234.7, 456.3), (3840, 2160), (-0.5, 99.9)):
+        camera.x, camera.y = cam_x, cam_y
+        expected = _expected(camera, boxes)
+        for index in (None, grid):
+            indices, positions = camera.visible(bounds, index)
+            assert indices.tolist() == [i for i, _ in expected]
+            assert np.allclose(positions, [p for _, p in expected])
+
+
+def test_empty_groups():
+    """Grupos vacíos y consultas fuera del mundo devuelven arrays vacíos."""
+    camera = Camera(800, 600, 5120, 2880)
+    indices, positions = camera.visible(pack_bounds([]))
+    assert indices.size == 0 and positions.shape == (0, 2)
+
+    bounds = pack_bounds(_boxes(50))
+    grid = SpatialGrid(bounds[:, :2], bounds[:, 2:])
+    camera.x, camera.y = 100000, 100000
+    indices, _ = camera.visible(bounds, grid)
+    assert indices.size == 0
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_empty_groups()
+    print("✅ Consultas en lote de la cámara OK")
@@ -0,0 +1,106 @@
+"""
+Prueba del pool de conexiones SQLite
+====================================
+
+Verifica que el pool no abre más de ``pool_size`` conexiones activas de cada
+tipo (la siguiente petición espera y esa espera se mide), que liberar una
+conexión despierta a quien espera una de su tipo y que las consultas que
+escriben, aunque empiecen por WITH o PRAGMA, no van a conexiones de solo lectura.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.database_connection import DatabaseConnection, is_read_only_query
+
+
+def test_checkout_waits_when_pool_is_full(tmp_path):
+    """Con el pool lleno se espera a que se devuelva una conexión."""
+    pool = DatabaseConnection(tmp_path / "pool.db", pool_size=1)
+    acquired = threading.Event()
+
+    def hold():
+        with pool.get_connection(read_only=True):
+            acquired.set()
+            time.sleep(0.05)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait(1.0)
+    with pool.get_connection(read_only=True) as conn:
+        conn.execute("SELECT 1")
+    holder.join()
+
+    stats = pool.get_pool_stats()
+    assert stats["waits"] == 1 and stats["peak_active"] == 1
+    assert stats["connections_created"] == 1
+    assert stats["wait_ms_max"] >= 20
+
+    # Sin conexión libre en el plazo, error en lugar de abrir otra
+    pool.checkout_timeout = 0.01
+    with pool.get_connection(), pytest.raises(RuntimeError):
+        with pool.get_connection():
+            pass
+    pool.close_all_connections()
+
+
+def _wait_for_waiters(pool, count):
+    """Espera a que ``count`` hilos estén bloqueados en el pool."""
+    deadline = time.perf_counter() + 1.0
+    while pool.get_pool_stats()["waits"] < count:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+
+
+def test_release_wakes_waiter_of_same_pool(tmp_path):
+    """Liberar una conexión de escritura despierta al que espera escritura."""
+    pool = DatabaseConnection(tmp_path / "pool.db", pool_size=1, checkout_timeout=5.0)
+    reader = pool.get_connection(read_only=True)
+    writer = pool.get_connection()
+    reader.__enter__()
+    writer.__enter__()
+    waited = {}
+
+    def wait(read_only):
+        started = time.perf_counter()
+        with pool.get_connection(read_only=read_only):
+            waited[read_only] = time.perf_counter() - started
+
+    # El de lectura espera primero: sería el único despertado con notify()
+    read_waiter = threading.Thread(target=wait, args=(True,))
+    read_waiter.start()
+    _wait_for_waiters(pool, 1)
+    write_waiter = threading.Thread(target=wait, args=(False,))
+    write_waiter.start()
+    _wait_for_waiters(pool, 2)
+
+    writer.__exit__(None, None, None)
+    write_waiter.join(1.0)
+    assert not write_waiter.is_alive() and waited[False] < 1.0
+
+    reader.__exit__(None, None, None)
+    read_waiter.join(1.0)
+    assert not read_waiter.is_alive() and waited[True] < 1.0
+    pool.close_all_connections()
+
+
+def test_write_statements_are_not_read_only():
+    """WITH con escritura y PRAGMA con asignación usan conexión de escritura."""
+    assert is_read_only_query("  select * from t")
+    assert is_read_only_query("WITH x AS (SELECT 1) SELECT * FROM x")
+    assert is_read_only_query("PRAGMA table_info(partidas)")
+    assert not is_read_only_query("WITH x AS (SELECT 1) INSERT INTO t SELECT * FROM x")
+    assert not is_read_only_query("with old as (select id from t) delete from t")
+    assert not is_read_only_query("PRAGMA user_version = 3")
+    assert not is_read_only_query("UPDATE t SET a = 1")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
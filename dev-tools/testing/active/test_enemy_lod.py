@@ -0,0 +1,128 @@
+"""
+Prueba del nivel de detalle de la IA de enemigos
+================================================
+
+Verifica que los enemigos se reparten en niveles por distancia y visibilidad,
+que el nivel medio se actualiza escalonado sin perder tiempo simulado, que los
+presupuestos aplazan (sin descartar) a los que no caben y que los lejanos solo
+se desplazan de forma aproximada.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.enemy_behavior import EnemyBehavior
+from entities.enemy_lod import DEFAULT_TIERS, EnemyLODScheduler, LODTier, load_tiers
+
+
+def _enemy(x, y=0.0):
+    return SimpleNamespace(
+        x=x, y=y, width=32, height=32, is_dead=False, updates=0, steps=0.0
+    )
+
+
+def _run_tick(scheduler, enemies, dt, player_pos=(0.0, 0.0), view_rect=None):
+    scheduler.begin_tick(enemies, player_pos, view_rect)
+    for enemy in enemies:
+        if scheduler.due(enemy, dt) is not None:
+            enemy.updates += 1
+            enemy.steps += scheduler.consume(enemy)
+
+
+def test_tiers_by_distance_and_visibility():
+    """Distancia al jugador decide el nivel; en pantalla siempre es cercano."""
+    scheduler = EnemyLODScheduler(DEFAULT_TIERS, view_margin=0)
+    enemies = [_enemy(x) for x in (100, 900, 1500, 3000, 4000)]
+    for enemy in enemies:
+        scheduler.attach(enemy)
+
+    scheduler.begin_tick(enemies, (0.0, 0.0), pygame.Rect(3900, -100, 200, 200))
+    assert [enemy.lod_tier for enemy in enemies] == [0, 1, 1, 2, 0]
+    assert scheduler.get_stats()["tiers"] == {"cercano": 2, "medio": 2, "lejano": 1}
+
+    scheduler.begin_tick(enemies, None)
+    assert {enemy.lod_tier for enemy in enemies} == {0}
+
+
+def test_mid_tier_staggered_without_losing_time():
+    """Cada enemigo medio se actualiza una vez por intervalo, con el dt acumulado."""
+    scheduler = EnemyLODScheduler(DEFAULT_TIERS)
+    enemies = [_enemy(1000.0) for _ in range(8)]
+    for enemy in enemies:
+        scheduler.attach(enemy)
+
+    per_tick = []
+    for _ in range(40):
+        _run_tick(scheduler, enemies, 0.01)
+        per_tick.append(scheduler.get_stats()["updated"])
+
+    assert all(enemy.updates == 10 for enemy in enemies)
+    # Escalonados: dos por tick en lugar de ocho cada cuatro
+    assert set(per_tick) == {2}
+    assert all(abs(enemy.steps + enemy.lod_elapsed - 0.4) < 1e-9 for enemy in enemies)
+
+
+def test_budget_defers_to_next_tick():
+    """Lo que no cabe en el presupuesto se actualiza en el tick siguiente."""
+    tiers = (LODTier("cercano", 10.0), LODTier("lejano", interval=1, budget=3))
+    scheduler = EnemyLODScheduler(tiers)
+    enemies = [_enemy(5000.0) for _ in range(5)]
+    for enemy in enemies:
+        scheduler.attach(enemy)
+
+    _run_tick(scheduler, enemies, 0.02)
+    assert scheduler.get_stats()["deferred"] == 2
+    _run_tick(scheduler, enemies, 0.02)
+    assert sum(enemy.updates for enemy in enemies) == 6
+    assert all(enemy.updates >= 1 for enemy in enemies)
+
+    # Los muertos van al nivel cercano y no gastan presupuesto lejano
+    enemies[0].is_dead = True
+    scheduler.begin_tick(enemies, (0.0, 0.0))
+    assert scheduler.due(enemies[0], 0.02) is tiers[0]
+
+
+def test_load_tiers_from_config():
+    """La configuración define los niveles; el primero y el último se acotan."""
+    tiers = load_tiers(
+        {
+            "niveles": [
+                {"nombre": "a", "distancia": 500, "intervalo": 3, "presupuesto": 1},
+                {"nombre": "b", "distancia": 900, "aproximado": True},
+            ]
+        }
+    )
+    assert tiers[0] == LODTier("a", 500.0)
+    assert tiers[1].coarse and tiers[1].max_distance == float("inf")
+    assert load_tiers({}) is DEFAULT_TIERS
+
+
+def test_coarse_update_only_moves():
+    """El modo aproximado avanza hacia el objetivo sin tocar la animación."""
+    core = SimpleNamespace(
+        x=0.0, y=0.0, speed=100.0, is_dead=False, current_animation="Idle"
+    )
+    behavior = EnemyBehavior(core)
+    behavior.patrol_points = [(30.0, 40.0), (0.0, 0.0)]
+
+    behavior.coarse_update(0.25)
+    assert (round(core.x, 6), round(core.y, 6)) == (15.0, 20.0)
+    behavior.coarse_update(0.5)
+    assert (core.x, core.y) == (30.0, 40.0)
+    assert behavior.current_patrol_index == 1
+    assert core.current_animation == "Idle"
+
+
+if __name__ == "__main__":
+    test_tiers_by_distance_and_visibility()
+    test_mid_tier_staggered_without_losing_time()
+    test_budget_defers_to_next_tick()
+    test_load_tiers_from_config()
+    test_coarse_update_only_moves()
+    print("✅ Nivel de detalle de la IA de enemigos OK")
@@ -0,0 +1,152 @@
+"""
+Prueba del almacén denso de enemigos
+====================================
+
+Verifica que los enemigos vivos siguen contiguos tras bajas por intercambio con
+el último, que los retirados se reciclan por tipo con el estado reiniciado y
+que una muerte masiva se retira en una sola actualización sin perder ninguno.
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.enemy_manager import EnemyManager
+from entities.enemy_store import EnemyStore
+from utils.animation_player import AnimationClock
+from utils.animation_registry import AnimationPlayerRegistry
+
+
+class _FakeLoader:
+    """Cargador mínimo con animaciones Idle y Dead de 4 fotogramas."""
+
+    def __init__(self):
+        self.animation_cache = {}
+
+    def load_character_animations(self, character_name):
+        key = f"{character_name}_animations"
+        if key not in self.animation_cache:
+            self.animation_cache[key] = {
+                name: {
+                    "frames": [pygame.Surface((8, 8)) for _ in range(4)],
+                    "frame_count": 4,
+                    "fps": 8,
+                    "frame_duration": 125.0,
+                }
+                for name in ("Idle", "Dead")
+            }
+        return self.animation_cache[key]
+
+    def evict_character(self, character_name):
+        self.animation_cache.pop(f"{character_name}_animations", None)
+
+
+class _FakeAnimationManager:
+    """Gestor con el mismo contrato de reproductores que el real."""
+
+    def __init__(self):
+        self.clock = AnimationClock()
+        self.registry = AnimationPlayerRegistry(_FakeLoader(), self.clock)
+
+    def create_animation_player(self, character_name, initial_animation="Idle"):
+        return self.registry.acquire(character_name, initial_animation)
+
+    def release_animation_player(self, player):
+        self.registry.release(player)
+
+
+class _Dummy:
+    """Enemigo mínimo para probar el almacén aislado."""
+
+    def __init__(self, x, y, enemy_type):
+        self.x, self.y, self.enemy_type = x, y, enemy_type
+        self.released = False
+
+    def reset(self, x, y):
+        self.x, self.y, self.released = x, y, False
+
+    def release(self):
+        self.released = True
+
+
+def _assert_dense(store):
+    assert all(enemy.store_index == i for i, enemy in enumerate(store.live))
+
+
+def test_swap_remove_keeps_live_dense():
+    """Retirar del medio, del final y del principio mantiene índices válidos."""
+    store = EnemyStore(_Dummy)
+    enemies = [store.spawn("zombiemale", i, 0) for i in range(6)]
+
+    store.remove(enemies[2])
+    assert [enemy.x for enemy in store.live] == [0, 1, 5, 3, 4]
+    store.remove(enemies[4])
+    store.remove(enemies[0])
+    _assert_dense(store)
+    assert sorted(enemy.x for enemy in store) == [1, 3, 5]
+    assert enemies[2].released and enemies[2].store_index == -1
+
+    store.clear()
+    assert len(store) == 0
+    assert store.free_count("zombiemale") == 6
+    assert store.stats == {"created": 6, "recycled": 0, "removed": 6}
+
+
+def test_recycling_per_type():
+    """Solo se reutilizan instancias del mismo tipo, y se reinician."""
+    store = EnemyStore(_Dummy, max_free_per_type=2)
+    for i in range(3):
+        store.spawn("zombiemale", i, 0)
+    store.clear()
+    assert store.free_count() == 2
+
+    other = store.spawn("zombieguirl", 0, 0)
+    reused = store.spawn("zombiemale", 50, 60)
+    assert other.enemy_type == "zombieguirl"
+    assert (reused.x, reused.y, reused.released) == (50, 60, False)
+    assert store.stats["created"] == 4 and store.stats["recycled"] == 1
+
+
+def test_mass_death_removed_in_one_update():
+    """Todos los muertos salen en un tick; los reciclados vuelven como nuevos."""
+    animations = _FakeAnimationManager()
+    manager = EnemyManager(animations)
+    manager.spawn_delay = float("inf")
+    for i in range(40):
+        manager.store.spawn("zombiemale" if i % 2 else "zombieguirl", i * 10, 0)
+    survivors = manager.enemies[::5]
+    for enemy in manager.enemies:
+        if enemy not in survivors:
+            enemy.take_damage(10_000)
+
+    manager.update(0.016, None)  # Paso a la animación de muerte
+    animations.clock.advance(1000)
+    manager.update(0.016, None)
+
+    assert manager.enemies is manager.store.live
+    assert sorted(map(id, manager.enemies)) == sorted(map(id, survivors))
+    _assert_dense(manager.store)
+    assert animations.registry.get_stats()["live_players"] == len(survivors)
+
+    reused = manager.store.spawn("zombiemale", 123, 456)
+    assert manager.store.stats["recycled"] == 1
+    assert not reused.is_dead and reused.core.health == reused.core.max_health
+    assert (reused.x, reused.y) == (123, 456)
+    assert reused.core.current_animation == "Idle"
+    assert not reused.behavior.is_tracking_player
+    assert reused.core.animation_player.current_animation == "Idle"
+
+    manager.clear_all_enemies()
+    assert manager.get_enemy_count() == 0
+    assert animations.registry.get_stats()["live_players"] == 0
+
+
+if __name__ == "__main__":
+    test_swap_remove_keeps_live_dense()
+    test_recycling_per_type()
+    test_mass_death_removed_in_one_update()
+    print("✅ Almacén denso de enemigos OK")
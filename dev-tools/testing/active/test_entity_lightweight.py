@@ -0,0 +1,81 @@
+"""
+Prueba del modo ligero de entidades
+===================================
+
+Verifica que proyectiles y powerups no tienen ``__dict__``, que los sistemas de
+efectos y renderizado se crean solo al usarse y que los sprites y servicios se
+comparten entre instancias.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.entity import Entity, EntityState, EntityType
+from entities.powerup import Powerup
+from entities.powerup_types import PowerupType
+from entities.projectile import Projectile
+
+
+class _Config:
+    def get(self, section, key, default=None):
+        return default
+
+
+class _Marker(Entity):
+    def _update_logic(self, delta_time: float):
+        pass
+
+
+def test_slotted_entities_share_sprites_and_services():
+    """Sin __dict__, con sprite, logger y servicios compartidos."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # Los powerups convierten su sprite
+    shots = [Projectile(i, 0, i + 50, 0, 5, 8, _Config()) for i in range(3)]
+    boosts = [Powerup(0, 0, PowerupType.SPEED) for _ in range(2)]
+    for entity in (*shots, *boosts):
+        assert not hasattr(entity, "__dict__")
+
+    assert shots[0].sprite is shots[1].sprite is shots[2].sprite
+    assert boosts[0].get_current_frame() is boosts[1].get_current_frame()
+    assert boosts[0].effects_manager is boosts[1].effects_manager
+    assert shots[0].logger is shots[1].logger
+
+    shots[0].update(1 / 60)
+    assert shots[0].x > 0 and shots[0].velocity_x > 0
+    boosts[0].debug = True
+
+
+def test_optional_components_allocated_on_first_use():
+    """Efectos, renderizado, dirección y rectángulo se crean al primer uso."""
+    entity = _Marker(EntityType.TILE, 10, 20, 30, 40)
+    entity.update(0.1)
+    assert entity._effects_system is None and entity._rendering_system is None
+    assert entity._collision_rect is None and entity._direction is None
+    assert not entity.is_invulnerable
+
+    assert entity.rect == pygame.Rect(10, 20, 30, 40)
+    entity.move(pygame.math.Vector2(3, 4), speed=10)
+    assert entity.direction == pygame.math.Vector2(0.6, 0.8)
+    assert entity.state == EntityState.MOVING
+
+    effects = entity.effects_system
+    assert entity.effects_system is effects
+    effects.apply_invulnerability(1.0)
+    assert entity.is_invulnerable
+    entity.update(0.5)
+    assert effects.invulnerable_timer == 0.5
+    assert entity.rendering_system.entity is entity
+
+
+if __name__ == "__main__":
+    test_slotted_entities_share_sprites_and_services()
+    test_optional_components_allocated_on_first_use()
+    print("✅ Modo ligero de entidades OK")
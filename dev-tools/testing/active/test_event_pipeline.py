@@ -0,0 +1,132 @@
+"""
+Prueba del filtrado y la traza de eventos del motor
+===================================================
+
+Verifica que el motor bloquea en la cola los eventos que la escena activa no
+procesa, que cambia el filtro al cambiar de escena, que QUIT lo consume el
+motor y que la traza circular guarda los últimos eventos y se vuelca con F12.
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from core.event_tracer import EventTracer
+from core.game_engine_events import GameEngineEvents
+
+
+class _Config:
+    def __init__(self, debug):
+        self.debug = debug
+
+    def get(self, section, key, default=None):
+        return self.debug if (section, key) == ("game", "debug") else default
+
+
+class _Scene:
+    def __init__(self, event_types=None):
+        self.event_types = event_types
+        self.received = []
+
+    def handle_event(self, event):
+        self.received.append(event.type)
+
+
+def _engine_events(scene, debug=False):
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    core = SimpleNamespace(
+        config=_Config(debug),
+        running=True,
+        scene_manager=SimpleNamespace(current_scene=scene),
+    )
+    return GameEngineEvents(core), core
+
+
+def _key(kind, key=pygame.K_a):
+    return pygame.event.Event(kind, key=key, mod=0, unicode="", scancode=0)
+
+
+def test_scene_filters_block_events_in_queue():
+    """Solo llegan los tipos de la escena; QUIT y eventos de usuario siempre."""
+    game = _Scene(frozenset({pygame.KEYDOWN}))
+    events, core = _engine_events(game)
+    events.handle_events()  # Instala el filtro de la escena
+
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+    pygame.event.post(_key(pygame.KEYDOWN))
+    pygame.event.post(_key(pygame.KEYUP))
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=1))
+    assert pygame.event.peek(pygame.MOUSEMOTION) is False
+    events.handle_events()
+    assert game.received == [pygame.KEYDOWN, pygame.USEREVENT]
+
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    events.handle_events()
+    assert core.running is False
+    assert game.received == [pygame.KEYDOWN, pygame.USEREVENT]
+
+    stats = events.get_event_stats()
+    assert stats["frames"] == 3
+    assert stats["events"] == 3 and stats["delivered"] == 2
+    assert stats["max_ms"] >= stats["last_ms"] >= 0.0
+
+
+def test_filters_follow_active_scene():
+    """Al cambiar de escena se reabren los tipos y no llegan los ya en cola."""
+    menu = _Scene()
+    events, core = _engine_events(menu)
+    events.handle_events()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+
+    # La escena de juego no procesa movimiento de ratón: el que está en cola
+    # no le llega
+    game = _Scene(frozenset({pygame.KEYDOWN}))
+    core.scene_manager.current_scene = game
+    events.handle_events()
+    assert game.received == []
+    assert events._dispatch(pygame.event.Event(pygame.MOUSEMOTION), game) is False
+
+    core.scene_manager.current_scene = menu
+    events.handle_events()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(2, 2)))
+    events.handle_events()
+    assert menu.received == [pygame.MOUSEMOTION]
+
+
+def test_tracer_ring_buffer_and_dump(caplog):
+    """La traza guarda los últimos eventos y F12 la vuelca en el log."""
+    tracer = EventTracer(capacity=3)
+    for code in range(5):
+        tracer.record(code, pygame.event.Event(pygame.USEREVENT, code=code), True)
+    lines = tracer.dump()
+    assert len(tracer) == 3 and tracer.total == 5
+    assert "frame 2" in lines[0] and "'code': 4" in lines[-1]
+
+    scene = _Scene()
+    events, _ = _engine_events(scene, debug=True)
+    pygame.event.post(_key(pygame.KEYDOWN, pygame.K_x))
+    pygame.event.post(_key(pygame.KEYDOWN, pygame.K_F12))
+    with caplog.at_level(logging.INFO, logger="SiK_Game"):
+        events.handle_events()
+    assert scene.received == [pygame.KEYDOWN]  # F12 no llega a la escena
+    assert "Traza de eventos: 1 de 1" in caplog.text
+    assert len(events.tracer) == 2
+
+    assert _engine_events(_Scene())[0].tracer is None
+
+
+if __name__ == "__main__":
+    import pytest
+
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,119 @@
+"""
+Prueba del campo de flujo hacia el jugador
+==========================================
+
+Verifica que el campo rodea los obstáculos (sin cortar esquinas), que solo se
+recalcula cuando el jugador cambia de celda y que los enemigos que persiguen
+siguen su dirección en lugar de ir en línea recta contra un muro.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.enemy_behavior import EnemyBehavior
+from utils.flow_field import FlowField
+
+# Muro vertical en la columna 3 con hueco abajo (fila 8 y 9 libres)
+WALL = np.array([[192.0, 0.0, 64.0, 512.0]])
+
+
+def _field():
+    field = FlowField(640, 640, cell_size=64)
+    field.set_obstacles(WALL)
+    return field
+
+
+def _walk(field, x, y, steps=200, speed=16.0):
+    """Sigue el campo desde (x, y) y devuelve las celdas visitadas."""
+    visited = [field.cell_of(x, y)]
+    for _ in range(steps):
+        direction = field.sample(x, y)
+        if direction is None:
+            break
+        x += direction[0] * speed
+        y += direction[1] * speed
+        visited.append(field.cell_of(x, y))
+    return visited
+
+
+def test_obstacles_marked_and_distances():
+    """Las celdas del muro quedan bloqueadas y la distancia lo rodea."""
+    field = _field()
+    assert field.blocked[:8, 3].all() and not field.blocked[8:, 3].any()
+    assert field.blocked.sum() == 8
+
+    assert field.update(500, 100)
+    assert field.target_cell == (1, 7)
+    # Al otro lado del muro hay que bajar hasta el hueco y volver a subir
+    assert field.distance[1, 2] == 19
+    assert field.distance[1, 4] == 3
+
+
+def test_flow_goes_around_wall_without_cutting_corners():
+    """Siguiendo el campo se llega al jugador pasando por el hueco."""
+    field = _field()
+    field.update(500, 100)
+
+    visited = _walk(field, 100.0, 100.0)
+    assert visited[-1] == (1, 7)
+    assert (8, 3) in visited or (9, 3) in visited
+    assert not any(field.blocked[cell] for cell in visited)
+    assert field.sample(500, 100) is None
+    assert field.sample(-10, 100) is None
+
+
+def test_recompute_only_on_cell_change():
+    """Moverse dentro de la celda no recalcula; cambiar de celda sí."""
+    field = _field()
+    assert field.update(500, 100)
+    assert not field.update(510, 120)
+    assert field.update(560, 100)
+    assert field.stats["recomputes"] == 2
+
+    # Cambiar obstáculos invalida el campo
+    field.set_obstacles(np.empty((0, 4)))
+    assert field.update(560, 100)
+    assert field.sample(100, 100) == (1.0, 0.0)
+
+
+def test_chasing_enemy_follows_flow():
+    """Un enemigo persiguiendo al jugador tras el muro baja hacia el hueco."""
+    field = _field()
+    core = SimpleNamespace(
+        x=150.0,
+        y=100.0,
+        speed=100.0,
+        is_dead=False,
+        current_animation="Idle",
+        attack_range=10,
+        detection_range=1000,
+        persistent_tracking=False,
+        update_animation=lambda: None,
+        update_facing_direction=lambda: None,
+    )
+    behavior = EnemyBehavior(core)
+    player = (500.0, 100.0)
+    field.update(*player)
+
+    behavior.update(0.1, player, field)
+    assert (core.x, core.y) == (150.0, 110.0)
+    assert core.current_animation == "Walk"
+
+    # Sin campo, línea recta contra el muro
+    core.x, core.y = 150.0, 100.0
+    behavior.update(0.1, player)
+    assert (core.x, core.y) == (160.0, 100.0)
+
+
+if __name__ == "__main__":
+    test_obstacles_marked_and_distances()
+    test_flow_goes_around_wall_without_cutting_corners()
+    test_recompute_only_on_cell_change()
+    test_chasing_enemy_follows_flow()
+    print("✅ Campo de flujo OK")
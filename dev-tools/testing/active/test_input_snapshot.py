@@ -0,0 +1,183 @@
+"""
+Prueba de la instantánea de entrada por tick
+============================================
+
+Verifica que InputManager.sample lee teclado y ratón una vez por tick en una
+instantánea de acciones y ejes, que los toques más cortos que un tick no se
+pierden, que se mide la latencia evento-acción, que los gamepads conectados
+antes de crear el gestor se leen y que el movimiento del jugador se calcula a
+partir de la instantánea y no del tamaño fijo de la pantalla.
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.entity import EntityState
+from entities.player_movement import PlayerMovement
+from utils.input_manager import ACTION_BITS, InputAction, InputManager
+
+
+class _Keys:
+    """Estado de teclado falso con las teclas indicadas pulsadas."""
+
+    def __init__(self, *pressed):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+def _setup(monkeypatch, keys=(), mouse_pos=(400, 300), buttons=(False,) * 3):
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _Keys(*keys))
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: mouse_pos)
+    monkeypatch.setattr(pygame.mouse, "get_pressed", lambda *a: buttons)
+
+
+def _key_event(kind, key):
+    return pygame.event.Event(kind, key=key, mod=0, unicode="", scancode=0)
+
+
+def test_held_keys_and_mouse_in_one_snapshot(monkeypatch):
+    """Teclas mantenidas dan ejes digitales; la puntería es relativa al centro."""
+    _setup(
+        monkeypatch,
+        keys=(pygame.K_w, pygame.K_d, pygame.K_LEFT),
+        mouse_pos=(700, 150),
+        buttons=(True, False, False),
+    )
+    manager = InputManager()
+    snapshot = manager.sample()
+
+    assert snapshot.tick == 1
+    assert snapshot.is_down(InputAction.MOVE_UP)
+    assert snapshot.is_down(InputAction.ATTACK)  # Clic izquierdo
+    # Izquierda y derecha a la vez se anulan
+    assert (snapshot.move_x, snapshot.move_y) == (0.0, -1.0)
+    assert (snapshot.aim_x, snapshot.aim_y) == (300.0, -150.0)
+    assert snapshot.just_pressed(InputAction.MOVE_UP)
+
+    # Siguiente tick con las mismas teclas: activas pero sin flanco
+    again = manager.sample()
+    assert again.tick == 2 and again.actions == snapshot.actions
+    assert again.pressed == 0 and again.released == 0
+
+
+def test_tap_shorter_than_tick_is_latched(monkeypatch):
+    """Un toque que empieza y acaba entre dos ticks llega a la instantánea."""
+    _setup(monkeypatch)
+    manager = InputManager()
+    manager.handle_event(_key_event(pygame.KEYDOWN, pygame.K_RETURN))
+    manager.handle_event(_key_event(pygame.KEYUP, pygame.K_RETURN))
+
+    snapshot = manager.sample()
+    assert snapshot.just_pressed(InputAction.ATTACK)
+    assert manager.sample().released == ACTION_BITS[InputAction.ATTACK]
+
+    stats = manager.get_diagnostics()
+    assert stats["latency_samples"] == 1
+    assert 0.0 <= stats["latency_last_ms"] < stats["tick_ms"]
+    assert stats["latency_over_one_tick"] == 0
+
+    # Un evento que espera más de un tick se cuenta aparte
+    slow = InputManager(tick_ms=0.0)
+    slow.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+    slow.sample()
+    assert slow.get_diagnostics()["latency_over_one_tick"] == 1
+
+    # Teclas sin acción ni se retienen ni se miden
+    manager.handle_event(_key_event(pygame.KEYDOWN, pygame.K_z))
+    assert manager.sample().actions == 0
+    assert manager.get_diagnostics()["latency_samples"] == 1
+
+
+def test_player_movement_reads_snapshot(monkeypatch):
+    """Velocidad, orientación y ataque salen de la instantánea."""
+    _setup(monkeypatch, keys=(pygame.K_DOWN, pygame.K_a), mouse_pos=(100, 300))
+    core = SimpleNamespace(
+        stats=SimpleNamespace(speed=200),
+        facing_right=True,
+        state=EntityState.IDLE,
+        current_frame_index=3,
+        animation_timer=1.0,
+        update_sprite=lambda: None,
+    )
+    movement = PlayerMovement(core)
+    manager = InputManager()
+
+    movement.handle_input(manager.sample(), None)
+    assert (movement.velocity_x, movement.velocity_y) == (-200, 200)
+    assert core.facing_right is False  # Ratón a la izquierda del centro (800x600)
+    assert not movement.is_attacking
+
+    manager.handle_event(_key_event(pygame.KEYDOWN, pygame.K_j))
+    movement.handle_input(manager.sample(), None)
+    assert movement.is_attacking and core.state == EntityState.ATTACKING
+
+
+class _Gamepad:
+    """Gamepad falso con los botones y ejes indicados."""
+
+    def __init__(self, device_index, buttons=(), axes=(0.0, 0.0)):
+        self.instance_id = 100 + device_index
+        self.buttons = set(buttons)
+        self.axes = list(axes)
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_name(self):
+        return "Gamepad de prueba"
+
+    def get_numbuttons(self):
+        return 8
+
+    def get_button(self, button):
+        return button in self.buttons
+
+    def get_numaxes(self):
+        return len(self.axes)
+
+    def get_axis(self, axis):
+        return self.axes[axis]
+
+
+def test_gamepad_connected_before_creation_is_read(monkeypatch):
+    """Un gamepad conectado antes de crear el gestor se registra y se lee."""
+    _setup(monkeypatch)
+    pads = {0: _Gamepad(0, buttons=(0,), axes=(0.8, -0.05))}
+    monkeypatch.setattr(pygame.joystick, "get_init", lambda: True)
+    monkeypatch.setattr(pygame.joystick, "get_count", lambda: len(pads))
+    monkeypatch.setattr(pygame.joystick, "Joystick", lambda index: pads[index])
+
+    manager = InputManager(deadzone=0.1)
+    assert list(manager.joysticks) == [100]
+    snapshot = manager.sample()
+    assert snapshot.is_down(InputAction.JUMP)  # Botón 0
+    assert snapshot.is_down(InputAction.MOVE_RIGHT)
+    assert (snapshot.move_x, snapshot.move_y) == (0.8, -0.05)
+    assert manager.get_diagnostics()["gamepads"] == 1
+
+    # Conexión y desconexión en caliente; el repetido no se duplica
+    pads[1] = _Gamepad(1)
+    manager.handle_event(pygame.event.Event(pygame.JOYDEVICEADDED, device_index=0))
+    manager.handle_event(pygame.event.Event(pygame.JOYDEVICEADDED, device_index=1))
+    assert sorted(manager.joysticks) == [100, 101]
+    manager.handle_event(pygame.event.Event(pygame.JOYDEVICEREMOVED, instance_id=100))
+    assert manager.sample().actions == 0
+
+
+if __name__ == "__main__":
+    import pytest
+
+    sys.exit(pytest.main([__file__, "-q"]))
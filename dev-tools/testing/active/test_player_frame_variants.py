@@ -0,0 +1,116 @@
+"""
+Prueba de las variantes precalculadas del jugador
+=================================================
+
+Verifica que todas las variantes (animación, frame, orientación) se precalculan
+al tamaño final y que dibujar al jugador frame a frame no crea superficies ni
+acumula memoria.
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.player import Player
+from entities.player_core import AnimationState
+from utils.config_manager import ConfigManager
+
+
+class _FakeAnimationManager:
+    """Gestor mínimo: frames de 64x48 con la mitad izquierda marcada."""
+
+    def load_character_animations(self, character_name):
+        animations = {}
+        for name, count in (("Idle", 4), ("Attack", 6), ("Dead", 3)):
+            frames = []
+            for _ in range(count):
+                frame = pygame.Surface((64, 48), pygame.SRCALPHA)
+                frame.fill((255, 0, 0, 255), (0, 0, 32, 48))
+                frames.append(frame)
+            animations[name] = {"frames": frames, "frame_count": count}
+        return animations
+
+
+def _player():
+    return Player(300, 300, "guerrero", ConfigManager(), _FakeAnimationManager())
+
+
+def test_variants_precomputed_at_render_size():
+    """Cada animación tiene sus frames a 100x100 y volteados para la izquierda."""
+    player = _player()
+    variants = player.core.frame_variants
+    assert set(variants) == {
+        (name, facing)
+        for name in ("Idle", "Attack", "Dead")
+        for facing in (True, False)
+    }
+    for (name, _facing), frames in variants.items():
+        assert len(frames) == len(player.animations[name]["frames"])
+        assert all(frame.get_size() == (100, 100) for frame in frames)
+
+    right = player.core.get_frame("Idle", 0, True)
+    left = player.core.get_frame("Idle", 0, False)
+    assert right.get_at((10, 50))[:3] == (255, 0, 0)
+    assert left.get_at((89, 50))[:3] == (255, 0, 0)
+    assert left.get_at((10, 50)).a == 0
+
+
+def test_render_path_allocates_nothing():
+    """get_current_frame solo devuelve variantes ya existentes y no reserva memoria."""
+    player = _player()
+    precomputed = {
+        id(frame) for frames in player.core.frame_variants.values() for frame in frames
+    }
+    states = [AnimationState.IDLE, AnimationState.ATTACK, AnimationState.DEAD]
+
+    # Estados preparados de antemano: el bucle medido no crea objetos propios
+    plan = [(states[i % 3], i % 2 == 0, i) for i in range(5000)]
+
+    def render_frames(render: bool, check: bool = False):
+        frame = None
+        for state, facing_right, frame_index in plan:
+            player.core.current_animation_state = state
+            player.core.facing_right = facing_right
+            player.core.current_frame_index = frame_index
+            if render:
+                frame = player.get_current_frame()
+            # id() crea un entero: solo se comprueba fuera de la medición
+            if check:
+                assert id(frame) in precomputed
+        return frame
+
+    def peak_of(render: bool):
+        """Pico de memoria del bucle sobre lo reservado al empezar."""
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        frame = render_frames(render)
+        _, peak = tracemalloc.get_traced_memory()
+        return peak - before, frame
+
+    render_frames(render=True, check=True)  # Calentar cachés del intérprete
+    render_frames(render=False)
+    tracemalloc.start()
+    try:
+        # El bucle sin dibujar mide lo que reserva el propio bucle (su iterador)
+        baseline, _ = peak_of(render=False)
+        peak, frame = peak_of(render=True)
+    finally:
+        tracemalloc.stop()
+    # El pico, no solo el neto: ni siquiera objetos temporales liberados al momento
+    assert peak == baseline
+    assert id(frame) in precomputed
+
+    velocity = player.velocity
+    assert (velocity.x, velocity.y) == (0, 0)
+    assert type(velocity) is type(player.velocity)
+
+
+if __name__ == "__main__":
+    test_variants_precomputed_at_render_size()
+    test_render_path_allocates_nothing()
+    print("✅ Variantes del jugador OK")
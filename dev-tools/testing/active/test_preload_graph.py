@@ -0,0 +1,81 @@
+"""
+Prueba del grafo de precarga
+============================
+
+Verifica el orden por dependencias, la detección de ciclos, el progreso ponderado
+por trabajo terminado y que las tareas de hilo principal solo corren con pump().
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.preload_graph import PreloadGraph
+
+
+def test_order_and_cycles():
+    """Las dependencias fijan el orden y los ciclos se rechazan."""
+    graph = PreloadGraph()
+    graph.add("world", lambda r: r["config"] * 2, deps=("config",))
+    graph.add("config", lambda r: 21)
+    graph.add("hud", lambda r: r["world"] + 0, deps=("world",))
+    assert graph.order() == ["config", "world", "hud"]
+    assert graph.run_all()["hud"] == 42
+
+    with pytest.raises(ValueError):
+        graph.add("config", lambda r: None)
+
+    cyclic = PreloadGraph()
+    cyclic.add("a", lambda r: None, deps=("b",))
+    cyclic.add("b", lambda r: None, deps=("a",))
+    with pytest.raises(ValueError):
+        cyclic.order()
+
+    unknown = PreloadGraph()
+    unknown.add("a", lambda r: None, deps=("missing",))
+    with pytest.raises(ValueError):
+        unknown.start()
+
+
+def test_progress_main_thread_and_failures():
+    """El progreso sigue al peso terminado; los fallos se propagan sin bloquear."""
+    release = threading.Event()
+    main_thread_ids = []
+
+    graph = PreloadGraph()
+    graph.add("slow", lambda r: release.wait(5), weight=3.0)
+    graph.add(
+        "fonts",
+        lambda r: main_thread_ids.append(threading.get_ident()),
+        main_thread=True,
+    )
+    graph.add("broken", lambda r: 1 / 0)
+    graph.add("needs_broken", lambda r: "nunca", deps=("broken",), main_thread=True)
+    graph.start()
+
+    # Sin pump() las tareas de hilo principal no avanzan
+    assert graph.tasks["fonts"].state == "pending"
+    assert graph.progress < 1.0
+
+    graph.pump()
+    assert main_thread_ids == [threading.get_ident()]
+    release.set()
+    graph.run_all()
+
+    assert graph.is_complete()
+    assert graph.progress == 1.0
+    assert isinstance(graph.errors["broken"], ZeroDivisionError)
+    assert graph.tasks["needs_broken"].state == "failed"
+    assert "needs_broken" not in graph.results
+    assert set(graph.get_timings()) == {"slow", "fonts", "broken", "needs_broken"}
+
+
+if __name__ == "__main__":
+    test_order_and_cycles()
+    test_progress_main_thread_and_failures()
+    print("✅ Grafo de precarga OK")
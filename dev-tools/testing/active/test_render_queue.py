@@ -0,0 +1,68 @@
+"""
+Prueba de la cola de dibujado por capas
+=======================================
+
+Verifica que cada capa se vuelca con una sola llamada, en orden de capas, que
+el orden por Y es estable y que las estadísticas del frame son correctas.
+"""
+
+import sys
+from pathlib import Path
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.render_queue import RenderQueue
+
+
+def _solid(color, size=(4, 4)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+def test_layers_flush_in_order_with_one_call_each():
+    """Capas en orden, una llamada por capa no vacía y la cola queda vacía."""
+    target = pygame.Surface((16, 16))
+    queue = RenderQueue(layers=("ground", "enemies", "player"))
+    queue.submit("player", _solid((0, 0, 255)), (0, 0))
+    queue.extend("ground", [(_solid((255, 0, 0)), (x, 0)) for x in range(0, 16, 4)])
+
+    assert queue.flush(target) == 2
+    assert target.get_at((0, 0))[:3] == (0, 0, 255)
+    assert target.get_at((4, 0))[:3] == (255, 0, 0)
+    assert queue.frame_stats == {
+        "draw_calls": 2,
+        "sprites": 5,
+        "layers": {"ground": 4, "player": 1},
+    }
+    assert queue.flush(target) == 0
+
+
+def test_y_sort_is_stable_by_sprite_foot():
+    """Con orden por Y se dibuja encima el sprite con el pie más abajo."""
+    target = pygame.Surface((16, 16))
+    queue = RenderQueue(layers=("enemies",), y_sorted=("enemies",))
+    tall = _solid((255, 0, 0), (2, 12))  # pie en y=12
+    short = _solid((0, 255, 0), (4, 4))  # pie en y=10
+    queue.submit("enemies", tall, (0, 0))
+    queue.submit("enemies", short, (0, 6))
+    # Mismo pie que short, encolado después: se dibuja después (orden estable)
+    queue.submit("enemies", _solid((0, 0, 255), (4, 2)), (0, 8))
+    queue.flush(target)
+    assert target.get_at((1, 7))[:3] == (255, 0, 0)
+    assert target.get_at((3, 9))[:3] == (0, 0, 255)
+
+    unsorted = RenderQueue(layers=("enemies",))
+    unsorted.submit("enemies", tall, (0, 0))
+    unsorted.submit("enemies", short, (0, 6))
+    unsorted.flush(target)
+    assert target.get_at((1, 7))[:3] == (0, 255, 0)
+
+
+if __name__ == "__main__":
+    test_layers_flush_in_order_with_one_call_each()
+    test_y_sort_is_stable_by_sprite_foot()
+    print("✅ Cola de dibujado OK")
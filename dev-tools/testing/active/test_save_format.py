@@ -0,0 +1,117 @@
+"""
+Prueba del formato binario de guardado
+======================================
+
+Verifica ida y vuelta, detección de corrupción, migración de versiones y la
+lectura de guardados antiguos en pickle y en SQLite.
+"""
+
+import pickle
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils import save_format
+from utils.database_manager import DatabaseManager
+from utils.save_database import SaveDatabase
+from utils.save_encryption import SaveEncryption
+from utils.save_loader import SaveLoader
+from utils.schema_manager import SchemaManager
+
+
+class FakeConfig:
+    """Configuración mínima con la carpeta de guardados indicada."""
+
+    def __init__(self, saves_path: str = "saves"):
+        self.saves_path = saves_path
+
+    def get(self, section, key, default=None):
+        return self.saves_path if (section, key) == ("paths", "saves") else default
+
+
+class FakeGameState:
+    """Estado de juego con la interfaz usada por el sistema de guardado."""
+
+    active_slot = 1
+    player_name = "Tester"
+    level = 4
+    score = 321
+    lives = 2
+    play_time = 60
+    selected_character = "adventureguirl"
+
+    def get_state_dict(self):
+        return {"level": self.level, "score": self.score, "inventario": ["a"] * 200}
+
+
+def test_round_trip_with_encryption_and_compression():
+    """El guardado cifrado y comprimido se decodifica igual que se escribió."""
+    crypto = SaveEncryption(FakeConfig())
+    blob = save_format.encode_game_save(
+        FakeGameState(), {"extra": 1}, {"slot": 1}, crypto.encrypt_data
+    )
+    header = save_format.read_header(blob)
+    assert header["flags"] & save_format.FLAG_ENCRYPTED
+    assert header["sections"] == 3
+
+    data = save_format.decode_game_save(blob, crypto.decrypt_data)
+    assert data["game_state"] == FakeGameState().get_state_dict()
+    assert data["additional_data"] == {"extra": 1}
+
+    corrupted = bytearray(blob)
+    corrupted[-1] ^= 0xFF
+    with pytest.raises(save_format.SaveFormatError):
+        save_format.decode(bytes(corrupted), crypto.decrypt_data)
+
+
+def test_older_versions_migrate_forward(monkeypatch):
+    """Las migraciones registradas se aplican al leer versiones anteriores."""
+    monkeypatch.setattr(save_format, "FORMAT_VERSION", 2)
+    monkeypatch.setitem(
+        save_format.MIGRATIONS,
+        1,
+        lambda sections: {**sections, b"NUEV": {"migrado": True}},
+    )
+    blob = bytearray(save_format.encode({b"STAT": {"score": 1}}))
+    blob[4:6] = (1).to_bytes(2, "little")
+    sections = save_format.decode(bytes(blob))
+    assert sections[b"NUEV"] == {"migrado": True}
+
+
+def test_legacy_pickle_files_still_load():
+    """Los archivos pickle + zlib + XOR anteriores se siguen leyendo."""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = FakeConfig(tmp)
+        crypto = SaveEncryption(config)
+        legacy = {"game_state": {"score": 7}, "additional_data": {}}
+        Path(tmp, "save_1.dat").write_bytes(
+            crypto.encrypt_data(zlib.compress(pickle.dumps(legacy)))
+        )
+        loader = SaveLoader(config, crypto)
+        assert loader.load_save_file(1, loader.load_save_files_info()) == legacy
+
+
+def test_sqlite_blob_round_trip():
+    """El backend SQLite guarda y carga el mismo formato como BLOB."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "saves.db"), pool_size=1)
+        try:
+            SchemaManager(db_manager).create_all_tables()
+            database = SaveDatabase(db_manager, SaveEncryption(FakeConfig()))
+            assert database.save_game_to_database(2, FakeGameState(), {"x": 1})
+
+            data = database.load_game_from_database(2)
+            assert data["game_state"]["score"] == 321
+            assert data["save_metadata"]["personaje"] == "adventureguirl"
+            stored = db_manager.execute_query(
+                "SELECT estado_juego FROM partidas_guardadas WHERE slot = 2"
+            )[0]["estado_juego"]
+            assert save_format.is_binary_save(stored)
+        finally:
+            db_manager.close_all_connections()
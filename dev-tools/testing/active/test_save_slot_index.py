@@ -0,0 +1,123 @@
+"""
+Prueba del índice de slots de guardado
+======================================
+
+Verifica que los menús obtienen los metadatos sin abrir partidas, que el índice
+se actualiza en cada guardado y que la validación usa solo el CRC32.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.save_manager import SaveManager
+
+
+class FakeConfig:
+    """Configuración mínima con la carpeta de guardados en un directorio temporal."""
+
+    def __init__(self, saves_path: str):
+        self.values = {"paths": {"saves": saves_path}}
+
+    def get(self, section, key, default=None):
+        return self.values.get(section, {}).get(key, default)
+
+    def get_section(self, section):
+        return self.values.get(section, {})
+
+
+class FakeGameState:
+    """Estado de juego con la interfaz usada por el sistema de guardado."""
+
+    def __init__(self, slot: int, score: int):
+        self.active_slot = slot
+        self.player_name = f"Jugador {slot}"
+        self.level = 3
+        self.score = score
+        self.lives = 2
+        self.play_time = 30
+        self.selected_character = "robot"
+
+    def get_state_dict(self):
+        return {"score": self.score, "level": self.level}
+
+
+def _forbid_payload_access(manager: SaveManager) -> None:
+    """Hace fallar cualquier lectura completa de partidas."""
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("Se ha leído una partida completa")
+
+    manager.compatibility.load_game_unified = fail
+    manager.loader.load_save_file = fail
+
+
+def test_menus_read_index_without_payloads():
+    """El índice sirve metadatos y el último slot sin descifrar partidas."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SaveManager(FakeConfig(tmp))
+        try:
+            manager.save_game(FakeGameState(1, 100), blocking=True)
+            manager.save_game(FakeGameState(3, 300), blocking=True)
+
+            reopened = SaveManager(FakeConfig(tmp))
+            _forbid_payload_access(reopened)
+            slots = reopened.get_save_files_info()
+            assert [s["exists"] for s in slots] == [True, False, True]
+            assert slots[2]["score"] == 300 and slots[2]["character"] == "robot"
+            assert slots[0]["checksum"] is not None
+            assert reopened.get_latest_slot() == 3
+            assert reopened.validate_saves_integrity() == {
+                "slot_1": True,
+                "slot_3": True,
+            }
+
+            save_file = Path(tmp) / "save_1.dat"
+            data = bytearray(save_file.read_bytes())
+            data[-1] ^= 0xFF
+            save_file.write_bytes(bytes(data))
+            assert reopened.validate_saves_integrity()["slot_1"] is False
+
+            reopened.delete_save(3)
+            assert reopened.get_latest_slot() == 1
+            reopened.shutdown()
+        finally:
+            manager.shutdown()
+
+
+def test_index_rebuilt_from_existing_saves():
+    """Sin índice, se reconstruye una vez desde las partidas existentes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SaveManager(FakeConfig(tmp))
+        manager.save_game(FakeGameState(2, 50), blocking=True)
+        manager.shutdown()
+        index_file = Path(tmp) / "slots_index.json"
+        index_file.unlink()
+
+        rebuilt = SaveManager(FakeConfig(tmp))
+        slots = rebuilt.get_save_files_info()
+        assert slots[1]["exists"] and slots[1]["score"] == 50
+        assert slots[1]["checksum"] is not None
+        assert json.loads(index_file.read_text(encoding="utf-8"))["slots"]["2"]
+        rebuilt.shutdown()
+
+
+def test_first_save_without_index_keeps_other_slots():
+    """Guardar sin índice lo reconstruye antes: los demás slots no se pierden."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SaveManager(FakeConfig(tmp))
+        manager.save_game(FakeGameState(1, 10), blocking=True)
+        manager.save_game(FakeGameState(2, 20), blocking=True)
+        manager.shutdown()
+        (Path(tmp) / "slots_index.json").unlink()
+
+        reopened = SaveManager(FakeConfig(tmp))
+        reopened.save_game(FakeGameState(3, 30), blocking=True)
+        slots = reopened.get_save_files_info()
+        assert [s["exists"] for s in slots] == [True, True, True]
+        assert [s["score"] for s in slots] == [10, 20, 30]
+        reopened.shutdown()
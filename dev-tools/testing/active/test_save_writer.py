@@ -0,0 +1,136 @@
+"""
+Prueba del guardado en segundo plano
+====================================
+
+Verifica que SaveManager captura una instantánea, escribe en el hilo escritor,
+fusiona guardados repetidos del mismo slot y omite escrituras sin cambios.
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.save_manager import SaveManager
+from utils.save_writer import SaveWriter
+
+
+class FakeConfig:
+    """Configuración mínima con la carpeta de guardados en un directorio temporal."""
+
+    def __init__(self, saves_path: str):
+        self.values = {
+            "paths": {"saves": saves_path},
+            "save_system": {"save_system": {"backup_interval": 0}},
+        }
+
+    def get(self, section, key, default=None):
+        return self.values.get(section, {}).get(key, default)
+
+    def get_section(self, section):
+        return self.values.get(section, {})
+
+
+class FakeGameState:
+    """Estado de juego con la interfaz usada por el sistema de guardado."""
+
+    def __init__(self):
+        self.active_slot = 1
+        self.player_name = "Tester"
+        self.level = 2
+        self.score = 150
+        self.lives = 3
+        self.play_time = 12.5
+        self.selected_character = "guerrero"
+
+    def get_state_dict(self):
+        return {"level": self.level, "score": self.score, "lives": self.lives}
+
+
+def test_snapshot_written_in_background_and_incremental():
+    """El guardado se escribe en el hilo escritor y no repite slots sin cambios."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SaveManager(FakeConfig(tmp))
+        state = FakeGameState()
+        threads, results = [], []
+        original = manager.compatibility.save_game_unified
+
+        def tracking_save(*args):
+            threads.append(threading.current_thread().name)
+            return original(*args)
+
+        manager.compatibility.save_game_unified = tracking_save
+        try:
+            assert manager.save_game(state, on_complete=results.append)
+            state.score = 999  # Cambios posteriores no afectan a la instantánea
+            manager.writer.flush()
+            manager.update()
+            assert results == [True]
+            assert threads == ["SaveWriter"]
+            assert (Path(tmp) / "save_1.dat").exists()
+            assert not list(Path(tmp).glob("*.tmp"))
+
+            # Misma instantánea: se omite la escritura
+            state.score = 150
+            manager.save_game(state)
+            manager.writer.flush()
+            assert len(threads) == 1
+
+            loaded = manager.load_save(1)
+            assert loaded["game_state"]["score"] == 150
+        finally:
+            manager.shutdown()
+
+
+def test_writer_coalesces_and_reports_errors():
+    """Solo se ejecuta el último trabajo de cada clave y los errores llegan por callback."""
+    writer = SaveWriter()
+    gate = threading.Event()
+    executed, errors = [], []
+
+    writer.submit(gate.wait)
+    for value in range(5):
+        writer.submit(lambda v=value: executed.append(v), key="slot_1")
+    writer.submit(lambda: 1 / 0, on_error=errors.append)
+    gate.set()
+    writer.flush()
+    writer.dispatch_callbacks()
+
+    assert executed == [4]
+    assert writer.stats["coalesced"] == 4
+    assert len(errors) == 1 and isinstance(errors[0], ZeroDivisionError)
+    writer.shutdown()
+
+
+def test_coalesced_jobs_keep_their_callbacks():
+    """Los callbacks de un trabajo sustituido llegan con el de la escritura final."""
+    writer = SaveWriter()
+    gate = threading.Event()
+    completed, errors = [], []
+
+    writer.submit(gate.wait)
+    for value in range(3):
+        writer.submit(
+            lambda v=value: v,
+            on_complete=lambda result, v=value: completed.append((v, result)),
+            key="slot_1",
+        )
+    for _ in range(2):
+        writer.submit(lambda: 1 / 0, on_error=errors.append, key="slot_2")
+    gate.set()
+    writer.flush()
+    writer.dispatch_callbacks()
+
+    assert completed == [(0, 2), (1, 2), (2, 2)]
+    assert len(errors) == 2 and all(isinstance(e, ZeroDivisionError) for e in errors)
+    writer.shutdown()
+
+
+if __name__ == "__main__":
+    test_snapshot_written_in_background_and_incremental()
+    test_writer_coalesces_and_reports_errors()
+    test_coalesced_jobs_keep_their_callbacks()
+    print("¡Guardado en segundo plano verificado!")
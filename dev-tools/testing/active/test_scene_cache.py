@@ -0,0 +1,193 @@
+"""
+Prueba del ciclo de vida de escenas y la caché del SceneManager
+===============================================================
+
+Verifica que una escena se prepara por pasos sin activarse, que volver a una
+escena en caché usa suspend/resume en lugar de reconstruirla, que la caché
+expulsa la escena menos usada (salvo las que no tienen fábrica) y que al
+activar una escena se preparan las que suelen venir después.
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from core.scene_manager import Scene, SceneManager
+
+
+class _Config:
+    """Configuración falsa con el tamaño de caché indicado."""
+
+    def __init__(self, cached: int = 6):
+        self.cached = cached
+
+    def get(self, section, key, default=None):
+        return self.cached if key == "escenas_en_cache" else default
+
+
+class _Scene(Scene):
+    """Escena que anota las llamadas de su ciclo de vida."""
+
+    steps = 0
+
+    def __init__(self, calls: list):
+        super().__init__(None, _Config())
+        self.calls = calls
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def render(self):
+        pass
+
+    def prepare(self):
+        for step in range(1, self.steps + 1):
+            self.calls.append("prepare")
+            yield step / self.steps
+
+    def enter(self):
+        self.calls.append("enter")
+
+    def exit(self):
+        self.calls.append("exit")
+
+    def suspend(self):
+        self.calls.append("suspend")
+
+    def resume(self):
+        self.calls.append("resume")
+
+    def dispose(self):
+        self.calls.append("dispose")
+
+
+class _Factory:
+    """Fábrica que cuenta las construcciones y guarda la última escena."""
+
+    def __init__(self, steps: int = 0, next_scenes: tuple[str, ...] = ()):
+        self.steps = steps
+        self.next_scenes = next_scenes
+        self.calls: list[str] = []
+        self.built = 0
+        self.scene = None
+
+    def __call__(self):
+        self.built += 1
+        self.scene = _Scene(self.calls)
+        self.scene.steps = self.steps
+        self.scene.next_scenes = self.next_scenes
+        return self.scene
+
+
+def _manager(cached: int = 6) -> SceneManager:
+    manager = SceneManager(None, _Config(cached))
+    manager.prepare_budget_ms = 0.0  # Un paso por frame
+    return manager
+
+
+def test_prepare_runs_in_steps_before_activation():
+    """La preparación avanza con update() y la activación posterior es en caché."""
+    manager = _manager()
+    menu, game = _Factory(), _Factory(steps=3)
+    manager.register_scene("menu", menu)
+    manager.register_scene("game", game)
+    manager.change_scene("menu")
+
+    assert manager.prepare_scene("game")
+    assert manager.get_prepare_progress("game") == 0.0
+    manager.update()  # Construcción
+    assert game.built == 1 and not manager.is_ready("game")
+    manager.update()
+    assert manager.get_prepare_progress("game") == 1 / 3
+    for _ in range(3):
+        manager.update()
+    assert manager.is_ready("game") and game.calls == ["prepare"] * 3
+    assert manager.current_scene is menu.scene
+
+    manager.change_scene("game")
+    assert game.calls[-1] == "enter"
+    assert manager.transitions[-1][:2] == ("menu", "game")
+    assert manager.transitions[-1][3] is True  # Estaba en caché
+    assert not manager.prepare_scene("missing")
+
+
+def test_cold_change_finishes_preparation():
+    """Cambiar a una escena sin preparar la construye y prepara en el momento."""
+    manager = _manager()
+    game = _Factory(steps=2)
+    manager.register_scene("game", game)
+    manager.change_scene("game")
+    assert game.calls == ["prepare", "prepare", "enter"]
+    assert manager.get_transition_stats()["cold"] == 1
+
+
+def test_revisit_resumes_without_rebuilding():
+    """Ir y volver usa suspend/resume y no vuelve a construir la escena."""
+    manager = _manager()
+    game, pause = _Factory(), _Factory()
+    manager.register_scene("game", game)
+    manager.register_scene("pause", pause)
+    for name in ("game", "pause", "game", "pause"):
+        manager.change_scene(name)
+
+    assert game.built == pause.built == 1
+    assert game.calls == ["enter", "suspend", "resume", "suspend"]
+    assert pause.calls == ["enter", "suspend", "resume"]
+    stats = manager.get_transition_stats()
+    assert stats["transitions"] == 4 and stats["cold"] == 2
+
+
+def test_cache_evicts_least_recent_scene():
+    """Con la caché llena se expulsa la menos usada; las fijas se conservan."""
+    manager = _manager(cached=2)
+    pinned_calls: list[str] = []
+    manager.add_scene("loading", _Scene(pinned_calls))
+    a, b = _Factory(), _Factory()
+    manager.register_scene("a", a)
+    manager.register_scene("b", b)
+
+    manager.change_scene("a")
+    manager.change_scene("b")
+    # "loading" no tiene fábrica: se expulsa "a" aunque sea más reciente
+    assert "loading" in manager.scenes and "a" not in manager.scenes
+    assert a.calls[-1] == "dispose"
+    assert manager.get_prepare_progress("a") == 0.0
+
+    manager.change_scene("a")
+    assert a.built == 2 and a.calls[-1] == "enter"
+    assert manager.transitions[-1][3] is False
+    assert "b" not in manager.scenes and "dispose" not in pinned_calls
+
+    manager.remove_scene("loading")
+    assert not manager.has_scene("loading") and pinned_calls == ["dispose"]
+
+
+def test_next_scenes_are_prepared_on_activation():
+    """Al activar una escena se preparan en segundo plano sus siguientes."""
+    manager = _manager()
+    slots = _Factory(steps=1)
+    manager.register_scene("menu", _Factory(next_scenes=("slots", "missing")))
+    manager.register_scene("slots", slots)
+
+    manager.change_scene("menu")
+    assert manager.get_transition_stats()["preparing"] == ["slots"]
+    manager.update()
+    manager.update()
+    manager.update()
+    assert manager.is_ready("slots")
+    manager.change_scene("slots")
+    assert manager.transitions[-1][3] is True
+
+
+if __name__ == "__main__":
+    test_prepare_runs_in_steps_before_activation()
+    test_cold_change_finishes_preparation()
+    test_revisit_resumes_without_rebuilding()
+    test_cache_evicts_least_recent_scene()
+    test_next_scenes_are_prepared_on_activation()
+    print("✅ Caché de escenas OK")
@@ -0,0 +1,170 @@
+"""
+Prueba de las tablas de aparición por oleada
+===========================================
+
+Verifica con una prueba chi-cuadrado que las tablas de alias reproducen las
+probabilidades esperadas (por peso, por rareza y por oleada) y que, una vez
+compiladas, elegir enemigo no consulta la base de datos.
+"""
+
+import random
+import sys
+from collections import Counter
+from operator import attrgetter
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.enemy_types import (
+    RARITY_WEIGHTS,
+    WAVE_RARITIES,
+    EnemyRarity,
+    EnemyTypesManager,
+)
+from entities.spawn_tables import SpawnTables
+from utils.alias_table import AliasTable
+
+SAMPLES = 200_000
+NAME = attrgetter("name")
+MALE, FEMALE, CRAWLER, RUNNER = (
+    "zombie_male",
+    "zombie_female",
+    "zombie_crawler",
+    "zombie_runner",
+)
+
+
+def _chi_square_critical(df: int, z: float = 3.719) -> float:
+    """Valor crítico chi-cuadrado (p = 1e-4) por Wilson-Hilferty."""
+    k = 2 / (9 * df)
+    return df * (1 - k + z * k**0.5) ** 3
+
+
+def _assert_distribution(table: AliasTable, expected: dict, key, seed=11):
+    """Muestrea la tabla y compara frecuencias con ``expected`` (chi-cuadrado)."""
+    rng = random.Random(seed)
+    counts = Counter(map(key, (table.sample(rng) for _ in range(SAMPLES))))
+    assert set(counts) <= set(expected)
+    chi2 = sum(
+        (counts[item] - SAMPLES * p) ** 2 / (SAMPLES * p)
+        for item, p in expected.items()
+    )
+    assert chi2 < _chi_square_critical(len(expected) - 1), (chi2, counts)
+
+
+def _config(name, rarity, spawn_chance):
+    return SimpleNamespace(name=name, rarity=rarity, spawn_chance=spawn_chance)
+
+
+CONFIGS = [
+    _config("zombie_male", EnemyRarity.NORMAL, 0.8),
+    _config("zombie_female", EnemyRarity.NORMAL, 0.7),
+    _config("zombie_crawler", EnemyRarity.NORMAL, 0.1),
+    _config("zombie_runner", EnemyRarity.RARE, 0.5),
+    _config("zombie_tank", EnemyRarity.ELITE, 1.0),
+    _config("disabled", EnemyRarity.ELITE, 0.0),
+]
+
+
+def test_alias_table_matches_weights():
+    """La tabla reproduce pesos muy desiguales."""
+    weights = {"a": 50.0, "b": 30.0, "c": 15.0, "d": 4.0, "e": 1.0}
+    table = AliasTable(list(weights), list(weights.values()))
+    _assert_distribution(table, {k: w / 100 for k, w in weights.items()}, str)
+
+    single = AliasTable(["solo"], [3.0])
+    assert {single.sample() for _ in range(100)} == {"solo"}
+    with pytest.raises(ValueError):
+        AliasTable(["a", "b"], [0.0, 0.0])
+    with pytest.raises(ValueError):
+        AliasTable([], [])
+
+
+def test_wave_tables_follow_rarity_and_spawn_chance():
+    """Cada oleada mezcla sus rarezas según su peso y la probabilidad de cada tipo."""
+    tables = SpawnTables(CONFIGS, RARITY_WEIGHTS, WAVE_RARITIES)
+    assert tables.for_rarity(EnemyRarity.LEGENDARY) is None
+    assert tables.rarities_for_wave(5) == (EnemyRarity.NORMAL, EnemyRarity.RARE)
+
+    # Oleada 1: solo normales, según su probabilidad de aparición
+    wave_1 = tables.for_wave(1)
+    _assert_distribution(
+        wave_1, {MALE: 0.5, FEMALE: 0.7 / 1.6, CRAWLER: 0.1 / 1.6}, NAME
+    )
+
+    # Oleada 5: normal 0.7 y rara 0.2, renormalizadas
+    normal, rare = 0.7 / 0.9, 0.2 / 0.9
+    _assert_distribution(
+        tables.for_wave(5),
+        {
+            MALE: normal * 0.5,
+            FEMALE: normal * 0.7 / 1.6,
+            CRAWLER: normal * 0.1 / 1.6,
+            RUNNER: rare,
+        },
+        NAME,
+    )
+
+    # Oleada 20: la rareza legendaria no tiene enemigos y no cuenta
+    total = 0.7 + 0.2 + 0.08
+    expected = {
+        MALE: 0.7 / total * 0.5,
+        FEMALE: 0.7 / total * 0.7 / 1.6,
+        CRAWLER: 0.7 / total * 0.1 / 1.6,
+        RUNNER: 0.2 / total,
+        "zombie_tank": 0.08 / total,
+    }
+    _assert_distribution(tables.for_wave(20), expected, NAME)
+    assert tables.for_wave(20) is tables.for_wave(50)
+
+
+class _CountingDatabase:
+    """Base de datos falsa que cuenta las consultas."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def get_all_enemies(self):
+        self.queries += 1
+        return [
+            {"tipo": "zombie_male", "rareza": "normal", "probabilidad_spawn": 0.8},
+            {"tipo": "zombie_runner", "rareza": "rare", "probabilidad_spawn": 0.5},
+        ]
+
+    def get_enemy_data(self, enemy_type):
+        self.queries += 1
+        return None
+
+    def get_enemies_by_rarity(self, rarity):
+        self.queries += 1
+        return []
+
+
+def test_selection_does_not_touch_database():
+    """Tras compilar, elegir enemigo no hace consultas; recompilar hace una."""
+    manager = object.__new__(EnemyTypesManager)
+    manager._config_db = _CountingDatabase()
+    manager.logger = None
+
+    manager.rebuild_spawn_tables()
+    assert manager._config_db.queries == 1
+    names = {manager.get_random_for_wave(8).name for _ in range(2000)}
+    names |= {manager.get_random_enemy().name for _ in range(100)}
+    assert manager.get_random_by_rarity(EnemyRarity.RARE).name == "zombie_runner"
+    assert manager.get_random_by_rarity(EnemyRarity.ELITE) is None
+    assert names == {"zombie_male", "zombie_runner"}
+    assert manager._config_db.queries == 1
+
+    manager.rebuild_spawn_tables()
+    assert manager._config_db.queries == 2
+
+
+if __name__ == "__main__":
+    test_alias_table_matches_weights()
+    test_wave_tables_follow_rarity_and_spawn_chance()
+    test_selection_does_not_touch_database()
+    print("✅ Tablas de aparición OK")
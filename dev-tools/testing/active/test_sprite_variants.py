@@ -0,0 +1,83 @@
+"""
+Prueba de la caché de variantes de sprites
+==========================================
+
+Verifica que las variantes (escala/volteo, destello, tinte, transparencia) se
+generan una vez por (sprite, efectos), que respetan el alfa del sprite, que
+desaparecen con el sprite base y que el parpadeo de invulnerabilidad las usa.
+"""
+
+import gc
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from entities.entity_effects import INVULNERABLE_FLASH, EntityEffectsSystem
+from entities.entity_types import EntityState
+from utils.sprite_variants import SpriteVariantCache, alpha, fit, flash, tint
+
+
+def _sprite():
+    sprite = pygame.Surface((8, 4), pygame.SRCALPHA)
+    sprite.fill((100, 50, 0, 255), (0, 0, 4, 4))
+    return sprite
+
+
+def test_variants_generated_once_and_correct():
+    """Cada combinación se genera una vez y con los colores esperados."""
+    cache = SpriteVariantCache()
+    sprite = _sprite()
+
+    flashed = [cache.get(sprite, fit((16, 8), True), flash()) for _ in range(500)]
+    assert all(variant is flashed[0] for variant in flashed)
+    assert cache.stats == {"hits": 499, "generated": 1}
+    assert flashed[0].get_size() == (16, 8)
+    # Volteado: la parte opaca queda a la derecha, con el alfa intacto
+    assert flashed[0].get_at((1, 1)).a == 0
+    # Mitad del color original y mitad de blanco
+    r, g, b, a = flashed[0].get_at((14, 1))
+    assert abs(r - 177) <= 1 and abs(g - 152) <= 1 and abs(b - 127) <= 1 and a == 255
+
+    assert cache.get(sprite) is sprite
+    assert tuple(cache.get(sprite, tint((255, 0, 255))).get_at((0, 0))) == (
+        100,
+        0,
+        0,
+        255,
+    )
+    assert cache.get(sprite, alpha(128)).get_at((0, 0)).a == 128
+    assert tuple(sprite.get_at((0, 0))) == (100, 50, 0, 255)
+    assert len(cache) == 3
+
+    del sprite, flashed
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_invulnerability_blink_selects_cached_variant(monkeypatch):
+    """El parpadeo y los tintes de estado eligen variantes, sin componer."""
+    entity = SimpleNamespace(state=EntityState.IDLE)
+    effects = EntityEffectsSystem(entity)
+    sprite = _sprite()
+    assert effects.apply_visual_effects(sprite) is sprite
+
+    effects.add_effect("veneno", {"duration": 2.0, "tint": (0, 255, 0)})
+    effects.apply_invulnerability(1.0)
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: 100)
+    assert effects.get_visual_effects() == (tint((0, 255, 0)), INVULNERABLE_FLASH)
+
+    first = effects.apply_visual_effects(sprite)
+    assert all(effects.apply_visual_effects(sprite) is first for _ in range(100))
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: 200)
+    assert effects.get_visual_effects() == (tint((0, 255, 0)),)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,89 @@
+"""
+Prueba del atlas de texturas
+============================
+
+Verifica que el empaquetado no solapa fotogramas, que el atlas guardado se
+carga con una decodificación por hoja y que los fotogramas (subsuperficies)
+conservan los píxeles originales.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.texture_atlas import (
+    TextureAtlasLoader,
+    build_atlas,
+    pack_rects,
+    save_atlas,
+)
+
+
+def _frames(count: int, size: tuple[int, int], seed: int) -> list[pygame.Surface]:
+    rng = random.Random(seed)
+    frames = []
+    for _ in range(count):
+        frame = pygame.Surface(size, pygame.SRCALPHA)
+        frame.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256), 255))
+        pygame.draw.circle(frame, (255, 255, 255, 128), (size[0] // 2, 5), 4)
+        frames.append(frame)
+    return frames
+
+
+def test_pack_rects_no_overlap():
+    """Los rectángulos empaquetados no se solapan y caben en su hoja."""
+    rng = random.Random(7)
+    sizes = [(rng.randint(10, 120), rng.randint(10, 120)) for _ in range(200)]
+    placements = pack_rects(sizes, max_size=512)
+    rects = {}
+    for (w, h), (sheet, x, y) in zip(sizes, placements, strict=True):
+        rect = pygame.Rect(x, y, w, h)
+        assert rect.right <= 512 and rect.bottom <= 512
+        assert rect.collidelist(rects.setdefault(sheet, [])) == -1
+        rects[sheet].append(rect)
+    assert len(rects) > 1
+
+
+def test_atlas_roundtrip():
+    """Hojas guardadas y recargadas: mismos píxeles, una carga por hoja."""
+    pygame.init()
+    animations = {
+        "Idle": _frames(10, (48, 64), 1),
+        "Run": _frames(8, (56, 64), 2),
+        "Dead": _frames(10, (80, 50), 3),
+    }
+    sheets, manifest = build_atlas("prueba", animations, max_size=256)
+    assert len(sheets) < sum(len(f) for f in animations.values()) // 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_atlas(Path(tmp), sheets, manifest)
+        loader = TextureAtlasLoader(Path(tmp))
+        assert loader.has_atlas("prueba")
+
+        for name, originals in animations.items():
+            frames = loader.get_frames("prueba", name)
+            assert len(frames) == len(originals)
+            for original, frame in zip(originals, frames, strict=True):
+                assert frame.get_size() == original.get_size()
+                assert frame.get_parent() is not None
+                for point in ((0, 0), (original.get_width() // 2, 5)):
+                    assert frame.get_at(point) == original.get_at(point)
+
+        assert loader.sheets_loaded == len(sheets)
+        assert loader.get_frames("prueba", "Idle", scale=2.0) is None
+        assert loader.get_frames("inexistente", "Idle") is None
+
+
+if __name__ == "__main__":
+    test_pack_rects_no_overlap()
+    test_atlas_roundtrip()
+    print("✅ Atlas de texturas OK")
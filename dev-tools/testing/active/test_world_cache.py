@@ -0,0 +1,143 @@
+"""
+Prueba de la caché de mundos generados
+======================================
+
+Verifica que un mundo leído de caché es idéntico al generado con las mismas
+semillas, que cambiar los parámetros del generador cambia la clave (y el mundo
+se regenera), que un archivo corrupto se descarta, que la caché usa la carpeta
+de la configuración y que las partidas guardadas conservan la semilla que
+reproduce su mundo.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from core.game_state import GameState
+from scenes.game_scene_preload import (
+    create_world_cache,
+    generate_world_tiles,
+    load_world,
+)
+from utils.seed_set import SeedSet
+from utils.world_cache import WorldCache
+from utils.world_core import WorldCore
+
+# Pantalla pequeña: mundo de 800x600, pocos elementos
+SCREEN = (200, 150)
+
+
+def _records(tiles):
+    return [(t.tile_type, t.sprite_name, t.x, t.y, t.width, t.height) for t in tiles]
+
+
+def _setup():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def test_cached_world_matches_generated(tmp_path):
+    """Primera carga genera y guarda; la segunda lee el mismo mundo del disco."""
+    _setup()
+    cache = WorldCache(tmp_path)
+    generated, width, height = load_world(*SCREEN, SeedSet(5), cache)
+    assert (width, height) == (800, 600) and cache.misses == 1
+    assert len(list(tmp_path.glob("*.sikw"))) == 1
+
+    cached, _, _ = load_world(*SCREEN, SeedSet(5), cache)
+    assert cache.hits == 1
+    assert _records(cached) == _records(generated)
+    assert _records(cached) == _records(
+        generate_world_tiles(*SCREEN, SeedSet(5).rng("world"))[0]
+    )
+    for left, right in zip(cached, generated, strict=True):
+        assert left.sprite.get_size() == right.sprite.get_size()
+        assert left.has_collision() == right.has_collision()
+
+    # Otra semilla, otro archivo
+    load_world(*SCREEN, SeedSet(6), cache)
+    assert cache.misses == 2 and len(list(tmp_path.glob("*.sikw"))) == 2
+
+
+def test_generator_change_invalidates_cache(tmp_path, monkeypatch):
+    """Si cambia un parámetro del generador, la clave cambia y se regenera."""
+    _setup()
+    cache = WorldCache(tmp_path)
+    load_world(*SCREEN, SeedSet(5), cache)
+    original_init = WorldCore.__init__
+
+    def denser(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.element_density *= 2
+
+    monkeypatch.setattr(WorldCore, "__init__", denser)
+    load_world(*SCREEN, SeedSet(5), cache)
+    assert cache.hits == 0 and cache.misses == 2
+    assert len(list(tmp_path.glob("*.sikw"))) == 2
+
+
+def test_corrupt_entry_is_discarded(tmp_path):
+    """Un archivo dañado no se usa: se borra y el mundo se regenera."""
+    _setup()
+    cache = WorldCache(tmp_path, max_entries=1)
+    tiles, _, _ = load_world(*SCREEN, SeedSet(5), cache)
+    (entry,) = tmp_path.glob("*.sikw")
+    entry.write_bytes(entry.read_bytes()[:-8])
+
+    assert cache.load(entry.stem) is None and not entry.exists()
+    regenerated, _, _ = load_world(*SCREEN, SeedSet(5), cache)
+    assert _records(regenerated) == _records(tiles)
+
+    # Límite de entradas: el mundo más antiguo se borra
+    load_world(*SCREEN, SeedSet(6), cache)
+    assert len(list(tmp_path.glob("*.sikw"))) == 1
+
+
+class FakeConfig:
+    """Configuración mínima con la carpeta de caché indicada."""
+
+    def __init__(self, cache_path: str, enabled: bool = True):
+        self.values = {
+            "game": {"cache_mundos": enabled},
+            "paths": {"cache": cache_path},
+        }
+
+    def get(self, section, key, default=None):
+        return self.values.get(section, {}).get(key, default)
+
+
+def test_cache_follows_configured_path(tmp_path):
+    """La caché va a paths.cache/worlds y se puede desactivar."""
+    cache = create_world_cache(FakeConfig(str(tmp_path)))
+    assert cache is not None and cache.directory == tmp_path / "worlds"
+    assert create_world_cache(FakeConfig(str(tmp_path), enabled=False)) is None
+
+
+def test_saved_game_keeps_world_seed():
+    """El estado guardado incluye las semillas; los guardados antiguos no."""
+    state = GameState()
+    state.seeds = SeedSet(1234)
+    data = state.get_state_dict()
+
+    loaded = GameState()
+    loaded.load_state(data)
+    assert loaded.seeds.master == 1234
+    assert loaded.seeds.seed_for("world") == state.seeds.seed_for("world")
+
+    legacy = {key: value for key, value in data.items() if key != "seeds"}
+    previous = loaded.seeds
+    loaded.load_state(legacy)
+    assert loaded.seeds is previous
+
+
+if __name__ == "__main__":
+    import pytest
+
+    sys.exit(pytest.main([__file__, "-q"]))
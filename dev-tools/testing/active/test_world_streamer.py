@@ -0,0 +1,118 @@
+"""
+Prueba del mundo por chunks
+===========================
+
+Verifica que cada chunk sale igual de su semilla y coordenadas sea cual sea el
+orden de carga, que los chunks se cargan poco a poco alrededor del jugador y se
+retiran al alejarse (con memoria acotada), que un chunk retirado se restaura
+idéntico y que la navegación y la cámara funcionan fuera del mundo fijo.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from utils.camera import Camera
+from utils.flow_field import FlowField
+from utils.world_streamer import WorldStreamer
+
+CHUNK = 512
+
+
+def _records(tiles):
+    return [(t.tile_type, t.sprite_name, t.x, t.y, t.width, t.height) for t in tiles]
+
+
+def _streamer(seed: int = 7, **kwargs) -> WorldStreamer:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    return WorldStreamer(seed, 200, 150, chunk_size=CHUNK, **kwargs)
+
+
+def test_chunks_are_deterministic():
+    """Un chunk depende solo de la semilla y sus coordenadas."""
+    first, second = _streamer(), _streamer()
+    first.generate_chunk(0, 0)
+    chunk = first.generate_chunk(-3, 2)
+    assert chunk and _records(chunk) == _records(second.generate_chunk(-3, 2))
+    assert _records(chunk) != _records(_streamer(seed=8).generate_chunk(-3, 2))
+
+    # Dentro del chunk y lejos de su borde: los vecinos no se solapan
+    margin = first.margin
+    for tile in chunk:
+        assert -3 * CHUNK + margin <= tile.x <= -2 * CHUNK - margin
+        assert 2 * CHUNK + margin <= tile.y <= 3 * CHUNK - margin
+
+
+def test_update_loads_nearest_chunks_gradually():
+    """Cada update carga como mucho un chunk, empezando por el del jugador."""
+    streamer = _streamer()
+    assert streamer.update(100, 100)
+    assert list(streamer.chunks) == [(0, 0)]
+    while streamer.update(100, 100):
+        pass
+    assert set(streamer.chunks) == set(streamer.wanted_chunks(100, 100))
+    assert len(streamer.chunks) == 9
+    assert _records(streamer.tiles) == _records(
+        [tile for tiles in streamer.chunks.values() for tile in tiles]
+    )
+    assert streamer.contains(-CHUNK + 1, -CHUNK + 1)
+    assert not streamer.contains(2 * CHUNK, 0)
+    assert streamer.view_bounds(100, 100) == (-CHUNK, -CHUNK, 3 * CHUNK, 3 * CHUNK)
+
+
+def test_far_chunks_are_evicted_and_restored():
+    """Al alejarse los chunks se retiran; al volver se restauran idénticos."""
+    streamer = _streamer(max_stored=4)
+    streamer.update(100, 100, max_new=None)
+    home = _records(streamer.chunks[(0, 0)])
+
+    # Un largo paseo: los chunks cargados y guardados nunca pasan del límite
+    for step in range(40):
+        streamer.update(step * CHUNK / 2, 100, max_new=None)
+        assert len(streamer.chunks) <= (2 * streamer.view_radius + 3) ** 2
+        assert streamer.get_stats()["stored"] <= 4
+    assert (0, 0) not in streamer.chunks and streamer.stats["evicted"] > 0
+
+    # Retirado hace poco: se restaura del guardado, idéntico al generado
+    streamer.update(16 * CHUNK + 100, 100, max_new=None)
+    assert streamer.stats["restored"] > 0
+    assert _records(streamer.chunks[(16, 0)]) == _records(
+        _streamer().generate_chunk(16, 0)
+    )
+
+    # Descartado del guardado: se regenera igual
+    streamer.update(100, 100, max_new=None)
+    assert _records(streamer.chunks[(0, 0)]) == home
+
+
+def test_navigation_and_camera_without_world_bounds():
+    """La rejilla de navegación admite origen negativo y la cámara no se limita."""
+    field = FlowField(640, 640, cell_size=64, origin=(-320, -320))
+    field.set_obstacles(np.array([[-64.0, -320.0, 64.0, 576.0]]))
+    assert field.blocked[:, 4].sum() == 9
+    field.update(200, 0)
+    assert field.sample(-250, 0)[1] > 0  # Rodea el muro por abajo
+    assert field.sample(-1000, 0) is None
+
+    camera = Camera(200, 150, 800, 600)
+    camera.set_unbounded()
+    camera.follow_target(-5000, -5000)
+    camera.clamp_to_world()
+    assert (camera.target_x, camera.target_y) == (-5100, -5075)
+
+
+if __name__ == "__main__":
+    test_chunks_are_deterministic()
+    test_update_loads_nearest_chunks_gradually()
+    test_far_chunks_are_evicted_and_restored()
+    test_navigation_and_camera_without_world_bounds()
+    print("✅ Mundo por chunks OK")
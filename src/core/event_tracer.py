@@ -0,0 +1,72 @@
+"""
+Event Tracer - Traza circular de eventos
+========================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Guarda los últimos eventos de Pygame en un búfer circular sin
+formatear nada mientras se juega. El texto solo se genera al volcar la traza
+(bajo demanda), así que tenerla activa cuesta una inserción por evento.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+
+class EventTracer:
+    """Búfer circular con los últimos eventos recibidos."""
+
+    def __init__(self, capacity: int = 512):
+        """
+        Inicializa la traza.
+
+        Args:
+            capacity: Número máximo de eventos guardados (los más antiguos se descartan)
+        """
+        self.capacity = capacity
+        self._entries: deque[tuple[float, int, pygame.event.Event, bool]] = deque(
+            maxlen=capacity
+        )
+        self.total = 0
+
+    def record(self, frame: int, event: pygame.event.Event, delivered: bool):
+        """
+        Añade un evento a la traza.
+
+        Args:
+            frame: Frame en el que se procesó
+            event: Evento de Pygame
+            delivered: False si se filtró o lo consumió el propio motor
+        """
+        self._entries.append((time.perf_counter(), frame, event, delivered))
+        self.total += 1
+
+    def dump(self) -> list[str]:
+        """Formatea la traza, del evento más antiguo al más reciente."""
+        if not self._entries:
+            return []
+        start = self._entries[0][0]
+        return [
+            f"+{(stamp - start) * 1000:8.2f} ms  frame {frame}  "
+            f"{pygame.event.event_name(event.type)}"
+            f"{'' if delivered else ' (no entregado)'} {event.dict}"
+            for stamp, frame, event, delivered in self._entries
+        ]
+
+    def dump_to_log(self, logger):
+        """Vuelca la traza completa en el log."""
+        lines = self.dump()
+        logger.info(
+            "Traza de eventos: %d de %d eventos recibidos", len(lines), self.total
+        )
+        for line in lines:
+            logger.info("  %s", line)
+
+    def clear(self):
+        """Vacía la traza."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
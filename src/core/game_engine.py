@@ -101,6 +101,11 @@ class GameEngine:
             self.core.clock.tick(self.core.get_fps())
 
         self.logger.info("Saliendo del bucle principal. Limpiando y cerrando...")
+        # Guardar la repetición si la partida se estaba grabando
+        game_scene = self.core.scene_manager.scenes.get("game")
+        if game_scene is not None and hasattr(game_scene, "save_recording"):
+            game_scene.save_recording()
+        self.core.save_manager.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -108,6 +113,8 @@ class GameEngine:
         """Actualiza la lógica del juego."""
         if self.scene_manager:
             self.scene_manager.update()
+        # Callbacks de guardado y backup periódico en segundo plano
+        self.core.save_manager.update()
 
     def _render(self):
         """Renderiza el juego en pantalla."""
@@ -7,10 +7,44 @@ Fecha: 2024
 Descripción: Sistema de eventos y callbacks del motor del juego.
 """
 
+import time
+
 import pygame
 
 from utils.logger import get_logger
 
+from .event_tracer import EventTracer
+
+# Eventos de entrada que una escena puede no querer recibir. El resto (ventana,
+# QUIT, dispositivos, eventos de usuario) llega siempre.
+FILTERABLE_EVENTS = frozenset(
+    {
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.CONTROLLERAXISMOTION,
+        pygame.CONTROLLERBUTTONDOWN,
+        pygame.CONTROLLERBUTTONUP,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+        pygame.MULTIGESTURE,
+    }
+)
+
+# Frames entre registros del coste de eventos
+STATS_LOG_INTERVAL = 300
+
 
 class GameEngineEvents:
     """Sistema de manejo de eventos y callbacks del motor."""
@@ -24,72 +58,134 @@ class GameEngineEvents:
         """
         self.core = core
         self.logger = get_logger("SiK_Game")
-        self._mouse_log_counter = 0
+
+        # Manejadores del motor por tipo de evento; el resto va a la escena
+        self._handlers = {pygame.QUIT: self._handle_quit}
+
+        # Escena cuyos filtros están instalados y tipos que acepta
+        self._filtered_scene = None
+        self._scene_types: frozenset[int] | None = None
+
+        # Traza circular opcional (activa con game.debug), volcable con F12
+        self.tracer: EventTracer | None = None
+        if core.config.get("game", "debug", False):
+            self.tracer = EventTracer()
+            self._handlers[pygame.KEYDOWN] = self._handle_debug_key
+
+        self._frame = 0
+        self.stats = {
+            "frames": 0,
+            "events": 0,
+            "delivered": 0,
+            "undelivered": 0,
+            "last_events": 0,
+            "last_ms": 0.0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+        }
 
     def handle_events(self):
         """Procesa todos los eventos de Pygame."""
-        for event in pygame.event.get():
-            # Solo registrar eventos importantes como INFO, el resto como DEBUG
-            if event.type == pygame.QUIT:  # pylint: disable=no-member
-                self.logger.info("Evento QUIT detectado - Cerrando juego")
-                self.core.running = False
-            elif event.type != pygame.MOUSEMOTION:  # pylint: disable=no-member
-                self.logger.debug("Evento global: %s - %s", event.type, event)
-            # Logging detallado de eventos
-            self._log_event(event)
-
-            if event.type != pygame.QUIT:  # pylint: disable=no-member
-                self.core.scene_manager.handle_event(event)
-
-    def _log_event(self, event: pygame.event.Event):
-        """Registra eventos de Pygame para debug."""
-        if event.type == pygame.MOUSEBUTTONDOWN:  # pylint: disable=no-member
-            self.logger.debug(
-                "MOUSE CLICK: %s en (%s, %s)", event.button, event.pos[0], event.pos[1]
-            )
-        elif event.type == pygame.MOUSEBUTTONUP:  # pylint: disable=no-member
-            self.logger.debug(
-                "MOUSE RELEASE: %s en (%s, %s)",
-                event.button,
-                event.pos[0],
-                event.pos[1],
-            )
-        elif event.type == pygame.MOUSEMOTION:  # pylint: disable=no-member
-            # Solo loggear movimiento cada 10 frames para no saturar
-            self._mouse_log_counter += 1
-            if self._mouse_log_counter % 10 == 0:
-                self.logger.debug("MOUSE MOTION: (%s, %s)", event.pos[0], event.pos[1])
-        elif event.type == pygame.KEYDOWN:  # pylint: disable=no-member
-            self.logger.debug(
-                "KEY DOWN: %s (scancode: %s)",
-                pygame.key.name(event.key),
-                event.scancode,
-            )
-        elif event.type == pygame.KEYUP:  # pylint: disable=no-member
+        start = time.perf_counter()
+        scene = self.core.scene_manager.current_scene
+        if scene is not self._filtered_scene:
+            self._install_filters(scene)
+
+        events = pygame.event.get()
+        handlers = self._handlers
+        tracer = self.tracer
+        delivered = 0
+        for event in events:
+            handler = handlers.get(event.type)
+            if handler is not None:
+                accepted = handler(event, scene)
+            else:
+                accepted = self._dispatch(event, scene)
+            delivered += accepted
+            if tracer is not None:
+                tracer.record(self._frame, event, accepted)
+
+        self._frame += 1
+        self._record_stats(len(events), delivered, time.perf_counter() - start)
+
+    def _install_filters(self, scene):
+        """Bloquea en la cola de Pygame los eventos que la escena no procesa."""
+        self._filtered_scene = scene
+        self._scene_types = getattr(scene, "event_types", None)
+        if self._scene_types is None:
+            pygame.event.set_allowed(list(FILTERABLE_EVENTS))
+            return
+        blocked = FILTERABLE_EVENTS - self._scene_types
+        pygame.event.set_blocked(list(blocked))
+        pygame.event.set_allowed(list(FILTERABLE_EVENTS & self._scene_types))
+        self.logger.debug(
+            "Filtro de eventos para %s: %d tipos bloqueados",
+            scene.__class__.__name__,
+            len(blocked),
+        )
+
+    def _dispatch(self, event: pygame.event.Event, scene) -> bool:
+        """Entrega el evento a la escena activa si lo procesa."""
+        if scene is None:
+            return False
+        types = self._scene_types
+        if types is not None and event.type in FILTERABLE_EVENTS:
+            # Eventos que ya estaban en cola al cambiar de escena
+            if event.type not in types:
+                return False
+        scene.handle_event(event)
+        return True
+
+    def _handle_quit(self, event: pygame.event.Event, scene) -> bool:
+        """Cierra el juego al recibir QUIT (no se reenvía a la escena)."""
+        self.logger.info("Evento QUIT detectado - Cerrando juego")
+        self.core.running = False
+        return False
+
+    def _handle_debug_key(self, event: pygame.event.Event, scene) -> bool:
+        """F12 vuelca la traza de eventos; el resto de teclas va a la escena."""
+        if event.key == pygame.K_F12:
+            self.dump_event_trace()
+            return False
+        return self._dispatch(event, scene)
+
+    def dump_event_trace(self):
+        """Vuelca en el log la traza de eventos recientes (si está activa)."""
+        if self.tracer is None:
+            self.logger.info("Traza de eventos desactivada (game.debug)")
+            return
+        self.tracer.dump_to_log(self.logger)
+
+    def _record_stats(self, count: int, delivered: int, elapsed: float):
+        """Acumula el coste por frame del manejo de eventos."""
+        stats = self.stats
+        elapsed_ms = elapsed * 1000
+        stats["frames"] += 1
+        stats["events"] += count
+        stats["delivered"] += delivered
+        stats["undelivered"] += count - delivered
+        stats["last_events"] = count
+        stats["last_ms"] = elapsed_ms
+        stats["avg_ms"] += (elapsed_ms - stats["avg_ms"]) / stats["frames"]
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        if stats["frames"] % STATS_LOG_INTERVAL == 0:
             self.logger.debug(
-                "KEY UP: %s (scancode: %s)", pygame.key.name(event.key), event.scancode
+                "Eventos: %.3f ms/frame de media (máx %.3f), %d recibidos, %d sin entregar",
+                stats["avg_ms"],
+                stats["max_ms"],
+                stats["events"],
+                stats["undelivered"],
             )
-        elif event.type == pygame.MOUSEWHEEL:  # pylint: disable=no-member
-            self.logger.debug("MOUSE WHEEL: %s en (%s, %s)", event.y, event.x, event.y)
+
+    def get_event_stats(self) -> dict:
+        """Coste por frame del manejo de eventos y eventos entregados a la escena."""
+        return dict(self.stats)
 
     def handle_continue_game(self):
         """Maneja la acción de continuar juego desde el último slot activo."""
         try:
-            # Buscar el save más reciente de los 3 slots
-            saves_info = self.core.save_manager.get_save_files_info()
-            last_save_slot = None
-            last_timestamp = None
-
-            for save_info in saves_info:
-                if save_info.get("exists", False):
-                    timestamp = save_info.get("timestamp")
-                    if timestamp and (
-                        last_timestamp is None or timestamp > last_timestamp
-                    ):
-                        last_timestamp = timestamp
-                        last_save_slot = save_info.get(
-                            "file_number", save_info.get("slot")
-                        )
+            # El índice de slots resuelve el más reciente sin abrir partidas
+            last_save_slot = self.core.save_manager.get_latest_slot()
 
             if last_save_slot:
                 self.logger.info("Continuando juego desde slot: %d", last_save_slot)
@@ -149,7 +245,11 @@ class GameEngineEvents:
     def handle_save_game(self):
         """Maneja el guardado manual desde el menú de pausa."""
         self.logger.info("Guardando partida manualmente en slot activo")
-        self.core.save_manager.save_game()
+        self.core.save_manager.save_game(
+            self.core.game_state,
+            on_complete=lambda _: self.logger.info("Partida guardada"),
+            on_error=lambda e: self.logger.error("Error guardando partida: %s", e),
+        )
 
     def log_and_quit_menu(self):
         """Diferencia el cierre por botón Salir del menú y el cierre de ventana."""
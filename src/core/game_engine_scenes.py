@@ -7,14 +7,18 @@ Fecha: 2024
 Descripción: Configuración de escenas del juego y sus transiciones.
 """
 
+from functools import partial
+
 from scenes.character_select_scene import CharacterSelectScene
 from scenes.game_scene_core import GameScene
+from scenes.game_scene_preload import add_game_scene_tasks
 from scenes.loading_scene import LoadingScene
 from scenes.main_menu_scene import MainMenuScene
 from scenes.options_scene import OptionsScene
 from scenes.pause_scene import PauseScene
 from scenes.slot_selection_scene import SlotSelectionScene
 from utils.logger import get_logger
+from utils.preload_graph import PreloadGraph
 
 
 class GameEngineScenes:
@@ -34,13 +38,21 @@ class GameEngineScenes:
 
     def setup_scenes(self):
         """
-        Configura las escenas iniciales del juego con carga secuencial para mejor UX.
-        Muestra LoadingScene inmediatamente, luego carga las demás en segundo plano.
+        Configura las escenas iniciales del juego con carga real en segundo plano.
+        Muestra LoadingScene inmediatamente; el grafo de precarga construye el
+        mundo y las demás escenas mientras la pantalla de carga sigue respondiendo.
         """
         try:
             self.logger.info("Iniciando configuración de escenas...")
 
-            # PASO 1: Crear y mostrar SOLO LoadingScene primero
+            # PASO 1: Grafo de precarga (recursos del juego + construcción de escenas)
+            graph = PreloadGraph("ScenePreload")
+            add_game_scene_tasks(
+                graph, self.core.screen, self.core.config, self.core.game_state
+            )
+            self._add_scene_tasks(graph)
+
+            # PASO 2: Crear y mostrar LoadingScene, que ejecuta el grafo
             self.logger.info("Creando LoadingScene...")
             loading_scene = LoadingScene(
                 self.core.screen,
@@ -48,152 +60,154 @@ class GameEngineScenes:
                 self.core.game_state,
                 self.core.save_manager,
                 self._on_loading_complete,
+                preload_graph=graph,
             )
-
-            # Añadir solo LoadingScene y mostrarla inmediatamente
             self.core.scene_manager.add_scene("loading", loading_scene)
             self.core.scene_manager.change_scene("loading")
 
-            # IMPORTANTE: Renderizar inmediatamente para que aparezca
-            self.core.screen.fill((0, 0, 0))  # Limpiar pantalla
-            loading_scene.render()
-            import pygame
-
-            pygame.display.flip()  # Mostrar inmediatamente
-
             self.logger.info(
-                "LoadingScene mostrada - iniciando carga de otras escenas..."
+                "LoadingScene mostrada - %d tareas de precarga en curso",
+                len(graph.tasks),
             )
+        except (RuntimeError, ValueError) as e:
+            self.logger.error("Error al configurar escenas: %s", e)
+            raise
 
-            # PASO 2: Crear las demás escenas secuencialmente con progreso real
-            scenes_to_create = [
-                ("MainMenuScene", MainMenuScene),
-                ("GameScene", GameScene),
-                ("PauseScene", PauseScene),
-                ("CharacterSelectScene", CharacterSelectScene),
-                ("SlotSelectionScene", SlotSelectionScene),
-                ("OptionsScene", OptionsScene),
-            ]
-
-            created_scenes = {}
-            total_scenes = len(scenes_to_create)
-
-            for i, (scene_name, scene_class) in enumerate(scenes_to_create):
-                self.logger.info("Creando %s...", scene_name)
-
-                # Actualizar progreso en LoadingScene
-                progress = (i + 1) / total_scenes
-                if hasattr(loading_scene, "core") and hasattr(
-                    loading_scene.core, "update_loading_progress"
-                ):
-                    loading_scene.core.update_loading_progress(progress, i + 1)
-
-                # Crear la escena
-                scene = scene_class(
-                    self.core.screen,
-                    self.core.config,
-                    self.core.game_state,
-                    self.core.save_manager,
-                )
+    def _add_scene_tasks(self, graph: PreloadGraph):
+        """
+        Añade al grafo la construcción y el registro de escenas.
 
-                # Añadir al diccionario
-                scene_key = scene_name.lower().replace("scene", "")
-                if scene_key == "mainmenu":
-                    scene_key = "main_menu"
-                elif scene_key == "characterselect":
-                    scene_key = "character_select"
-                elif scene_key == "slotselection":
-                    scene_key = "slot_selection"
+        Las escenas crean fuentes y superficies, así que se construyen en el hilo
+        principal y después de generar el mundo (ver add_game_scene_tasks).
+        """
+        scenes_to_create = [
+            ("main_menu", MainMenuScene),
+            ("game", GameScene),
+            ("pause", PauseScene),
+            ("character_select", CharacterSelectScene),
+            ("slot_selection", SlotSelectionScene),
+            ("options", OptionsScene),
+        ]
+
+        def create_scene(scene_class, results=None):
+            self.logger.info("Creando %s...", scene_class.__name__)
+            args = (
+                self.core.screen,
+                self.core.config,
+                self.core.game_state,
+                self.core.save_manager,
+            )
+            if results is not None:
+                return scene_class(*args, preloaded=results)
+            return scene_class(*args)
+
+        for scene_key, scene_class in scenes_to_create:
+            if scene_class is GameScene:
+                graph.add(
+                    f"scene_{scene_key}",
+                    lambda r: create_scene(GameScene, r),
+                    deps=[
+                        name for name in graph.tasks if not name.startswith("scene_")
+                    ],
+                    weight=2.0,
+                    main_thread=True,
+                )
+            else:
+                graph.add(
+                    f"scene_{scene_key}",
+                    lambda r, cls=scene_class: create_scene(cls),
+                    deps=("world",),
+                    main_thread=True,
+                )
 
-                created_scenes[scene_key] = scene
+        def rebuild_scene(scene_key, scene_class):
+            # Reconstrucción tras salir de la caché: hay que volver a conectarla
+            scene = create_scene(scene_class)
+            self.connect_scene(scene_key, scene)
+            return scene
 
-            # PASO 3: Añadir las escenas restantes al gestor
+        def register_scenes(results):
             self.logger.info("Registrando escenas en SceneManager...")
-            for scene_key, scene in created_scenes.items():
-                self.core.scene_manager.add_scene(scene_key, scene)
-
-            # PASO 4: Configurar callbacks para transiciones entre escenas
+            for scene_key, scene_class in scenes_to_create:
+                # La escena de juego guarda la partida en curso: no se expulsa
+                factory = None
+                if scene_class is not GameScene:
+                    factory = partial(rebuild_scene, scene_key, scene_class)
+                self.core.scene_manager.add_scene(
+                    scene_key, results[f"scene_{scene_key}"], factory
+                )
             self.logger.info("Configurando transiciones entre escenas...")
             self.setup_scene_transitions()
-
-            # Marcar carga como completa
-            if hasattr(loading_scene, "core") and hasattr(
-                loading_scene.core, "update_loading_progress"
-            ):
-                loading_scene.core.update_loading_progress(1.0, total_scenes)
-
             self.logger.info(
                 "Todas las escenas configuradas correctamente - sistema listo"
             )
-            # Forzar la transición a main_menu y un renderizado inicial
-            self.core.scene_manager.change_scene("main_menu")
-            self.core.scene_manager.update()
-            self.core.scene_manager.render()
-            pygame.display.flip()
-        except RuntimeError as e:
-            self.logger.error("Error al configurar escenas: %s", e)
-            raise
+
+        graph.add(
+            "register_scenes",
+            register_scenes,
+            deps=[f"scene_{scene_key}" for scene_key, _ in scenes_to_create],
+            main_thread=True,
+        )
 
     def setup_scene_transitions(self):
         """
         Configura las transiciones entre escenas y documenta la diferenciación
         de botón Salir y cierre de ventana.
         """
-        try:
-            main_menu_scene = self.core.scene_manager.scenes["main_menu"]
-            slot_selection_scene = self.core.scene_manager.scenes["slot_selection"]
-            options_scene = self.core.scene_manager.scenes["options"]
-            character_select_scene = self.core.scene_manager.scenes["character_select"]
-            pause_scene = self.core.scene_manager.scenes["pause"]
-
-            # Menú principal - callbacks condensados
-            main_callbacks = main_menu_scene.menu_manager.callbacks
-            main_callbacks.on_new_game = lambda: self.core.scene_manager.change_scene(
-                "slot_selection"
-            )
-            main_callbacks.on_continue_game = self.events.handle_continue_game
-            main_callbacks.on_load_game = lambda: self.core.scene_manager.change_scene(
-                "slot_selection"
-            )
-            main_callbacks.on_options = lambda: self.core.scene_manager.change_scene(
-                "options"
-            )
-            main_callbacks.on_exit = self.events.log_and_quit_menu
-
-            # Selección de slots - callbacks condensados
-            slot_callbacks = slot_selection_scene.menu_manager.callbacks
-            slot_callbacks.on_select_slot = self.events.handle_slot_selection
-            slot_callbacks.on_clear_slot = self.events.handle_clear_slot
-            slot_callbacks.on_back_to_main_from_slots = (
-                lambda: self.core.scene_manager.change_scene("main_menu")
-            )
+        for scene_key, scene in self.core.scene_manager.scenes.items():
+            self.connect_scene(scene_key, scene)
+        self.logger.info("Transiciones entre escenas configuradas (flujo avanzado)")
 
-            # Otros callbacks - verificar que menu_manager existe
-            if hasattr(options_scene, "menu_manager") and options_scene.menu_manager:
-                options_scene.menu_manager.callbacks.on_back_to_main = (
-                    lambda: self.core.scene_manager.change_scene("main_menu")
-                )
-            character_select_scene.menu_manager.callbacks.on_character_selected = (
-                self.events.handle_character_selection
-            )
-
-            # Pausa - callbacks condensados
-            pause_callbacks = pause_scene.menu_manager.callbacks
-            pause_callbacks.on_resume_game = (
-                lambda: self.core.scene_manager.change_scene("game")
-            )
-            pause_callbacks.on_save_game = self.events.handle_save_game
-            pause_callbacks.on_main_menu = lambda: self.core.scene_manager.change_scene(
-                "main_menu"
-            )
-            pause_callbacks.on_exit = self.events.log_and_quit_menu
+    def connect_scene(self, scene_key: str, scene):
+        """
+        Conecta los callbacks de una escena con sus transiciones.
 
-            self.logger.info("Transiciones entre escenas configuradas (flujo avanzado)")
+        Se llama al registrar las escenas y cada vez que una escena expulsada
+        de la caché se reconstruye.
+        """
+        change_scene = self.core.scene_manager.change_scene
+        try:
+            if scene_key == "main_menu":
+                # Menú principal - callbacks condensados
+                main_callbacks = scene.menu_manager.callbacks
+                main_callbacks.on_new_game = lambda: change_scene("slot_selection")
+                main_callbacks.on_continue_game = self.events.handle_continue_game
+                main_callbacks.on_load_game = lambda: change_scene("slot_selection")
+                main_callbacks.on_options = lambda: change_scene("options")
+                main_callbacks.on_exit = self.events.log_and_quit_menu
+            elif scene_key == "slot_selection":
+                # Selección de slots - callbacks condensados
+                slot_callbacks = scene.menu_manager.callbacks
+                slot_callbacks.on_select_slot = self.events.handle_slot_selection
+                slot_callbacks.on_clear_slot = self.events.handle_clear_slot
+                slot_callbacks.on_back_to_main_from_slots = lambda: change_scene(
+                    "main_menu"
+                )
+            elif scene_key == "options":
+                # Verificar que menu_manager existe
+                if hasattr(scene, "menu_manager") and scene.menu_manager:
+                    scene.menu_manager.callbacks.on_back_to_main = lambda: change_scene(
+                        "main_menu"
+                    )
+            elif scene_key == "character_select":
+                scene.menu_manager.callbacks.on_character_selected = (
+                    self.events.handle_character_selection
+                )
+            elif scene_key == "pause":
+                # Pausa - callbacks condensados
+                pause_callbacks = scene.menu_manager.callbacks
+                pause_callbacks.on_resume_game = lambda: change_scene("game")
+                pause_callbacks.on_save_game = self.events.handle_save_game
+                pause_callbacks.on_main_menu = lambda: change_scene("main_menu")
+                pause_callbacks.on_exit = self.events.log_and_quit_menu
         except RuntimeError as e:
-            self.logger.error("Error configurando transiciones: %s", e)
+            self.logger.error("Error configurando transiciones de %s: %s", scene_key, e)
 
     def _on_loading_complete(self):
         """Callback cuando la carga está completa."""
+        # La pantalla de carga no se vuelve a usar: se quita antes de cambiar para
+        # que no ocupe sitio en la caché de escenas (sale con exit, no suspend)
+        self.core.scene_manager.remove_scene("loading")
         self.core.scene_manager.change_scene("main_menu")
 
     def _quit_game(self):
@@ -11,6 +11,8 @@ import logging
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from utils.seed_set import SeedSet
+
 if TYPE_CHECKING:
     from .scene_manager import SceneManager
 
@@ -54,6 +56,9 @@ class GameState:
         self.active_slot = 1  # Slot activo por defecto
         self.active_slot = 1  # Slot activo para guardar/cargar
 
+        # Semillas de la simulación (mundo, oleadas, enemigos, powerups)
+        self.seeds = SeedSet()
+
         # Configuración del juego
         self.settings = {
             "sound_enabled": True,
@@ -123,6 +128,8 @@ class GameState:
             "player_name": self.player_name,
             "selected_character": self.selected_character,
             "settings": self.settings,
+            # Con la semilla, cargar la partida reproduce su mundo (ver WorldCache)
+            "seeds": self.seeds.to_dict(),
         }
 
     def set_scene(self, scene_name: str):
@@ -155,6 +162,8 @@ class GameState:
         self.high_score = state_dict.get("high_score", 0)
         self.player_name = state_dict.get("player_name", "Player")
         self.settings = state_dict.get("settings", self.settings)
+        if "seeds" in state_dict:
+            self.seeds = SeedSet.from_dict(state_dict["seeds"])
 
         self.logger.info("Estado del juego cargado")
 
@@ -5,10 +5,16 @@ Scene Manager - Gestor de escenas
 Autor: SiK Team
 Fecha: 2024
 Descripción: Gestiona las diferentes escenas del juego (menú, juego, pausa, etc.).
+Las escenas se preparan por pasos antes de activarse (sin bloquear el frame) y
+las usadas recientemente se mantienen calientes en una caché acotada, con
+``suspend``/``resume`` al salir y volver en lugar de reconstruirlas.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
 
 import pygame
 
@@ -21,6 +27,14 @@ class Scene(ABC):
     Clase base abstracta para todas las escenas del juego.
     """
 
+    # Tipos de evento de entrada que procesa la escena (None: todos). El motor
+    # bloquea el resto en la cola de Pygame mientras la escena está activa.
+    event_types: frozenset[int] | None = None
+
+    # Escenas a las que se suele ir desde esta: el gestor las prepara en
+    # segundo plano al activarla para que la transición sea inmediata.
+    next_scenes: tuple[str, ...] = ()
+
     def __init__(self, screen: pygame.Surface, config: ConfigManager):
         """
         Inicializa la escena.
@@ -48,6 +62,15 @@ class Scene(ABC):
         """Renderiza la escena."""
         pass
 
+    def prepare(self) -> Iterator[float]:
+        """
+        Trabajo de preparación previo a la primera activación, por pasos.
+
+        El gestor avanza el iterador con presupuesto por frame mientras otra
+        escena sigue activa; cada paso devuelve el progreso (0.0 - 1.0).
+        """
+        return iter(())
+
     def enter(self):
         """Se llama cuando se entra en la escena."""
         self.logger.info(f"Entrando en escena: {self.__class__.__name__}")
@@ -56,10 +79,27 @@ class Scene(ABC):
         """Se llama cuando se sale de la escena."""
         self.logger.info(f"Saliendo de escena: {self.__class__.__name__}")
 
+    def suspend(self):
+        """Se sale de la escena pero sigue en caché para volver después."""
+        self.exit()
+
+    def resume(self):
+        """Se vuelve a una escena que seguía en caché (no se reconstruye)."""
+        self.enter()
+
+    def dispose(self):
+        """Se llama al expulsar la escena de la caché; libera sus recursos."""
+        self.logger.debug(f"Liberando escena: {self.__class__.__name__}")
+
 
 class SceneManager:
     """
     Gestiona las diferentes escenas del juego.
+
+    Las escenas se registran ya construidas (``add_scene``) o con una fábrica
+    (``register_scene``). Las que tienen fábrica se pueden expulsar de la caché
+    cuando hay más de ``escenas_en_cache`` construidas y se reconstruyen al
+    prepararlas de nuevo; las que no tienen fábrica nunca se expulsan.
     """
 
     def __init__(self, screen: pygame.Surface, config: ConfigManager):
@@ -77,59 +117,248 @@ class SceneManager:
 
         self.scenes: dict[str, Scene] = {}
         self.current_scene: Scene | None = None
+        self.current_name: str | None = None
         self.next_scene: str | None = None
 
+        # Caché de escenas: orden de uso (la más reciente al final)
+        self.max_cached = config.get("game", "escenas_en_cache", 6)
+        self.prepare_budget_ms = 4.0
+        self._factories: dict[str, Callable[[], Scene]] = {}
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._activated: set[str] = set()
+        self._preparing: dict[str, Iterator[float] | None] = {}
+        self._progress: dict[str, float] = {}
+        self.transitions: deque[tuple[str | None, str, float, bool]] = deque(maxlen=32)
+
         self.logger.info("Gestor de escenas inicializado")
 
-    def add_scene(self, name: str, scene: Scene):
+    def add_scene(
+        self,
+        name: str,
+        scene: Scene,
+        factory: Callable[[], Scene] | None = None,
+    ):
         """
-        Añade una escena al gestor.
+        Añade una escena ya construida al gestor.
 
         Args:
                 name: Nombre identificativo de la escena
                 scene: Instancia de la escena
+                factory: Reconstruye la escena si se expulsa de la caché
+                    (sin fábrica la escena se mantiene siempre)
         """
         self.scenes[name] = scene
+        if factory is not None:
+            self._factories[name] = factory
+        self._progress[name] = 1.0
+        self._touch(name)
         self.logger.info(f"Escena añadida: {name}")
 
+    def register_scene(self, name: str, factory: Callable[[], Scene]):
+        """
+        Registra una escena que se construirá al prepararla o activarla.
+
+        Args:
+                name: Nombre identificativo de la escena
+                factory: Función sin argumentos que construye la escena
+        """
+        self._factories[name] = factory
+        self._progress.setdefault(name, 0.0)
+        self.logger.info(f"Escena registrada (sin construir): {name}")
+
+    def remove_scene(self, name: str):
+        """Elimina una escena que ya no se va a usar (p. ej. la de carga)."""
+        scene = self.scenes.pop(name, None)
+        if scene is not None and scene is not self.current_scene:
+            self._dispose(scene)
+        self._factories.pop(name, None)
+        self._recent.pop(name, None)
+        self._preparing.pop(name, None)
+        self._progress.pop(name, None)
+        self._activated.discard(name)
+
+    def has_scene(self, name: str) -> bool:
+        """Indica si la escena existe, construida o con fábrica."""
+        return name in self.scenes or name in self._factories
+
+    def is_ready(self, name: str) -> bool:
+        """Indica si la escena está construida y preparada."""
+        return name in self.scenes and name not in self._preparing
+
+    def get_prepare_progress(self, name: str) -> float:
+        """Progreso de preparación de una escena (0.0 - 1.0)."""
+        return self._progress.get(name, 0.0)
+
+    def prepare_scene(self, name: str) -> bool:
+        """
+        Empieza a preparar una escena en segundo plano.
+
+        La construcción y los pasos de ``Scene.prepare`` se ejecutan en el hilo
+        principal (crean superficies y fuentes) repartidos entre frames desde
+        ``update``, con ``prepare_budget_ms`` por frame.
+
+        Returns:
+                True si la escena queda lista o en preparación
+        """
+        if not self.has_scene(name):
+            self.logger.error(f"Escena no encontrada: {name}")
+            return False
+        if name not in self.scenes and name not in self._preparing:
+            self._preparing[name] = None
+            self._progress[name] = 0.0
+            self.logger.debug("[SceneManager] Preparando escena: %s", name)
+        self._touch(name)
+        return True
+
+    def _build(self, name: str):
+        """Construye una escena con su fábrica y arranca su preparación."""
+        started = time.perf_counter()
+        scene = self._factories[name]()
+        self.scenes[name] = scene
+        prepare = getattr(scene, "prepare", None)
+        self._preparing[name] = iter(prepare() if prepare else ())
+        self.logger.info(
+            "[SceneManager] Escena %s construida en %.1f ms",
+            name,
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _step(self, name: str) -> bool:
+        """Avanza un paso la preparación; devuelve True al terminar."""
+        steps = self._preparing[name]
+        if steps is None:
+            self._build(name)
+            return False
+        progress = next(steps, None)
+        if progress is None:
+            del self._preparing[name]
+            self._progress[name] = 1.0
+            self._evict()
+            return True
+        self._progress[name] = max(0.0, min(1.0, float(progress)))
+        return False
+
+    def _pump_preparations(self, budget_ms: float):
+        """Avanza las preparaciones pendientes hasta agotar el presupuesto."""
+        if not self._preparing:
+            return
+        deadline = time.perf_counter() + budget_ms / 1000
+        for name in list(self._preparing):
+            while name in self._preparing:
+                self._step(name)
+                if time.perf_counter() >= deadline:
+                    return
+
+    def _finish_preparation(self, name: str):
+        """Termina de inmediato la preparación de una escena (bloqueante)."""
+        if name not in self.scenes and name not in self._preparing:
+            self._preparing[name] = None
+        while name in self._preparing:
+            self._step(name)
+
+    @staticmethod
+    def _dispose(scene):
+        """Libera la escena si define ``dispose``."""
+        dispose = getattr(scene, "dispose", None)
+        if dispose is not None:
+            dispose()
+
+    def _touch(self, name: str):
+        """Marca la escena como usada recientemente."""
+        self._recent[name] = None
+        self._recent.move_to_end(name)
+
+    def _evict(self):
+        """Expulsa las escenas menos usadas si la caché supera su límite."""
+        for name in list(self._recent):
+            if len(self.scenes) <= self.max_cached:
+                return
+            scene = self.scenes.get(name)
+            if (
+                scene is None
+                or scene is self.current_scene
+                or name not in self._factories
+                or name in self._preparing
+            ):
+                continue
+            del self.scenes[name]
+            self._recent.pop(name)
+            self._activated.discard(name)
+            self._progress[name] = 0.0
+            self._dispose(scene)
+            self.logger.info("[SceneManager] Escena expulsada de la caché: %s", name)
+
     def change_scene(self, scene_name: str):
         """
         Cambia a una escena específica.
 
+        Una escena ya preparada se activa sin reconstruirse (``resume`` si ya
+        estuvo activa); si aún no lo está, se termina de preparar aquí.
+
         Args:
                 scene_name: Nombre de la escena a cambiar
         """
-        if scene_name not in self.scenes:
+        if not self.has_scene(scene_name):
             self.logger.error(f"Escena no encontrada: {scene_name}")
             return
 
+        started = time.perf_counter()
+        previous = self.current_name
+        warm = self.is_ready(scene_name)
+        if not warm:
+            self._finish_preparation(scene_name)
+
         self.logger.info(
             f"[SceneManager] Cambio de escena: {self.current_scene} -> {scene_name}"
         )
-        # Cambio inmediato de escena
         if self.current_scene:
-            self.current_scene.exit()
+            # Escenas sin ciclo de vida completo (p. ej. LoadingScene) solo tienen exit
+            leave = self.current_scene.exit
+            if previous in self.scenes:
+                leave = getattr(self.current_scene, "suspend", leave)
+            leave()
 
         self.current_scene = self.scenes[scene_name]
-        self.current_scene.enter()
+        self.current_name = scene_name
+        if scene_name in self._activated:
+            getattr(self.current_scene, "resume", self.current_scene.enter)()
+        else:
+            self._activated.add(scene_name)
+            self.current_scene.enter()
+        self._touch(scene_name)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.transitions.append((previous, scene_name, elapsed_ms, warm))
+        self.logger.info(
+            "Cambiado a escena: %s (%.2f ms, %s)",
+            scene_name,
+            elapsed_ms,
+            "en caché" if warm else "preparada al activar",
+        )
 
-        self.logger.info(f"Cambiado a escena: {scene_name}")
+        for name in getattr(self.current_scene, "next_scenes", ()):
+            if name in self._factories and not self.is_ready(name):
+                self.prepare_scene(name)
+        self._evict()
+
+    def get_transition_stats(self) -> dict:
+        """Tiempos de las últimas transiciones y estado de la caché."""
+        times = [entry[2] for entry in self.transitions]
+        return {
+            "transitions": len(times),
+            "last_ms": times[-1] if times else 0.0,
+            "max_ms": max(times, default=0.0),
+            "cold": sum(1 for entry in self.transitions if not entry[3]),
+            "cached": list(self._recent),
+            "preparing": list(self._preparing),
+        }
 
     def _switch_scene(self):
-        """Realiza el cambio de escena."""
+        """Realiza el cambio de escena pendiente."""
         if self.next_scene is None:
             return
-
-        # Salir de la escena actual
-        if self.current_scene:
-            self.current_scene.exit()
-
-        # Entrar en la nueva escena
-        self.current_scene = self.scenes[self.next_scene]
-        self.current_scene.enter()
-
-        self.logger.info(f"Cambiado a escena: {self.next_scene}")
-        self.next_scene = None
+        scene_name, self.next_scene = self.next_scene, None
+        self.change_scene(scene_name)
 
     def handle_event(self, event: pygame.event.Event):
         """Procesa eventos de Pygame."""
@@ -146,6 +375,7 @@ class SceneManager:
     def update(self):
         """Actualiza la lógica del gestor de escenas."""
         self._switch_scene()
+        self._pump_preparations(self.prepare_budget_ms)
 
         if self.current_scene:
             self.current_scene.update()
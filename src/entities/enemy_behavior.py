@@ -10,7 +10,8 @@ Descripción: Sistema de comportamiento e inteligencia artificial para enemigos.
 import math
 import random
 
-import pygame
+from utils.flow_field import FlowField
+from utils.sim_clock import sim_clock
 
 
 class EnemyBehavior:
@@ -24,26 +25,36 @@ class EnemyBehavior:
             enemy_core: Instancia de EnemyCore con estado básico
         """
         self.core = enemy_core
+        self.patrol_delay = 2000  # milisegundos
+        self.max_tracking_time = 10.0  # Segundos sin contacto visual
+        self.rng = random  # EnemyManager asigna el generador de la partida
+        self.reset()
 
+    def reset(self):
+        """Olvida el patrullaje y el seguimiento (al crear o reutilizar el enemigo)."""
         # IA y patrullaje
         self.patrol_points: list[tuple[float, float]] = []
         self.current_patrol_index = 0
         self.patrol_timer = 0
-        self.patrol_delay = 2000  # milisegundos
 
         # Seguimiento persistente del jugador
         self.last_player_position = None
         self.tracking_timer = 0.0
-        self.max_tracking_time = 10.0  # Segundos sin contacto visual
         self.is_tracking_player = False
 
-    def update(self, dt: float, player_pos: tuple[float, float] | None = None):
+    def update(
+        self,
+        dt: float,
+        player_pos: tuple[float, float] | None = None,
+        flow_field: FlowField | None = None,
+    ):
         """
         Actualiza el comportamiento del enemigo.
 
         Args:
             dt: Delta time en segundos
             player_pos: Posición del jugador (x, y) si está cerca
+            flow_field: Campo de flujo hacia el jugador (rodea obstáculos)
         """
         if self.core.is_dead:
             self.core.update_dead_animation()
@@ -58,13 +69,53 @@ class EnemyBehavior:
         # IA según estado de seguimiento
         if self.is_tracking_player and (player_pos or self.last_player_position):
             target_pos = player_pos if player_pos else self.last_player_position
-            self._chase_player(target_pos, dt)
+            self._chase_player(target_pos, dt, flow_field if player_pos else None)
         else:
             self._patrol(dt)
 
         # Actualizar volteo basado en movimiento
         self.core.update_facing_direction()
 
+    def coarse_update(self, dt: float, player_pos: tuple[float, float] | None = None):
+        """
+        Actualización aproximada para enemigos lejanos (nivel de detalle bajo).
+
+        Sin detección, ataques ni animación: solo sigue desplazándose hacia su
+        objetivo (última posición conocida del jugador o punto de patrulla).
+
+        Args:
+            dt: Tiempo acumulado desde su última actualización, en segundos
+            player_pos: Posición del jugador (no se usa para detectar)
+        """
+        if self.core.is_dead:
+            return
+
+        if self.is_tracking_player and self.last_player_position:
+            self.tracking_timer += dt
+            if self.tracking_timer >= self.max_tracking_time:
+                self.is_tracking_player = False
+                self.last_player_position = None
+                return
+            target = self.last_player_position
+        elif self.patrol_points:
+            target = self.patrol_points[self.current_patrol_index]
+        else:
+            return
+
+        dx = target[0] - self.core.x
+        dy = target[1] - self.core.y
+        distance = math.hypot(dx, dy)
+        step = self.core.speed * dt
+        if distance <= step:
+            self.core.x, self.core.y = target
+            if not self.is_tracking_player:
+                self.current_patrol_index = (self.current_patrol_index + 1) % len(
+                    self.patrol_points
+                )
+        else:
+            self.core.x += dx / distance * step
+            self.core.y += dy / distance * step
+
     def _update_tracking_state(self, player_pos: tuple[float, float] | None, dt: float):
         """Actualiza el estado de seguimiento persistente del jugador."""
         if player_pos and self._is_player_in_range(player_pos):
@@ -92,16 +143,27 @@ class EnemyBehavior:
 
         return distance < detection_range
 
-    def _chase_player(self, player_pos: tuple[float, float], dt: float):
-        """Persigue al jugador calculando dirección y movimiento."""
+    def _chase_player(
+        self,
+        player_pos: tuple[float, float],
+        dt: float,
+        flow_field: FlowField | None = None,
+    ):
+        """Persigue al jugador siguiendo el campo de flujo o en línea recta."""
         dx = player_pos[0] - self.core.x
         dy = player_pos[1] - self.core.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.hypot(dx, dy)
 
         if distance > 0:
-            # Normalizar y aplicar velocidad
-            dx = (dx / distance) * self.core.speed * dt
-            dy = (dy / distance) * self.core.speed * dt
+            # Dirección compartida del campo; en línea recta si no hay camino
+            # o ya está en la celda del jugador
+            direction = (
+                flow_field.sample(self.core.x, self.core.y) if flow_field else None
+            )
+            if direction is None:
+                direction = (dx / distance, dy / distance)
+            dx = direction[0] * self.core.speed * dt
+            dy = direction[1] * self.core.speed * dt
 
             # Mover hacia el jugador
             self.core.x += dx
@@ -148,15 +210,15 @@ class EnemyBehavior:
 
         self.patrol_points = [
             (
-                base_x + random.randint(-patrol_radius, patrol_radius),
-                base_y + random.randint(-patrol_radius, patrol_radius),
+                base_x + self.rng.randint(-patrol_radius, patrol_radius),
+                base_y + self.rng.randint(-patrol_radius, patrol_radius),
             )
             for _ in range(3)
         ]
 
     def _attack_player(self):
         """Ataca al jugador si el cooldown ha terminado."""
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.now_ms()
         if current_time - self.core.last_attack_time >= self.core.attack_cooldown:
             self.core.is_attacking = True
             self.core.current_animation = "Attack"
@@ -10,6 +10,12 @@ Descripción: Núcleo base para enemigos con configuración y estado.
 import pygame
 
 from utils.config_manager import ConfigManager
+from utils.sim_clock import sim_clock
+from utils.sprite_variants import fit, flash, sprite_variants
+
+# Destello al recibir daño
+HIT_FLASH = flash((255, 255, 255), 160)
+HIT_FLASH_MS = 120
 
 
 class EnemyCore:
@@ -34,12 +40,18 @@ class EnemyCore:
         # Cargar configuración desde archivos
         self.config_manager = ConfigManager()
         self._load_enemy_config()
+        # Efecto de escala y volteo por orientación (clave de la caché de variantes)
+        self._fit_effects = {
+            True: fit((self.width, self.height)),
+            False: fit((self.width, self.height), flip_x=True),
+        }
 
         # Estado del enemigo
         self.facing_right = True
         self.is_attacking = False
         self.is_dead = False
         self.target = None
+        self.hit_flash_until = 0
 
         # Sistema de animación
         self.animation_player = animation_manager.create_animation_player(
@@ -89,6 +101,7 @@ class EnemyCore:
     def take_damage(self, damage: int):
         """Recibe daño y actualiza estado."""
         self.health -= damage
+        self.hit_flash_until = sim_clock.now_ms() + HIT_FLASH_MS
         if self.health <= 0:
             self.health = 0
             self.is_dead = True
@@ -117,14 +130,54 @@ class EnemyCore:
         """Método público para actualizar animación de muerte."""
         self._update_dead_animation()
 
+    def release(self):
+        """Devuelve el reproductor de animación al dejar de usarse el enemigo."""
+        self.animation_manager.release_animation_player(self.animation_player)
+        self.animation_player = None
+
+    def reset(self, x: float, y: float):
+        """
+        Devuelve el núcleo al estado de recién creado para reutilizarlo.
+
+        La configuración del tipo se conserva; solo se reinicia el estado.
+
+        Args:
+            x: Nueva posición X
+            y: Nueva posición Y
+        """
+        self.x = x
+        self.y = y
+        self._last_x = x
+        self.health = self.max_health
+        self.facing_right = True
+        self.is_attacking = False
+        self.is_dead = False
+        self.target = None
+        self.hit_flash_until = 0
+        self.last_attack_time = 0
+
+        self.current_animation = "Idle"
+        if self.animation_player is None:
+            self.animation_player = self.animation_manager.create_animation_player(
+                self.enemy_type, "Idle"
+            )
+        else:
+            self.animation_player.reset("Idle")
+
     def get_current_frame(self) -> pygame.Surface | None:
-        """Obtiene el frame actual de la animación con escala y volteo."""
+        """
+        Obtiene el frame actual de la animación con escala, volteo y destello.
+
+        Las variantes salen de la caché compartida: solo se generan la primera
+        vez que se piden para cada frame.
+        """
         frame = self.animation_player.get_current_frame()
-        if frame:
-            frame = pygame.transform.scale(frame, (self.width, self.height))
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-        return frame
+        if not frame:
+            return frame
+        fit_effect = self._fit_effects[self.facing_right]
+        if sim_clock.now_ms() < self.hit_flash_until:
+            return sprite_variants.get(frame, fit_effect, HIT_FLASH)
+        return sprite_variants.get(frame, fit_effect)
 
     def get_rect(self) -> pygame.Rect:
         """Obtiene el rectángulo de colisión."""
@@ -134,7 +187,7 @@ class EnemyCore:
 
     def is_attack_ready(self) -> bool:
         """Verifica si puede atacar según cooldown."""
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.now_ms()
         return current_time - self.last_attack_time >= self.attack_cooldown
 
     def reset_attack_state(self):
@@ -0,0 +1,190 @@
+"""
+Enemy LOD - Nivel de detalle de la IA de enemigos
+=================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Reparte cada tick a los enemigos en niveles según su distancia al
+jugador y si están en pantalla. El nivel cercano ejecuta la IA completa cada
+tick; el medio la ejecuta cada pocos ticks, escalonado entre enemigos; el
+lejano solo desplaza al enemigo de forma aproximada. Cada nivel puede limitar
+cuántos enemigos actualiza por tick (los que no caben esperan al siguiente) y
+el planificador informa de cuántos hay en cada nivel.
+
+Configuración (``enemies.json``, sección ``nivel_detalle_ia``)::
+
+    {"niveles": [
+        {"nombre": "cercano", "distancia": 700, "intervalo": 1},
+        {"nombre": "medio", "distancia": 1600, "intervalo": 4, "presupuesto": 48},
+        {"nombre": "lejano", "intervalo": 15, "presupuesto": 48, "aproximado": true}
+     ],
+     "margen_pantalla": 100}
+"""
+
+from itertools import count
+from math import inf
+from typing import NamedTuple
+
+import numpy as np
+import pygame
+
+from utils.camera import pack_bounds
+
+
+class LODTier(NamedTuple):
+    """Nivel de detalle: hasta qué distancia aplica y cada cuánto se actualiza."""
+
+    name: str
+    max_distance: float = inf
+    interval: int = 1  # Ticks entre actualizaciones
+    budget: int | None = None  # Máximo de actualizaciones por tick
+    coarse: bool = False  # Solo movimiento aproximado, sin IA
+
+
+DEFAULT_TIERS = (
+    LODTier("cercano", 700.0),
+    LODTier("medio", 1600.0, interval=4, budget=48),
+    LODTier("lejano", interval=15, budget=48, coarse=True),
+)
+
+# Paso máximo acumulado (s) que recibe un enemigo al actualizarse
+MAX_LOD_STEP = 0.5
+
+
+def load_tiers(config: dict) -> tuple[LODTier, ...]:
+    """
+    Lee los niveles de la configuración; sin niveles devuelve los de serie.
+
+    El primer nivel siempre se actualiza cada tick sin presupuesto (en él
+    caen los enemigos en pantalla y los muertos) y el último cubre cualquier
+    distancia.
+    """
+    levels = config.get("niveles") or []
+    if not levels:
+        return DEFAULT_TIERS
+    tiers = [
+        LODTier(
+            name=level.get("nombre", f"nivel_{index}"),
+            max_distance=float(level.get("distancia", inf)),
+            interval=max(1, int(level.get("intervalo", 1))),
+            budget=level.get("presupuesto"),
+            coarse=bool(level.get("aproximado", False)),
+        )
+        for index, level in enumerate(levels)
+    ]
+    tiers[0] = tiers[0]._replace(interval=1, budget=None, coarse=False)
+    tiers[-1] = tiers[-1]._replace(max_distance=inf)
+    return tuple(tiers)
+
+
+class EnemyLODScheduler:
+    """Decide cada tick qué enemigos se actualizan y con qué detalle."""
+
+    def __init__(
+        self, tiers: tuple[LODTier, ...] = DEFAULT_TIERS, view_margin: float = 100
+    ):
+        """
+        Inicializa el planificador.
+
+        Args:
+            tiers: Niveles de cercano a lejano
+            view_margin: Margen (px) alrededor de la pantalla que cuenta como visible
+        """
+        self.tiers = tiers
+        self.view_margin = view_margin
+        self._limits = np.array([tier.max_distance**2 for tier in tiers[:-1]])
+        self._phases = count()
+        self.tick = 0
+        self._used = [0] * len(tiers)
+        # Aplazados por presupuesto en el tick anterior: tienen prioridad
+        self._owed = [0] * len(tiers)
+        self._next_owed = [0] * len(tiers)
+        self.stats = {"tiers": dict.fromkeys((t.name for t in tiers), 0)}
+        self.stats.update(updated=0, coarse=0, deferred=0)
+
+    def attach(self, enemy):
+        """Prepara el estado de LOD de un enemigo nuevo o reutilizado."""
+        enemy.lod_tier = 0
+        enemy.lod_phase = next(self._phases)
+        enemy.lod_elapsed = 0.0
+        enemy.lod_deferred = False
+
+    def begin_tick(
+        self,
+        enemies: list,
+        player_pos: tuple[float, float] | None,
+        view_rect: pygame.Rect | None = None,
+    ):
+        """
+        Asigna nivel a cada enemigo para este tick.
+
+        Args:
+            enemies: Enemigos vivos
+            player_pos: Posición del jugador; sin ella todos van al nivel cercano
+            view_rect: Zona visible del mundo (los enemigos en ella, nivel cercano)
+        """
+        self.tick += 1
+        self._used = [0] * len(self.tiers)
+        self._owed, self._next_owed = self._next_owed, [0] * len(self.tiers)
+        self.stats.update(updated=0, coarse=0, deferred=0)
+        if not enemies:
+            self.stats["tiers"] = dict.fromkeys(self.stats["tiers"], 0)
+            return
+
+        if player_pos is None:
+            levels = np.zeros(len(enemies), dtype=np.intp)
+        else:
+            bounds = pack_bounds(enemies)
+            x, y = bounds[:, 0], bounds[:, 1]
+            distance2 = (x - player_pos[0]) ** 2 + (y - player_pos[1]) ** 2
+            levels = np.searchsorted(self._limits, distance2)
+            if view_rect is not None:
+                view = view_rect.inflate(2 * self.view_margin, 2 * self.view_margin)
+                on_screen = (
+                    (x >= view.left) & (x <= view.right)
+                    & (y >= view.top) & (y <= view.bottom)
+                )  # fmt: skip
+                levels[on_screen] = 0
+
+        for enemy, level in zip(enemies, levels.tolist(), strict=True):
+            enemy.lod_tier = level
+        per_tier = np.bincount(levels, minlength=len(self.tiers)).tolist()
+        self.stats["tiers"] = dict(zip(self.stats["tiers"], per_tier, strict=True))
+
+    def due(self, enemy, dt: float) -> LODTier | None:
+        """
+        Acumula ``dt`` en el enemigo y dice si le toca actualizarse este tick.
+
+        Returns:
+            Nivel con el que actualizarlo, o None si espera a otro tick. El
+            paso a usar es ``enemy.lod_elapsed``; tras actualizarlo se llama a
+            ``consume``.
+        """
+        enemy.lod_elapsed += dt
+        level = 0 if enemy.is_dead else enemy.lod_tier
+        tier = self.tiers[level]
+        if not enemy.lod_deferred and (self.tick + enemy.lod_phase) % tier.interval:
+            return None
+        if tier.budget is not None:
+            reserved = 0 if enemy.lod_deferred else self._owed[level]
+            if self._used[level] + reserved >= tier.budget:
+                enemy.lod_deferred = True
+                self._next_owed[level] += 1
+                self.stats["deferred"] += 1
+                return None
+            if enemy.lod_deferred and self._owed[level]:
+                self._owed[level] -= 1
+        self._used[level] += 1
+        self.stats["coarse" if tier.coarse else "updated"] += 1
+        return tier
+
+    def consume(self, enemy) -> float:
+        """Devuelve el paso acumulado del enemigo (acotado) y lo pone a cero."""
+        step = min(enemy.lod_elapsed, MAX_LOD_STEP)
+        enemy.lod_elapsed = 0.0
+        enemy.lod_deferred = False
+        return step
+
+    def get_stats(self) -> dict:
+        """Enemigos por nivel y actualizaciones del último tick."""
+        return {**self.stats, "tiers": dict(self.stats["tiers"])}
@@ -13,8 +13,21 @@ import random
 
 import pygame
 
+from utils.config_manager import ConfigManager
+from utils.flow_field import FlowField
+
 from .enemy_behavior import EnemyBehavior
 from .enemy_core import EnemyCore
+from .enemy_lod import EnemyLODScheduler, load_tiers
+from .enemy_store import EnemyStore
+
+
+def ring_point(
+    x: float, y: float, radius: float, rng: random.Random
+) -> tuple[float, float]:
+    """Punto aleatorio a ``radius`` de (x, y) (apariciones fuera de la vista)."""
+    angle = rng.uniform(0.0, math.tau)
+    return x + math.cos(angle) * radius, y + math.sin(angle) * radius
 
 
 class Enemy:
@@ -24,10 +37,27 @@ class Enemy:
         """Inicializa un enemigo completo."""
         self.core = EnemyCore(x, y, enemy_type, animation_manager)
         self.behavior = EnemyBehavior(self.core)
-
-    def update(self, dt: float, player_pos: tuple[float, float] | None = None):
+        # Posición en EnemyStore.live (-1 si no está vivo en un almacén)
+        self.store_index = -1
+        # Nivel de detalle de IA (lo gestiona EnemyLODScheduler)
+        self.lod_tier = 0
+        self.lod_phase = 0
+        self.lod_elapsed = 0.0
+        self.lod_deferred = False
+
+    def reset(self, x: float, y: float):
+        """Reinicia el enemigo en otra posición para reutilizarlo."""
+        self.core.reset(x, y)
+        self.behavior.reset()
+
+    def update(
+        self,
+        dt: float,
+        player_pos: tuple[float, float] | None = None,
+        flow_field: FlowField | None = None,
+    ):
         """Actualiza el enemigo usando el sistema de comportamiento."""
-        self.behavior.update(dt, player_pos)
+        self.behavior.update(dt, player_pos, flow_field)
 
     # Propiedades delegadas para compatibilidad
     @property
@@ -40,6 +70,11 @@ class Enemy:
         """Obtiene la posición Y del enemigo."""
         return self.core.y
 
+    @property
+    def enemy_type(self) -> str:
+        """Obtiene el tipo del enemigo."""
+        return self.core.enemy_type
+
     @property
     def is_dead(self) -> bool:
         """Verifica si el enemigo está muerto."""
@@ -64,6 +99,10 @@ class Enemy:
         """Delega daño al core."""
         self.core.take_damage(damage)
 
+    def release(self):
+        """Libera los recursos compartidos del enemigo (reproductor de animación)."""
+        self.core.release()
+
     def get_current_frame(self):
         """Delega obtención de frame al core."""
         return self.core.get_current_frame()
@@ -111,32 +150,70 @@ class EnemyManager:
             animation_manager: Gestor de animaciones
         """
         self.animation_manager = animation_manager
-        self.enemies: list[Enemy] = []
+        self.store = EnemyStore(
+            lambda x, y, enemy_type: Enemy(x, y, enemy_type, animation_manager)
+        )
+        # Vista densa de los enemigos vivos (la lista del almacén, sin copias)
+        self.enemies: list[Enemy] = self.store.live
         self.spawn_timer = 0
         self.spawn_delay = 1500  # milisegundos
         self.max_enemies = 8
         self.logger = logging.getLogger("enemy")
 
-    def update(self, dt: float, player_pos: tuple[float, float] | None = None):
+        # Nivel de detalle de la IA según distancia al jugador
+        lod_config = ConfigManager().get_config("enemies").get("nivel_detalle_ia", {})
+        self.lod = EnemyLODScheduler(
+            load_tiers(lod_config), lod_config.get("margen_pantalla", 100)
+        )
+        # Navegación compartida hacia el jugador (la asigna la escena con el mundo)
+        self.navigation: FlowField | None = None
+        # Aparición y patrullas; GameScene asigna el flujo "enemies" de la partida
+        self.rng = random.Random()
+        # Mundo por chunks: aparición a esta distancia del jugador (None: bordes)
+        self.spawn_radius: float | None = None
+
+    def update(
+        self,
+        dt: float,
+        player_pos: tuple[float, float] | None = None,
+        view_rect: pygame.Rect | None = None,
+    ):
         """
         Actualiza todos los enemigos.
 
         Args:
             dt: Delta time en segundos
             player_pos: Posición del jugador
+            view_rect: Zona visible del mundo (sus enemigos, con IA completa)
         """
-        # Actualizar enemigos existentes
-        for enemy in self.enemies[:]:
-            enemy.update(dt, player_pos)
+        self.lod.begin_tick(self.enemies, player_pos, view_rect)
+        if self.navigation is not None and player_pos is not None:
+            self.navigation.update(*player_pos)
+
+        # Actualizar enemigos existentes. Al retirar uno, el último ocupa su
+        # hueco y aún no se ha actualizado: se repite el mismo índice.
+        enemies = self.enemies
+        index = 0
+        while index < len(enemies):
+            enemy = enemies[index]
+            tier = self.lod.due(enemy, dt)
+            if tier is not None:
+                step = self.lod.consume(enemy)
+                if tier.coarse:
+                    enemy.behavior.coarse_update(step, player_pos)
+                else:
+                    enemy.update(step, player_pos, self.navigation)
 
             # Remover enemigos muertos después de un tiempo
             if enemy.is_dead and enemy.core.animation_player.is_animation_completed():
-                self.enemies.remove(enemy)
+                self.store.remove(enemy)
+            else:
+                index += 1
 
         # Generar nuevos enemigos
-        self._spawn_enemies(dt)
+        self._spawn_enemies(dt, player_pos)
 
-    def _spawn_enemies(self, dt: float):
+    def _spawn_enemies(self, dt: float, player_pos: tuple[float, float] | None = None):
         """Genera nuevos enemigos si no se ha alcanzado el máximo."""
         if len(self.enemies) >= self.max_enemies:
             return
@@ -144,36 +221,55 @@ class EnemyManager:
         self.spawn_timer += dt * 1000  # Convertir a milisegundos
 
         if self.spawn_timer >= self.spawn_delay:
-            self._spawn_enemy()
+            self._spawn_enemy(player_pos)
             self.spawn_timer = 0
 
-    def _spawn_enemy(self):
-        """Genera un enemigo en una posición aleatoria en los bordes del mundo."""
+    def _spawn_enemy(self, player_pos: tuple[float, float] | None = None):
+        """
+        Genera un enemigo en una posición aleatoria en los bordes del mundo, o
+        alrededor del jugador si el mundo no tiene bordes (``spawn_radius``).
+        """
+        rng = self.rng
+        if self.spawn_radius is not None and player_pos is not None:
+            x, y = ring_point(*player_pos, self.spawn_radius, rng)
+        else:
+            x, y = self._edge_position(rng)
+
+        enemy_type = rng.choice(["zombiemale", "zombieguirl"])
+
+        try:
+            self.spawn_enemy(enemy_type, x, y)
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Error creando enemigo %s: %s", enemy_type, e)
+
+    @staticmethod
+    def _edge_position(rng: random.Random) -> tuple[float, float]:
+        """Posición aleatoria en los bordes del mundo de tamaño fijo."""
         world_width = 5000
         world_height = 5000
 
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = rng.choice(["top", "bottom", "left", "right"])
 
         if side == "top":
-            x = random.randint(0, world_width)
+            x = rng.randint(0, world_width)
             y = -50
         elif side == "bottom":
-            x = random.randint(0, world_width)
+            x = rng.randint(0, world_width)
             y = world_height + 50
         elif side == "left":
             x = -50
-            y = random.randint(0, world_height)
+            y = rng.randint(0, world_height)
         else:  # right
             x = world_width + 50
-            y = random.randint(0, world_height)
+            y = rng.randint(0, world_height)
+        return x, y
 
-        enemy_type = random.choice(["zombiemale", "zombieguirl"])
-
-        try:
-            new_enemy = Enemy(x, y, enemy_type, self.animation_manager)
-            self.enemies.append(new_enemy)
-        except Exception as e:  # pylint: disable=broad-except
-            self.logger.error("Error creando enemigo %s: %s", enemy_type, e)
+    def spawn_enemy(self, enemy_type: str, x: float, y: float) -> Enemy:
+        """Añade un enemigo (reutilizado si hay uno libre del tipo) y lo devuelve."""
+        enemy = self.store.spawn(enemy_type, x, y)
+        enemy.behavior.rng = self.rng
+        self.lod.attach(enemy)
+        return enemy
 
     def render(self, screen, camera_offset: tuple[float, float] = (0, 0)):
         """Renderiza todos los enemigos."""
@@ -207,8 +303,12 @@ class EnemyManager:
 
     def clear_all_enemies(self):
         """Elimina todos los enemigos."""
-        self.enemies.clear()
+        self.store.clear()
 
     def get_enemy_count(self) -> int:
         """Obtiene el número de enemigos activos."""
         return len(self.enemies)
+
+    def get_lod_stats(self) -> dict:
+        """Enemigos por nivel de detalle y actualizaciones del último tick."""
+        return self.lod.get_stats()
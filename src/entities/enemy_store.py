@@ -0,0 +1,99 @@
+"""
+Enemy Store - Almacén denso de enemigos
+=======================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Mantiene los enemigos vivos contiguos en una lista y los retira
+intercambiándolos con el último (O(1) por baja, sin copiar la lista). Los
+enemigos retirados se guardan en una lista libre por tipo y se reinician al
+volver a pedirlos, en lugar de reconstruir núcleo, comportamiento y
+configuración en cada aparición.
+"""
+
+from collections.abc import Callable, Iterator
+
+
+class EnemyStore:
+    """Enemigos vivos contiguos con bajas O(1) y reciclaje por tipo."""
+
+    def __init__(self, factory: Callable, max_free_per_type: int = 64):
+        """
+        Inicializa el almacén.
+
+        Args:
+            factory: Crea un enemigo nuevo: ``factory(x, y, enemy_type)``
+            max_free_per_type: Enemigos retirados que se guardan por tipo
+        """
+        self.factory = factory
+        self.max_free_per_type = max_free_per_type
+        # Vivos, sin huecos; cada enemigo conoce su posición en ``store_index``
+        self.live: list = []
+        self._free: dict[str, list] = {}
+        self.stats = {"created": 0, "recycled": 0, "removed": 0}
+
+    def spawn(self, enemy_type: str, x: float, y: float):
+        """
+        Añade un enemigo vivo, reutilizando uno retirado del mismo tipo si lo hay.
+
+        Args:
+            enemy_type: Tipo de enemigo
+            x: Posición X
+            y: Posición Y
+
+        Returns:
+            Enemigo añadido
+        """
+        free = self._free.get(enemy_type)
+        if free:
+            enemy = free.pop()
+            enemy.reset(x, y)
+            self.stats["recycled"] += 1
+        else:
+            enemy = self.factory(x, y, enemy_type)
+            self.stats["created"] += 1
+        enemy.store_index = len(self.live)
+        self.live.append(enemy)
+        return enemy
+
+    def remove(self, enemy):
+        """
+        Retira un enemigo vivo: el último ocupa su hueco y él pasa a la lista libre.
+
+        Args:
+            enemy: Enemigo presente en ``live``
+        """
+        index = enemy.store_index
+        last = self.live.pop()
+        if last is not enemy:
+            self.live[index] = last
+            last.store_index = index
+        self._retire(enemy)
+        self.stats["removed"] += 1
+
+    def clear(self):
+        """Retira todos los enemigos vivos."""
+        for enemy in self.live:
+            self._retire(enemy)
+        self.stats["removed"] += len(self.live)
+        self.live.clear()
+
+    def free_count(self, enemy_type: str | None = None) -> int:
+        """Enemigos retirados disponibles (de un tipo o en total)."""
+        if enemy_type is not None:
+            return len(self._free.get(enemy_type, ()))
+        return sum(len(free) for free in self._free.values())
+
+    def _retire(self, enemy):
+        """Libera los recursos del enemigo y lo guarda para reutilizarlo."""
+        enemy.store_index = -1
+        enemy.release()
+        free = self._free.setdefault(enemy.enemy_type, [])
+        if len(free) < self.max_free_per_type:
+            free.append(enemy)
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.live)
@@ -22,6 +22,8 @@ from typing import Any
 from utils.config_database import ConfigDatabase
 from utils.database_manager import DatabaseManager
 
+from .spawn_tables import SpawnTables
+
 
 class EnemyRarity(Enum):
     """Rareza de los enemigos."""
@@ -42,6 +44,23 @@ class EnemyBehavior(Enum):
     BOSS = "boss"
 
 
+# Peso relativo de cada rareza al elegir enemigo
+RARITY_WEIGHTS = {
+    EnemyRarity.NORMAL: 0.7,  # 70%
+    EnemyRarity.RARE: 0.2,  # 20%
+    EnemyRarity.ELITE: 0.08,  # 8%
+    EnemyRarity.LEGENDARY: 0.02,  # 2%
+}
+
+# Rarezas disponibles por rango de oleadas
+WAVE_RARITIES = (
+    (range(1, 4), (EnemyRarity.NORMAL,)),
+    (range(4, 7), (EnemyRarity.NORMAL, EnemyRarity.RARE)),
+    (range(7, 11), (EnemyRarity.NORMAL, EnemyRarity.RARE, EnemyRarity.ELITE)),
+    (range(11, 100), tuple(RARITY_WEIGHTS)),
+)
+
+
 @dataclass
 class EnemyConfig:
     """Configuración de un tipo de enemigo."""
@@ -67,6 +86,7 @@ class EnemyTypesManager:
 
     _instance = None
     _config_db = None
+    _spawn_tables: SpawnTables | None = None
 
     def __new__(cls):
         """Singleton para evitar múltiples conexiones a la base de datos."""
@@ -125,21 +145,63 @@ class EnemyTypesManager:
         else:
             return list(self._get_fallback_data().keys())
 
+    def get_all_configs(self) -> list[EnemyConfig]:
+        """
+        Obtiene la configuración de todos los enemigos con una sola consulta.
+
+        Returns:
+            Lista de EnemyConfig (los de fallback si no hay base de datos)
+        """
+        if self._config_db:
+            try:
+                return [
+                    self._convert_to_config(enemy_data)
+                    for enemy_data in self._config_db.get_all_enemies()
+                ]
+            except Exception as e:
+                self.logger.error(f"Error obteniendo configuraciones: {e}")
+        return [
+            config
+            for config in map(self._get_fallback_config, self._get_fallback_data())
+            if config
+        ]
+
+    def get_spawn_tables(self) -> SpawnTables:
+        """Tablas de aparición compiladas (se construyen la primera vez)."""
+        if self._spawn_tables is None:
+            self._spawn_tables = SpawnTables(
+                self.get_all_configs(), RARITY_WEIGHTS, WAVE_RARITIES
+            )
+        return self._spawn_tables
+
+    def rebuild_spawn_tables(self) -> SpawnTables:
+        """Recompila las tablas de aparición (al empezar oleadas o cambiar config)."""
+        self._spawn_tables = None
+        return self.get_spawn_tables()
+
     def get_random_by_rarity(self, rarity: EnemyRarity) -> EnemyConfig | None:
         """Obtiene un enemigo aleatorio de una rareza específica."""
-        configs = self.get_by_rarity(rarity)
-        if configs:
-            total_chance = sum(config.spawn_chance for config in configs)
-            rand = random.uniform(0, total_chance)
-            current = 0
-            for config in configs:
-                current += config.spawn_chance
-                if rand <= current:
-                    return config
-        return None
+        table = self.get_spawn_tables().for_rarity(rarity)
+        return table.sample() if table else None
+
+    def get_random_for_wave(
+        self, wave: int, rng: random.Random | None = None
+    ) -> EnemyConfig | None:
+        """Obtiene un enemigo aleatorio entre las rarezas de una oleada."""
+        table = self.get_spawn_tables().for_wave(wave)
+        return table.sample(rng) if table else None
 
     def get_by_rarity(self, rarity: EnemyRarity) -> list[EnemyConfig]:
         """Obtiene todos los enemigos de una rareza específica."""
+        if self._config_db:
+            try:
+                # Filtro indexado por rareza: solo se decodifican los candidatos
+                rows = self._config_db.get_enemies_by_rarity(rarity.value)
+                configs = [self.get_enemy_config(row["tipo"]) for row in rows]
+                return [config for config in configs if config]
+            except Exception as e:
+                self.logger.error(f"Error obteniendo enemigos {rarity.value}: {e}")
+
         all_types = self.get_all_enemy_types()
         configs = []
         for enemy_type in all_types:
@@ -150,21 +212,9 @@ class EnemyTypesManager:
 
     def get_random_enemy(self) -> EnemyConfig:
         """Obtiene un enemigo aleatorio basado en probabilidades de rareza."""
-        rarity_chances = {
-            EnemyRarity.NORMAL: 0.7,  # 70%
-            EnemyRarity.RARE: 0.2,  # 20%
-            EnemyRarity.ELITE: 0.08,  # 8%
-            EnemyRarity.LEGENDARY: 0.02,  # 2%
-        }
-
-        rand = random.random()
-        current = 0
-        for rarity, chance in rarity_chances.items():
-            current += chance
-            if rand <= current:
-                result = self.get_random_by_rarity(rarity)
-                if result:
-                    return result
+        table = self.get_spawn_tables().for_rarities(tuple(RARITY_WEIGHTS))
+        if table:
+            return table.sample()
 
         # Fallback al enemigo normal
         return self._get_fallback_config("zombie_male") or self._create_default_config()
@@ -172,9 +222,13 @@ class EnemyTypesManager:
     def _convert_to_config(self, enemy_data: dict[str, Any]) -> EnemyConfig:
         """Convierte datos de la base de datos a EnemyConfig."""
         stats = enemy_data.get("stats", {})
+        try:
+            rarity = EnemyRarity(enemy_data.get("rareza", "normal"))
+        except ValueError:
+            rarity = EnemyRarity.NORMAL
         return EnemyConfig(
             name=enemy_data.get("tipo", "unknown"),
-            rarity=EnemyRarity.NORMAL,  # Por defecto, puede expandirse
+            rarity=rarity,
             behavior=EnemyBehavior.CHASE,  # Por defecto, puede expandirse
             health=stats.get("vida", 50),
             speed=stats.get("velocidad", 80),
@@ -184,7 +238,7 @@ class EnemyTypesManager:
             color=(200, 100, 100),  # Rojo por defecto
             symbol="Z",  # Zombie por defecto
             size=32,  # Tamaño por defecto
-            spawn_chance=1.0,  # Por defecto
+            spawn_chance=float(enemy_data.get("probabilidad_spawn", 1.0)),
         )
 
     def _get_fallback_config(self, enemy_type: str) -> EnemyConfig | None:
@@ -281,5 +335,17 @@ class EnemyTypes:
         """Obtiene un enemigo aleatorio de una rareza específica."""
         return _enemy_manager.get_random_by_rarity(rarity)
 
+    @classmethod
+    def get_random_for_wave(
+        cls, wave: int, rng: random.Random | None = None
+    ) -> EnemyConfig | None:
+        """Obtiene un enemigo aleatorio para una oleada."""
+        return _enemy_manager.get_random_for_wave(wave, rng)
+
+    @classmethod
+    def rebuild_spawn_tables(cls) -> SpawnTables:
+        """Recompila las tablas de aparición."""
+        return _enemy_manager.rebuild_spawn_tables()
+
     # Configuraciones estáticas para compatibilidad inmediata
     ZOMBIE_NORMAL = _enemy_manager._create_default_config()
@@ -1,4 +1,12 @@
-"""Entity Core - Clase Base Refactorizada."""
+"""
+Entity Core - Clase Base Refactorizada.
+
+El estado base va en ``__slots__`` y los componentes opcionales (sistemas de
+efectos y renderizado, rectángulo de colisión, dirección) se crean la primera
+vez que se usan. El logger y la configuración por defecto son de la clase. Las
+subclases que declaran sus propios ``__slots__`` (proyectiles, powerups) no
+tienen ``__dict__``; el resto conserva atributos libres como antes.
+"""
 
 import logging
 from abc import ABC, abstractmethod
@@ -14,6 +22,32 @@ from .entity_types import EntityState, EntityStats, EntityType
 class Entity(ABC):
     """Clase base abstracta para todas las entidades del juego."""
 
+    __slots__ = (
+        "entity_type",
+        "x",
+        "y",
+        "width",
+        "height",
+        "stats",
+        "state",
+        "velocity",
+        "collision_enabled",
+        "_direction",
+        "_collision_rect",
+        "_effects_system",
+        "_rendering_system",
+    )
+
+    # Configuración por defecto compartida (solo lectura)
+    config: Any = {"game": {"debug": False}}
+    logger = logging.getLogger("Entity")
+
+    def __init_subclass__(cls, **kwargs):
+        """Un logger por clase (no por instancia), salvo que la clase defina el suyo."""
+        super().__init_subclass__(**kwargs)
+        if "logger" not in cls.__dict__:
+            cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(
         self,
         entity_type: EntityType,
@@ -32,21 +66,51 @@ class Entity(ABC):
 
         # Estado y movimiento
         self.state = EntityState.IDLE
-        self.direction = pygame.math.Vector2(0, 0)  # pylint: disable=c-extension-no-member
+        self._direction = None
         self.velocity = pygame.math.Vector2(0, 0)  # pylint: disable=c-extension-no-member
 
         # Colisiones
-        self.collision_rect = pygame.Rect(x, y, width, height)
+        self._collision_rect = None
         self.collision_enabled = True
 
-        # Sistemas modulares
-        self.effects_system = EntityEffectsSystem(self)
-        self.rendering_system = EntityRenderingSystem(self)
+        # Sistemas modulares (se crean al primer uso)
+        self._effects_system = None
+        self._rendering_system = None
 
-        # Logging y config
-        self.logger = logging.getLogger(f"{self.__class__.__name__}")
         self.logger.debug("Entidad %s creada en (%s, %s)", entity_type.value, x, y)
-        self.config = {"game": {"debug": False}}
+
+    @property
+    def effects_system(self) -> EntityEffectsSystem:
+        """Sistema de efectos de la entidad (se crea al primer uso)."""
+        if self._effects_system is None:
+            self._effects_system = EntityEffectsSystem(self)
+        return self._effects_system
+
+    @property
+    def rendering_system(self) -> EntityRenderingSystem:
+        """Sistema de renderizado de la entidad (se crea al primer uso)."""
+        if self._rendering_system is None:
+            self._rendering_system = EntityRenderingSystem(self)
+        return self._rendering_system
+
+    @property
+    def direction(self) -> pygame.math.Vector2:  # pylint: disable=c-extension-no-member
+        """Dirección normalizada del último movimiento."""
+        if self._direction is None:
+            self._direction = pygame.math.Vector2(0, 0)  # pylint: disable=c-extension-no-member
+        return self._direction
+
+    @direction.setter
+    def direction(self, value: pygame.math.Vector2):  # pylint: disable=c-extension-no-member
+        """Establece la dirección."""
+        self._direction = value
+
+    @property
+    def collision_rect(self) -> pygame.Rect:
+        """Rectángulo de colisión reutilizable (se crea al primer uso)."""
+        if self._collision_rect is None:
+            self._collision_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._collision_rect
 
     @property
     def position(self) -> tuple[float, float]:
@@ -73,13 +137,18 @@ class Entity(ABC):
     @property
     def is_invulnerable(self) -> bool:
         """Verifica si la entidad es invulnerable."""
-        return self.effects_system.is_invulnerable
+        if self._effects_system is None:
+            return self.state == EntityState.INVULNERABLE
+        return self._effects_system.is_invulnerable
 
     def update(self, delta_time: float):
         """Actualiza la entidad."""
         self._update_position(delta_time)
-        self.rendering_system.update_animation(delta_time)
-        self.effects_system.update_effects(delta_time)
+        # Sin sistema creado no hay animación ni efectos que avanzar
+        if self._rendering_system is not None:
+            self._rendering_system.update_animation(delta_time)
+        if self._effects_system is not None:
+            self._effects_system.update_effects(delta_time)
         self._update_logic(delta_time)
 
     def _update_position(self, delta_time: float):
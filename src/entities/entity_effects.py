@@ -8,13 +8,18 @@ Descripción: Gestión de efectos, invulnerabilidad y estados especiales para en
 """
 
 import logging
-import time
 from typing import Any
 
 import pygame
 
+from utils.sim_clock import sim_clock
+from utils.sprite_variants import Effect, flash, sprite_variants, tint
+
 from .entity_types import EntityState
 
+# Destello blanco del parpadeo de invulnerabilidad
+INVULNERABLE_FLASH = flash((255, 255, 255), 128)
+
 
 class EntityEffectsSystem:
     """Sistema de gestión de efectos para entidades."""
@@ -59,7 +64,7 @@ class EntityEffectsSystem:
             for effect_name in effects_to_remove:
                 del self.effects[effect_name]
         elif hasattr(self.effects, "update_effects"):
-            current_time = time.time()
+            current_time = sim_clock.now()
             self.effects.update_effects(current_time)
 
     def _update_invulnerability(self, delta_time: float):
@@ -136,23 +141,36 @@ class EntityEffectsSystem:
 
         return True
 
-    def render_visual_effects(
-        self, screen: pygame.Surface, x: float, y: float, width: int, height: int
-    ):
+    def get_visual_effects(self) -> tuple[Effect, ...]:
         """
-        Renderiza efectos visuales.
+        Efectos visuales activos, como claves de la caché de variantes.
 
-        Args:
-            screen: Superficie de renderizado
-            x, y: Posición
-            width, height: Dimensiones
+        Los efectos con ``"tint"`` en sus datos tiñen el sprite; durante la
+        invulnerabilidad el sprite parpadea con un destello blanco.
         """
+        effects = ()
+        if isinstance(self.effects, dict):
+            effects = tuple(
+                tint(effect_data["tint"])
+                for effect_data in self.effects.values()
+                if "tint" in effect_data
+            )
         # Efecto de invulnerabilidad (parpadeo)
         if self.is_invulnerable and int(pygame.time.get_ticks() / 100) % 2:
-            overlay = pygame.Surface((width, height))
-            overlay.set_alpha(128)
-            overlay.fill((255, 255, 255))
-            screen.blit(overlay, (x, y))
+            effects += (INVULNERABLE_FLASH,)
+        return effects
+
+    def apply_visual_effects(self, sprite: pygame.Surface) -> pygame.Surface:
+        """
+        Selecciona la variante del sprite con los efectos activos.
+
+        Args:
+            sprite: Sprite base del frame actual
+
+        Returns:
+            Variante cacheada, o el mismo sprite si no hay efectos
+        """
+        return sprite_variants.get(sprite, *self.get_visual_effects())
 
     def get_effects_data(self) -> dict[str, Any]:
         """Obtiene datos de efectos para guardado."""
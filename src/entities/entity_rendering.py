@@ -71,6 +71,12 @@ class EntityRenderingSystem:
         if not current_sprite:
             return
 
+        # Variante precalculada con los efectos visuales (tinte, parpadeo)
+        if hasattr(self.entity, "effects_system"):
+            current_sprite = self.entity.effects_system.apply_visual_effects(
+                current_sprite
+            )
+
         # Usar coordenadas de pantalla si se proporcionan, sino usar posición del mundo
         if camera_offset != (0, 0):
             render_x = camera_offset[0]
@@ -88,12 +94,6 @@ class EntityRenderingSystem:
         # Renderizar sprite centrado
         screen.blit(current_sprite, (centered_x, centered_y))
 
-        # Renderizar efectos visuales
-        if hasattr(self.entity, "effects_system"):
-            self.entity.effects_system.render_visual_effects(
-                screen, centered_x, centered_y, sprite_width, sprite_height
-            )
-
         # Debug: mostrar rectángulo de colisión
         self._render_debug_info(
             screen, centered_x, centered_y, sprite_width, sprite_height
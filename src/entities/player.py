@@ -7,12 +7,11 @@ Fecha: 30 de Julio, 2025
 Descripción: Fachada que mantiene API original delegando a módulos especializados.
 """
 
-from typing import Any
-
-import pygame
+from typing import Any, NamedTuple
 
 from utils.animation_manager import IntelligentAnimationManager
 from utils.config_manager import ConfigManager
+from utils.input_manager import InputSnapshot
 
 from .entity import Entity, EntityType
 from .player_core import PlayerCore
@@ -20,6 +19,13 @@ from .player_integration import PlayerIntegration
 from .player_movement import PlayerMovement
 
 
+class VelocityVector(NamedTuple):
+    """Vector de velocidad con atributos x e y para compatibilidad."""
+
+    x: float
+    y: float
+
+
 class Player(Entity):
     """
     Fachada del jugador que mantiene API original delegando a módulos especializados.
@@ -54,8 +60,8 @@ class Player(Entity):
             entity_type=EntityType.PLAYER,
             x=x,
             y=y,
-            width=100,
-            height=100,
+            width=PlayerCore.SPRITE_SIZE[0],
+            height=PlayerCore.SPRITE_SIZE[1],
             stats=self.core.stats,
         )
 
@@ -84,18 +90,14 @@ class Player(Entity):
         """
         Obtiene el frame actual del sprite del jugador.
 
+        Las variantes se precalculan al tamaño final al cargar el personaje:
+        no se voltea, copia ni escala nada por frame.
+
         Returns:
             pygame.Surface: Surface del sprite actual del jugador
         """
-        # Actualizar sprite antes de devolverlo
         self.core.update_sprite()
-        sprite = self.core.sprite
-
-        # **CRÍTICO: Asegurar tamaño correcto del sprite**
-        if sprite and sprite.get_size() != (self.width, self.height):
-            sprite = pygame.transform.scale(sprite, (self.width, self.height))
-
-        return sprite
+        return self.core.sprite
 
     @property
     def current_animation_state(self):
@@ -160,16 +162,7 @@ class Player(Entity):
     @property
     def velocity(self):
         """Vector de velocidad (compatibilidad con Entity)."""
-        vel_x, vel_y = self.movement.get_velocity()
-
-        # Crear objeto con atributos x e y para compatibilidad
-        class VelocityVector:
-            """Vector de velocidad con atributos x e y para compatibilidad."""
-
-            def __init__(self, x, y):
-                self.x, self.y = x, y
-
-        return VelocityVector(vel_x, vel_y)
+        return VelocityVector(*self.movement.get_velocity())
 
     @velocity.setter
     def velocity(self, value):
@@ -183,14 +176,9 @@ class Player(Entity):
                 "velocity debe tener atributos x, y o ser una tupla/lista de 2 elementos"
             )
 
-    def handle_input(
-        self,
-        keys: pygame.key.ScancodeWrapper,
-        mouse_pos: tuple[int, int],
-        mouse_buttons: tuple[bool, bool, bool],
-    ):
-        """Maneja la entrada del usuario."""
-        return self.movement.handle_input(keys, mouse_pos, mouse_buttons, self.effects)
+    def handle_input(self, snapshot: InputSnapshot):
+        """Maneja la entrada del usuario (instantánea del tick)."""
+        return self.movement.handle_input(snapshot, self.effects)
 
     def attack(self, target_pos: tuple[int, int], enemies: list[Any]):
         """Ejecuta el ataque actual."""
@@ -5,6 +5,8 @@ Player Core - Núcleo del sistema de jugador
 Autor: SiK Team
 Fecha: 30 de Julio, 2025
 Descripción: Núcleo del sistema de jugador con configuración y estado base.
+Al cargar el personaje se precalculan todas las variantes (animación, frame,
+orientación) al tamaño final de dibujado; por frame solo se consultan.
 """
 
 import logging
@@ -38,6 +40,9 @@ class PlayerCore:
     Maneja la inicialización, configuración y estado fundamental.
     """
 
+    # Tamaño final con el que se dibuja el jugador
+    SPRITE_SIZE = (100, 100)
+
     def __init__(
         self,
         x: float,
@@ -66,6 +71,8 @@ class PlayerCore:
         # Configuración del mundo (más grande que la pantalla)
         self.world_width = 5000  # Mundo 5 veces más ancho que la pantalla
         self.world_height = 5000  # Mundo 5 veces más alto que la pantalla
+        # False en el mundo por chunks: no hay límites que respetar
+        self.world_bounded = True
 
         # Estado del jugador
         self.current_animation_state = AnimationState.IDLE
@@ -85,9 +92,15 @@ class PlayerCore:
             character_name
         )
 
+        # Variantes precalculadas: (animación, mira a la derecha) -> frames
+        self.frame_variants = self._build_frame_variants(self.animations)
+        self._fallback_sprites = {
+            facing: self._create_fallback_sprite(facing) for facing in (True, False)
+        }
+
         # Configurar sprite inicial
-        self.sprite = None
-        self._create_fallback_sprite()
+        self.sprite = self._fallback_sprites[self.facing_right]
+        self.update_sprite()
 
         self.logger.info("PlayerCore %s inicializado en (%s, %s)", character_name, x, y)
 
@@ -138,36 +151,82 @@ class PlayerCore:
         # Estadísticas por defecto genéricas
         return PlayerStats()
 
-    def _create_fallback_sprite(self):
+    def _build_frame_variants(
+        self, animations: dict | None
+    ) -> dict[tuple[str, bool], list[pygame.Surface]]:
+        """
+        Escala y voltea una sola vez todos los frames del personaje.
+
+        Returns:
+            (animación, mira a la derecha) -> frames al tamaño SPRITE_SIZE
+        """
+        variants = {}
+        convert = pygame.display.get_surface() is not None
+        for name, animation_data in (animations or {}).items():
+            frames = (animation_data or {}).get("frames") or []
+            right = []
+            for frame in frames:
+                if frame.get_size() != self.SPRITE_SIZE:
+                    frame = pygame.transform.scale(frame, self.SPRITE_SIZE)
+                right.append(frame.convert_alpha() if convert else frame)
+            if right:
+                variants[(name, True)] = right
+                variants[(name, False)] = [
+                    pygame.transform.flip(frame, True, False) for frame in right
+                ]
+        return variants
+
+    def _create_fallback_sprite(self, facing_right: bool) -> pygame.Surface:
         """Crea un sprite de fallback si no se pueden cargar las animaciones."""
         try:
             # Crear sprite de fallback con el tamaño correcto
-            self.sprite = pygame.Surface((100, 100))  # Tamaño actual del jugador
-            self.sprite.fill((0, 255, 0))  # Verde para el jugador
+            sprite = pygame.Surface(self.SPRITE_SIZE)
+            sprite.fill((0, 255, 0))  # Verde para el jugador
 
             # Añadir un borde
-            pygame.draw.rect(self.sprite, (0, 200, 0), (0, 0, 100, 100), 2)
+            pygame.draw.rect(sprite, (0, 200, 0), (0, 0, 100, 100), 2)
 
             # Añadir un punto central
-            pygame.draw.circle(self.sprite, (255, 255, 255), (50, 50), 8)
+            pygame.draw.circle(sprite, (255, 255, 255), (50, 50), 8)
 
             # Añadir indicador de dirección
-            if self.facing_right:
+            if facing_right:
                 # Flecha apuntando a la derecha
                 pygame.draw.polygon(
-                    self.sprite, (255, 255, 255), [(60, 40), (80, 50), (60, 60)]
+                    sprite, (255, 255, 255), [(60, 40), (80, 50), (60, 60)]
                 )
             else:
                 # Flecha apuntando a la izquierda
                 pygame.draw.polygon(
-                    self.sprite, (255, 255, 255), [(40, 40), (20, 50), (40, 60)]
+                    sprite, (255, 255, 255), [(40, 40), (20, 50), (40, 60)]
                 )
+            return sprite
 
         except (OSError, RuntimeError) as e:
             self.logger.error("Error creando sprite de fallback: %s", e)
             # Crear sprite mínimo
-            self.sprite = pygame.Surface((32, 32))
-            self.sprite.fill((255, 0, 0))  # Rojo como último recurso
+            sprite = pygame.Surface((32, 32))
+            sprite.fill((255, 0, 0))  # Rojo como último recurso
+            return sprite
+
+    def get_frame(
+        self, animation: str, frame_index: int, facing_right: bool
+    ) -> pygame.Surface:
+        """
+        Variante precalculada de un frame (sin crear superficies).
+
+        Args:
+            animation: Nombre de la animación
+            frame_index: Índice del frame (se envuelve con el número de frames)
+            facing_right: Orientación del jugador
+
+        Returns:
+            Frame listo para dibujar, o el sprite de fallback de esa orientación
+        """
+        frames = self.frame_variants.get((animation, facing_right))
+        if not frames:
+            return self._fallback_sprites[facing_right]
+        return frames[frame_index % len(frames)]
 
     def get_animation_state(self) -> AnimationState:
         """Determina el estado de animación actual."""
@@ -179,34 +238,12 @@ class PlayerCore:
             return AnimationState.IDLE
 
     def update_sprite(self):
-        """Actualiza el sprite del jugador incluyendo el volteo horizontal."""
-        if self.animations and self.current_animation_state.value in self.animations:
-            animation_data = self.animations[self.current_animation_state.value]
-            if (
-                animation_data
-                and "frames" in animation_data
-                and animation_data["frames"]
-            ):
-                # Obtener el frame actual de la animación
-                frames = animation_data["frames"]
-                if frames:
-                    # Usar el frame actual basado en el índice
-                    current_frame_index = self.current_frame_index % len(frames)
-                    base_sprite = frames[current_frame_index]
-
-                    # Aplicar volteo horizontal si es necesario
-                    if not self.facing_right:
-                        self.sprite = pygame.transform.flip(base_sprite, True, False)
-                    else:
-                        self.sprite = (
-                            base_sprite.copy()
-                        )  # Copia para evitar modificar el original
-                else:
-                    self._create_fallback_sprite()
-            else:
-                self._create_fallback_sprite()
-        else:
-            self._create_fallback_sprite()
+        """Selecciona el sprite actual entre las variantes precalculadas."""
+        self.sprite = self.get_frame(
+            self.current_animation_state.value,
+            self.current_frame_index,
+            self.facing_right,
+        )
 
     def update_animation_timing(self, delta_time: float):
         """
@@ -262,6 +299,8 @@ class PlayerCore:
 
     def clamp_position(self):
         """Mantiene al jugador dentro de los límites del mundo con margen apropiado."""
+        if not self.world_bounded:
+            return
         # Cargar configuración de mundo desde gameplay.json
         gameplay_config = self.config.get_config("gameplay")
         mundo_config = gameplay_config.get("mundo", {}) if gameplay_config else {}
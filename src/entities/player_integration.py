@@ -8,13 +8,13 @@ Descripción: Integración del jugador con stats, effects, combat y otros sistem
 """
 
 import logging
-import time
 from typing import Any
 
 import pygame
 import pygame.mixer
 
 from entities.powerup import PowerupEffect
+from utils.sim_clock import sim_clock
 
 from .attack_configuration import AttackConfig
 from .entity import EntityState
@@ -69,7 +69,7 @@ class PlayerIntegration:
         Returns:
             Lista de resultados del ataque
         """
-        current_time = time.time()
+        current_time = sim_clock.now()
 
         # Obtener ataque activo
         if not self.attack_configs:
@@ -146,7 +146,7 @@ class PlayerIntegration:
         Args:
             powerup_effect: Efecto del powerup
         """
-        current_time = time.time()
+        current_time = sim_clock.now()
         self.effects.apply_powerup(powerup_effect, current_time)
 
     def has_effect(self, effect_type) -> bool:
@@ -155,7 +155,7 @@ class PlayerIntegration:
 
     def get_effect_remaining_time(self, effect_type) -> float:
         """Obtiene el tiempo restante de un efecto."""
-        current_time = time.time()
+        current_time = sim_clock.now()
         return self.effects.get_effect_remaining_time(effect_type, current_time)
 
     def get_active_effects(self) -> dict:
@@ -169,7 +169,7 @@ class PlayerIntegration:
         Args:
             delta_time: Tiempo transcurrido desde el último frame
         """
-        current_time = time.time()
+        current_time = sim_clock.now()
         self.effects.update_effects(current_time)
 
     def get_integration_data(self) -> dict[str, Any]:
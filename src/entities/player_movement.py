@@ -7,9 +7,8 @@ Fecha: 30 de Julio, 2025
 Descripción: Sistema de movimiento, input handling y animaciones del jugador.
 """
 
-import pygame
-
 from entities.powerup import PowerupType
+from utils.input_manager import InputAction, InputSnapshot
 
 from .entity import EntityState
 from .player_core import AnimationState, PlayerCore
@@ -40,41 +39,24 @@ class PlayerMovement:
         self.is_attacking = False
 
         # Cache para optimización
-        self._last_mouse_pos = (0, 0)
+        self._last_aim_x = 0.0
         self._last_animation_state = None
 
-    def handle_input(
-        self,
-        keys: pygame.key.ScancodeWrapper,
-        mouse_pos: tuple[int, int],
-        mouse_buttons: tuple[bool, bool, bool],
-        player_effects,
-    ):
+    def handle_input(self, snapshot: InputSnapshot, player_effects):
         """
         Maneja la entrada del usuario.
 
         Args:
-            keys: Estado de las teclas
-            mouse_pos: Posición del ratón
-            mouse_buttons: Estado de los botones del ratón
+            snapshot: Instantánea de entrada del tick (InputManager.sample)
             player_effects: Sistema de efectos del jugador
         """
-        # Reiniciar velocidad
-        self.velocity_x = 0
-        self.velocity_y = 0
-
         # Determinar dirección del personaje basada en el ratón
-        self._update_facing_direction(mouse_pos)
-
-        # Movimiento con WASD
-        if keys[119] or keys[273]:  # W or UP
-            self.velocity_y = -self.player_core.stats.speed
-        if keys[115] or keys[274]:  # S or DOWN
-            self.velocity_y = self.player_core.stats.speed
-        if keys[97] or keys[276]:  # A or LEFT
-            self.velocity_x = -self.player_core.stats.speed
-        if keys[100] or keys[275]:  # D or RIGHT
-            self.velocity_x = self.player_core.stats.speed
+        self._update_facing_direction(snapshot.aim_x)
+
+        # Movimiento por ejes: teclado (-1, 0, 1) o stick analógico
+        speed = self.player_core.stats.speed
+        self.velocity_x = snapshot.move_x * speed
+        self.velocity_y = snapshot.move_y * speed
 
         # Aplicar modificadores de velocidad por efectos
         speed_boost = (
@@ -86,28 +68,24 @@ class PlayerMovement:
             self.velocity_x *= 1 + speed_boost
             self.velocity_y *= 1 + speed_boost
 
-        # Manejar ataque con clic izquierdo
-        self._handle_attack_input(mouse_buttons[0])
+        # Manejar ataque (clic izquierdo, teclado o gamepad)
+        self._handle_attack_input(snapshot.is_down(InputAction.ATTACK))
 
-    def _update_facing_direction(self, mouse_pos: tuple[int, int]):
+    def _update_facing_direction(self, aim_x: float):
         """
         Actualiza la dirección del personaje basada en la posición del ratón.
 
         Args:
-            mouse_pos: Posición del ratón en la pantalla (coordenadas de pantalla)
+            aim_x: Posición horizontal del ratón relativa al centro de la pantalla
         """
         # Solo actualizar si la posición del ratón cambió significativamente (optimización)
-        if abs(mouse_pos[0] - getattr(self, "_last_mouse_x", 0)) > 5:
-            self._last_mouse_x = mouse_pos[0]
-
-            # Obtener centro de la pantalla para calcular dirección relativa
-            # El mouse_pos ya viene en coordenadas de pantalla
-            screen_center_x = 640  # Mitad de 1280px (pantalla)
+        if abs(aim_x - self._last_aim_x) > 5:
+            self._last_aim_x = aim_x
 
             # Determinar dirección horizontal basada en la mitad de la pantalla
-            if mouse_pos[0] > screen_center_x:
+            if aim_x > 0:
                 new_facing = True  # Mirando a la derecha
-            elif mouse_pos[0] < screen_center_x:
+            elif aim_x < 0:
                 new_facing = False  # Mirando a la izquierda
             else:
                 return  # Mantener dirección actual si está en el centro exacto
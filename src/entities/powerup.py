@@ -23,11 +23,29 @@ class Powerup(Entity):
     """
     Powerup que mejora temporalmente al jugador (FACHADA).
     Mantiene 100% compatibilidad con API original.
+
+    Entidad ligera: sin ``__dict__``; configuración y efectos son servicios
+    compartidos por todos los powerups.
     """
 
+    __slots__ = (
+        "powerup_type",
+        "renderer",
+        "config",
+        "sprite",
+        "float_offset",
+        "float_speed",
+        "debug",
+    )
+
     # Configuración para compatibilidad
     POWERUP_CONFIGS = PowerupConfiguration.POWERUP_CONFIGS
 
+    logger = logging.getLogger(__name__)
+    # Servicios sin estado por powerup, compartidos
+    config_manager = PowerupConfiguration()
+    effects_manager = PowerupEffects()
+
     def __init__(self, x: float, y: float, powerup_type: PowerupType):
         """
         Inicializa un powerup modular.
@@ -53,11 +71,8 @@ class Powerup(Entity):
         )
 
         self.powerup_type = powerup_type
-        self.logger = logging.getLogger(__name__)
 
         # Inicializar módulos especializados
-        self.config_manager = PowerupConfiguration()
-        self.effects_manager = PowerupEffects()
         self.renderer = PowerupRenderer(powerup_type, self.width, self.height)
 
         # Propiedades para compatibilidad
@@ -124,18 +139,21 @@ class Powerup(Entity):
         return self.config_manager.get_symbol(self.powerup_type)
 
     @classmethod
-    def create_random(cls, x: float, y: float) -> "Powerup":
+    def create_random(
+        cls, x: float, y: float, rng: random.Random | None = None
+    ) -> "Powerup":
         """
         Crea un powerup aleatorio.
 
         Args:
             x: Posición X
             y: Posición Y
+            rng: Generador aleatorio (por defecto, el del módulo ``random``)
 
         Returns:
             Powerup aleatorio
         """
-        powerup_type = random.choice(list(PowerupType))
+        powerup_type = (rng or random).choice(list(PowerupType))
         return cls(x, y, powerup_type)
 
     @classmethod
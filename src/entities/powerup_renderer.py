@@ -18,6 +18,9 @@ from .powerup_types import PowerupConfiguration, PowerupType
 class PowerupRenderer:
     """Manejador de renderizado de powerups."""
 
+    # Sprites por (tipo, ancho, alto): se dibujan una vez y se comparten
+    _sprites: dict[tuple[PowerupType, int, int], pygame.Surface] = {}
+
     def __init__(self, powerup_type: PowerupType, width: int = 30, height: int = 30):
         """
         Inicializa el renderizador de powerup.
@@ -42,7 +45,17 @@ class PowerupRenderer:
         self._setup_sprite()
 
     def _setup_sprite(self):
-        """Configura el sprite del powerup."""
+        """Configura el sprite del powerup (compartido por tipo y tamaño)."""
+        key = (self.powerup_type, self.width, self.height)
+        self.sprite = self._sprites.get(key)
+        if self.sprite is not None:
+            return
+        self._build_sprite()
+        if self.sprite is not None:
+            self._sprites[key] = self.sprite
+
+    def _build_sprite(self):
+        """Dibuja el sprite del powerup."""
         try:
             # Crear superficie con transparencia
             self.sprite = pygame.Surface((self.width, self.height))
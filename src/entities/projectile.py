@@ -20,8 +20,16 @@ from .entity import Entity, EntityStats, EntityType
 class Projectile(Entity):
     """
     Representa un proyectil disparado por el jugador.
+
+    Entidad ligera: sin ``__dict__`` y con el sprite compartido por tamaño.
     """
 
+    __slots__ = ("config", "velocity_x", "velocity_y", "alive", "sprite")
+
+    logger = logging.getLogger(__name__)
+    # Sprite compartido por (ancho, alto): se carga una sola vez del disco
+    _sprites: dict[tuple[int, int], pygame.Surface] = {}
+
     def __init__(
         self,
         x: float,
@@ -63,7 +71,6 @@ class Projectile(Entity):
         )
 
         self.config = config
-        self.logger = logging.getLogger(__name__)
 
         # Velocidad y dirección
         self.velocity_x = dx * speed
@@ -80,22 +87,32 @@ class Projectile(Entity):
         )
 
     def _setup_sprite(self):
-        """Configura el sprite del proyectil."""
+        """Configura el sprite del proyectil (compartido entre proyectiles)."""
+        size = (self.width, self.height)
+        sprite = self._sprites.get(size)
+        if sprite is None:
+            sprite = self._sprites[size] = self._load_sprite(size)
+        self.sprite = sprite
+
+    @staticmethod
+    def _load_sprite(size: tuple[int, int]) -> pygame.Surface:
+        """Carga el sprite de proyectil o crea uno por defecto."""
         try:
             # Intentar cargar sprite de proyectil
             sprite_path = "assets/objects/proyectiles/Explosion_1.png"
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-        except (FileNotFoundError, OSError, ValueError):
+            sprite = pygame.image.load(sprite_path).convert_alpha()
+            return pygame.transform.scale(sprite, size)
+        except (FileNotFoundError, OSError, ValueError, pygame.error):
             # Crear sprite por defecto
-            self.sprite = pygame.Surface((self.width, self.height))
-            self.sprite.fill((255, 255, 0))  # Amarillo para proyectiles
+            sprite = pygame.Surface(size)
+            sprite.fill((255, 255, 0))  # Amarillo para proyectiles
             pygame.draw.circle(
-                self.sprite,
+                sprite,
                 (255, 255, 0),
-                (self.width // 2, self.height // 2),
-                self.width // 2,
+                (size[0] // 2, size[1] // 2),
+                size[0] // 2,
             )
+            return sprite
 
     def _update_logic(self, delta_time: float):
         """Actualiza la lógica del proyectil."""
@@ -8,11 +8,11 @@ Descripción: Sistema especializado para la creación y gestión de proyectiles.
 """
 
 import math
-import time
 
 from entities.powerup import PowerupType
 from entities.projectile import Projectile
 from utils.config_manager import ConfigManager
+from utils.sim_clock import sim_clock
 
 
 class ProjectileSystem:
@@ -26,7 +26,7 @@ class ProjectileSystem:
 
     def can_shoot(self) -> bool:
         """Verifica si el jugador puede disparar."""
-        current_time = time.time()
+        current_time = sim_clock.now()
         return current_time - self.last_shoot_time >= self.shoot_cooldown
 
     def create_projectiles(
@@ -42,7 +42,7 @@ class ProjectileSystem:
         if not self.can_shoot():
             return []
 
-        current_time = time.time()
+        current_time = sim_clock.now()
         projectiles = []
 
         # Crear proyectil base
@@ -0,0 +1,103 @@
+"""
+Spawn Tables - Tablas de aparición precompiladas
+===============================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Compila una sola vez las configuraciones de enemigos en tablas de
+alias (utils.alias_table) por rareza y por oleada. El peso de cada enemigo en
+una oleada es el peso de su rareza (renormalizado entre las rarezas con
+enemigos disponibles en esa oleada) por su probabilidad de aparición dentro de
+la rareza. Elegir enemigo es O(1) y no consulta la base de datos; las tablas
+se reconstruyen al empezar las oleadas o al cambiar la configuración.
+"""
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+
+from utils.alias_table import AliasTable
+
+
+class SpawnTables:
+    """Tablas de alias de configuraciones de enemigos por rareza y oleada."""
+
+    def __init__(
+        self,
+        configs: Iterable,
+        rarity_weights: Mapping[Hashable, float],
+        wave_rarities: Sequence[tuple[range, tuple]],
+    ):
+        """
+        Compila las tablas.
+
+        Args:
+            configs: Configuraciones con ``rarity`` y ``spawn_chance``
+            rarity_weights: Peso relativo de cada rareza
+            wave_rarities: Pares (rango de oleadas, rarezas disponibles)
+        """
+        self.rarity_weights = dict(rarity_weights)
+        self.wave_rarities = tuple(wave_rarities)
+        self.by_rarity: dict[Hashable, AliasTable] = {}
+
+        grouped: dict[Hashable, list] = {}
+        for config in configs:
+            if config.spawn_chance > 0:
+                grouped.setdefault(config.rarity, []).append(config)
+        for rarity, members in grouped.items():
+            self.by_rarity[rarity] = AliasTable(
+                members, [config.spawn_chance for config in members]
+            )
+
+        self._by_rarities: dict[tuple, AliasTable | None] = {}
+        self._by_wave: dict[int, AliasTable | None] = {}
+        # Compilar ya las combinaciones conocidas: muestrear no construye nada
+        for _, rarities in self.wave_rarities:
+            self.for_rarities(rarities)
+        self.for_rarities(tuple(self.rarity_weights))
+
+    def rarities_for_wave(self, wave: int) -> tuple:
+        """Rarezas disponibles en una oleada (la primera del mapa si no encaja)."""
+        for waves, rarities in self.wave_rarities:
+            if wave in waves:
+                return tuple(rarities)
+        return tuple(self.wave_rarities[0][1]) if self.wave_rarities else ()
+
+    def for_rarity(self, rarity) -> AliasTable | None:
+        """Tabla de una rareza, o None si no tiene enemigos."""
+        return self.by_rarity.get(rarity)
+
+    def for_rarities(self, rarities: tuple) -> AliasTable | None:
+        """
+        Tabla combinada de varias rarezas, o None si ninguna tiene enemigos.
+
+        Args:
+            rarities: Rarezas a combinar
+        """
+        key = tuple(rarities)
+        if key in self._by_rarities:
+            return self._by_rarities[key]
+
+        present = [
+            rarity
+            for rarity in key
+            if rarity in self.by_rarity and self.rarity_weights.get(rarity, 0) > 0
+        ]
+        table = None
+        if present:
+            total = sum(self.rarity_weights[rarity] for rarity in present)
+            items, weights = [], []
+            for rarity in present:
+                share = self.rarity_weights[rarity] / total
+                members = self.by_rarity[rarity]
+                items.extend(members.items)
+                weights.extend(
+                    share * probability for probability in members.probabilities()
+                )
+            table = AliasTable(items, weights)
+        self._by_rarities[key] = table
+        return table
+
+    def for_wave(self, wave: int) -> AliasTable | None:
+        """Tabla de una oleada (se resuelve una vez por número de oleada)."""
+        if wave not in self._by_wave:
+            self._by_wave[wave] = self.for_rarities(self.rarities_for_wave(wave))
+        return self._by_wave[wave]
@@ -9,6 +9,7 @@ Descripción: Sistema de tiles para elementos del escenario como árboles, rocas
 
 import logging
 import random
+import threading
 from enum import Enum
 
 import pygame
@@ -84,6 +85,10 @@ class Tile(Entity):
         },
     }
 
+    # Fuentes de símbolos compartidas por tamaño (ver get_symbol_font)
+    _symbol_fonts: dict[int, pygame.font.Font] = {}
+    _font_lock = threading.Lock()
+
     def __init__(
         self,
         x: float,
@@ -153,10 +158,41 @@ class Tile(Entity):
             self.sprite = pygame.Surface((self.width, self.height))
             self.sprite.fill((128, 128, 128))
 
+    @classmethod
+    def get_symbol_font(cls, size: int) -> pygame.font.Font:
+        """
+        Fuente de símbolos compartida por tamaño.
+
+        Crear una fuente por tile abre el archivo de fuente cientos de veces al
+        generar el mundo; además, FreeType no permite crear fuentes desde varios
+        hilos a la vez, así que se crean una sola vez (ver ``preload_symbol_fonts``).
+        """
+        with cls._font_lock:
+            font = cls._symbol_fonts.get(size)
+            if font is None:
+                font = pygame.font.Font(None, size)
+                cls._symbol_fonts[size] = font
+            return font
+
+    @classmethod
+    def preload_symbol_fonts(cls) -> int:
+        """
+        Crea las fuentes de símbolos de todos los tipos de tile.
+
+        Debe llamarse desde el hilo principal antes de generar el mundo en segundo
+        plano, para que el hilo de generación solo renderice con fuentes ya creadas.
+
+        Returns:
+            Número de fuentes disponibles en caché
+        """
+        for config in cls.TILE_CONFIGS.values():
+            cls.get_symbol_font(min(config["width"], config["height"]) // 2)
+        return len(cls._symbol_fonts)
+
     def _add_symbol(self):
         """Añade un símbolo al sprite según el tipo de tile."""
         try:
-            font = pygame.font.Font(None, min(self.width, self.height) // 2)
+            font = self.get_symbol_font(min(self.width, self.height) // 2)
             symbol = self.config["symbol"]
             text = font.render(symbol, True, (255, 255, 255))
 
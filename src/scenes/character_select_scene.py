@@ -15,6 +15,8 @@ from .character_ui import CharacterUI
 class CharacterSelectScene(Scene):
     """Escena de selección de personaje jugable (Refactorizada V2)."""
 
+    next_scenes = ("game",)
+
     def __init__(self, screen, config, game_state, save_manager):
         super().__init__(screen, config)
         self.game_state = game_state
@@ -1,7 +1,10 @@
 """Game Scene Core - Núcleo de la Escena Principal"""
 
+import math
 import os
-import random
+import time
+import zlib
+from array import array
 
 import pygame
 
@@ -12,14 +15,19 @@ from entities.projectile import Projectile
 from ui.hud import HUD
 from utils.animation_manager import IntelligentAnimationManager
 from utils.asset_manager import AssetManager
-from utils.camera import Camera
+from utils.camera import Camera, pack_bounds
 from utils.config_manager import ConfigManager
+from utils.flow_field import FlowField
+from utils.input_manager import InputManager
 from utils.logger import get_logger
+from utils.replay import Replay
+from utils.sim_clock import sim_clock
 from utils.simple_desert_background import SimpleDesertBackground
-from utils.world_generator import WorldGenerator
+from utils.world_streamer import WorldStreamer
 
 from .game_scene_collisions import GameSceneCollisions
 from .game_scene_powerups import GameScenePowerups
+from .game_scene_preload import create_world_cache, load_world, load_world_config
 from .game_scene_render import GameSceneRenderer
 from .game_scene_waves import GameSceneWaves
 
@@ -27,29 +35,74 @@ from .game_scene_waves import GameSceneWaves
 class GameScene(Scene):
     """Núcleo de la escena principal del juego. Delegación a submódulos."""
 
+    # Teclado, botones y gamepad; ratón y sticks se leen en InputManager.sample
+    event_types = frozenset(
+        {
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.JOYBUTTONDOWN,
+            pygame.JOYBUTTONUP,
+        }
+    )
+
+    next_scenes = ("pause",)
+
+    # Aparición del jugador (y centro de la zona sin elementos del mundo por chunks)
+    spawn_position = (2500, 2500)
+
     def __init__(
-        self, screen: pygame.Surface, config: ConfigManager, game_state, save_manager
+        self,
+        screen: pygame.Surface,
+        config: ConfigManager,
+        game_state,
+        save_manager,
+        preloaded: dict | None = None,
     ):
-        """Inicializa la escena principal del juego."""
+        """
+        Inicializa la escena principal del juego.
+
+        Args:
+            preloaded: Resultados del grafo de precarga (ver game_scene_preload);
+                lo que falte se construye aquí de forma síncrona
+        """
         super().__init__(screen, config)
+        preloaded = preloaded or {}
         self.game_state = game_state
         self.save_manager = save_manager
         self.scene_manager = None  # Definición explícita del atributo
         self.is_paused = False  # Estado de pausa
         self.logger = get_logger("SiK_Game")
         self.logger.info("[GameScene] Escena de nivel inicializada (núcleo)")
+        # Semillas y reloj de la partida: con la misma entrada, la misma partida
+        self.seeds = game_state.seeds
+        sim_clock.reset()
         # Inicialización de entidades y managers
-        self.asset_manager = AssetManager()
-        self.animation_manager = IntelligentAnimationManager(self.asset_manager)
+        self.asset_manager = preloaded.get("asset_manager") or AssetManager()
+        self.animation_manager = preloaded.get(
+            "animation_manager"
+        ) or IntelligentAnimationManager(self.asset_manager)
         self.player = None
-        self.enemy_manager = EnemyManager(self.animation_manager)
+        self.enemy_manager = preloaded.get("enemy_manager") or EnemyManager(
+            self.animation_manager
+        )
+        self.enemy_manager.rng = self.seeds.rng("enemies")
         self.projectiles: list[Projectile] = []
         self.powerups = []
         self.tiles = []
-        self.hud = HUD(screen, config, game_state)
+        # Mundo por chunks (None: mundo de tamaño fijo generado entero)
+        self.world_streamer: WorldStreamer | None = None
+        self._navigation_chunk: tuple[int, int] | None = None
+        self.hud = preloaded.get("hud") or HUD(screen, config, game_state)
+        gamepad_config = (config.get_input_config() or {}).get("gamepad", {})
+        self.input = InputManager(deadzone=gamepad_config.get("deadzone", 0.1))
+        self.input.gamepad_enabled = gamepad_config.get("habilitado", True)
+        self.recorder: Replay | None = None
+        self.recording_path: str | None = None
 
         # Configuración del mundo desde gameplay.json
-        self._load_world_config()
+        self._load_world_config(preloaded.get("world_config"))
 
         self.camera = Camera(
             screen_width=screen.get_width(),
@@ -75,11 +128,14 @@ class GameScene(Scene):
         self.powerup_spawn_timer = 0
         self.powerup_spawn_delay = 10000
         self.powerup_spawn_chance = 0.3
-        self.background = None
+        self.background = preloaded.get("background")
 
-        self._generate_world()
-        self._load_background()
+        self._generate_world(preloaded.get("world"))
+        if self.background is None:
+            self._load_background()
         self._initialize_player()
+        if self.world_streamer is not None and self.player:
+            self.player.core.world_bounded = False
 
         # Integración de submódulos
         self.waves = GameSceneWaves(self)
@@ -89,38 +145,22 @@ class GameScene(Scene):
         self.logger.info(
             "[GameScene] Submódulos integrados: waves, powerups, collisions, render"
         )
+        if config.get("game", "grabar_repeticion", False):
+            self.start_recording()
 
-    def _load_world_config(self):
-        """Carga la configuración del mundo desde gameplay.json."""
-        try:
-            gameplay_config = self.config_manager.get_config("gameplay")
-            world_config = gameplay_config.get("escenario", {}).get("mundo", {})
-
-            self.world_width = world_config.get("ancho", 5120)
-            self.world_height = world_config.get("alto", 2880)
+    def _load_world_config(self, world_config: dict | None = None):
+        """Aplica la configuración del mundo (precargada o leída de gameplay.json)."""
+        if world_config is None:
+            world_config = load_world_config(self.config)
+        for key, value in world_config.items():
+            setattr(self, key, value)
 
-            # Configuración de bordes
-            borders_config = gameplay_config.get("escenario", {}).get("bordes", {})
-            self.borders_enabled = borders_config.get("visible", True)
-            self.border_thickness = borders_config.get("grosor", 50)
-            self.border_color = tuple(borders_config.get("color", [200, 200, 200]))
-            self.border_collision = borders_config.get("colision", True)
-
-            self.logger.info(
-                "Configuración del mundo cargada: %dx%d, bordes: %s",
-                self.world_width,
-                self.world_height,
-                "habilitados" if self.borders_enabled else "deshabilitados",
-            )
-        except Exception as e:
-            self.logger.error("Error cargando configuración del mundo: %s", e)
-            # Valores por defecto
-            self.world_width = 5120
-            self.world_height = 2880
-            self.borders_enabled = True
-            self.border_thickness = 50
-            self.border_color = (200, 200, 200)
-            self.border_collision = True
+        self.logger.info(
+            "Configuración del mundo cargada: %dx%d, bordes: %s",
+            self.world_width,
+            self.world_height,
+            "habilitados" if self.borders_enabled else "deshabilitados",
+        )
 
     @property
     def enemies(self):
@@ -129,6 +169,8 @@ class GameScene(Scene):
 
     def handle_event(self, event):
         """Maneja los eventos de la escena del juego."""
+        self.input.handle_event(event)
+
         # Sistema de pausa mejorado con múltiples teclas
         if event.type == pygame.KEYDOWN:
             if event.key in [pygame.K_ESCAPE, pygame.K_p]:
@@ -158,20 +200,44 @@ class GameScene(Scene):
             self.logger.info("Juego pausado - cambiando a escena de pausa")
             self.scene_manager.change_scene("pause")
 
+    def enter(self):
+        """Al entrar con otras semillas (partida cargada) se cambia a su mundo."""
+        super().enter()
+        if self.game_state.seeds is not self.seeds:
+            self._apply_seeds(self.game_state.seeds)
+
+    def _apply_seeds(self, seeds):
+        """Usa las semillas de otra partida: flujos aleatorios y mundo (de caché)."""
+        self.logger.info("[GameScene] Semillas de partida cargada: %d", seeds.master)
+        self.seeds = seeds
+        self.enemy_manager.rng = seeds.rng("enemies")
+        self.waves.rng = seeds.rng("waves")
+        self.powerups_manager.rng = seeds.rng("powerups")
+        self._generate_world()
+
+    def suspend(self):
+        """Pausa: la escena sigue en caché; se suelta la entrada y se guarda la grabación."""
+        super().suspend()
+        self.input.reset_states()
+        self.save_recording()
+
+    def resume(self):
+        """Vuelta desde la pausa sin reconstruir mundo, HUD ni gestores."""
+        super().resume()
+        self.is_paused = False
+        self.input.reset_states()
+
     def update(self):
-        current_time = pygame.time.get_ticks()
         delta_time = 1.0 / 60.0
+        sim_clock.advance(delta_time)
+        current_time = sim_clock.now_ms()
 
-        # **CRÍTICO: Procesar input del jugador**
+        # **CRÍTICO: Procesar input del jugador** (una lectura por tick)
+        snapshot = self.input.sample()
         if self.player:
-            keys = pygame.key.get_pressed()
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_buttons = pygame.mouse.get_pressed()
             # Player effects desde integration
             player_effects = getattr(self.player.integration, "player_effects", None)
-            self.player.movement.handle_input(
-                keys, mouse_pos, mouse_buttons, player_effects
-            )
+            self.player.movement.handle_input(snapshot, player_effects)
 
         if self.background and hasattr(self.background, "update"):
             self.background.update(delta_time)
@@ -184,10 +250,17 @@ class GameScene(Scene):
         self.camera.update(delta_time)
         if self.player:
             self.player.update(delta_time)
-            # Aplicar colisiones con bordes del escenario
-            self._enforce_world_boundaries()
+            if self.world_streamer is not None:
+                self._stream_world(self.player.x, self.player.y)
+            else:
+                # Aplicar colisiones con bordes del escenario
+                self._enforce_world_boundaries()
         player_pos = (self.player.x, self.player.y) if self.player else None
-        self.enemy_manager.update(delta_time, player_pos)
+        self.enemy_manager.update(
+            delta_time, player_pos, self.camera.get_visible_rect()
+        )
+        # Animaciones con el reloj de simulación: se congelan con la pausa
+        self.animation_manager.update(delta_time)
         self.waves.check_wave_completion()
         for projectile in self.projectiles[:]:
             projectile.update(delta_time)
@@ -195,7 +268,7 @@ class GameScene(Scene):
         self.powerups_manager.update_powerups(delta_time)
         if (
             current_time - self.powerup_spawn_timer > self.powerup_spawn_delay
-            and random.random() < self.powerup_spawn_chance
+            and self.powerups_manager.rng.random() < self.powerup_spawn_chance
         ):
             self.powerups_manager.spawn_powerup()
             self.powerup_spawn_timer = current_time
@@ -206,10 +279,71 @@ class GameScene(Scene):
             self.game_state.current_player = self.player
         if self.game_state.lives <= 0:
             self.logger.info("Game Over")
+        if self.recorder is not None:
+            self.recorder.record(snapshot, self.get_state_hash())
 
     def render(self):
         self.renderer.render_scene()
 
+    def get_state_hash(self) -> int:
+        """
+        Hash (CRC32) del estado de la simulación tras el tick.
+
+        Cubre jugador, enemigos, proyectiles, powerups, oleada y marcador: si
+        dos ejecuciones con la misma entrada dan hashes distintos, la
+        simulación ya no es la misma.
+        """
+        state = array("d", (sim_clock.time_ms, self.wave_number))
+        state.extend((self.game_state.score, self.game_state.lives))
+        if self.player:
+            state.extend((self.player.x, self.player.y))
+            state.append(self.player.core.stats.health)
+        for enemy in self.enemies:
+            state.extend((enemy.x, enemy.y, enemy.core.health))
+        for projectile in self.projectiles:
+            state.extend((projectile.x, projectile.y))
+        for powerup in self.powerups:
+            state.extend((powerup.x, powerup.y))
+        return zlib.crc32(state.tobytes())
+
+    def start_recording(self, path: str | None = None):
+        """
+        Empieza a grabar la partida (semillas y entrada de cada tick).
+
+        Args:
+            path: Archivo de destino (por defecto, logs/replays con la fecha)
+        """
+        self.recording_path = path or time.strftime(
+            "logs/replays/partida_%Y%m%d_%H%M%S.sikr"
+        )
+        character = self.player.core.character_name if self.player else None
+        self.recorder = Replay(
+            self.seeds,
+            {
+                "character": character,
+                "screen": [self.screen.get_width(), self.screen.get_height()],
+            },
+        )
+        self.logger.info("Grabando repetición en %s", self.recording_path)
+
+    def save_recording(self):
+        """Guarda lo grabado hasta ahora (se sobrescribe en cada guardado)."""
+        if self.recorder is None or not self.recording_path:
+            return
+        try:
+            self.recorder.save(self.recording_path)
+            self.logger.info(
+                "Repetición guardada: %d ticks en %s",
+                len(self.recorder),
+                self.recording_path,
+            )
+        except OSError as e:
+            self.logger.error("Error guardando repetición: %s", e)
+
+    def get_input_diagnostics(self) -> dict:
+        """Latencia de entrada (evento a acción) y estado del muestreo."""
+        return self.input.get_diagnostics()
+
     def _load_background(self):
         try:
             self.background = SimpleDesertBackground(
@@ -257,7 +391,7 @@ class GameScene(Scene):
                 )
                 character_key = "guerrero"
 
-            player_x, player_y = 2500, 2500
+            player_x, player_y = self.spawn_position
 
             # Verificar múltiples rutas posibles para los sprites
             sprite_paths = [
@@ -342,28 +476,27 @@ class GameScene(Scene):
         if hasattr(self.camera, "clamp_to_world"):
             self.camera.clamp_to_world()
 
-    def _generate_world(self):
+    def _generate_world(self, world: tuple[list, int, int] | None = None):
+        if self.streaming_enabled:
+            self._start_streaming()
+            return
         try:
-            world_width, world_height = (
-                self.screen.get_width() * 4,
-                self.screen.get_height() * 4,
-            )
-            world_generator = WorldGenerator(
-                world_width=world_width,
-                world_height=world_height,
-                screen_width=self.screen.get_width(),
-                screen_height=self.screen.get_height(),
-            )
-            self.tiles = world_generator.generate_world()
-            self.tiles.extend(world_generator.generate_desert_oasis(1000, 1000, 300))
-            self.tiles.extend(world_generator.generate_rock_formation(4000, 1000, 250))
-            self.tiles.extend(world_generator.generate_cactus_field(1000, 4000, 200))
-            self.tiles.extend(world_generator.generate_ruins(4000, 4000, 280))
+            if world is None:
+                world = load_world(
+                    self.screen.get_width(),
+                    self.screen.get_height(),
+                    self.seeds,
+                    create_world_cache(self.config),
+                )
+            self.tiles, world_width, world_height = world
             if self.camera:
                 self.camera.world_width, self.camera.world_height = (
                     world_width,
                     world_height,
                 )
+            self.enemy_manager.navigation = self._build_navigation(
+                world_width, world_height
+            )
             self.logger.info(
                 "Mundo generado con %d elementos - Tamaño: %dx%d",
                 len(self.tiles),
@@ -373,3 +506,60 @@ class GameScene(Scene):
         except ImportError:
             self.logger.error("Error al generar mundo")
             self.tiles = []
+
+    def _build_navigation(
+        self, width: int, height: int, origin: tuple[float, float] = (0, 0)
+    ) -> FlowField:
+        """Campo de flujo que rodea los tiles con colisión."""
+        navigation = FlowField(width, height, origin=origin)
+        navigation.set_obstacles(
+            pack_bounds([tile for tile in self.tiles if tile.has_collision()])
+        )
+        return navigation
+
+    def _start_streaming(self):
+        """
+        Mundo por chunks: sin límites ni bordes, generado alrededor del jugador.
+
+        Los chunks cercanos se cargan enteros al empezar; después, como mucho
+        uno por frame a medida que el jugador se mueve (ver _stream_world).
+        """
+        width, height = self.screen.get_width(), self.screen.get_height()
+        self.world_streamer = WorldStreamer(
+            self.seeds.seed_for("world"),
+            width,
+            height,
+            chunk_size=self.chunk_size,
+            view_radius=self.chunk_radius,
+            max_stored=self.chunks_stored,
+            safe_center=self.spawn_position,
+        )
+        x, y = (self.player.x, self.player.y) if self.player else self.spawn_position
+        self.world_streamer.update(x, y, max_new=None)
+        self.tiles = self.world_streamer.tiles
+        self._navigation_chunk = None
+        self._stream_world(x, y)
+        self.camera.set_unbounded()
+        # Enemigos justo fuera de la vista, en cualquier dirección
+        self.enemy_manager.spawn_radius = math.hypot(width, height) / 2 + 100
+        self.logger.info(
+            "Mundo por chunks de %dpx (radio %d): %d elementos iniciales",
+            self.chunk_size,
+            self.chunk_radius,
+            len(self.tiles),
+        )
+
+    def _stream_world(self, x: float, y: float):
+        """Carga y retira chunks alrededor del jugador; rehace la navegación."""
+        streamer = self.world_streamer
+        changed = streamer.update(x, y)
+        if changed:
+            self.tiles = streamer.tiles
+        chunk = streamer.chunk_of(x, y)
+        if changed or chunk != self._navigation_chunk:
+            # La navegación cubre los chunks alrededor del jugador
+            self._navigation_chunk = chunk
+            left, top, width, height = streamer.view_bounds(x, y)
+            self.enemy_manager.navigation = self._build_navigation(
+                width, height, (left, top)
+            )
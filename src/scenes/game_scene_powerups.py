@@ -7,9 +7,9 @@ Fecha: 2024-12-19
 Descripción: Lógica de generación, recogida y efectos de powerups en la escena principal del juego.
 """
 
-import random
-
 from entities.powerup import Powerup
+from utils.camera import pack_bounds
+from utils.render_queue import RenderQueue
 
 
 class GameScenePowerups:
@@ -29,15 +29,25 @@ class GameScenePowerups:
             scene: Referencia al núcleo GameScene.
         """
         self.scene = scene  # Referencia al núcleo GameScene
+        self.rng = scene.seeds.rng("powerups")
 
     def spawn_powerup(self):
         """
-        Genera un powerup aleatorio en el mundo.
+        Genera un powerup aleatorio en el mundo (en el mundo por chunks, en los
+        chunks cargados alrededor del jugador).
         """
         try:
-            x = random.randint(100, 4900)
-            y = random.randint(100, 4900)
-            powerup = Powerup.create_random(x, y)
+            streamer = self.scene.world_streamer
+            if streamer is not None and self.scene.player:
+                left, top, width, height = streamer.view_bounds(
+                    self.scene.player.x, self.scene.player.y
+                )
+                x = self.rng.randint(left + 100, left + width - 100)
+                y = self.rng.randint(top + 100, top + height - 100)
+            else:
+                x = self.rng.randint(100, 4900)
+                y = self.rng.randint(100, 4900)
+            powerup = Powerup.create_random(x, y, self.rng)
             self.scene.powerups.append(powerup)
             # Corregir acceso a atributo - asegurar que powerup_type existe
             powerup_name = getattr(
@@ -80,7 +90,8 @@ class GameScenePowerups:
 
     def _is_out_of_bounds(self, powerup):
         """
-        Verifica si un powerup está fuera de los límites del mundo.
+        Verifica si un powerup está fuera de los límites del mundo (en el mundo
+        por chunks, si su chunk se ha retirado).
 
         Args:
             powerup: Objeto Powerup a verificar.
@@ -88,10 +99,30 @@ class GameScenePowerups:
         Returns:
             bool: True si el powerup está fuera de los límites, False en caso contrario.
         """
+        streamer = self.scene.world_streamer
+        if streamer is not None:
+            return not streamer.contains(powerup.x, powerup.y)
         return (
             powerup.x < -100 or powerup.x > 5100 or powerup.y < -100 or powerup.y > 5100
         )
 
+    def submit_sprites(self, queue, camera):
+        """
+        Encola los powerups visibles en la capa "powerups" de una RenderQueue.
+
+        Args:
+            queue: Cola de dibujado del frame
+            camera: Cámara para conversión de coordenadas
+        """
+        if hasattr(self.scene, "powerups") and self.scene.powerups:
+            powerups = self.scene.powerups
+            # Recorte y transformación de todo el grupo en una operación
+            indices, positions = camera.visible(pack_bounds(powerups))
+            for i, position in zip(indices.tolist(), positions.tolist(), strict=True):
+                frame = powerups[i].get_current_frame()
+                if frame:
+                    queue.submit("powerups", frame, position)
+
     def render(self, screen, camera):
         """
         Renderiza todos los powerups visibles en pantalla.
@@ -100,15 +131,6 @@ class GameScenePowerups:
             screen: Superficie de pantalla donde renderizar
             camera: Cámara para conversión de coordenadas
         """
-        if hasattr(self.scene, "powerups") and self.scene.powerups:
-            for powerup in self.scene.powerups:
-                # Verificar si está visible
-                if camera.is_visible(
-                    powerup.x, powerup.y, powerup.width, powerup.height
-                ):
-                    # Convertir a coordenadas de pantalla
-                    screen_x, screen_y = camera.world_to_screen(powerup.x, powerup.y)
-                    # Obtener frame del powerup
-                    frame = powerup.get_current_frame()
-                    if frame:
-                        screen.blit(frame, (screen_x, screen_y))
+        queue = RenderQueue(layers=("powerups",))
+        self.submit_sprites(queue, camera)
+        queue.flush(screen)
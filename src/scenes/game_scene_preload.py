@@ -0,0 +1,233 @@
+"""
+Game Scene Preload - Precarga de la escena principal
+====================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Tareas de precarga de la escena de juego (configuración del mundo,
+fotogramas de personajes y enemigos, generación del mundo, fondo y HUD). Se
+ejecutan durante la pantalla de carga y ``GameScene`` consume sus resultados en
+lugar de construirlos en su primer frame. El mundo se lee de la caché de mundos
+cuando ya se generó con las mismas semillas; con el mundo por chunks no se
+genera aquí, sino alrededor del jugador durante la partida.
+"""
+
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from entities.enemy import EnemyManager
+from entities.tile import Tile
+from ui.hud import HUD
+from utils.animation_manager import IntelligentAnimationManager
+from utils.asset_manager import AssetManager
+from utils.config_manager import ConfigManager
+from utils.logger import get_logger
+from utils.preload_graph import PreloadGraph
+from utils.seed_set import SeedSet
+from utils.simple_desert_background import SimpleDesertBackground
+from utils.world_cache import WorldCache, world_key
+from utils.world_generator import WorldGenerator
+
+# Personajes jugables y enemigos cuyos fotogramas se precargan
+PLAYER_CHARACTERS = ["guerrero", "adventureguirl", "robot"]
+ENEMY_CHARACTERS = ["zombiemale", "zombieguirl"]
+
+DEFAULT_WORLD_CONFIG = {
+    "world_width": 5120,
+    "world_height": 2880,
+    "borders_enabled": True,
+    "border_thickness": 50,
+    "border_color": (200, 200, 200),
+    "border_collision": True,
+    "streaming_enabled": False,
+    "chunk_size": 1024,
+    "chunk_radius": 1,
+    "chunks_stored": 64,
+}
+
+# Estructuras especiales del mundo: (método de WorldGenerator, centro x, y, radio)
+WORLD_FEATURES = (
+    ("generate_desert_oasis", 1000, 1000, 300),
+    ("generate_rock_formation", 4000, 1000, 250),
+    ("generate_cactus_field", 1000, 4000, 200),
+    ("generate_ruins", 4000, 4000, 280),
+)
+
+
+def load_world_config(config: ConfigManager) -> dict[str, Any]:
+    """
+    Lee la configuración del mundo y de los bordes desde gameplay.json.
+
+    Returns:
+        Diccionario con tamaño del mundo, bordes y mundo por chunks
+    """
+    logger = get_logger("SiK_Game")
+    try:
+        gameplay_config = config.get_config("gameplay")
+        escenario = gameplay_config.get("escenario", {})
+        world_config = escenario.get("mundo", {})
+        borders_config = escenario.get("bordes", {})
+        streaming_config = world_config.get("por_chunks", {})
+        return {
+            "world_width": world_config.get("ancho", 5120),
+            "world_height": world_config.get("alto", 2880),
+            "borders_enabled": borders_config.get("visible", True),
+            "border_thickness": borders_config.get("grosor", 50),
+            "border_color": tuple(borders_config.get("color", [200, 200, 200])),
+            "border_collision": borders_config.get("colision", True),
+            "streaming_enabled": streaming_config.get("habilitado", False),
+            "chunk_size": streaming_config.get("tamaño_chunk", 1024),
+            "chunk_radius": streaming_config.get("radio_chunks", 1),
+            "chunks_stored": streaming_config.get("chunks_guardados", 64),
+        }
+    except Exception as e:
+        logger.error("Error cargando configuración del mundo: %s", e)
+        return dict(DEFAULT_WORLD_CONFIG)
+
+
+def generate_world_tiles(
+    screen_width: int, screen_height: int, rng: random.Random | None = None
+) -> tuple[list, int, int]:
+    """
+    Genera los elementos del mundo (tiles y estructuras especiales).
+
+    Args:
+        rng: Generador del mundo (flujo "world" de las semillas de la partida)
+
+    Returns:
+        Tupla (tiles, ancho del mundo, alto del mundo)
+    """
+    world_generator = _world_generator(screen_width, screen_height, rng)
+    return (
+        _generate(world_generator),
+        world_generator.world_width,
+        world_generator.world_height,
+    )
+
+
+def load_world(
+    screen_width: int,
+    screen_height: int,
+    seeds: SeedSet,
+    cache: WorldCache | None = None,
+) -> tuple[list, int, int]:
+    """
+    Mundo de unas semillas: de la caché si ya se generó, si no se genera y guarda.
+
+    Args:
+        seeds: Semillas de la partida (se usa el flujo "world")
+        cache: Caché de mundos (None: generar siempre)
+
+    Returns:
+        Tupla (tiles, ancho del mundo, alto del mundo)
+    """
+    logger = get_logger("SiK_Game")
+    world_generator = _world_generator(screen_width, screen_height, seeds.rng("world"))
+    size = (world_generator.world_width, world_generator.world_height)
+    if cache is None:
+        return _generate(world_generator), *size
+
+    started = time.perf_counter()
+    seed = seeds.seed_for("world")
+    key = world_key(seed, *size, world_generator.fingerprint(WORLD_FEATURES))
+    tiles = cache.load(key)
+    if tiles is not None:
+        logger.info(
+            "Mundo %s cargado de caché: %d elementos en %.1f ms",
+            key,
+            len(tiles),
+            (time.perf_counter() - started) * 1000,
+        )
+        return tiles, *size
+
+    tiles = _generate(world_generator)
+    cache.store(key, tiles, {"seed": seed, "size": list(size)})
+    logger.info(
+        "Mundo %s generado y guardado en caché: %d elementos en %.1f ms",
+        key,
+        len(tiles),
+        (time.perf_counter() - started) * 1000,
+    )
+    return tiles, *size
+
+
+def create_world_cache(config: ConfigManager) -> WorldCache | None:
+    """Caché de mundos según la configuración (None si está desactivada)."""
+    if not config.get("game", "cache_mundos", True):
+        return None
+    return WorldCache(Path(config.get("paths", "cache", "cache")) / "worlds")
+
+
+def _world_generator(
+    screen_width: int, screen_height: int, rng: random.Random | None
+) -> WorldGenerator:
+    return WorldGenerator(
+        world_width=screen_width * 4,
+        world_height=screen_height * 4,
+        screen_width=screen_width,
+        screen_height=screen_height,
+        rng=rng,
+    )
+
+
+def _generate(world_generator: WorldGenerator) -> list:
+    tiles = world_generator.generate_world()
+    for method, center_x, center_y, radius in WORLD_FEATURES:
+        tiles.extend(getattr(world_generator, method)(center_x, center_y, radius))
+    return tiles
+
+
+def _load_enemies(results: dict[str, Any]) -> EnemyManager:
+    animation_manager = results["animation_manager"]
+    animation_manager.preload_characters(ENEMY_CHARACTERS)
+    return EnemyManager(animation_manager)
+
+
+def add_game_scene_tasks(
+    graph: PreloadGraph, screen: pygame.Surface, config: ConfigManager, game_state
+) -> None:
+    """
+    Añade al grafo las tareas de precarga de la escena de juego.
+
+    La generación del mundo (la tarea más costosa) corre en el hilo de fondo.
+    Renderiza los símbolos de los tiles con fuentes creadas antes en el hilo
+    principal (``tile_fonts``), y el HUD, que crea sus propias fuentes, espera a
+    que el mundo termine, porque FreeType no admite crear fuentes en paralelo.
+    """
+    width, height = screen.get_width(), screen.get_height()
+    graph.add("world_config", lambda r: load_world_config(config))
+    graph.add("asset_manager", lambda r: AssetManager(), weight=2.0)
+    graph.add(
+        "animation_manager",
+        lambda r: IntelligentAnimationManager(r["asset_manager"]),
+        deps=("asset_manager",),
+    )
+    graph.add(
+        "character_frames",
+        lambda r: r["animation_manager"].preload_characters(PLAYER_CHARACTERS),
+        deps=("animation_manager",),
+        weight=3.0,
+    )
+    graph.add("enemy_manager", _load_enemies, deps=("character_frames",), weight=2.0)
+    graph.add("tile_fonts", lambda r: Tile.preload_symbol_fonts(), main_thread=True)
+    graph.add(
+        "world",
+        lambda r: (
+            None
+            if r["world_config"]["streaming_enabled"]
+            else load_world(width, height, game_state.seeds, create_world_cache(config))
+        ),
+        deps=("tile_fonts", "world_config"),
+        weight=20.0,
+    )
+    graph.add("background", lambda r: SimpleDesertBackground(width, height))
+    graph.add(
+        "hud",
+        lambda r: HUD(screen, config, game_state),
+        deps=("world",),
+        main_thread=True,
+    )
@@ -1,6 +1,9 @@
 """
 Módulo de renderizado para GameScene.
 Maneja el renderizado de todos los elementos del juego.
+
+Los sprites de cada capa se encolan en una RenderQueue y se vuelcan con una
+llamada por capa; fondo y bordes (primitivas) se dibujan antes y el HUD después.
 """
 
 import logging
@@ -8,9 +11,19 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from utils.background_pattern import BackgroundPalette, get_background_pattern
+from utils.camera import pack_bounds
+from utils.render_queue import RenderQueue
+from utils.spatial_grid import SpatialGrid
+
 if TYPE_CHECKING:
     from scenes.game_scene_core import GameScene
 
+# Fondo sin escena: rejilla verde de celdas de 100 px
+PROCEDURAL_PALETTE = BackgroundPalette(
+    base=(32, 48, 32), grid=(48, 64, 48), cell_size=100, grid_thickness=2
+)
+
 
 class GameSceneRenderer:
     """Renderizador para la escena del juego."""
@@ -28,16 +41,23 @@ class GameSceneRenderer:
         self.screen = screen
         self.camera = camera
         self.logger = logging.getLogger("render_loops")
+        # Tiles estáticos: límites e índice espacial, reconstruidos si cambia la lista
+        self._tile_source = None
+        self._tile_bounds = None
+        self._tile_index = None
+        # Enemigos y tiles se ordenan por el pie para dar profundidad
+        self.render_queue = RenderQueue(y_sorted=("enemies", "tiles"))
+        self._frame_counter = 0
 
     def render_scene(self) -> None:
         """Renderiza todos los elementos de la escena."""
+        self.render_queue.clear()
         try:
-            # Renderizar fondo procedural y bordes
-            self._render_procedural_background()
-            self._render_world_borders()
-
-            # Renderizar fondo de escena (si existe)
+            # Renderizar fondo de escena (o rejilla procedural) y bordes
             self._render_background()
+            if self.scene.world_streamer is None:
+                # El mundo por chunks no tiene bordes
+                self._render_world_borders()
 
             # Renderizar enemigos
             self._render_enemies()
@@ -54,16 +74,45 @@ class GameSceneRenderer:
             # Renderizar powerups
             self._render_powerups()
 
+            # Volcar las capas de sprites (una llamada por capa)
+            self.render_queue.flush(self.screen)
+            self._log_render_stats()
+
             # Renderizar HUD
             self._render_hud()
 
         except Exception as e:
             self.logger.error("Error crítico en render_scene: %s", e)
 
+    def get_render_stats(self) -> dict:
+        """Llamadas de dibujado y sprites por capa del último frame."""
+        return self.render_queue.frame_stats
+
+    def _log_render_stats(self) -> None:
+        """Registra las estadísticas de dibujado cada 60 frames."""
+        self._frame_counter += 1
+        if self._frame_counter % 60 == 0:
+            stats = self.render_queue.frame_stats
+            self.logger.debug(
+                "Dibujado: %d llamadas, %d sprites %s",
+                stats["draw_calls"],
+                stats["sprites"],
+                stats["layers"],
+            )
+            latency = self.scene.input.get_diagnostics()
+            self.logger.debug(
+                "Entrada: latencia media %.2f ms, máx %.2f ms, %d sobre un tick",
+                latency["latency_avg_ms"],
+                latency["latency_max_ms"],
+                latency["latency_over_one_tick"],
+            )
+
     def _render_background(self) -> None:
-        """Renderiza el fondo de la escena."""
+        """Renderiza el fondo de la escena, anclado a la posición de la cámara."""
         if hasattr(self.scene, "background") and self.scene.background:
-            self.scene.background.render(self.screen, self.camera)
+            self.scene.background.render(self.screen, self.camera.x, self.camera.y)
+        else:
+            self._render_procedural_background()
 
     def _render_enemies(self) -> None:
         """Renderiza todos los enemigos en pantalla."""
@@ -72,36 +121,47 @@ class GameSceneRenderer:
                 hasattr(self.scene, "enemy_manager")
                 and self.scene.enemy_manager.enemies
             ):
-                for enemy in self.scene.enemy_manager.enemies:
-                    # Verificar si está visible
-                    if self.camera.is_visible(
-                        enemy.x, enemy.y, enemy.width, enemy.height
-                    ):
-                        # Convertir a coordenadas de pantalla
-                        screen_x, screen_y = self.camera.world_to_screen(
-                            enemy.x, enemy.y
-                        )
-                        # Obtener frame actual del enemigo
-                        frame = enemy.get_current_frame()
-                        if frame:
-                            self.screen.blit(frame, (screen_x, screen_y))
+                self._render_visible_entities(
+                    self.scene.enemy_manager.enemies, "enemies"
+                )
         except Exception as e:
             self.logger.error("Error renderizando enemigos: %s", e)
 
+    def _render_visible_entities(self, entities: list, layer: str) -> None:
+        """Recorta un grupo de entidades en lote y encola las visibles."""
+        indices, positions = self.camera.visible(pack_bounds(entities))
+        submit = self.render_queue.submit
+        for i, position in zip(indices.tolist(), positions.tolist(), strict=True):
+            frame = entities[i].get_current_frame()
+            if frame:
+                submit(layer, frame, position)
+
+    def _get_tile_index(self, tiles: list) -> SpatialGrid:
+        """Índice espacial de los tiles (se construye una vez por lista de tiles)."""
+        if self._tile_source is not tiles or len(self._tile_bounds) != len(tiles):
+            self._tile_source = tiles
+            self._tile_bounds = pack_bounds(tiles)
+            self._tile_index = SpatialGrid(
+                self._tile_bounds[:, :2], self._tile_bounds[:, 2:]
+            )
+        return self._tile_index
+
     def _render_world_tiles(self) -> None:
         """Renderiza los tiles del mundo."""
         if hasattr(self.scene, "tiles") and self.scene.tiles:
             rendered_count = 0
-            total_tiles = len(self.scene.tiles)
-
-            for tile in self.scene.tiles:
-                if self.camera.is_visible(tile.x, tile.y, tile.width, tile.height):
-                    # Convertir a coordenadas de pantalla
-                    screen_x, screen_y = self.camera.world_to_screen(tile.x, tile.y)
-                    # Renderizar tile usando sprite (no image)
-                    if hasattr(tile, "sprite") and tile.sprite:
-                        self.screen.blit(tile.sprite, (screen_x, screen_y))
-                        rendered_count += 1
+            tiles = self.scene.tiles
+            total_tiles = len(tiles)
+
+            index = self._get_tile_index(tiles)
+            indices, positions = self.camera.visible(self._tile_bounds, index)
+            submit = self.render_queue.submit
+            for i, position in zip(indices.tolist(), positions.tolist(), strict=True):
+                # Renderizar tile usando sprite (no image)
+                sprite = getattr(tiles[i], "sprite", None)
+                if sprite:
+                    submit("tiles", sprite, position)
+                    rendered_count += 1
 
             # Log cada 60 frames (aprox. 1 segundo a 60 FPS)
             if hasattr(self, "_tile_debug_counter"):
@@ -138,31 +198,19 @@ class GameSceneRenderer:
                     # Obtener frame actual del jugador
                     frame = self.scene.player.get_current_frame()
                     if frame:
-                        self.screen.blit(frame, (screen_x, screen_y))
+                        self.render_queue.submit("player", frame, (screen_x, screen_y))
         except Exception as e:
             self.logger.error("Error renderizando jugador: %s", e)
 
     def _render_projectiles(self) -> None:
         """Renderiza los proyectiles."""
         if hasattr(self.scene, "projectiles") and self.scene.projectiles:
-            for projectile in self.scene.projectiles:
-                # Verificar si está visible
-                if self.camera.is_visible(
-                    projectile.x, projectile.y, projectile.width, projectile.height
-                ):
-                    # Convertir a coordenadas de pantalla
-                    screen_x, screen_y = self.camera.world_to_screen(
-                        projectile.x, projectile.y
-                    )
-                    # Obtener frame del proyectil
-                    frame = projectile.get_current_frame()
-                    if frame:
-                        self.screen.blit(frame, (screen_x, screen_y))
+            self._render_visible_entities(self.scene.projectiles, "projectiles")
 
     def _render_powerups(self) -> None:
         """Renderiza los powerups."""
         if hasattr(self.scene, "powerups_manager") and self.scene.powerups_manager:
-            self.scene.powerups_manager.render(self.screen, self.camera)
+            self.scene.powerups_manager.submit_sprites(self.render_queue, self.camera)
 
     def _render_hud(self) -> None:
         """Renderiza la interfaz de usuario."""
@@ -171,51 +219,11 @@ class GameSceneRenderer:
 
     def _render_procedural_background(self) -> None:
         """
-        Renderiza un fondo procedural con grid y detalles aleatorios.
+        Renderiza un fondo procedural con grid (patrón prerenderizado).
         """
         try:
-            # Usar valores por defecto para el fondo
-            base_color = (32, 48, 32)
-            line_color = (48, 64, 48)
-            cell_size = 100
-            line_thickness = 2
-
-            # Llenar fondo base
-            self.screen.fill(base_color)
-
-            # Obtener área visible de la cámara
-            camera_rect = self.camera.get_visible_rect()
-
-            # Calcular grid visible
-            start_x = int(camera_rect.x // cell_size) * cell_size
-            end_x = start_x + camera_rect.width + cell_size
-            start_y = int(camera_rect.y // cell_size) * cell_size
-            end_y = start_y + camera_rect.height + cell_size
-
-            # Dibujar líneas verticales
-            for x in range(start_x, end_x, cell_size):
-                screen_x, screen_y = self.camera.world_to_screen(x, camera_rect.y)
-                if 0 <= screen_x <= self.screen.get_width():
-                    pygame.draw.line(
-                        self.screen,
-                        line_color,
-                        (screen_x, 0),
-                        (screen_x, self.screen.get_height()),
-                        line_thickness,
-                    )
-
-            # Dibujar líneas horizontales
-            for y in range(start_y, end_y, cell_size):
-                screen_x, screen_y = self.camera.world_to_screen(camera_rect.x, y)
-                if 0 <= screen_y <= self.screen.get_height():
-                    pygame.draw.line(
-                        self.screen,
-                        line_color,
-                        (0, screen_y),
-                        (self.screen.get_width(), screen_y),
-                        line_thickness,
-                    )
-
+            pattern = get_background_pattern(self.screen.get_size(), PROCEDURAL_PALETTE)
+            pattern.render(self.screen, self.camera.x, self.camera.y)
         except Exception as e:
             self.logger.error("Error renderizando fondo procedural: %s", e)
 
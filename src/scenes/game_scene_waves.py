@@ -7,11 +7,9 @@ Fecha: 2024-12-19
 Descripción: Lógica de oleadas y gestión de enemigos para la escena principal del juego.
 """
 
-import random
-
-import pygame
-
-from entities.enemy_types import EnemyRarity, EnemyTypes
+from entities.enemy_manager import ring_point
+from entities.enemy_types import EnemyTypes
+from utils.sim_clock import sim_clock
 
 # Constantes descriptivas para tiempos de pausa
 TIEMPO_PAUSA_MEJORAS = 3000
@@ -35,6 +33,9 @@ class GameSceneWaves:
             scene: Referencia al núcleo GameScene.
         """
         self.scene = scene  # Referencia al núcleo GameScene
+        self.rng = scene.seeds.rng("waves")
+        # Compilar las tablas de aparición al empezar las oleadas
+        EnemyTypes.rebuild_spawn_tables()
 
     def spawn_enemy(self):
         """
@@ -57,78 +58,43 @@ class GameSceneWaves:
 
     def _get_spawn_position(self):
         """
-        Calcula una posición aleatoria en los bordes del mundo visible.
+        Calcula una posición aleatoria en los bordes del mundo visible; en el
+        mundo por chunks, fuera de la vista alrededor del jugador.
 
         Returns:
             tuple[int, int]: Coordenadas (x, y) de la posición de spawn.
         """
-        spawn_side = random.randint(0, 3)
+        player = self.scene.player
+        if self.scene.world_streamer is not None and player:
+            radius = self.scene.enemy_manager.spawn_radius
+            return ring_point(player.x, player.y, radius, self.rng)
+        spawn_side = self.rng.randint(0, 3)
         if spawn_side == 0:
-            return random.randint(0, 5000), -50
+            return self.rng.randint(0, 5000), -50
         elif spawn_side == 1:
-            return 5050, random.randint(0, 5000)
+            return 5050, self.rng.randint(0, 5000)
         elif spawn_side == 2:
-            return random.randint(0, 5000), 5050
+            return self.rng.randint(0, 5000), 5050
         else:
-            return -50, random.randint(0, 5000)
+            return -50, self.rng.randint(0, 5000)
 
     def select_enemy_for_wave(self):
         """
         Selecciona el tipo de enemigo basado en la oleada actual.
 
+        Usa las tablas de aparición precompiladas: elegir es O(1) y no
+        consulta la base de datos.
+
         Returns:
             Configuración del enemigo seleccionado.
 
         Ejemplo:
             >>> enemigo = gestor_oleadas.select_enemy_for_wave()
         """
-        wave = self.scene.wave_number
-        rarities = self._get_rarities_for_wave(wave)
-        return self._select_enemy_by_rarity(rarities)
-
-    def _get_rarities_for_wave(self, wave):
-        """
-        Obtiene las rarezas disponibles para una oleada específica.
-
-        Args:
-            wave: Número de la oleada actual.
-
-        Returns:
-            list[EnemyRarity]: Lista de rarezas disponibles.
-        """
-        enemy_rarities = {
-            range(1, 4): [EnemyRarity.NORMAL],
-            range(4, 7): [EnemyRarity.NORMAL, EnemyRarity.RARE],
-            range(7, 11): [EnemyRarity.NORMAL, EnemyRarity.RARE, EnemyRarity.ELITE],
-            range(11, 100): [
-                EnemyRarity.NORMAL,
-                EnemyRarity.RARE,
-                EnemyRarity.ELITE,
-                EnemyRarity.LEGENDARY,
-            ],
-        }
-        for rarity_range, rarities in enemy_rarities.items():
-            if wave in rarity_range:
-                return rarities
-        return [EnemyRarity.NORMAL]
-
-    def _select_enemy_by_rarity(self, rarities):
-        """
-        Selecciona un enemigo aleatorio basado en las rarezas disponibles.
-
-        Args:
-            rarities: Lista de rarezas disponibles.
-
-        Returns:
-            EnemyTypes: Tipo de enemigo seleccionado.
-        """
-        rand = random.random()
-        for rarity in rarities:
-            if rand < 0.5:
-                return (
-                    EnemyTypes.get_random_by_rarity(rarity) or EnemyTypes.ZOMBIE_NORMAL
-                )
-        return EnemyTypes.ZOMBIE_NORMAL
+        return (
+            EnemyTypes.get_random_for_wave(self.scene.wave_number, self.rng)
+            or EnemyTypes.ZOMBIE_NORMAL
+        )
 
     def check_wave_completion(self):
         """
@@ -152,7 +118,7 @@ class GameSceneWaves:
             )
             self._configurar_menu_mejoras()
             scene.paused_for_upgrade = True
-            scene.enemy_spawn_timer = pygame.time.get_ticks() + TIEMPO_PAUSA_MEJORAS
+            scene.enemy_spawn_timer = sim_clock.now_ms() + TIEMPO_PAUSA_MEJORAS
 
     def _configurar_menu_mejoras(self):
         """
@@ -191,4 +157,4 @@ class GameSceneWaves:
         scene.logger.info("Continuando juego tras mejoras")
         scene.wave_completed = False
         scene.paused_for_upgrade = False
-        scene.enemy_spawn_timer = pygame.time.get_ticks() + TIEMPO_PAUSA_POST_MEJORAS
+        scene.enemy_spawn_timer = sim_clock.now_ms() + TIEMPO_PAUSA_POST_MEJORAS
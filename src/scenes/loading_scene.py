@@ -12,6 +12,7 @@ from collections.abc import Callable
 import pygame
 
 from utils.config_manager import ConfigManager
+from utils.preload_graph import PreloadGraph
 
 from .loading_scene_core import LoadingSceneCore
 from .loading_scene_events import LoadingSceneEvents
@@ -24,6 +25,16 @@ class LoadingScene:
     Escena de carga principal que integra todos los componentes.
     """
 
+    # Eventos con los que se puede saltar la pantalla de carga
+    event_types = frozenset(
+        {
+            pygame.KEYDOWN,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.JOYBUTTONDOWN,
+            pygame.JOYHATMOTION,
+        }
+    )
+
     def __init__(
         self,
         screen: pygame.Surface,
@@ -31,6 +42,7 @@ class LoadingScene:
         game_state,
         save_manager,
         on_loading_complete: Callable | None = None,
+        preload_graph: PreloadGraph | None = None,
     ):
         """
         Inicializa la escena de carga.
@@ -41,12 +53,13 @@ class LoadingScene:
             game_state: Estado del juego
             save_manager: Gestor de guardado
             on_loading_complete: Callback cuando termine la carga
+            preload_graph: Grafo de tareas que se ejecuta mientras se muestra
         """
         # Inicializar componentes especializados
         self.core = LoadingSceneCore(
             screen, config, game_state, save_manager, on_loading_complete
         )
-        self.logic = LoadingSceneLogic(self.core)
+        self.logic = LoadingSceneLogic(self.core, preload_graph)
         self.renderer = LoadingSceneRenderer(self.core)
         self.events = LoadingSceneEvents(self.core)
 
@@ -74,6 +87,7 @@ class LoadingScene:
 
     def update(self):
         """Actualiza la lógica de la escena de carga."""
+        self.logic.update()
         self.core.update()
 
     def render(self):
@@ -4,90 +4,86 @@ Loading Scene Logic - Lógica de carga y threading
 
 Autor: SiK Team
 Fecha: 2025-07-30
-Descripción: Manejo de la lógica de carga en segundo plano.
+Descripción: Manejo de la lógica de carga: progreso según el trabajo terminado
+del grafo de precarga.
 """
 
-import threading
-import time
 from typing import TYPE_CHECKING
 
 from utils.logger import get_logger
+from utils.preload_graph import PreloadGraph
 
 if TYPE_CHECKING:
     from .loading_scene_core import LoadingSceneCore
 
+# Tiempo por frame para tareas de precarga del hilo principal
+MAIN_THREAD_BUDGET_MS = 8.0
+
 
 class LoadingSceneLogic:
     """
-    Lógica de carga en segundo plano para la escena de carga.
+    Lógica de carga de la escena de carga, dirigida por un grafo de precarga.
     """
 
-    def __init__(self, core: "LoadingSceneCore"):
+    def __init__(self, core: "LoadingSceneCore", graph: PreloadGraph | None = None):
         """
         Inicializa la lógica de carga.
 
         Args:
             core: Núcleo de la escena de carga
+            graph: Grafo de tareas de precarga (None = nada que cargar)
         """
         self.core = core
         self.logger = get_logger("SiK_Game")
-        self.loading_thread = None
+        self.graph = graph
 
     def start_background_loading(self):
-        """Inicia la carga en segundo plano."""
-        if self.loading_thread and self.loading_thread.is_alive():
-            self.logger.warning("Hilo de carga ya está en ejecución")
+        """Arranca el grafo de precarga (las tareas de fondo en su propio hilo)."""
+        if self.graph is None:
+            self.logger.info("Sin tareas de precarga - carga completada")
+            self._finish()
             return
 
-        self.loading_thread = threading.Thread(target=self._background_loading_task)
-        self.loading_thread.daemon = True
-        self.loading_thread.start()
-        self.logger.info("Hilo de carga en segundo plano iniciado")
-
-    def _background_loading_task(self):
-        """Tarea de carga en segundo plano con configuración de progreso."""
-        try:
-            # Obtener configuración de carga
-            loading_config = self.core.config.get_section("loading_screen")
-            progress_config = loading_config.get("progress", {})
-
-            # Configuración de tiempo
-            total_duration = (
-                progress_config.get("duration", 5000) / 1000.0
-            )  # Convertir a segundos
-            total_steps = progress_config.get("steps", len(self.core.loading_messages))
-            step_duration = total_duration / total_steps if total_steps > 0 else 0.5
-
-            self.logger.info(
-                f"Iniciando carga: {total_duration:.1f}s total, {step_duration:.2f}s por paso"
-            )
-
-            for i in range(total_steps):
-                # Tiempo de carga realista por paso
-                time.sleep(step_duration)
-
-                # Actualizar progreso
-                progress = (i + 1) / total_steps
-                message_index = min(i + 1, len(self.core.loading_messages) - 1)
-
-                self.core.update_loading_progress(progress, message_index)
-                self.logger.debug(
-                    "Progreso de carga: %.1f%% - %s",
-                    progress * 100,
-                    self.core.loading_messages[message_index]
-                    if message_index < len(self.core.loading_messages)
-                    else "Completando...",
-                )
-
-            # Carga completada - pausa final para mostrar 100%
-            time.sleep(0.3)
-            self.core.update_loading_progress(1.0, len(self.core.loading_messages) - 1)
-            self.logger.info("Carga completada exitosamente en %.1fs", total_duration)
-
-        except (RuntimeError, OSError) as e:
-            self.logger.error("Error durante la carga: %s", e)
-            # Marcar como completado incluso si hay error
-            self.core.update_loading_progress(1.0, len(self.core.loading_messages) - 1)
+        self.graph.start()
+        self.logger.info(
+            "Precarga iniciada: %d tareas (%s)",
+            len(self.graph.tasks),
+            ", ".join(self.graph.order()),
+        )
+
+    def update(self):
+        """
+        Avanza la carga un frame.
+
+        Ejecuta las tareas de hilo principal que ya están listas (con presupuesto
+        de tiempo) y traslada a la barra el peso de trabajo realmente terminado.
+        """
+        if self.graph is None or self.core.loading_complete:
+            return
+
+        self.graph.pump(MAIN_THREAD_BUDGET_MS)
+        if self.graph.is_complete():
+            self._finish()
+            return
+
+        progress = self.graph.progress
+        message_index = int(progress * (len(self.core.loading_messages) - 1))
+        self.core.update_loading_progress(progress, message_index)
+
+    def _finish(self):
+        """Marca la carga como completada y registra los tiempos por tarea."""
+        self.core.update_loading_progress(1.0, len(self.core.loading_messages) - 1)
+        if self.graph is None:
+            return
+        for name, error in self.graph.errors.items():
+            self.logger.warning("Precarga '%s' fallida: %s", name, error)
+        self.logger.info(
+            "Carga completada en %.0f ms (%s)",
+            self.graph.total_ms,
+            ", ".join(
+                f"{name}={ms:.0f}ms" for name, ms in self.graph.get_timings().items()
+            ),
+        )
 
     def is_loading_active(self) -> bool:
         """
@@ -97,17 +93,17 @@ class LoadingSceneLogic:
             True si la carga está en progreso
         """
         return (
-            self.loading_thread is not None
-            and self.loading_thread.is_alive()
+            self.graph is not None
+            and not self.graph.is_complete()
             and not self.core.loading_complete
         )
 
     def stop_loading(self):
-        """Detiene la carga si está en progreso."""
-        if self.loading_thread and self.loading_thread.is_alive():
-            # Marcar como completado para finalizar el hilo
-            self.core.update_loading_progress(1.0, len(self.core.loading_messages) - 1)
-            self.logger.info("Carga detenida manualmente")
+        """Termina la carga pendiente de forma bloqueante."""
+        if self.is_loading_active():
+            self.graph.run_all()
+            self._finish()
+            self.logger.info("Carga completada manualmente")
 
     def get_loading_info(self) -> dict:
         """
@@ -118,9 +114,9 @@ class LoadingSceneLogic:
         """
         return {
             "thread_active": self.is_loading_active(),
-            "thread_alive": self.loading_thread.is_alive()
-            if self.loading_thread
-            else False,
+            "current_task": self.graph.current_task() if self.graph else None,
+            "task_timings_ms": self.graph.get_timings() if self.graph else {},
+            "failed_tasks": sorted(self.graph.errors) if self.graph else [],
             "loading_state": self.core.get_loading_state(),
         }
 
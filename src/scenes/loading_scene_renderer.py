@@ -32,6 +32,12 @@ class LoadingSceneRenderer:
         """
         self.core = core
         self.logger = get_logger("SiK_Game")
+        # Fuentes creadas una vez: la precarga genera el mundo en otro hilo
+        # mientras esta escena se dibuja, y FreeType no admite crear fuentes
+        # concurrentemente
+        self.fonts = {
+            size: pygame.font.Font(None, size) for size in (72, 36, 28, 24, 20)
+        }
 
     def render_all(self):
         """Renderiza todos los elementos de la pantalla de carga."""
@@ -70,8 +76,8 @@ class LoadingSceneRenderer:
 
     def _render_title(self):
         """Renderiza el título del juego."""
-        font_large = pygame.font.Font(None, 72)
-        font_small = pygame.font.Font(None, 36)
+        font_large = self.fonts[72]
+        font_small = self.fonts[36]
 
         # Título principal configurable
         title_text = font_large.render(self.core.title, True, (255, 255, 255))
@@ -118,7 +124,7 @@ class LoadingSceneRenderer:
             )
 
         # Texto de progreso
-        font = pygame.font.Font(None, 24)
+        font = self.fonts[24]
         progress_text = font.render(
             f"{self.core.loading_progress:.1%}", True, (255, 255, 255)
         )
@@ -130,7 +136,7 @@ class LoadingSceneRenderer:
     def _render_current_message(self):
         """Renderiza el mensaje actual de carga."""
         if self.core.current_message_index < len(self.core.loading_messages):
-            font = pygame.font.Font(None, 28)
+            font = self.fonts[28]
             message = self.core.loading_messages[self.core.current_message_index]
             message_text = font.render(message, True, (220, 220, 220))
             message_rect = message_text.get_rect(
@@ -160,7 +166,7 @@ class LoadingSceneRenderer:
 
     def _render_additional_info(self):
         """Renderiza información adicional."""
-        font = pygame.font.Font(None, 20)
+        font = self.fonts[20]
 
         # Versión configurable
         version_text = font.render(self.core.version, True, (150, 150, 150))
@@ -24,6 +24,8 @@ class MainMenuScene(Scene):
     Escena del menú principal del juego.
     """
 
+    next_scenes = ("slot_selection", "options")
+
     def __init__(
         self, screen: pygame.Surface, config: ConfigManager, game_state, save_manager
     ):
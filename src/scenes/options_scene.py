@@ -26,6 +26,8 @@ class OptionsScene(Scene):
     Utiliza paneles especializados para mejor organización.
     """
 
+    next_scenes = ("main_menu",)
+
     def __init__(
         self, screen: pygame.Surface, config: ConfigManager, game_state, save_manager
     ):
@@ -23,6 +23,8 @@ class PauseScene(Scene):
     Escena de pausa del juego.
     """
 
+    next_scenes = ("game", "main_menu", "options")
+
     def __init__(
         self, screen: pygame.Surface, config: ConfigManager, game_state, save_manager
     ):
@@ -20,6 +20,8 @@ class SlotSelectionScene(Scene):
     Escena de selección de slots de guardado.
     """
 
+    next_scenes = ("character_select", "game")
+
     def __init__(
         self, screen: pygame.Surface, config: ConfigManager, game_state, save_manager
     ):
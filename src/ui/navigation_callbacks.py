@@ -42,26 +42,16 @@ class NavigationCallbacks:
     def on_continue_game(self):
         """Callback para continuar la última partida guardada."""
         try:
-            save_files = self.save_manager.get_save_files_info()
+            # El índice de slots resuelve el más reciente sin abrir partidas
+            latest_slot = self.save_manager.get_latest_slot()
 
-            # Buscar el último guardado con timestamp más reciente
-            latest_save = None
-            latest_timestamp = 0
-
-            for save_file in save_files:
-                if save_file.get("exists", False):
-                    timestamp = save_file.get("timestamp", 0)
-                    if timestamp > latest_timestamp:
-                        latest_timestamp = timestamp
-                        latest_save = save_file
-
-            if latest_save:
+            if latest_slot:
                 self.logger.info(
-                    "Continuando desde archivo de guardado %s", latest_save["slot"]
+                    "Continuando desde archivo de guardado %s", latest_slot
                 )
 
                 # Cargar el estado del juego
-                game_data = self.save_manager.load_save(latest_save["slot"])
+                game_data = self.save_manager.load_save(latest_slot)
                 if game_data:
                     self.game_state.load_state(game_data)
                     self.game_state.set_scene("game")
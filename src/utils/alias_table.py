@@ -0,0 +1,80 @@
+"""
+Alias Table - Muestreo ponderado en tiempo constante
+====================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Tabla de alias de Walker con la construcción estable de Vose.
+Se construye una vez en O(n) a partir de pesos y cada muestra cuesta una
+celda aleatoria y una comparación, sin importar cuántos elementos haya.
+"""
+
+import random
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """Elige elementos con probabilidad proporcional a su peso en O(1)."""
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        """
+        Construye la tabla.
+
+        Args:
+            items: Elementos a elegir
+            weights: Peso no negativo de cada elemento (al menos uno positivo)
+
+        Raises:
+            ValueError: Si no hay elementos, las longitudes difieren o los
+                pesos no suman una cantidad positiva
+        """
+        if len(items) != len(weights):
+            raise ValueError("items y weights deben tener la misma longitud")
+        total = float(sum(weights))
+        if not items or total <= 0 or min(weights) < 0:
+            raise ValueError("Se necesitan pesos no negativos con suma positiva")
+
+        count = len(items)
+        self.items = tuple(items)
+        self.weights = tuple(float(w) for w in weights)
+        self.prob = [0.0] * count
+        self.alias = list(range(count))
+
+        # Vose: repartir cada celda "pequeña" con una "grande"
+        scaled = [w * count / total for w in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Lo que queda vale 1 salvo error de redondeo
+        for index in large + small:
+            self.prob[index] = 1.0
+
+    def sample(self, rng: random.Random | None = None) -> T:
+        """
+        Elige un elemento.
+
+        Args:
+            rng: Generador aleatorio (por defecto, el del módulo ``random``)
+        """
+        u = (rng or random).random() * len(self.items)
+        index = int(u)
+        if u - index < self.prob[index]:
+            return self.items[index]
+        return self.items[self.alias[index]]
+
+    def probabilities(self) -> list[float]:
+        """Probabilidad normalizada de cada elemento (en el orden de ``items``)."""
+        total = sum(self.weights)
+        return [w / total for w in self.weights]
+
+    def __len__(self) -> int:
+        return len(self.items)
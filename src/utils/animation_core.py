@@ -45,42 +45,20 @@ class AnimationCore:
 
     def get_optimal_fps(self, animation_type: str, frame_count: int) -> int:
         """
-        Calcula el FPS óptimo para una animación basado en el número de fotogramas.
+        Calcula el FPS óptimo para una animación según su tipo y número de frames.
+
+        Es la única fórmula de FPS del juego: el cargador de animaciones, los
+        assets de personajes y la fachada del gestor delegan aquí.
 
         Args:
-            animation_type: Tipo de animación (idle, run, attack, etc.)
+            animation_type: Tipo de animación (Idle, Run, Attack...; sin distinguir
+                mayúsculas)
             frame_count: Número de fotogramas disponibles
 
         Returns:
             FPS óptimo para la animación
         """
-        # FPS base ajustado por tipo de animación
-        base_speed = self.animation_speeds.get(animation_type.lower(), 1.0)
-        adjusted_fps = int(self.base_fps * base_speed)
-
-        # Si tenemos muy pocos fotogramas, reducir FPS para que se vea bien
-        if frame_count <= 3:
-            return max(8, adjusted_fps // 2)  # Mínimo 8 FPS
-        elif frame_count <= 5:
-            return max(10, int(adjusted_fps // 1.5))
-        elif frame_count <= 8:
-            return max(12, int(adjusted_fps // 1.2))
-        else:
-            return adjusted_fps
-
-    def calculate_optimal_fps(self, frame_count: int, anim_type: str) -> int:
-        """
-        Calcula el FPS óptimo basado en el número de frames y tipo de animación.
-
-        Args:
-            frame_count: Número de frames disponibles
-            anim_type: Tipo de animación
-
-        Returns:
-            FPS óptimo calculado
-        """
-        # FPS base por tipo de animación
-        base_fps = self.animation_speeds.get(anim_type, 1.0) * self.base_fps
+        base_fps = self.get_animation_speed(animation_type) * self.base_fps
 
         # Ajustar según el número de frames
         if frame_count <= 4:
@@ -96,6 +74,10 @@ class AnimationCore:
             # Muchos frames: FPS alto
             return min(30, int(base_fps * 1.2))
 
+    def calculate_optimal_fps(self, frame_count: int, anim_type: str) -> int:
+        """Alias de compatibilidad de get_optimal_fps (orden de argumentos antiguo)."""
+        return self.get_optimal_fps(anim_type, frame_count)
+
     def get_animation_speed(self, animation_type: str) -> float:
         """
         Obtiene la velocidad configurada para un tipo de animación.
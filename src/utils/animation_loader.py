@@ -105,8 +105,8 @@ class AnimationLoader:
                 )
                 return None
 
-            optimal_fps = self.animation_core.calculate_optimal_fps(
-                len(real_frames), anim_type
+            optimal_fps = self.animation_core.get_optimal_fps(
+                anim_type, len(real_frames)
             )
             frame_duration = self.animation_core.get_frame_duration(optimal_fps)
 
@@ -150,6 +150,10 @@ class AnimationLoader:
         # Si hay muy pocos colores, probablemente es un placeholder
         return len(colors) <= 3
 
+    def evict_character(self, character_name: str):
+        """Suelta de la caché las animaciones de un personaje."""
+        self.animation_cache.pop(f"{character_name}_animations", None)
+
     def clear_cache(self):
         """Limpia el caché de animaciones."""
         self.animation_cache.clear()
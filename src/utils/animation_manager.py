@@ -14,7 +14,8 @@ import pygame
 
 from .animation_core import AnimationCore
 from .animation_loader import AnimationLoader
-from .animation_player import AnimationPlayer
+from .animation_player import AnimationClock, AnimationPlayer  # noqa: F401 (re-export)
+from .animation_registry import AnimationPlayerRegistry
 from .asset_manager import AssetManager
 
 
@@ -27,6 +28,7 @@ class IntelligentAnimationManager:
     - AnimationCore: Configuración y cálculos
     - AnimationLoader: Carga de animaciones
     - AnimationPlayer: Reproducción individual
+    - AnimationPlayerRegistry: Adquisición y liberación de reproductores
     """
 
     def __init__(self, asset_manager: AssetManager | None = None):
@@ -38,8 +40,11 @@ class IntelligentAnimationManager:
         self.animation_core = AnimationCore()
         self.animation_loader = AnimationLoader(self.asset_manager, self.animation_core)
 
-        # Cache de reproductores activos
+        # Reproductores de get_current_sprite, uno por personaje y animación
         self.active_players = {}
+        # Reloj de simulación común a todos los reproductores
+        self.clock = AnimationClock()
+        self.registry = AnimationPlayerRegistry(self.animation_loader, self.clock)
 
         self.logger.info("IntelligentAnimationManager inicializado con sistema modular")
 
@@ -62,15 +67,17 @@ class IntelligentAnimationManager:
     def create_animation_player(
         self, character_name: str, initial_animation: str = "Idle"
     ):
-        """Crea un reproductor de animación."""
-        animations = self.load_character_animations(character_name)
-        player = AnimationPlayer(character_name, animations, initial_animation)
+        """
+        Adquiere un reproductor de animación del registro.
 
-        # Guardar en caché de reproductores activos
-        player_key = f"{character_name}_{initial_animation}"
-        self.active_players[player_key] = player
+        El propietario debe devolverlo con release_animation_player() al
+        destruirse para que sus fotogramas puedan liberarse.
+        """
+        return self.registry.acquire(character_name, initial_animation)
 
-        return player
+    def release_animation_player(self, player):
+        """Devuelve al registro un reproductor obtenido con create_animation_player."""
+        self.registry.release(player)
 
     def get_current_sprite(
         self, character_name: str, animation_type: str = "Idle"
@@ -80,6 +87,7 @@ class IntelligentAnimationManager:
         player_key = f"{character_name}_{animation_type}"
         if player_key not in self.active_players:
             player = self.create_animation_player(character_name, animation_type)
+            self.active_players[player_key] = player
         else:
             player = self.active_players[player_key]
 
@@ -89,9 +97,17 @@ class IntelligentAnimationManager:
     # MÉTODOS DE COMPATIBILIDAD CON LA API ORIGINAL
     # ============================================================================
 
+    def update(self, delta_time: float):
+        """
+        Avanza todas las animaciones un tick de simulación.
+
+        Args:
+            delta_time: Segundos de simulación (no se llama en pausa)
+        """
+        self.clock.advance(delta_time * 1000.0)
+
     def update_character_animation(self, character_name: str, delta_time: float):
-        """Método de compatibilidad - la actualización es automática en AnimationPlayer."""
-        # Los AnimationPlayer se actualizan automáticamente, este método por compatibilidad
+        """Método de compatibilidad - el reloj común avanza todos los reproductores."""
         _ = delta_time  # Argumento mantenido por compatibilidad de API
         self.logger.debug("update_character_animation llamado para %s", character_name)
 
@@ -113,7 +129,10 @@ class IntelligentAnimationManager:
     def clear_cache(self):
         """Limpia todas las cachés del sistema."""
         self.animation_loader.clear_cache()
+        for player in self.active_players.values():
+            self.registry.release(player)
         self.active_players.clear()
+        self.registry.clear_pool()
         self.logger.info("Caché del sistema de animaciones limpiado")
 
     def get_system_info(self) -> dict:
@@ -121,8 +140,13 @@ class IntelligentAnimationManager:
         loader_info = self.animation_loader.get_cache_info()
         core_config = self.animation_core.get_animation_config_summary()
 
+        registry_info = self.registry.get_stats()
+
         return {
-            "active_players": len(self.active_players),
+            "active_players": registry_info["live_players"],
+            "pooled_players": registry_info["pooled_players"],
+            "cached_frames": registry_info["cached_frames"],
+            "frame_memory_bytes": registry_info["frame_bytes"],
             "cached_characters": loader_info["cached_characters"],
             "total_animations": loader_info["total_animations"],
             "base_fps": core_config["base_fps"],
@@ -130,8 +154,9 @@ class IntelligentAnimationManager:
         }
 
     def preload_characters(self, character_names: list):
-        """Precarga animaciones para múltiples personajes."""
+        """Precarga animaciones para múltiples personajes (quedan fijadas en memoria)."""
         self.animation_loader.preload_character_animations(character_names)
+        self.registry.pin(character_names)
 
     @property
     def base_fps(self) -> int:
@@ -1,17 +1,64 @@
 """
-Animation Player - Reproductor de Animaciones (Optimizado)
-==========================================================
+Animation Player - Reproductor de Animaciones
+=============================================
 
 Autor: SiK Team
 Fecha: 2025-07-30
-Descripción: Reproductor de animaciones para personajes individuales - versión compactada.
+Descripción: Reproductor de animaciones para personajes individuales y reloj de
+animación común. El tiempo lo marca la simulación (``AnimationClock.advance``),
+no el reloj de pared: en pausa las animaciones se congelan, y el índice de
+frame se resuelve una vez por tick para todos los reproductores con horarios
+de frame precalculados por (número de frames, duración de frame).
 """
 
 import logging
+import weakref
+from bisect import bisect_right
+from functools import lru_cache
 
 import pygame
 
 
+@lru_cache(maxsize=256)
+def frame_schedule(frame_count: int, frame_duration: float) -> tuple[float, ...]:
+    """
+    Instantes (ms) en que termina cada frame de una animación.
+
+    Se calcula una vez por combinación de frames y duración y se comparte entre
+    todos los reproductores; el último valor es la duración total.
+    """
+    return tuple(frame_duration * (i + 1) for i in range(max(1, frame_count)))
+
+
+class AnimationClock:
+    """Reloj de simulación que avanza todos los reproductores en un solo paso."""
+
+    def __init__(self):
+        self.time_ms = 0.0
+        self.players: weakref.WeakSet[AnimationPlayer] = weakref.WeakSet()
+
+    def register(self, player: "AnimationPlayer"):
+        """Añade un reproductor al paso común (se suelta solo al destruirse)."""
+        self.players.add(player)
+
+    def unregister(self, player: "AnimationPlayer"):
+        """Saca un reproductor del paso común."""
+        self.players.discard(player)
+
+    def advance(self, delta_ms: float):
+        """
+        Avanza el tiempo de simulación y recalcula el frame de cada reproductor.
+
+        Args:
+            delta_ms: Milisegundos de simulación transcurridos (0 en pausa)
+        """
+        if delta_ms <= 0:
+            return
+        self.time_ms += delta_ms
+        for player in list(self.players):
+            player.advance(delta_ms)
+
+
 class AnimationPlayer:
     """Reproductor de animaciones para un personaje específico."""
 
@@ -20,13 +67,24 @@ class AnimationPlayer:
         character_name: str,
         animations: dict[str, dict],
         initial_animation: str = "Idle",
+        clock: AnimationClock | None = None,
     ):
-        """Inicializa el reproductor de animaciones."""
+        """
+        Inicializa el reproductor de animaciones.
+
+        Args:
+            character_name: Nombre del personaje
+            animations: Animación -> datos (frames, frame_count, frame_duration, fps)
+            initial_animation: Animación inicial
+            clock: Reloj que avanza el reproductor; sin reloj se avanza con advance()
+        """
         self.logger = logging.getLogger(__name__)
         self.character_name = character_name
         self.animations = animations
         self.current_animation = initial_animation
-        self.animation_start_time = pygame.time.get_ticks()
+        self.elapsed_ms = 0.0
+        self._frame_index = 0
+        self._schedule: tuple[float, ...] = (1.0,)
 
         # Validar que la animación inicial existe
         if initial_animation not in self.animations:
@@ -43,6 +101,24 @@ class AnimationPlayer:
                 self.logger.error(
                     "No hay animaciones disponibles para %s", character_name
                 )
+        self._load_schedule()
+
+        if clock is not None:
+            clock.register(self)
+
+    def _load_schedule(self):
+        """Toma el horario precalculado de la animación actual."""
+        animation_data = self.animations.get(self.current_animation)
+        if animation_data:
+            self._schedule = frame_schedule(
+                animation_data["frame_count"], animation_data["frame_duration"]
+            )
+
+    def advance(self, delta_ms: float):
+        """Avanza el tiempo de la animación actual y resuelve su frame."""
+        self.elapsed_ms += delta_ms
+        total = self._schedule[-1]
+        self._frame_index = bisect_right(self._schedule, self.elapsed_ms % total)
 
     def set_animation(self, animation_type: str):
         """Cambia la animación actual."""
@@ -51,7 +127,8 @@ class AnimationPlayer:
             and animation_type in self.animations
         ):
             self.current_animation = animation_type
-            self.animation_start_time = pygame.time.get_ticks()
+            self._load_schedule()
+            self.restart_animation()
             self.logger.debug(
                 "Cambiando animación de %s a: %s", self.character_name, animation_type
             )
@@ -60,55 +137,37 @@ class AnimationPlayer:
         """Obtiene el frame actual de la animación."""
         if self.current_animation not in self.animations:
             return None
-        frame_index = self._calculate_current_frame_index()
-        return self.animations[self.current_animation]["frames"][frame_index]
-
-    def _calculate_current_frame_index(self) -> int:
-        """Calcula el índice del frame actual."""
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.animation_start_time
-        animation_data = self.animations[self.current_animation]
-        frame_duration = animation_data["frame_duration"]
-        frame_count = animation_data["frame_count"]
-        return int((elapsed_time // frame_duration) % frame_count)
+        return self.animations[self.current_animation]["frames"][self._frame_index]
 
     @property
     def current_frame_index(self) -> int:
         """Obtiene el índice del frame actual."""
-        return (
-            0
-            if self.current_animation not in self.animations
-            else self._calculate_current_frame_index()
-        )
+        return 0 if self.current_animation not in self.animations else self._frame_index
 
     def is_animation_completed(self) -> bool:
         """Verifica si la animación actual se completó."""
         if self.current_animation not in self.animations:
             return True
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.animation_start_time
-        animation_data = self.animations[self.current_animation]
-        total_duration = (
-            animation_data["frame_duration"] * animation_data["frame_count"]
-        )
-        return elapsed_time >= total_duration
+        return self.elapsed_ms >= self._schedule[-1]
+
+    def reset(self, animation_type: str = "Idle"):
+        """Prepara un reproductor reciclado: animación inicial desde el principio."""
+        if animation_type in self.animations:
+            self.current_animation = animation_type
+            self._load_schedule()
+        self.restart_animation()
 
     def restart_animation(self):
         """Reinicia la animación actual."""
-        self.animation_start_time = pygame.time.get_ticks()
+        self.elapsed_ms = 0.0
+        self._frame_index = 0
 
     def get_animation_progress(self) -> float:
         """Obtiene el progreso de la animación (0.0-1.0)."""
         if self.current_animation not in self.animations:
             return 1.0
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.animation_start_time
-        animation_data = self.animations[self.current_animation]
-        total_duration = (
-            animation_data["frame_duration"] * animation_data["frame_count"]
-        )
-        progress = (elapsed_time % total_duration) / total_duration
-        return min(1.0, max(0.0, progress))
+        total = self._schedule[-1]
+        return min(1.0, max(0.0, (self.elapsed_ms % total) / total))
 
     def get_animation_info(self) -> dict:
         """Obtiene información de la animación actual."""
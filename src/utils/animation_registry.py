@@ -0,0 +1,138 @@
+"""
+Animation Registry - Registro de reproductores de animación
+===========================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Las entidades adquieren y liberan reproductores de animación. Los
+fotogramas de cada personaje se cuentan por referencias: al liberar el último
+reproductor de un personaje no precargado se sueltan sus fotogramas de la caché
+del cargador. Los reproductores liberados se reciclan (con límite por personaje)
+para que los spawns y muertes continuos no hagan crecer la memoria.
+"""
+
+import logging
+
+from .animation_loader import AnimationLoader
+from .animation_player import AnimationClock, AnimationPlayer
+
+# Reproductores libres que se guardan por personaje para reciclar
+MAX_POOLED_PER_CHARACTER = 32
+
+
+class AnimationPlayerRegistry:
+    """Registro acotado y con conteo de referencias de reproductores."""
+
+    def __init__(
+        self,
+        loader: AnimationLoader,
+        clock: AnimationClock,
+        max_pooled: int = MAX_POOLED_PER_CHARACTER,
+    ):
+        """
+        Inicializa el registro.
+
+        Args:
+            loader: Cargador (y caché) de animaciones de personajes
+            clock: Reloj que avanza los reproductores vivos
+            max_pooled: Reproductores libres retenidos por personaje
+        """
+        self.logger = logging.getLogger(__name__)
+        self.loader = loader
+        self.clock = clock
+        self.max_pooled = max_pooled
+        self._live: dict[int, AnimationPlayer] = {}
+        self._pool: dict[str, list[AnimationPlayer]] = {}
+        self._refs: dict[str, int] = {}
+        self.pinned: set[str] = set()
+        self.stats = {"created": 0, "recycled": 0, "released": 0, "evicted": 0}
+
+    def acquire(
+        self, character_name: str, initial_animation: str = "Idle"
+    ) -> AnimationPlayer:
+        """
+        Entrega un reproductor (reciclado si hay uno libre) y lo suma al reloj.
+
+        Args:
+            character_name: Nombre del personaje
+            initial_animation: Animación inicial
+
+        Returns:
+            Reproductor que debe devolverse con ``release``
+        """
+        pool = self._pool.get(character_name)
+        if pool:
+            player = pool.pop()
+            player.reset(initial_animation)
+            self.stats["recycled"] += 1
+        else:
+            animations = self.loader.load_character_animations(character_name)
+            player = AnimationPlayer(character_name, animations, initial_animation)
+            self.stats["created"] += 1
+
+        self.clock.register(player)
+        self._live[id(player)] = player
+        self._refs[character_name] = self._refs.get(character_name, 0) + 1
+        return player
+
+    def release(self, player: AnimationPlayer | None):
+        """
+        Devuelve un reproductor; liberar dos veces el mismo no tiene efecto.
+
+        Args:
+            player: Reproductor obtenido con ``acquire``
+        """
+        if player is None or self._live.pop(id(player), None) is None:
+            return
+        self.clock.unregister(player)
+        self.stats["released"] += 1
+
+        name = player.character_name
+        self._refs[name] -= 1
+        pool = self._pool.setdefault(name, [])
+        if len(pool) < self.max_pooled:
+            pool.append(player)
+        if self._refs[name] == 0 and name not in self.pinned:
+            self._evict(name)
+
+    def _evict(self, character_name: str):
+        """Suelta los reproductores libres y los fotogramas de un personaje."""
+        del self._refs[character_name]
+        self._pool.pop(character_name, None)
+        self.loader.evict_character(character_name)
+        self.stats["evicted"] += 1
+        self.logger.debug("Animaciones de %s liberadas", character_name)
+
+    def pin(self, character_names: list[str]):
+        """Mantiene en memoria personajes precargados aunque no tengan referencias."""
+        self.pinned.update(character_names)
+
+    def clear_pool(self):
+        """Descarta los reproductores libres (p. ej. al limpiar la caché)."""
+        self._pool.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Estado del registro y memoria de fotogramas en caché.
+
+        Returns:
+            Reproductores vivos y libres, personajes referenciados, fotogramas
+            en caché y bytes aproximados de sus píxeles
+        """
+        frames = 0
+        frame_bytes = 0
+        for animations in self.loader.animation_cache.values():
+            for animation_data in animations.values():
+                for frame in animation_data["frames"]:
+                    frames += 1
+                    frame_bytes += (
+                        frame.get_width() * frame.get_height() * frame.get_bytesize()
+                    )
+        return {
+            "live_players": len(self._live),
+            "pooled_players": sum(len(pool) for pool in self._pool.values()),
+            "referenced_characters": len(self._refs),
+            "cached_frames": frames,
+            "frame_bytes": frame_bytes,
+            **self.stats,
+        }
@@ -0,0 +1,127 @@
+"""
+Background Pattern - Patrón de fondo prerenderizado
+==================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Renderiza una sola vez un mosaico sin costuras del fondo (color
+base, ondulaciones de arena y rejilla del mundo) por resolución y paleta, y lo
+replica en una superficie algo mayor que la pantalla. Cada frame el fondo es un
+único blit desplazado según la cámara: el coste no depende de la densidad de
+la rejilla ni del número de líneas.
+"""
+
+from functools import lru_cache
+from math import lcm
+from typing import NamedTuple
+
+import pygame
+
+Color = tuple[int, int, int]
+
+
+class BackgroundPalette(NamedTuple):
+    """Colores y espaciados del patrón (hashable: sirve de clave de caché)."""
+
+    base: Color
+    # Líneas horizontales cada ``stripe_spacing`` px, ciclando estos colores
+    stripes: tuple[Color, ...] = ()
+    stripe_spacing: int = 20
+    # Líneas verticales finas cada ``column_spacing`` px
+    column: Color | None = None
+    column_spacing: int = 50
+    # Rejilla del mundo
+    grid: Color | None = None
+    cell_size: int = 100
+    grid_thickness: int = 2
+
+
+def pattern_period(palette: BackgroundPalette) -> tuple[int, int]:
+    """Lado (ancho, alto) mínimo con el que el patrón se repite sin costuras."""
+    period_x = palette.cell_size if palette.grid else 1
+    period_y = period_x
+    if palette.stripes:
+        period_y = lcm(period_y, palette.stripe_spacing * len(palette.stripes))
+    if palette.column:
+        period_x = lcm(period_x, palette.column_spacing)
+    return period_x, period_y
+
+
+def build_pattern_tile(palette: BackgroundPalette) -> pygame.Surface:
+    """
+    Dibuja un mosaico del patrón con las mismas líneas que el fondo por frame.
+
+    Returns:
+        Superficie de un periodo del patrón
+    """
+    width, height = pattern_period(palette)
+    tile = pygame.Surface((width, height))
+    tile.fill(palette.base)
+
+    if palette.stripes:
+        for index, y in enumerate(range(0, height, palette.stripe_spacing)):
+            color = palette.stripes[index % len(palette.stripes)]
+            pygame.draw.line(tile, color, (0, y), (width, y), 1)
+    if palette.column:
+        for x in range(0, width, palette.column_spacing):
+            pygame.draw.line(tile, palette.column, (x, 0), (x, height), 1)
+    if palette.grid:
+        thickness = palette.grid_thickness
+        for x in range(0, width, palette.cell_size):
+            tile.fill(palette.grid, (x, 0, thickness, height))
+        for y in range(0, height, palette.cell_size):
+            tile.fill(palette.grid, (0, y, width, thickness))
+    return tile
+
+
+class BackgroundPattern:
+    """Patrón replicado a tamaño de pantalla, dibujado con un blit por frame."""
+
+    def __init__(self, screen_size: tuple[int, int], palette: BackgroundPalette):
+        """
+        Construye la superficie replicada.
+
+        Args:
+            screen_size: Resolución de la pantalla
+            palette: Paleta y espaciados del patrón
+        """
+        self.screen_size = screen_size
+        self.palette = palette
+        self.period = pattern_period(palette)
+        tile = build_pattern_tile(palette)
+
+        width = screen_size[0] + self.period[0]
+        height = screen_size[1] + self.period[1]
+        self.surface = pygame.Surface((width, height))
+        self.surface.fblits(
+            (tile, (x, y))
+            for x in range(0, width, self.period[0])
+            for y in range(0, height, self.period[1])
+        )
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+
+    def render(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+        """
+        Dibuja el fondo anclado al mundo.
+
+        Args:
+            screen: Superficie donde renderizar
+            camera_x: Posición X de la cámara en el mundo
+            camera_y: Posición Y de la cámara en el mundo
+        """
+        offset_x = int(camera_x) % self.period[0]
+        offset_y = int(camera_y) % self.period[1]
+        screen.blit(
+            self.surface,
+            (0, 0),
+            (offset_x, offset_y, self.screen_size[0], self.screen_size[1]),
+        )
+
+
+@lru_cache(maxsize=8)
+def get_background_pattern(
+    screen_size: tuple[int, int], palette: BackgroundPalette
+) -> BackgroundPattern:
+    """Patrón compartido por resolución y paleta (se construye una vez)."""
+    return BackgroundPattern(screen_size, palette)
@@ -5,12 +5,38 @@ Camera System - Sistema de Cámara
 Autor: SiK Team
 Fecha: 2024
 Descripción: Sistema de cámara que sigue al jugador y muestra la porción visible del mundo.
+Además de las consultas por objeto, ofrece consultas en lote con NumPy: un grupo
+de entidades se recorta y se pasa a coordenadas de pantalla en una sola operación.
 """
 
 import logging
+from itertools import chain
+from operator import attrgetter
 
+import numpy as np
 import pygame
 
+from .spatial_grid import SpatialGrid
+
+_BOUNDS = attrgetter("x", "y", "width", "height")
+
+
+def pack_bounds(entities) -> np.ndarray:
+    """
+    Empaqueta posición y tamaño de un grupo de entidades.
+
+    Args:
+        entities: Secuencia de objetos con x, y, width y height
+
+    Returns:
+        Array (N, 4) de float con (x, y, ancho, alto) por entidad
+    """
+    return np.fromiter(
+        chain.from_iterable(map(_BOUNDS, entities)),
+        dtype=np.float64,
+        count=4 * len(entities),
+    ).reshape(-1, 4)
+
 
 class Camera:
     """
@@ -48,6 +74,8 @@ class Camera:
         self.max_x = world_width - screen_width // 2
         self.min_y = screen_height // 2
         self.max_y = world_height - screen_height // 2
+        # Sin límites en el mundo por chunks (ver set_unbounded)
+        self.bounded = True
 
         self.logger = logging.getLogger(__name__)
         self.logger.info(
@@ -67,8 +95,13 @@ class Camera:
         self.target_y = target_y - self.screen_height // 2
 
         # Aplicar límites
-        self.target_x = max(self.min_x, min(self.max_x, self.target_x))
-        self.target_y = max(self.min_y, min(self.max_y, self.target_y))
+        if self.bounded:
+            self.target_x = max(self.min_x, min(self.max_x, self.target_x))
+            self.target_y = max(self.min_y, min(self.max_y, self.target_y))
+
+    def set_unbounded(self):
+        """Quita los límites del mundo: la cámara sigue al objetivo a cualquier parte."""
+        self.bounded = False
 
     def update(self, delta_time: float):
         """
@@ -135,6 +168,59 @@ class Camera:
             and screen_y <= self.screen_height
         )
 
+    def world_to_screen_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Convierte un array de posiciones del mundo a coordenadas de pantalla.
+
+        Args:
+                positions: Array (N, 2) de posiciones del mundo
+
+        Returns:
+                Array (N, 2) de coordenadas de pantalla
+        """
+        return np.asarray(positions, dtype=np.float64) - (self.x, self.y)
+
+    def cull(
+        self, positions: np.ndarray, sizes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Versión en lote de is_visible y world_to_screen.
+
+        Args:
+                positions: Array (N, 2) de posiciones del mundo
+                sizes: Array (N, 2) de anchos y altos
+
+        Returns:
+                Tupla (máscara de visibles (N,), coordenadas de pantalla (N, 2))
+        """
+        screen = self.world_to_screen_batch(positions)
+        mask = (
+            (screen + sizes >= 0) & (screen <= (self.screen_width, self.screen_height))
+        ).all(axis=1)
+        return mask, screen
+
+    def visible(
+        self, bounds: np.ndarray, index: SpatialGrid | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Índices visibles de un grupo y sus coordenadas de pantalla.
+
+        Args:
+                bounds: Array (N, 4) de (x, y, ancho, alto), ver pack_bounds
+                index: Índice espacial de ``bounds``; si se da, solo se prueban
+                        los candidatos del rectángulo visible
+
+        Returns:
+                Tupla (índices visibles en orden, coordenadas de pantalla (M, 2))
+        """
+        if index is not None:
+            # El rectángulo entero trunca la posición: se amplía un píxel
+            candidates = index.query(self.get_visible_rect().inflate(2, 2))
+            mask, screen = self.cull(bounds[candidates, :2], bounds[candidates, 2:])
+            return candidates[mask], screen[mask]
+        mask, screen = self.cull(bounds[:, :2], bounds[:, 2:])
+        return np.flatnonzero(mask), screen[mask]
+
     def get_viewport(self) -> tuple[float, float, float, float]:
         """
         Obtiene el área visible del mundo.
@@ -168,6 +254,9 @@ class Camera:
         """
         Limita la posición de la cámara para que no se salga de los límites del mundo.
         """
+        if not self.bounded:
+            return
+
         # Recalcular límites dinámicamente por si el mundo cambió
         self.min_x = 0
         self.max_x = max(0, self.world_width - self.screen_width)
@@ -12,6 +12,7 @@ from typing import Any
 
 import pygame
 
+from .animation_core import AnimationCore
 from .character_assets_loader import CharacterAssetsLoader
 
 
@@ -27,6 +28,7 @@ class CharacterAssetsAnimation:
         """
         self.assets_loader = assets_loader
         self.logger = logging.getLogger(__name__)
+        self.animation_core = AnimationCore()
 
         self.logger.info("CharacterAssetsAnimation inicializado")
 
@@ -72,6 +74,18 @@ class CharacterAssetsAnimation:
             char_config = self.assets_loader.get_character_config(character_name)
             max_frames = char_config.get("total_frames", 10)
 
+        # Atlas precompilado: una hoja decodificada y subsuperficies por frame
+        atlas_frames = self.assets_loader.get_atlas_frames(character_name, animation)
+        if atlas_frames is not None:
+            frames = atlas_frames[:max_frames]
+            self.logger.info(
+                "Cargados %d frames (atlas) para %s/%s",
+                len(frames),
+                character_name,
+                animation,
+            )
+            return frames
+
         # Cargar frames hasta encontrar uno que no exista o alcanzar el máximo
         if max_frames is not None:
             while frame <= max_frames:
@@ -123,7 +137,7 @@ class CharacterAssetsAnimation:
 
     def calculate_optimal_fps(self, frame_count: int, anim_type: str) -> int:
         """
-        Calcula el FPS óptimo para una animación.
+        Calcula el FPS óptimo para una animación (delegado a AnimationCore).
 
         Args:
             frame_count: Número de frames
@@ -132,34 +146,7 @@ class CharacterAssetsAnimation:
         Returns:
             FPS óptimo
         """
-        # FPS base por tipo de animación
-        base_fps = {
-            "Idle": 12,
-            "Walk": 15,
-            "Run": 18,
-            "Attack": 20,
-            "Dead": 10,
-            "Shoot": 16,
-            "Jump": 14,
-            "Melee": 18,
-            "Slide": 16,
-            "JumpMelee": 16,
-            "JumpShoot": 16,
-            "RunShoot": 18,
-            "JumpAttack": 15,
-        }
-
-        fps = base_fps.get(anim_type, 15)
-
-        # Ajustar según el número de frames
-        if frame_count <= 4:
-            return max(8, fps // 2)
-        elif frame_count <= 8:
-            return max(10, int(fps * 0.8))
-        elif frame_count <= 12:
-            return fps
-        else:
-            return min(30, int(fps * 1.2))
+        return self.animation_core.get_optimal_fps(anim_type, frame_count)
 
     def preload_character_animations(
         self, character_name: str
@@ -15,6 +15,7 @@ from typing import Any
 import pygame
 
 from .asset_loader import AssetLoader
+from .texture_atlas import TextureAtlasLoader
 
 
 class CharacterAssetsLoader:
@@ -30,6 +31,10 @@ class CharacterAssetsLoader:
         self.asset_loader = asset_loader
         self.logger = logging.getLogger(__name__)
         self.animation_config = self._load_animation_config()
+        # Atlas generados con dev-tools/scripts/build_texture_atlases.py
+        self.atlas = TextureAtlasLoader(
+            Path(self.asset_loader.base_path) / "characters" / "atlas"
+        )
 
         self.logger.info("CharacterAssetsLoader inicializado")
 
@@ -135,6 +140,25 @@ class CharacterAssetsLoader:
         )
         return self.asset_loader.create_placeholder(64, 64, scale)
 
+    def get_atlas_frames(
+        self, character_name: str, animation: str
+    ) -> list[pygame.Surface] | None:
+        """
+        Obtiene los frames de una animación desde el atlas del personaje.
+
+        Args:
+            character_name: Nombre del personaje
+            animation: Tipo de animación
+
+        Returns:
+            Subsuperficies del atlas, o None si no hay atlas para esa animación
+            o se generó con otra escala
+        """
+        char_config = self.animation_config["characters"].get(character_name, {})
+        return self.atlas.get_frames(
+            character_name, animation, char_config.get("escala_sprite", 1.0)
+        )
+
     def is_character_available(self, character_name: str) -> bool:
         """
         Verifica si un personaje está disponible en la configuración.
@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Any
 
 from .database_manager import DatabaseManager
+from .schema_tables import extract_typed_values
 
 
 class CharacterDatabase:
@@ -48,7 +49,7 @@ class CharacterDatabase:
             Diccionario con datos del personaje o None si no existe
         """
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -89,7 +90,7 @@ class CharacterDatabase:
             Lista de diccionarios con datos de todos los personajes activos
         """
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -123,6 +124,46 @@ class CharacterDatabase:
             self.logger.error("Error obteniendo lista de personajes: %s", e)
             return []
 
+    def get_characters_by_type(self, character_type: str) -> list[dict[str, Any]]:
+        """
+        Obtiene los personajes activos de una clase usando el índice por tipo.
+
+        Args:
+            character_type: Clase del personaje ('Melee', 'Ranged', etc.)
+
+        Returns:
+            Lista con nombre, nombre_mostrar y stats tipados de cada personaje
+        """
+        try:
+            with self.db_manager.get_connection(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT nombre, nombre_mostrar, vida, velocidad, dano, escudo
+                    FROM personajes
+                    WHERE tipo = ? AND activo = 1
+                    ORDER BY nombre_mostrar
+                """,
+                    (character_type,),
+                )
+                return [
+                    {
+                        "nombre": row[0],
+                        "nombre_mostrar": row[1],
+                        "vida": row[2],
+                        "velocidad": row[3],
+                        "dano": row[4],
+                        "escudo": row[5],
+                    }
+                    for row in cursor.fetchall()
+                ]
+
+        except (sqlite3.Error, AttributeError) as e:
+            self.logger.error(
+                "Error obteniendo personajes de tipo '%s': %s", character_type, e
+            )
+            return []
+
     def save_character_data(self, character_data: dict[str, Any]) -> bool:
         """
         Guarda o actualiza datos de un personaje en SQLite.
@@ -134,13 +175,15 @@ class CharacterDatabase:
             True si se guardó exitosamente, False en caso de error
         """
         try:
+            typed = extract_typed_values("personajes", character_data)
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     INSERT OR REPLACE INTO personajes
-                    (nombre, nombre_mostrar, tipo, descripcion, stats, ataques, sprite_config, activo)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    (nombre, nombre_mostrar, tipo, descripcion, stats, ataques, sprite_config,
+                     vida, velocidad, dano, escudo, activo)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         character_data.get("nombre", ""),
@@ -154,6 +197,10 @@ class CharacterDatabase:
                         json.dumps(
                             character_data.get("sprite_config", {}), ensure_ascii=False
                         ),
+                        typed["vida"],
+                        typed["velocidad"],
+                        typed["dano"],
+                        typed["escudo"],
                         character_data.get("activo", True),
                     ),
                 )
@@ -163,7 +210,7 @@ class CharacterDatabase:
                 )
                 return True
 
-        except (sqlite3.Error, TypeError, KeyError) as e:
+        except (sqlite3.Error, TypeError, KeyError, ValueError) as e:
             self.logger.error("Error guardando datos del personaje: %s", e)
             return False
 
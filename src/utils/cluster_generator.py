@@ -9,7 +9,6 @@ Descripción: Genera clusters específicos de elementos del mundo.
 
 import logging
 import math
-import random
 
 from entities.tile import Tile, TileType
 
@@ -60,8 +59,8 @@ class ClusterGenerator:
 
         for _ in range(num_elements):
             # Posición aleatoria dentro del radio
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, radius)
+            angle = self.world_core.rng.uniform(0, 2 * math.pi)
+            distance = self.world_core.rng.uniform(0, radius)
 
             x = center_x + distance * math.cos(angle)
             y = center_y + distance * math.sin(angle)
@@ -107,7 +106,7 @@ class ClusterGenerator:
     ) -> list[Tile]:
         """Genera una formación de rocas."""
         rock_types = [TileType.ROCK, TileType.ALTAR, TileType.CRYSTAL]
-        num_elements = random.randint(3, 8)
+        num_elements = self.world_core.rng.randint(3, 8)
         rock_elements = self.generate_cluster(
             center_x, center_y, radius, num_elements, rock_types
         )
@@ -121,7 +120,7 @@ class ClusterGenerator:
     ) -> list[Tile]:
         """Genera un campo de cactus."""
         cactus_types = [TileType.TREE]  # Los cactus se mapean como TREE
-        num_elements = random.randint(5, 12)
+        num_elements = self.world_core.rng.randint(5, 12)
         cactus_elements = self.generate_cluster(
             center_x, center_y, radius, num_elements, cactus_types
         )
@@ -135,7 +134,7 @@ class ClusterGenerator:
     ) -> list[Tile]:
         """Genera ruinas antiguas."""
         ruin_types = [TileType.ALTAR, TileType.CRYSTAL, TileType.ROCK]
-        num_elements = random.randint(4, 10)
+        num_elements = self.world_core.rng.randint(4, 10)
         ruin_elements = self.generate_cluster(
             center_x, center_y, radius, num_elements, ruin_types
         )
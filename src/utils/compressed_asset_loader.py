@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Optional
 from io import BytesIO
 
+from .texture_atlas import TextureAtlasLoader
+
 
 class CompressedAssetLoader:
     """Cargador optimizado para assets comprimidos."""
@@ -29,6 +31,7 @@ class CompressedAssetLoader:
         self.compressed_path = compressed_path
         self.loaded_characters = {}
         self.cache = {}
+        self.atlas = TextureAtlasLoader(compressed_path.parent / "atlas")
 
     def load_character(self, character_name: str) -> Optional[dict]:
         """
@@ -43,6 +46,21 @@ class CompressedAssetLoader:
         if character_name in self.loaded_characters:
             return self.loaded_characters[character_name]
 
+        # Atlas precompilado: una hoja por lote de frames en vez de un PNG por frame
+        atlas_animations = self.atlas.load_character(character_name)
+        if atlas_animations is not None:
+            character_data = {
+                "animations": atlas_animations,
+                "manifest": {"atlas": True},
+                "sprites": {
+                    f"{anim_type}_{index}": frame
+                    for anim_type, frames in atlas_animations.items()
+                    for index, frame in enumerate(frames, 1)
+                },
+            }
+            self.loaded_characters[character_name] = character_data
+            return character_data
+
         zip_path = self.compressed_path / f"{character_name}.zip"
 
         if not zip_path.exists():
@@ -119,6 +137,7 @@ class CompressedAssetLoader:
         """Limpia el cache de personajes cargados."""
         self.loaded_characters.clear()
         self.cache.clear()
+        self.atlas.clear_cache()
 
     def get_memory_usage(self) -> dict:
         """Obtiene información de uso de memoria."""
@@ -27,6 +27,7 @@ from typing import Any
 from .character_database import CharacterDatabase
 from .database_manager import DatabaseManager
 from .enemy_database import EnemyDatabase
+from .schema_migrations import SchemaMigrations
 
 
 class ConfigDatabase:
@@ -54,7 +55,7 @@ class ConfigDatabase:
     def _ensure_config_tables(self):
         """Asegura que las tablas de configuración existan."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT name FROM sqlite_master
@@ -66,8 +67,14 @@ class ConfigDatabase:
                     self.logger.info(
                         "Tablas de configuración incompletas, verificando SchemaManager..."
                     )
+                    return
 
-        except (sqlite3.Error, AttributeError, ValueError) as e:
+            # Migrar filas JSON antiguas a columnas tipadas si hace falta
+            applied = SchemaMigrations(self.db_manager).apply_pending_migrations()
+            if applied:
+                self.logger.info("Migraciones de esquema aplicadas: %s", applied)
+
+        except (sqlite3.Error, AttributeError, ValueError, RuntimeError) as e:
             self.logger.error("Error verificando tablas de configuración: %s", e)
 
     # === MÉTODOS DELEGADOS PARA COMPATIBILIDAD ===
@@ -85,6 +92,10 @@ class ConfigDatabase:
         """Delega a CharacterDatabase. Mantiene compatibilidad de API."""
         return self.characters.save_character_data(character_data)
 
+    def get_characters_by_type(self, character_type: str) -> list[dict[str, Any]]:
+        """Delega a CharacterDatabase. Consulta indexada por clase."""
+        return self.characters.get_characters_by_type(character_type)
+
     def get_enemy_data(self, enemy_type: str) -> dict[str, Any] | None:
         """Delega a EnemyDatabase. Mantiene compatibilidad de API."""
         return self.enemies.get_enemy_data(enemy_type)
@@ -93,6 +104,10 @@ class ConfigDatabase:
         """Delega a EnemyDatabase. Mantiene compatibilidad de API."""
         return self.enemies.get_all_enemies()
 
+    def get_enemies_by_rarity(self, rarity: str) -> list[dict[str, Any]]:
+        """Delega a EnemyDatabase. Consulta indexada por rareza."""
+        return self.enemies.get_enemies_by_rarity(rarity)
+
     def save_enemy_data(self, enemy_data: dict[str, Any]) -> bool:
         """Delega a EnemyDatabase. Mantiene compatibilidad de API."""
         return self.enemies.save_enemy_data(enemy_data)
@@ -2,46 +2,121 @@
 DatabaseConnection - Gestor de conexiones SQLite con pooling
 
 Gestiona el pool de conexiones, configuración y conexiones básicas.
+
+El pool separa conexiones de lectura (``PRAGMA query_only``) y de escritura
+(``BEGIN IMMEDIATE`` implícito antes del primer INSERT/UPDATE/DELETE), crece
+bajo demanda hasta ``pool_size`` conexiones activas de cada tipo (las demás
+peticiones esperan a que se devuelva una) y solo hace commit cuando la conexión
+abrió una transacción. Se comparte una instancia por ruta de base de datos.
 """
 
 import logging
+import re
 import sqlite3
 import threading
+import time
 from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+READ_ONLY_PREFIXES = ("SELECT", "PRAGMA", "EXPLAIN", "WITH")
+_WRITE_KEYWORDS = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b")
+
+
+def is_read_only_query(query: str) -> bool:
+    """
+    Indica si una consulta SQL solo lee datos.
+
+    ``WITH ... INSERT/UPDATE/DELETE`` y las asignaciones ``PRAGMA x = y``
+    escriben: fallarían en una conexión ``query_only``.
+    """
+    statement = query.lstrip().upper()
+    if statement.startswith("PRAGMA"):
+        return "=" not in statement
+    if statement.startswith("WITH"):
+        return _WRITE_KEYWORDS.search(statement) is None
+    return statement.startswith(READ_ONLY_PREFIXES)
+
+
+@dataclass
+class PoolStats:
+    """Métricas acumuladas del pool de conexiones."""
+
+    checkouts_read: int = 0
+    checkouts_write: int = 0
+    active: int = 0
+    peak_active: int = 0
+    waits: int = 0
+    connections_created: int = 0
+    commits: int = 0
+    commits_skipped: int = 0
+    rollbacks: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    hold_ms_max: float = 0.0
+
 
 class DatabaseConnection:
     """Gestor de conexiones SQLite con pooling optimizado."""
 
-    def __init__(self, db_path: str = "saves/game_database.db", pool_size: int = 5):
+    _shared: dict[Path, "DatabaseConnection"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: str = "saves/game_database.db",
+        pool_size: int = 5,
+        checkout_timeout: float = 30.0,
+    ):
         self.db_path = Path(db_path)
         self.pool_size = pool_size
-        self._pool: list[sqlite3.Connection] = []
+        self.checkout_timeout = checkout_timeout
+        self._read_pool: list[sqlite3.Connection] = []
+        self._write_pool: list[sqlite3.Connection] = []
         self._pool_lock = threading.Lock()
+        # Conexiones en uso por tipo (True: lectura); se espera en _available.
+        # Lectores y escritores comparten la condición: hay que usar notify_all
+        self._available = threading.Condition(self._pool_lock)
+        self._active = {True: 0, False: 0}
+        self._stats = PoolStats()
         self._logger = logging.getLogger("DatabaseConnection")
 
-        # Crear directorio y pool
+        # Crear directorio; las conexiones se abren bajo demanda
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._initialize_pool()
         self._logger.info("DatabaseConnection inicializado: %s", self.db_path)
 
-    def _initialize_pool(self) -> None:
-        """Inicializa el pool de conexiones SQLite."""
-        try:
-            for _ in range(self.pool_size):
-                self._pool.append(self._create_connection())
-            self._logger.info("Pool creado: %d conexiones", self.pool_size)
-        except sqlite3.Error as e:
-            self._logger.error("Error inicializando pool: %s", e)
-            raise RuntimeError(f"Error inicializando pool: {e}") from e
+    @classmethod
+    def shared(
+        cls, db_path: str = "saves/game_database.db", pool_size: int = 5
+    ) -> "DatabaseConnection":
+        """
+        Obtiene el pool compartido para una ruta de base de datos.
+
+        Varios DatabaseManager sobre el mismo archivo reutilizan así las mismas
+        conexiones en lugar de competir con pools independientes.
+        """
+        key = Path(db_path).resolve()
+        with cls._shared_lock:
+            pool = cls._shared.get(key)
+            if pool is None:
+                pool = cls(db_path, pool_size)
+                cls._shared[key] = pool
+            elif pool_size > pool.pool_size:
+                with pool._available:
+                    pool.pool_size = pool_size
+                    pool._available.notify_all()
+            return pool
 
-    def _create_connection(self) -> sqlite3.Connection:
+    def _create_connection(self, read_only: bool = False) -> sqlite3.Connection:
         """Crea una nueva conexión SQLite optimizada."""
         try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
             conn = sqlite3.connect(
-                str(self.db_path), timeout=30.0, check_same_thread=False
+                str(self.db_path),
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level="DEFERRED" if read_only else "IMMEDIATE",
             )
             conn.row_factory = sqlite3.Row
 
@@ -53,61 +128,168 @@ class DatabaseConnection:
                 "PRAGMA foreign_keys=ON",
                 "PRAGMA temp_store=MEMORY",
             ]
+            if read_only:
+                pragmas.append("PRAGMA query_only=ON")
             for pragma in pragmas:
                 conn.execute(pragma)
-            conn.commit()
+            self._count("connections_created")
             return conn
-        except sqlite3.Error as e:
+        except (sqlite3.Error, OSError) as e:
             self._logger.error("Error creando conexión: %s", e)
             raise RuntimeError(f"Error creando conexión: {e}") from e
 
+    def _checkout(self, read_only: bool) -> sqlite3.Connection:
+        """
+        Saca una conexión del pool correspondiente (o crea una nueva).
+
+        Con ``pool_size`` conexiones de ese tipo en uso, espera a que se
+        devuelva una.
+
+        Raises:
+            RuntimeError: Si no queda ninguna libre en ``checkout_timeout``
+        """
+        pool = self._read_pool if read_only else self._write_pool
+        with self._available:
+            if self._active[read_only] >= self.pool_size:
+                self._stats.waits += 1
+                if not self._available.wait_for(
+                    lambda: self._active[read_only] < self.pool_size,
+                    self.checkout_timeout,
+                ):
+                    raise RuntimeError("Pool de conexiones agotado")
+            self._active[read_only] += 1
+            conn = pool.pop() if pool else None
+        if conn is None:
+            try:
+                conn = self._create_connection(read_only)
+            except RuntimeError:
+                self._release(read_only)
+                raise
+
+        with self._pool_lock:
+            stats = self._stats
+            if read_only:
+                stats.checkouts_read += 1
+            else:
+                stats.checkouts_write += 1
+            stats.active += 1
+            stats.peak_active = max(stats.peak_active, stats.active)
+        return conn
+
+    def _record_wait(self, wait_ms: float) -> None:
+        """Acumula el tiempo de espera hasta disponer de la conexión."""
+        with self._pool_lock:
+            self._stats.wait_ms_total += wait_ms
+            self._stats.wait_ms_max = max(self._stats.wait_ms_max, wait_ms)
+
+    def _release(self, read_only: bool) -> None:
+        """Libera el hueco de una conexión y despierta a quien espera uno."""
+        with self._available:
+            self._active[read_only] -= 1
+            self._available.notify_all()
+
+    def _checkin(
+        self, conn: sqlite3.Connection, read_only: bool, hold_ms: float
+    ) -> None:
+        """Devuelve una conexión al pool o la cierra si está lleno."""
+        pool = self._read_pool if read_only else self._write_pool
+        with self._available:
+            self._stats.active -= 1
+            self._stats.hold_ms_max = max(self._stats.hold_ms_max, hold_ms)
+            self._active[read_only] -= 1
+            self._available.notify_all()
+            if len(pool) < self.pool_size:
+                pool.append(conn)
+                return
+        conn.close()
+
     @contextmanager
-    def get_connection(self):
-        """Context manager para obtener conexión del pool."""
-        conn = None
+    def get_connection(self, read_only: bool = False, begin: bool = False):
+        """
+        Context manager para obtener conexión del pool.
+
+        Args:
+            read_only: Usa una conexión de solo lectura (nunca hace commit)
+            begin: Abre explícitamente la transacción al obtener la conexión
+                (BEGIN DEFERRED en lectura, BEGIN IMMEDIATE en escritura)
+        """
+        requested = time.perf_counter()
+        conn = self._checkout(read_only)
+        started = requested
         try:
-            with self._pool_lock:
-                if self._pool:
-                    conn = self._pool.pop()
-                else:
-                    conn = self._create_connection()
+            if begin:
+                # BEGIN IMMEDIATE espera aquí al escritor activo: cuenta como espera
+                conn.execute("BEGIN DEFERRED" if read_only else "BEGIN IMMEDIATE")
+            started = time.perf_counter()
+            self._record_wait((started - requested) * 1000)
             self._logger.debug("Conexión obtenida del pool")
             yield conn
-        except sqlite3.Error as e:
-            self._logger.error("Error en conexión: %s", e)
-            if conn:
+        except BaseException as e:
+            if isinstance(e, sqlite3.Error):
+                self._logger.error("Error en conexión: %s", e)
+            if conn.in_transaction:
                 conn.rollback()
+                self._count("rollbacks")
             raise
+        else:
+            self._finish(conn, read_only)
         finally:
-            if conn:
-                try:
-                    conn.commit()
-                    with self._pool_lock:
-                        if len(self._pool) < self.pool_size:
-                            self._pool.append(conn)
-                        else:
-                            conn.close()
-                except sqlite3.Error as e:
-                    self._logger.error("Error devolviendo conexión: %s", e)
-                    conn.close()
+            hold_ms = (time.perf_counter() - started) * 1000
+            self._checkin(conn, read_only, hold_ms)
+
+    def _finish(self, conn: sqlite3.Connection, read_only: bool) -> None:
+        """Cierra la transacción abierta; sin commit si no se tocó nada."""
+        if not conn.in_transaction:
+            self._count("commits_skipped")
+            return
+        try:
+            if read_only:
+                conn.rollback()
+                self._count("commits_skipped")
+            else:
+                conn.commit()
+                self._count("commits")
+        except sqlite3.Error as e:
+            self._logger.error("Error devolviendo conexión: %s", e)
+            conn.rollback()
+            self._count("rollbacks")
+            raise
+
+    def _count(self, field: str) -> None:
+        """Incrementa un contador de PoolStats de forma segura entre hilos."""
+        with self._pool_lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
 
     def close_all_connections(self) -> None:
         """Cierra todas las conexiones del pool."""
         try:
             with self._pool_lock:
-                for conn in self._pool:
+                for conn in self._read_pool + self._write_pool:
                     conn.close()
-                self._pool.clear()
+                self._read_pool.clear()
+                self._write_pool.clear()
             self._logger.info("Todas las conexiones cerradas")
         except sqlite3.Error as e:
             self._logger.error("Error cerrando conexiones: %s", e)
 
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Obtiene las métricas de uso y contención del pool."""
+        with self._pool_lock:
+            stats = asdict(self._stats)
+        checkouts = stats["checkouts_read"] + stats["checkouts_write"]
+        stats["wait_ms_avg"] = stats["wait_ms_total"] / checkouts if checkouts else 0.0
+        return stats
+
     def get_connection_info(self) -> dict[str, Any]:
         """Obtiene información del estado de conexiones."""
         with self._pool_lock:
-            return {
+            info = {
                 "db_path": str(self.db_path),
                 "pool_size": self.pool_size,
-                "available_connections": len(self._pool),
+                "available_connections": len(self._read_pool) + len(self._write_pool),
+                "available_read": len(self._read_pool),
+                "available_write": len(self._write_pool),
                 "db_exists": self.db_path.exists(),
             }
+        info["stats"] = self.get_pool_stats()
+        return info
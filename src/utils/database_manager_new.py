@@ -15,16 +15,16 @@ class DatabaseManager:
     """Gestor centralizado de BD SQLite - Fachada unificada preservando API completa."""
 
     def __init__(self, db_path: str = "saves/game_database.db", pool_size: int = 5):
-        self._connection = DatabaseConnection(db_path, pool_size)
+        self._connection = DatabaseConnection.shared(db_path, pool_size)
         self._operations = DatabaseOperations(self._connection)
         self._logger = logging.getLogger("DatabaseManager")
         self._logger.info("DatabaseManager inicializado con módulos especializados")
 
     # === API DE CONEXIONES (delegada a DatabaseConnection) ===
 
-    def get_connection(self):
+    def get_connection(self, read_only: bool = False, begin: bool = False):
         """Context manager para obtener conexión del pool."""
-        return self._connection.get_connection()
+        return self._connection.get_connection(read_only, begin)
 
     def close_all_connections(self) -> None:
         """Cierra todas las conexiones del pool."""
@@ -34,6 +34,10 @@ class DatabaseManager:
         """Obtiene información del estado de conexiones."""
         return self._connection.get_connection_info()
 
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Obtiene métricas del pool (esperas, conexiones activas, commits)."""
+        return self._connection.get_pool_stats()
+
     # === API DE OPERACIONES (delegada a DatabaseOperations) ===
 
     def execute_query(
@@ -45,9 +49,9 @@ class DatabaseManager:
         """Ejecuta query SQL con parámetros opcionales."""
         return self._operations.execute_query(query, params, fetch_results)
 
-    def transaction(self):
+    def transaction(self, read_only: bool = False):
         """Context manager para transacciones SQLite."""
-        return self._operations.transaction()
+        return self._operations.transaction(read_only)
 
     def backup_database(self, backup_path: str) -> bool:
         """Crea backup de la base de datos."""
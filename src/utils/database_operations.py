@@ -10,7 +10,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-from .database_connection import DatabaseConnection
+from .database_connection import DatabaseConnection, is_read_only_query
 
 
 class DatabaseOperations:
@@ -27,8 +27,9 @@ class DatabaseOperations:
         fetch_results: bool = True,
     ) -> list[dict[str, Any]] | None:
         """Ejecuta query SQL con parámetros opcionales."""
+        read_only = is_read_only_query(query)
         try:
-            with self.connection.get_connection() as conn:
+            with self.connection.get_connection(read_only=read_only) as conn:
                 cursor = conn.cursor()
                 if params:
                     cursor.execute(query, params)
@@ -44,18 +45,22 @@ class DatabaseOperations:
             raise RuntimeError(f"Error ejecutando query: {e}") from e
 
     @contextmanager
-    def transaction(self):
-        """Context manager para transacciones SQLite."""
+    def transaction(self, read_only: bool = False):
+        """
+        Context manager para transacciones SQLite.
+
+        Las transacciones de escritura usan BEGIN IMMEDIATE (el bloqueo de
+        escritura se toma al empezar, sin esperas al promocionar) y las de
+        lectura BEGIN DEFERRED sobre una conexión de solo lectura. El commit o
+        rollback lo resuelve el pool al devolver la conexión.
+        """
         try:
-            with self.connection.get_connection() as conn:
-                conn.execute("BEGIN")
+            with self.connection.get_connection(read_only, begin=True) as conn:
                 self._logger.debug("Transacción iniciada")
                 yield conn
-                conn.commit()
-                self._logger.debug("Transacción confirmada")
+            self._logger.debug("Transacción confirmada")
         except sqlite3.Error as e:
             self._logger.error("Error en transacción: %s", e)
-            conn.rollback()
             self._logger.debug("Transacción revertida")
             raise
 
@@ -64,7 +69,7 @@ class DatabaseOperations:
         try:
             backup_file = Path(backup_path)
             backup_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.connection.get_connection() as source_conn:
+            with self.connection.get_connection(read_only=True) as source_conn:
                 backup_conn = sqlite3.connect(str(backup_file))
                 source_conn.backup(backup_conn)
                 backup_conn.close()
@@ -79,7 +84,6 @@ class DatabaseOperations:
         try:
             with self.connection.get_connection() as conn:
                 conn.execute("VACUUM")
-                conn.commit()
             self._logger.info("Base de datos optimizada con VACUUM")
             return True
         except sqlite3.Error as e:
@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Any
 
 from .database_manager import DatabaseManager
+from .schema_tables import extract_typed_values
 
 
 class EnemyDatabase:
@@ -48,12 +49,12 @@ class EnemyDatabase:
             Diccionario con datos del enemigo o None si no existe
         """
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     SELECT tipo, nombre_mostrar, stats, comportamiento,
-                           animaciones, variantes
+                           animaciones, variantes, rareza, probabilidad_spawn
                     FROM enemigos
                     WHERE tipo = ? AND activo = 1
                 """,
@@ -67,14 +68,7 @@ class EnemyDatabase:
                     )
                     return None
 
-                return {
-                    "tipo": row[0],
-                    "nombre_mostrar": row[1],
-                    "stats": json.loads(row[2]) if row[2] else {},
-                    "comportamiento": row[3],
-                    "animaciones": json.loads(row[4]) if row[4] else {},
-                    "variantes": json.loads(row[5]) if row[5] else {},
-                }
+                return self._row_to_dict(row)
 
         except (sqlite3.Error, json.JSONDecodeError, AttributeError) as e:
             self.logger.error(
@@ -90,29 +84,19 @@ class EnemyDatabase:
             Lista de diccionarios con datos de todos los enemigos activos
         """
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     SELECT tipo, nombre_mostrar, stats, comportamiento,
-                           animaciones, variantes
+                           animaciones, variantes, rareza, probabilidad_spawn
                     FROM enemigos
                     WHERE activo = 1
                     ORDER BY nombre_mostrar
                 """
                 )
 
-                enemies = []
-                for row in cursor.fetchall():
-                    enemy_data = {
-                        "tipo": row[0],
-                        "nombre_mostrar": row[1],
-                        "stats": json.loads(row[2]) if row[2] else {},
-                        "comportamiento": row[3],
-                        "animaciones": json.loads(row[4]) if row[4] else {},
-                        "variantes": json.loads(row[5]) if row[5] else {},
-                    }
-                    enemies.append(enemy_data)
+                enemies = [self._row_to_dict(row) for row in cursor.fetchall()]
 
                 self.logger.debug(
                     "Obtenidos %s tipos de enemigos de la base de datos", len(enemies)
@@ -123,6 +107,39 @@ class EnemyDatabase:
             self.logger.error("Error obteniendo lista de enemigos: %s", e)
             return []
 
+    def get_enemies_by_rarity(self, rarity: str) -> list[dict[str, Any]]:
+        """
+        Obtiene tipo y probabilidad de spawn de los enemigos de una rareza.
+
+        La consulta se resuelve solo con el índice idx_enemigos_rareza,
+        sin leer ni decodificar el JSON de cada fila.
+
+        Args:
+            rarity: Rareza ('normal', 'rare', 'elite', 'legendary')
+
+        Returns:
+            Lista de diccionarios con 'tipo' y 'probabilidad_spawn'
+        """
+        try:
+            with self.db_manager.get_connection(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT tipo, probabilidad_spawn
+                    FROM enemigos
+                    WHERE activo = 1 AND rareza = ?
+                """,
+                    (rarity,),
+                )
+                return [
+                    {"tipo": row[0], "probabilidad_spawn": row[1]}
+                    for row in cursor.fetchall()
+                ]
+
+        except (sqlite3.Error, AttributeError) as e:
+            self.logger.error("Error obteniendo enemigos de rareza '%s': %s", rarity, e)
+            return []
+
     def save_enemy_data(self, enemy_data: dict[str, Any]) -> bool:
         """
         Guarda o actualiza datos de un tipo de enemigo en SQLite.
@@ -134,13 +151,15 @@ class EnemyDatabase:
             True si se guardó exitosamente, False en caso de error
         """
         try:
+            typed = extract_typed_values("enemigos", enemy_data)
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     INSERT OR REPLACE INTO enemigos
-                    (tipo, nombre_mostrar, stats, comportamiento, animaciones, variantes, activo)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    (tipo, nombre_mostrar, stats, comportamiento, animaciones, variantes,
+                     rareza, probabilidad_spawn, vida, velocidad, dano, activo)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         enemy_data.get("tipo", ""),
@@ -151,6 +170,11 @@ class EnemyDatabase:
                             enemy_data.get("animaciones", {}), ensure_ascii=False
                         ),
                         json.dumps(enemy_data.get("variantes", {}), ensure_ascii=False),
+                        typed["rareza"],
+                        typed["probabilidad_spawn"],
+                        typed["vida"],
+                        typed["velocidad"],
+                        typed["dano"],
                         enemy_data.get("activo", True),
                     ),
                 )
@@ -160,7 +184,7 @@ class EnemyDatabase:
                 )
                 return True
 
-        except (sqlite3.Error, TypeError, KeyError) as e:
+        except (sqlite3.Error, TypeError, KeyError, ValueError) as e:
             self.logger.error("Error guardando datos del enemigo: %s", e)
             return False
 
@@ -196,6 +220,8 @@ class EnemyDatabase:
                     "comportamiento": enemy_data.get("comportamiento", "perseguir"),
                     "animaciones": enemy_data.get("animaciones", {}),
                     "variantes": enemy_data.get("variantes", {}),
+                    "rareza": enemy_data.get("rareza", "normal"),
+                    "probabilidad_spawn": enemy_data.get("probabilidad_spawn", 1.0),
                     "activo": True,
                 }
 
@@ -208,3 +234,17 @@ class EnemyDatabase:
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             self.logger.error("Error migrando enemigos desde JSON: %s", e)
             return False
+
+    @staticmethod
+    def _row_to_dict(row) -> dict[str, Any]:
+        """Convierte una fila de enemigos en el diccionario público."""
+        return {
+            "tipo": row[0],
+            "nombre_mostrar": row[1],
+            "stats": json.loads(row[2]) if row[2] else {},
+            "comportamiento": row[3],
+            "animaciones": json.loads(row[4]) if row[4] else {},
+            "variantes": json.loads(row[5]) if row[5] else {},
+            "rareza": row[6],
+            "probabilidad_spawn": row[7],
+        }
@@ -0,0 +1,182 @@
+"""
+Flow Field - Campo de flujo hacia el jugador
+============================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Divide el mundo en una rejilla gruesa, marca como bloqueadas las
+celdas que tocan obstáculos (tiles con colisión) y, cada vez que el jugador
+cambia de celda, recorre la rejilla una sola vez en anchura desde su celda.
+Cada celda guarda la dirección hacia su vecina más cercana al jugador, así que
+toda la horda comparte un único cálculo y cada enemigo consulta su dirección
+en O(1) en lugar de calcular su propio rumbo. La rejilla puede empezar en
+cualquier punto del mundo (``origin``): con el mundo por chunks cubre solo la
+zona cargada alrededor del jugador.
+"""
+
+from collections import deque
+
+import numpy as np
+
+# Lado de celda por defecto: del orden del tamaño de un enemigo
+DEFAULT_CELL_SIZE = 64
+
+# Vecinos (fila, columna) de las 8 direcciones
+_NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+_UNREACHED = np.iinfo(np.int32).max
+
+
+class FlowField:
+    """Campo de direcciones hacia un objetivo sobre una rejilla del mundo."""
+
+    def __init__(
+        self,
+        world_width: int,
+        world_height: int,
+        cell_size: int = DEFAULT_CELL_SIZE,
+        origin: tuple[float, float] = (0, 0),
+    ):
+        """
+        Inicializa una rejilla sin obstáculos ni objetivo.
+
+        Args:
+            world_width: Ancho del mundo en píxeles
+            world_height: Alto del mundo en píxeles
+            cell_size: Lado de cada celda en píxeles
+            origin: Esquina superior izquierda de la rejilla en el mundo
+        """
+        self.cell_size = cell_size
+        self.origin_x, self.origin_y = origin
+        self.cols = max(1, -(-int(world_width) // cell_size))
+        self.rows = max(1, -(-int(world_height) // cell_size))
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        self.distance = np.full((self.rows, self.cols), _UNREACHED, dtype=np.int32)
+        self.target_cell: tuple[int, int] | None = None
+        # Direcciones por celda aplanadas (fila * cols + columna) para leer en O(1)
+        self._flow: list[tuple[float, float] | None] = [None] * (self.rows * self.cols)
+        self.stats = {"recomputes": 0}
+
+    def set_obstacles(self, bounds: np.ndarray):
+        """
+        Marca como bloqueadas las celdas que tocan cada obstáculo.
+
+        Args:
+            bounds: Array (N, 4) con (x, y, ancho, alto) de cada obstáculo
+        """
+        self.blocked[:] = False
+        if len(bounds):
+            size = self.cell_size
+            corners = bounds[:, :2] - (self.origin_x, self.origin_y)
+            first = np.floor_divide(corners, size).astype(np.int64)
+            last = np.floor_divide(corners + bounds[:, 2:] - 1, size).astype(np.int64)
+            for x0, y0, x1, y1 in np.hstack((first, last)).tolist():
+                self.blocked[
+                    max(0, y0) : max(0, y1 + 1), max(0, x0) : max(0, x1 + 1)
+                ] = True
+        self.target_cell = None
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """Celda (fila, columna) de un punto, acotada a la rejilla."""
+        size = self.cell_size
+        row = min(max(int((y - self.origin_y) // size), 0), self.rows - 1)
+        col = min(max(int((x - self.origin_x) // size), 0), self.cols - 1)
+        return row, col
+
+    def update(self, target_x: float, target_y: float) -> bool:
+        """
+        Recalcula el campo si el objetivo ha cambiado de celda.
+
+        Args:
+            target_x: Posición X del objetivo (jugador)
+            target_y: Posición Y del objetivo
+
+        Returns:
+            True si se ha recalculado
+        """
+        cell = self.cell_of(target_x, target_y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._compute_distances(cell)
+        self._compute_directions()
+        self.stats["recomputes"] += 1
+        return True
+
+    def sample(self, x: float, y: float) -> tuple[float, float] | None:
+        """
+        Dirección unitaria hacia el objetivo desde un punto del mundo.
+
+        Returns:
+            (dx, dy), o None en la celda del objetivo, fuera del mundo o sin
+            camino (el llamador va entonces en línea recta)
+        """
+        size = self.cell_size
+        col = int((x - self.origin_x) // size)
+        row = int((y - self.origin_y) // size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self._flow[row * self.cols + col]
+        return None
+
+    def _compute_distances(self, start: tuple[int, int]):
+        """Recorrido en anchura (4 vecinos) desde la celda objetivo."""
+        rows, cols = self.rows, self.cols
+        blocked = self.blocked.ravel().tolist()
+        distance = [_UNREACHED] * (rows * cols)
+        origin = start[0] * cols + start[1]
+        distance[origin] = 0
+        queue = deque((origin,))
+        while queue:
+            index = queue.popleft()
+            step = distance[index] + 1
+            col = index % cols
+            for neighbor, valid in (
+                (index - cols, index >= cols),
+                (index + cols, index < (rows - 1) * cols),
+                (index - 1, col > 0),
+                (index + 1, col < cols - 1),
+            ):
+                if valid and not blocked[neighbor] and distance[neighbor] > step:
+                    distance[neighbor] = step
+                    queue.append(neighbor)
+        self.distance = np.array(distance, dtype=np.int32).reshape(rows, cols)
+
+    def _compute_directions(self):
+        """Cada celda apunta a su vecina (de 8) con menor distancia al objetivo."""
+        rows, cols = self.rows, self.cols
+        padded = np.full((rows + 2, cols + 2), _UNREACHED, dtype=np.int32)
+        padded[1:-1, 1:-1] = self.distance
+        open_cells = np.ones((rows + 2, cols + 2), dtype=bool)
+        open_cells[1:-1, 1:-1] = ~self.blocked
+        open_cells[[0, -1], :] = open_cells[:, [0, -1]] = False
+
+        candidates = []
+        for dr, dc in _NEIGHBORS:
+            shifted = padded[1 + dr : rows + 1 + dr, 1 + dc : cols + 1 + dc].copy()
+            if dr and dc:
+                # Sin cortar esquinas: las dos vecinas ortogonales deben estar libres
+                corner_free = (
+                    open_cells[1 + dr : rows + 1 + dr, 1 : cols + 1]
+                    & open_cells[1 : rows + 1, 1 + dc : cols + 1 + dc]
+                )
+                shifted[~corner_free] = _UNREACHED
+            candidates.append(shifted)
+        candidates = np.stack(candidates)
+        best = np.argmin(candidates, axis=0)
+        best_distance = np.take_along_axis(candidates, best[None], axis=0)[0]
+
+        # Vectores unitarios (dx, dy) de cada vecino
+        vectors = np.array(_NEIGHBORS, dtype=np.float64)[:, ::-1]
+        vectors /= np.hypot(vectors[:, 0], vectors[:, 1])[:, None]
+        # Sin dirección en la celda objetivo, ni donde ninguna vecina acerca
+        own = self.distance
+        no_flow = (best_distance == _UNREACHED) | (
+            (own != _UNREACHED) & (best_distance >= own)
+        )
+        self._flow = [
+            None if stop else (dx, dy)
+            for (dx, dy), stop in zip(
+                vectors[best].reshape(-1, 2).tolist(),
+                no_flow.ravel().tolist(),
+                strict=True,
+            )
+        ]
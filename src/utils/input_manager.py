@@ -5,11 +5,17 @@ Input Manager - Gestor de entrada
 Autor: SiK Team
 Fecha: 2024
 Descripción: Gestiona las entradas del usuario (teclado, ratón, gamepad).
+Una vez por tick ``sample`` lee teclado, ratón y gamepad y produce un
+InputSnapshot inmutable (máscara de bits de acciones y ejes analógicos) que
+leen todos los consumidores del tick. También mide la latencia desde que un
+evento llega al juego hasta que su acción aparece en una instantánea.
 """
 
 import logging
+import time
 from collections.abc import Callable
 from enum import Enum
+from typing import NamedTuple
 
 import pygame
 
@@ -36,13 +42,48 @@ class InputAction(Enum):
     MENU = "menu"
 
 
+# Bit de cada acción en InputSnapshot.actions
+ACTION_BITS = {action: 1 << index for index, action in enumerate(InputAction)}
+
+# Duración de un tick a 60 FPS (ms): presupuesto de latencia de entrada
+TICK_MS = 1000 / 60
+
+
+class InputSnapshot(NamedTuple):
+    """Estado de la entrada en un tick; todos los consumidores leen el mismo."""
+
+    tick: int
+    actions: int = 0  # Acciones activas (bits de ACTION_BITS)
+    pressed: int = 0  # Acciones que se activan en este tick
+    released: int = 0  # Acciones que se sueltan en este tick
+    move_x: float = 0.0  # Eje de movimiento (-1.0 a 1.0)
+    move_y: float = 0.0
+    aim_x: float = 0.0  # Puntería relativa al centro de la pantalla (px)
+    aim_y: float = 0.0
+    mouse_pos: tuple[int, int] = (0, 0)
+
+    def is_down(self, action: InputAction) -> bool:
+        """Indica si la acción está activa en este tick."""
+        return bool(self.actions & ACTION_BITS[action])
+
+    def just_pressed(self, action: InputAction) -> bool:
+        """Indica si la acción se ha activado en este tick."""
+        return bool(self.pressed & ACTION_BITS[action])
+
+
 class InputManager:
     """
     Gestiona las entradas del usuario.
     """
 
-    def __init__(self):
-        """Inicializa el gestor de entrada."""
+    def __init__(self, deadzone: float = 0.1, tick_ms: float = TICK_MS):
+        """
+        Inicializa el gestor de entrada.
+
+        Args:
+                deadzone: Zona muerta de los sticks del gamepad
+                tick_ms: Duración de un tick, presupuesto de latencia (ms)
+        """
         self.logger = logging.getLogger(__name__)
 
         # Estados de entrada
@@ -63,6 +104,31 @@ class InputManager:
             InputAction.PAUSE: {pygame.K_ESCAPE},
             InputAction.MENU: {pygame.K_ESCAPE},
         }
+        self.mouse_mappings: dict[InputAction, set[int]] = {
+            InputAction.ATTACK: {1},
+        }
+        self.gamepad_mappings: dict[InputAction, set[int]] = {
+            InputAction.JUMP: {0},
+            InputAction.INTERACT: {1},
+            InputAction.ATTACK: {2},
+            InputAction.PAUSE: {7},
+        }
+        self._compile_mappings()
+
+        # Instantánea por tick y eventos aún no reflejados en ninguna
+        self.snapshot = InputSnapshot(tick=0)
+        self._latched = 0
+        self._pending: list[tuple[float, int]] = []
+        self.joysticks: dict[int, pygame.joystick.JoystickType] = {}
+        self.deadzone = deadzone
+        self.tick_ms = tick_ms
+        self.latency = {
+            "samples": 0,
+            "last_ms": 0.0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+            "over_one_tick": 0,
+        }
 
         # Callbacks de eventos
         self.key_callbacks: dict[int, Callable] = {}
@@ -72,8 +138,30 @@ class InputManager:
         self.enabled = True
         self.gamepad_enabled = True
 
+        self._register_connected_gamepads()
         self.logger.info("Gestor de entrada inicializado")
 
+    def _register_connected_gamepads(self):
+        """
+        Registra los gamepads ya conectados.
+
+        SDL envía su JOYDEVICEADDED al arrancar, cuando quizá lo procesa otra
+        escena: sin esto, un gamepad conectado antes de la partida no se leería.
+        """
+        try:
+            if not pygame.joystick.get_init():
+                pygame.joystick.init()
+            for device_index in range(pygame.joystick.get_count()):
+                self._add_joystick(device_index)
+        except pygame.error as e:
+            self.logger.warning("No se pudieron enumerar los gamepads: %s", e)
+
+    def _add_joystick(self, device_index: int):
+        """Abre un gamepad por índice de dispositivo y lo registra."""
+        joystick = pygame.joystick.Joystick(device_index)
+        self.joysticks[joystick.get_instance_id()] = joystick
+        self.logger.info("Gamepad conectado: %s", joystick.get_name())
+
     def handle_event(self, event: pygame.event.Event):
         """
         Procesa un evento de Pygame.
@@ -85,19 +173,158 @@ class InputManager:
             return
 
         if event.type == pygame.KEYDOWN:
+            self._latch(self._key_bits.get(event.key, 0))
             self._handle_key_down(event.key)
         elif event.type == pygame.KEYUP:
             self._handle_key_up(event.key)
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            self._latch(self._mouse_bits.get(event.button, 0))
             self._handle_mouse_down(event.button)
         elif event.type == pygame.MOUSEBUTTONUP:
             self._handle_mouse_up(event.button)
         elif event.type == pygame.JOYBUTTONDOWN:
+            if self.gamepad_enabled:
+                self._latch(self._gamepad_bits.get(event.button, 0))
             self._handle_gamepad_down(event.button)
         elif event.type == pygame.JOYBUTTONUP:
             self._handle_gamepad_up(event.button)
         elif event.type == pygame.JOYAXISMOTION:
             self._handle_gamepad_axis(event.axis, event.value)
+        elif event.type == pygame.JOYDEVICEADDED:
+            self._add_joystick(event.device_index)
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.joysticks.pop(event.instance_id, None)
+
+    def _latch(self, bits: int):
+        """Retiene hasta el próximo tick las acciones de un evento de pulsación."""
+        if bits:
+            self._latched |= bits
+            self._pending.append((time.perf_counter(), bits))
+
+    def _compile_mappings(self):
+        """Invierte los mapeos a {código: bits} para leerlos en O(1)."""
+        compiled = []
+        for mappings in (
+            self.action_mappings,
+            self.mouse_mappings,
+            self.gamepad_mappings,
+        ):
+            codes: dict[int, int] = {}
+            for action, inputs in mappings.items():
+                for code in inputs:
+                    codes[code] = codes.get(code, 0) | ACTION_BITS[action]
+            compiled.append(codes)
+        self._key_bits, self._mouse_bits, self._gamepad_bits = compiled
+
+    def sample(self) -> InputSnapshot:
+        """
+        Lee el estado de la entrada una vez para el tick actual.
+
+        Las pulsaciones recibidas como evento desde el último tick cuentan
+        aunque la tecla ya se haya soltado, así que no se pierden toques más
+        cortos que un tick.
+
+        Returns:
+                Instantánea del tick (también en ``self.snapshot``)
+        """
+        previous = self.snapshot
+        actions = self._latched
+        mouse_pos = pygame.mouse.get_pos()
+        move_x = move_y = 0.0
+
+        if self.enabled:
+            keys = pygame.key.get_pressed()
+            for code, bits in self._key_bits.items():
+                if keys[code]:
+                    actions |= bits
+            buttons = pygame.mouse.get_pressed()
+            for button, bits in self._mouse_bits.items():
+                if 0 < button <= len(buttons) and buttons[button - 1]:
+                    actions |= bits
+            if self.gamepad_enabled:
+                for joystick in self.joysticks.values():
+                    actions, move_x, move_y = self._sample_gamepad(
+                        joystick, actions, move_x, move_y
+                    )
+
+        # Teclado digital si el stick no se mueve
+        if not move_x and not move_y:
+            move_x = float(
+                bool(actions & ACTION_BITS[InputAction.MOVE_RIGHT])
+                - bool(actions & ACTION_BITS[InputAction.MOVE_LEFT])
+            )
+            move_y = float(
+                bool(actions & ACTION_BITS[InputAction.MOVE_DOWN])
+                - bool(actions & ACTION_BITS[InputAction.MOVE_UP])
+            )
+
+        surface = pygame.display.get_surface()
+        center_x, center_y = (
+            (surface.get_width() / 2, surface.get_height() / 2) if surface else (0, 0)
+        )
+        self.snapshot = InputSnapshot(
+            tick=previous.tick + 1,
+            actions=actions,
+            pressed=actions & ~previous.actions,
+            released=previous.actions & ~actions,
+            move_x=move_x,
+            move_y=move_y,
+            aim_x=mouse_pos[0] - center_x,
+            aim_y=mouse_pos[1] - center_y,
+            mouse_pos=mouse_pos,
+        )
+        self._record_latency(actions)
+        self._latched = 0
+        return self.snapshot
+
+    def _sample_gamepad(self, joystick, actions: int, move_x: float, move_y: float):
+        """Suma botones y stick izquierdo de un gamepad a la instantánea."""
+        for button, bits in self._gamepad_bits.items():
+            if button < joystick.get_numbuttons() and joystick.get_button(button):
+                actions |= bits
+        if joystick.get_numaxes() >= 2:
+            axis_x, axis_y = joystick.get_axis(0), joystick.get_axis(1)
+            if abs(axis_x) > self.deadzone or abs(axis_y) > self.deadzone:
+                move_x, move_y = axis_x, axis_y
+                for value, negative, positive in (
+                    (axis_x, InputAction.MOVE_LEFT, InputAction.MOVE_RIGHT),
+                    (axis_y, InputAction.MOVE_UP, InputAction.MOVE_DOWN),
+                ):
+                    if value < -0.5:
+                        actions |= ACTION_BITS[negative]
+                    elif value > 0.5:
+                        actions |= ACTION_BITS[positive]
+        return actions, move_x, move_y
+
+    def _record_latency(self, actions: int):
+        """Mide cuánto tardó cada pulsación pendiente en llegar a una instantánea."""
+        if not self._pending:
+            return
+        now = time.perf_counter()
+        stats = self.latency
+        for received, bits in self._pending:
+            if not bits & actions:
+                continue
+            latency_ms = (now - received) * 1000
+            stats["samples"] += 1
+            stats["last_ms"] = latency_ms
+            stats["avg_ms"] += (latency_ms - stats["avg_ms"]) / stats["samples"]
+            stats["max_ms"] = max(stats["max_ms"], latency_ms)
+            if latency_ms > self.tick_ms:
+                stats["over_one_tick"] += 1
+                self.logger.debug(
+                    "Latencia de entrada por encima de un tick: %.2f ms", latency_ms
+                )
+        self._pending.clear()
+
+    def get_diagnostics(self) -> dict:
+        """Latencia evento-acción (ms) y estado del muestreo."""
+        return {
+            "tick": self.snapshot.tick,
+            "tick_ms": self.tick_ms,
+            "gamepads": len(self.joysticks),
+            **{f"latency_{key}": value for key, value in self.latency.items()},
+        }
 
     def _handle_key_down(self, key: int):
         """Procesa una tecla presionada."""
@@ -235,6 +462,7 @@ class InputManager:
                 keys: Conjunto de teclas
         """
         self.action_mappings[action] = keys
+        self._compile_mappings()
         self.logger.debug(f"Mapeo actualizado para {action}: {keys}")
 
     def reset_states(self):
@@ -243,3 +471,6 @@ class InputManager:
         self.mouse_buttons.clear()
         self.gamepad_buttons.clear()
         self.gamepad_axes.clear()
+        self.snapshot = InputSnapshot(tick=self.snapshot.tick)
+        self._latched = 0
+        self._pending.clear()
@@ -0,0 +1,209 @@
+"""
+Preload Graph - Grafo de tareas de precarga
+===========================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Tareas de carga con nombre, dependencias y peso. Las tareas de
+fondo se ejecutan en un hilo en orden topológico; las que deben crear recursos
+en el hilo principal (fuentes, superficies de pantalla, escenas) se ejecutan
+con ``pump()`` desde el bucle de la escena de carga, con presupuesto por frame.
+El progreso es el peso de las tareas terminadas, no un temporizador.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class PreloadTask:
+    """Tarea de precarga: ``func(results)`` recibe los resultados ya calculados."""
+
+    name: str
+    func: Callable[[dict[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+    weight: float = 1.0
+    main_thread: bool = False
+    duration_ms: float = 0.0
+    state: str = field(default="pending")
+
+
+class PreloadGraph:
+    """Grafo de tareas de precarga con progreso ponderado."""
+
+    def __init__(self, name: str = "preload"):
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        self.tasks: dict[str, PreloadTask] = {}
+        self.results: dict[str, Any] = {}
+        self.errors: dict[str, Exception] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self.total_ms = 0.0
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[dict[str, Any]], Any],
+        deps: tuple[str, ...] | list[str] = (),
+        weight: float = 1.0,
+        main_thread: bool = False,
+    ) -> None:
+        """
+        Añade una tarea al grafo.
+
+        Args:
+            name: Nombre único de la tarea (clave de su resultado)
+            func: Función que recibe el diccionario de resultados
+            deps: Tareas que deben terminar antes
+            weight: Peso relativo en la barra de progreso
+            main_thread: Ejecutar en el hilo principal mediante ``pump()``
+        """
+        if name in self.tasks:
+            raise ValueError(f"Tarea de precarga duplicada: {name}")
+        self.tasks[name] = PreloadTask(name, func, tuple(deps), weight, main_thread)
+
+    def order(self) -> list[str]:
+        """
+        Orden topológico de las tareas.
+
+        Raises:
+            ValueError: Si hay dependencias desconocidas o ciclos
+        """
+        pending = {name: set(task.deps) for name, task in self.tasks.items()}
+        for name, deps in pending.items():
+            unknown = deps - self.tasks.keys()
+            if unknown:
+                raise ValueError(
+                    f"Tarea {name} depende de tareas inexistentes {unknown}"
+                )
+        ordered: list[str] = []
+        while pending:
+            ready = [name for name, deps in pending.items() if not deps]
+            if not ready:
+                raise ValueError(f"Ciclo en el grafo de precarga: {sorted(pending)}")
+            for name in ready:
+                ordered.append(name)
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return ordered
+
+    def start(self) -> None:
+        """Valida el grafo y arranca el hilo de tareas de fondo."""
+        if self._thread is not None:
+            return
+        order = self.order()
+        self._started_at = time.perf_counter()
+        background = [
+            self.tasks[name] for name in order if not self.tasks[name].main_thread
+        ]
+        self._thread = threading.Thread(
+            target=self._run_background, args=(background,), name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def _run_background(self, tasks: list[PreloadTask]) -> None:
+        """Hilo de fondo: ejecuta cada tarea cuando sus dependencias terminan."""
+        for task in tasks:
+            with self._cond:
+                self._cond.wait_for(lambda t=task: self._deps_finished(t))
+            self._run_task(task)
+
+    def _deps_finished(self, task: PreloadTask) -> bool:
+        return all(self.tasks[dep].state in ("done", "failed") for dep in task.deps)
+
+    def _run_task(self, task: PreloadTask) -> None:
+        """Ejecuta una tarea; si falló alguna dependencia, la tarea también falla."""
+        failed = [dep for dep in task.deps if self.tasks[dep].state == "failed"]
+        started = time.perf_counter()
+        try:
+            if failed:
+                raise RuntimeError(f"dependencias fallidas: {', '.join(failed)}")
+            task.state = "running"
+            result = task.func(self.results)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Una tarea fallida no detiene la carga: el consumidor usa su fallback
+            self.logger.error("Tarea de precarga '%s' fallida: %s", task.name, e)
+            with self._cond:
+                self.errors[task.name] = e
+                task.state = "failed"
+                self._cond.notify_all()
+        else:
+            with self._cond:
+                self.results[task.name] = result
+                task.state = "done"
+                self._cond.notify_all()
+        task.duration_ms = (time.perf_counter() - started) * 1000
+        self.logger.debug("Precarga '%s': %.1f ms", task.name, task.duration_ms)
+        if self.is_complete():
+            self.total_ms = (time.perf_counter() - self._started_at) * 1000
+
+    def pump(self, budget_ms: float = 8.0) -> int:
+        """
+        Ejecuta en el hilo actual las tareas de hilo principal ya listas.
+
+        Args:
+            budget_ms: Tiempo máximo por llamada (se ejecuta al menos una tarea)
+
+        Returns:
+            Número de tareas ejecutadas
+        """
+        if self._thread is None:
+            self.start()
+        deadline = time.perf_counter() + budget_ms / 1000
+        executed = 0
+        for task in self.tasks.values():
+            if not task.main_thread or task.state != "pending":
+                continue
+            with self._cond:
+                ready = self._deps_finished(task)
+            if not ready:
+                continue
+            self._run_task(task)
+            executed += 1
+            if time.perf_counter() >= deadline:
+                break
+        return executed
+
+    def run_all(self) -> dict[str, Any]:
+        """Ejecuta el grafo completo de forma bloqueante (herramientas y pruebas)."""
+        self.start()
+        while not self.is_complete():
+            if not self.pump():
+                with self._cond:
+                    self._cond.wait(0.01)
+        return self.results
+
+    @property
+    def progress(self) -> float:
+        """Fracción del peso total ya terminado (0.0 - 1.0)."""
+        total = sum(task.weight for task in self.tasks.values())
+        if total <= 0:
+            return 1.0
+        finished = sum(
+            task.weight
+            for task in self.tasks.values()
+            if task.state in ("done", "failed")
+        )
+        return finished / total
+
+    def is_complete(self) -> bool:
+        """Indica si todas las tareas han terminado (con o sin error)."""
+        return all(task.state in ("done", "failed") for task in self.tasks.values())
+
+    def current_task(self) -> str | None:
+        """Nombre de la primera tarea en ejecución, si hay alguna."""
+        for task in self.tasks.values():
+            if task.state == "running":
+                return task.name
+        return None
+
+    def get_timings(self) -> dict[str, float]:
+        """Duración en milisegundos de cada tarea terminada."""
+        return {name: task.duration_ms for name, task in self.tasks.items()}
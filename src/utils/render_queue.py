@@ -0,0 +1,92 @@
+"""
+Render Queue - Cola de dibujado por capas
+=========================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Durante el frame cada capa acumula pares (superficie, posición) y
+al final se vuelca con una sola llamada ``Surface.fblits`` por capa (``blits``
+si la versión de pygame no la tiene). Las capas pueden ordenarse por el pie del
+sprite (orden estable) para dar profundidad en vista cenital, y la cola informa
+de las llamadas de dibujado y sprites de cada frame.
+"""
+
+import pygame
+
+# Orden de dibujado de las capas de la escena de juego
+DEFAULT_LAYERS = ("ground", "enemies", "tiles", "player", "projectiles", "powerups")
+
+
+def _depth(item: tuple[pygame.Surface, tuple[float, float]]) -> float:
+    """Clave de orden: coordenada Y del pie del sprite."""
+    surface, position = item
+    return position[1] + surface.get_height()
+
+
+class RenderQueue:
+    """Cola de sprites por capas que se vuelca con una llamada por capa."""
+
+    def __init__(
+        self,
+        layers: tuple[str, ...] = DEFAULT_LAYERS,
+        y_sorted: tuple[str, ...] = (),
+    ):
+        """
+        Inicializa la cola.
+
+        Args:
+            layers: Nombres de capa en orden de dibujado
+            y_sorted: Capas que se ordenan por Y antes de volcarse
+        """
+        self.layers: dict[str, list] = {name: [] for name in layers}
+        self.y_sorted = set(y_sorted)
+        self._batched = (
+            pygame.Surface.fblits
+            if hasattr(pygame.Surface, "fblits")
+            else lambda target, items: target.blits(items, doreturn=False)
+        )
+        self.frame_stats: dict = {"draw_calls": 0, "sprites": 0, "layers": {}}
+
+    def submit(
+        self, layer: str, surface: pygame.Surface, position: tuple[float, float]
+    ):
+        """Encola un sprite en una capa."""
+        self.layers[layer].append((surface, position))
+
+    def extend(self, layer: str, items):
+        """Encola varios pares (superficie, posición) en una capa."""
+        self.layers[layer].extend(items)
+
+    def clear(self):
+        """Descarta lo encolado sin dibujarlo."""
+        for items in self.layers.values():
+            items.clear()
+
+    def flush(self, target: pygame.Surface) -> int:
+        """
+        Dibuja todas las capas en orden y vacía la cola.
+
+        Args:
+            target: Superficie de destino
+
+        Returns:
+            Número de llamadas de dibujado del frame
+        """
+        draw_calls = 0
+        per_layer = {}
+        for name, items in self.layers.items():
+            if not items:
+                continue
+            if name in self.y_sorted:
+                items.sort(key=_depth)
+            self._batched(target, items)
+            draw_calls += 1
+            per_layer[name] = len(items)
+            items.clear()
+
+        self.frame_stats = {
+            "draw_calls": draw_calls,
+            "sprites": sum(per_layer.values()),
+            "layers": per_layer,
+        }
+        return draw_calls
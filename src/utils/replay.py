@@ -0,0 +1,218 @@
+"""
+Replay - Grabación y reproducción determinista de partidas
+==========================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Graba las semillas de la partida y la instantánea de entrada de
+cada tick (InputSnapshot) junto a un hash del estado de la simulación, en un
+archivo compacto: cabecera JSON y ticks empaquetados con ``struct`` y
+comprimidos con zlib. Al reproducir, ``ReplayInput`` sustituye al gestor de
+entrada de la escena y ``play_replay`` ejecuta la partida sin esperar al
+reloj, midiendo cada tick y comparando su hash con el grabado: un tirón visto
+en una partida real se convierte en una traza de benchmark repetible y una
+divergencia señala el primer tick en que dos versiones se separan.
+"""
+
+import json
+import struct
+import time
+import zlib
+from pathlib import Path
+
+from .input_manager import TICK_MS, InputSnapshot
+from .seed_set import SeedSet
+
+REPLAY_MAGIC = b"SIKR"
+REPLAY_VERSION = 1
+
+# Por tick: acciones, ejes de movimiento y puntería, ratón y hash del estado
+_TICK = struct.Struct("<H4d2hI")
+_HEADER = struct.Struct("<4sBI")
+
+
+class Replay:
+    """Partida grabada: semillas, metadatos y ticks de entrada con su hash."""
+
+    def __init__(self, seeds: SeedSet, meta: dict | None = None):
+        """
+        Inicializa una grabación vacía.
+
+        Args:
+            seeds: Semillas con las que empezó la partida
+            meta: Datos de la partida (personaje, resolución...)
+        """
+        self.seeds = seeds
+        self.meta = dict(meta or {})
+        self.ticks: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def record(self, snapshot: InputSnapshot, state_hash: int):
+        """Añade la entrada de un tick y el hash del estado tras simularlo."""
+        self.ticks.append(
+            (
+                snapshot.actions,
+                snapshot.move_x,
+                snapshot.move_y,
+                snapshot.aim_x,
+                snapshot.aim_y,
+                *snapshot.mouse_pos,
+                state_hash,
+            )
+        )
+
+    def snapshots(self):
+        """Reconstruye las instantáneas de entrada en orden (flancos incluidos)."""
+        previous = 0
+        for tick, (actions, move_x, move_y, aim_x, aim_y, mx, my, _) in enumerate(
+            self.ticks, start=1
+        ):
+            yield InputSnapshot(
+                tick=tick,
+                actions=actions,
+                pressed=actions & ~previous,
+                released=previous & ~actions,
+                move_x=move_x,
+                move_y=move_y,
+                aim_x=aim_x,
+                aim_y=aim_y,
+                mouse_pos=(mx, my),
+            )
+            previous = actions
+
+    def hashes(self) -> list[int]:
+        """Hash del estado grabado en cada tick."""
+        return [entry[-1] for entry in self.ticks]
+
+    def to_bytes(self) -> bytes:
+        """Serializa la grabación."""
+        header = json.dumps(
+            {
+                "seeds": self.seeds.to_dict(),
+                "ticks": len(self.ticks),
+                "tick_ms": TICK_MS,
+                **self.meta,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        body = b"".join(_TICK.pack(*entry) for entry in self.ticks)
+        return (
+            _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(header))
+            + header
+            + zlib.compress(body, 6)
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Lee una grabación serializada con ``to_bytes``.
+
+        Raises:
+            ValueError: Si no es un archivo de repetición o es de otra versión
+        """
+        magic, version, header_len = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Archivo de repetición no válido o de otra versión")
+        start = _HEADER.size
+        meta = json.loads(data[start : start + header_len].decode("utf-8"))
+        replay = cls(SeedSet.from_dict(meta.pop("seeds")), meta)
+        replay.ticks = list(
+            _TICK.iter_unpack(zlib.decompress(data[start + header_len :]))
+        )
+        return replay
+
+    def save(self, path: str | Path):
+        """Guarda la grabación (crea el directorio si hace falta)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        """Carga una grabación de disco."""
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayInput:
+    """Fuente de entrada que reproduce una grabación en lugar de leer dispositivos."""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self._snapshots = replay.snapshots()
+        self.snapshot = InputSnapshot(tick=0)
+
+    def sample(self) -> InputSnapshot:
+        """Instantánea del siguiente tick grabado (vacía al acabar)."""
+        self.snapshot = next(
+            self._snapshots, InputSnapshot(tick=self.snapshot.tick + 1)
+        )
+        return self.snapshot
+
+    def handle_event(self, event):
+        """Los eventos reales se ignoran durante la reproducción."""
+
+    def reset_states(self):
+        """Sin estado que reiniciar: la entrada sale de la grabación."""
+
+    def get_diagnostics(self) -> dict:
+        """Progreso de la reproducción (mismas claves que InputManager)."""
+        return {
+            "tick": self.snapshot.tick,
+            "tick_ms": TICK_MS,
+            "gamepads": 0,
+            "replay_ticks": len(self.replay),
+            # Sin dispositivos no hay latencia que medir
+            "latency_samples": 0,
+            "latency_last_ms": 0.0,
+            "latency_avg_ms": 0.0,
+            "latency_max_ms": 0.0,
+            "latency_over_one_tick": 0,
+        }
+
+
+def first_divergence(expected: list[int], actual: list[int]) -> int | None:
+    """Primer tick (desde 1) en que dos secuencias de hashes difieren."""
+    for tick, (left, right) in enumerate(zip(expected, actual, strict=False), 1):
+        if left != right:
+            return tick
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual)) + 1
+    return None
+
+
+def play_replay(scene, replay: Replay, render: bool = True) -> dict:
+    """
+    Reproduce una grabación en una escena de juego a máxima velocidad.
+
+    La escena debe haberse creado con las semillas de la grabación y sin
+    consumir (``game_state.seeds = SeedSet(replay.seeds.master)``).
+
+    Args:
+        scene: GameScene recién creada
+        replay: Grabación a reproducir
+        render: Si también se renderiza cada tick
+
+    Returns:
+        Tiempos por tick (ms), hashes obtenidos y primer tick divergente
+    """
+    scene.input = ReplayInput(replay)
+    scene.recorder = None
+    update_ms, render_ms, hashes = [], [], []
+    for _ in range(len(replay)):
+        started = time.perf_counter()
+        scene.update()
+        update_ms.append((time.perf_counter() - started) * 1000)
+        hashes.append(scene.get_state_hash())
+        started = time.perf_counter()
+        if render:
+            scene.render()
+        render_ms.append((time.perf_counter() - started) * 1000)
+    return {
+        "ticks": len(replay),
+        "update_ms": update_ms,
+        "render_ms": render_ms,
+        "hashes": hashes,
+        "divergence": first_divergence(replay.hashes(), hashes),
+    }
@@ -78,6 +78,19 @@ class SaveCompatibility:
         """
         return self.operations.load_game_unified(slot)
 
+    def load_raw_save(self, slot: int, header_only: bool = False) -> bytes | None:
+        """
+        Lee los bytes crudos de una partida sin descifrarla.
+
+        Args:
+            slot: Número de slot (1-3)
+            header_only: Lee solo la cabecera del formato binario
+
+        Returns:
+            Bytes almacenados o None si el slot no tiene partida
+        """
+        return self.operations.load_raw_save(slot, header_only)
+
     def get_saves_info_unified(self) -> list[dict[str, Any]]:
         """
         Obtiene información de partidas de ambos sistemas.
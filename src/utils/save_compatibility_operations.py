@@ -111,6 +111,27 @@ class SaveCompatibilityOperations:
 
         return pickle_data
 
+    def load_raw_save(self, slot: int, header_only: bool = False) -> bytes | None:
+        """
+        Lee los bytes crudos de una partida sin descifrarla ni decodificarla.
+
+        Args:
+            slot: Número de slot (1-3)
+            header_only: Lee solo la cabecera del formato binario
+
+        Returns:
+            Bytes almacenados o None si el slot no tiene partida
+        """
+        if self.core.is_sqlite_available() and self.core.database is not None:
+            data = self.core.database.load_save_blob(slot, header_only)
+            if data is not None:
+                return data
+        try:
+            return self.core.loader.read_save_bytes(slot, header_only)
+        except OSError as e:
+            self.logger.error("Error leyendo guardado crudo slot %d: %s", slot, e)
+            return None
+
     def get_saves_info_unified(self) -> list[dict[str, Any]]:
         """
         Obtiene información de partidas de ambos sistemas.
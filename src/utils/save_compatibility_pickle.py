@@ -9,13 +9,13 @@ Descripción: Gestión específica de archivos pickle.
 
 import json
 import logging
-import pickle
-import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import save_format
 from .save_compatibility_core import SaveCompatibilityCore
+from .save_writer import write_atomic
 
 
 class SaveCompatibilityPickle:
@@ -37,7 +37,7 @@ class SaveCompatibilityPickle:
         self, slot: int, game_state, additional_data: dict[str, Any] | None = None
     ) -> bool:
         """
-        Guarda el juego usando el sistema pickle tradicional.
+        Guarda el juego en archivo usando el formato binario de save_format.
 
         Args:
             slot: Número de slot
@@ -52,36 +52,30 @@ class SaveCompatibilityPickle:
                 self.logger.error("Sistema de encriptación no disponible")
                 return False
 
-            # Preparar datos para guardar
-            save_data = {
-                "game_state": game_state.get_state_dict(),
-                "additional_data": additional_data,
-                "save_timestamp": datetime.now().isoformat(),
-                "game_version": self.core.config.get("game", "version", "0.1.0"),
-            }
-
-            # Serializar y comprimir datos
-            serialized_data = pickle.dumps(save_data)
-            compressed_data = zlib.compress(serialized_data)
-
-            # Cifrar datos
-            if self.core.encryption_handler is not None:
-                encrypted_data = self.core.encryption_handler.encrypt_data(
-                    compressed_data
-                )
-            else:
+            # Codificar en el formato binario (secciones JSON + zlib + XOR)
+            encrypt = (
+                self.core.encryption_handler.encrypt_data
+                if self.core.encryption_handler is not None
+                else None
+            )
+            if encrypt is None:
                 self.logger.warning(
                     "No hay handler de encriptación, guardando sin cifrar"
                 )
-                encrypted_data = compressed_data
+            encrypted_data = save_format.encode_game_save(
+                game_state,
+                additional_data,
+                {
+                    "slot": slot,
+                    "save_timestamp": datetime.now().isoformat(),
+                    "game_version": self.core.config.get("game", "version", "0.1.0"),
+                },
+                encrypt,
+            )
 
-            # Guardar archivo cifrado
+            # Guardar archivo cifrado (temporal + renombrado atómico)
             saves_path = Path(self.core.config.get("paths", "saves", "saves"))
-            saves_path.mkdir(parents=True, exist_ok=True)
-            save_file = saves_path / f"save_{slot}.dat"
-
-            with open(save_file, "wb") as f:
-                f.write(encrypted_data)
+            write_atomic(saves_path / f"save_{slot}.dat", encrypted_data)
 
             # Actualizar archivo de información
             self.update_pickle_save_info(slot, game_state)
@@ -94,7 +88,7 @@ class SaveCompatibilityPickle:
                 "Error de archivo guardando con pickle slot %d: %s", slot, e
             )
             return False
-        except (MemoryError, pickle.PicklingError) as e:
+        except (MemoryError, TypeError, ValueError) as e:
             self.logger.error(
                 "Error de serialización guardando con pickle slot %d: %s", slot, e
             )
@@ -117,8 +111,10 @@ class SaveCompatibilityPickle:
                 "play_time": getattr(game_state, "play_time", 0),
             }
 
-            with open(info_file, "w", encoding="utf-8") as f:
-                json.dump(save_info, f, indent=4, ensure_ascii=False)
+            write_atomic(
+                info_file,
+                json.dumps(save_info, indent=4, ensure_ascii=False).encode("utf-8"),
+            )
 
         except OSError as e:
             self.logger.error("Error actualizando info pickle slot %d: %s", slot, e)
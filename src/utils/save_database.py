@@ -6,6 +6,7 @@ import sqlite3
 from datetime import datetime
 from typing import Any
 
+from . import save_format
 from .database_manager import DatabaseManager
 from .save_encryption import SaveEncryption
 
@@ -34,55 +35,38 @@ class SaveDatabase:
             bool: True si se guardó exitosamente, False en caso contrario
         """
         try:
-            game_data = {
-                "game_state": game_state.get_state_dict(),
-                "additional_data": additional_data or {},
-            }
-            json_data = json.dumps(game_data, ensure_ascii=False)
-            encrypted_package = self.encryption_handler.create_encrypted_package(
-                json_data.encode()
+            level = getattr(game_state, "level", 1)
+            now = datetime.now().isoformat()
+            # Formato binario común con el guardado en archivo (BLOB)
+            save_blob = save_format.encode_game_save(
+                game_state,
+                additional_data,
+                {"slot": slot, "save_timestamp": now},
+                self.encryption_handler.encrypt_data,
             )
-            save_data = {
-                "slot": slot,
-                "nombre_jugador": getattr(game_state, "player_name", f"Jugador {slot}"),
-                "descripcion": (
-                    f"Partida guardada - Nivel {getattr(game_state, 'level', 1)}"
-                ),
-                "nivel_actual": getattr(game_state, "level", 1),
-                "puntuacion": getattr(game_state, "score", 0),
-                "vidas": getattr(game_state, "lives", 3),
-                "tiempo_jugado": getattr(game_state, "play_time", 0),
-                "personaje": getattr(game_state, "selected_character", "guerrero"),
-                "estado_juego": json.dumps(encrypted_package, ensure_ascii=False),
-                "actualizado_en": datetime.now().isoformat(),
-            }
             query = """INSERT OR REPLACE INTO partidas_guardadas
                 (slot, nombre_jugador, descripcion, nivel_actual, puntuacion, vidas,
                  tiempo_jugado, personaje, estado_juego, actualizado_en, creado_en)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
                         COALESCE((SELECT creado_en FROM partidas_guardadas WHERE slot = ?), ?))"""
             params = (
-                save_data["slot"],
-                save_data["nombre_jugador"],
-                save_data["descripcion"],
-                save_data["nivel_actual"],
-                save_data["puntuacion"],
-                save_data["vidas"],
-                save_data["tiempo_jugado"],
-                save_data["personaje"],
-                save_data["estado_juego"],
-                save_data["actualizado_en"],
-                save_data["slot"],
-                save_data["actualizado_en"],
+                slot,
+                getattr(game_state, "player_name", f"Jugador {slot}"),
+                f"Partida guardada - Nivel {level}",
+                level,
+                getattr(game_state, "score", 0),
+                getattr(game_state, "lives", 3),
+                getattr(game_state, "play_time", 0),
+                getattr(game_state, "selected_character", None) or "guerrero",
+                sqlite3.Binary(save_blob),
+                now,
+                slot,
+                now,
             )
-            result = self.db_manager.execute_query(query, params)
-            if result:
-                self.logger.info("Partida guardada exitosamente en slot %d", slot)
-                return True
-            else:
-                self.logger.error("Error guardando partida en slot %d", slot)
-                return False
-        except (sqlite3.Error, json.JSONDecodeError, ValueError) as e:
+            self.db_manager.execute_query(query, params, fetch_results=False)
+            self.logger.info("Partida guardada exitosamente en slot %d", slot)
+            return True
+        except (RuntimeError, sqlite3.Error, TypeError, ValueError) as e:
             self.logger.error("Error guardando en base de datos slot %d: %s", slot, e)
             return False
 
@@ -102,48 +86,68 @@ class SaveDatabase:
                 self.logger.info("No se encontró partida en slot %d", slot)
                 return None
             save_record = results[0]
-            # Acceso por índices usando variables para evitar errores de tipo
-            idx_encrypted_data = 9
-            idx_slot = 1
-            idx_nombre = 2
-            idx_descripcion = 3
-            idx_nivel = 4
-            idx_puntuacion = 5
-            idx_vidas = 6
-            idx_tiempo = 7
-            idx_personaje = 8
-            idx_encrypted_data = 9
-            idx_creado = 10
-            idx_actualizado = 11
-
-            encrypted_package_json = save_record[idx_encrypted_data]  # type: ignore[index]
-            encrypted_package = json.loads(encrypted_package_json)
-            decrypted_data = self.encryption_handler.extract_encrypted_package(
-                encrypted_package
-            )
-            game_data = json.loads(decrypted_data.decode())
+            stored = save_record["estado_juego"]
+            if isinstance(stored, bytes) and save_format.is_binary_save(stored):
+                game_data = save_format.decode_game_save(
+                    stored, self.encryption_handler.decrypt_data
+                )
+            else:
+                # Formato antiguo: paquete XOR serializado en JSON
+                decrypted_data = self.encryption_handler.extract_encrypted_package(
+                    json.loads(stored)
+                )
+                game_data = json.loads(decrypted_data.decode())
             complete_data = {
                 "game_state": game_data["game_state"],
                 "additional_data": game_data["additional_data"],
                 "save_metadata": {
-                    "slot": save_record[idx_slot],  # type: ignore[index]
-                    "nombre_jugador": save_record[idx_nombre],  # type: ignore[index]
-                    "descripcion": save_record[idx_descripcion],  # type: ignore[index]
-                    "nivel_actual": save_record[idx_nivel],  # type: ignore[index]
-                    "puntuacion": save_record[idx_puntuacion],  # type: ignore[index]
-                    "vidas": save_record[idx_vidas],  # type: ignore[index]
-                    "tiempo_jugado": save_record[idx_tiempo],  # type: ignore[index]
-                    "personaje": save_record[idx_personaje],  # type: ignore[index]
-                    "creado_en": save_record[idx_creado],  # type: ignore[index]
-                    "actualizado_en": save_record[idx_actualizado],  # type: ignore[index]
+                    key: save_record[key]
+                    for key in (
+                        "slot",
+                        "nombre_jugador",
+                        "descripcion",
+                        "nivel_actual",
+                        "puntuacion",
+                        "vidas",
+                        "tiempo_jugado",
+                        "personaje",
+                        "creado_en",
+                        "actualizado_en",
+                    )
                 },
             }
             self.logger.info("Partida cargada exitosamente desde slot %d", slot)
             return complete_data
-        except (sqlite3.Error, json.JSONDecodeError, ValueError) as e:
+        except (RuntimeError, sqlite3.Error, KeyError, TypeError, ValueError) as e:
             self.logger.error("Error cargando desde base de datos slot %d: %s", slot, e)
             return None
 
+    def load_save_blob(self, slot: int, header_only: bool = False) -> bytes | None:
+        """Lee el BLOB de una partida (o solo su cabecera) sin descifrarlo.
+
+        Args:
+            slot: Número del slot de guardado (1-3)
+            header_only: Lee solo los bytes de cabecera del formato binario
+
+        Returns:
+            bytes | None: Datos almacenados o None si no hay partida binaria
+        """
+        column = (
+            f"substr(estado_juego, 1, {save_format.HEADER.size})"
+            if header_only
+            else "estado_juego"
+        )
+        try:
+            results = self.db_manager.execute_query(
+                f"SELECT {column} AS datos FROM partidas_guardadas WHERE slot = ?",
+                (slot,),
+            )
+        except RuntimeError as e:
+            self.logger.error("Error leyendo BLOB del slot %d: %s", slot, e)
+            return None
+        data = results[0]["datos"] if results else None
+        return data if isinstance(data, bytes) else None
+
     def get_all_saves_info(self) -> list[dict[str, Any]]:
         """Obtiene información de todas las partidas guardadas.
 
@@ -160,34 +164,22 @@ class SaveDatabase:
             saves_info = []
             if results:
                 for row in results:
-                    # Índices de columnas usando variables
-                    idx_slot = 0
-                    idx_nombre = 1
-                    idx_descripcion = 2
-                    idx_nivel = 3
-                    idx_puntuacion = 4
-                    idx_vidas = 5
-                    idx_tiempo = 6
-                    idx_personaje = 7
-                    idx_creado = 8
-                    idx_actualizado = 9
-
                     save_info = {
-                        "file_number": row[idx_slot],  # type: ignore[index]
+                        "file_number": row["slot"],
                         "exists": True,
-                        "player_name": row[idx_nombre],  # type: ignore[index]
-                        "description": row[idx_descripcion],  # type: ignore[index]
-                        "level": row[idx_nivel],  # type: ignore[index]
-                        "score": row[idx_puntuacion],  # type: ignore[index]
-                        "lives": row[idx_vidas],  # type: ignore[index]
-                        "play_time": row[idx_tiempo],  # type: ignore[index]
-                        "character": row[idx_personaje],  # type: ignore[index]
-                        "created_at": row[idx_creado],  # type: ignore[index]
-                        "last_used": row[idx_actualizado],  # type: ignore[index]
+                        "player_name": row["nombre_jugador"],
+                        "description": row["descripcion"],
+                        "level": row["nivel_actual"],
+                        "score": row["puntuacion"],
+                        "lives": row["vidas"],
+                        "play_time": row["tiempo_jugado"],
+                        "character": row["personaje"],
+                        "created_at": row["creado_en"],
+                        "last_used": row["actualizado_en"],
                     }
                     saves_info.append(save_info)
             return saves_info
-        except (sqlite3.Error, ValueError) as e:
+        except (RuntimeError, sqlite3.Error, KeyError, ValueError) as e:
             self.logger.error("Error obteniendo información de partidas: %s", e)
             return []
 
@@ -56,14 +56,17 @@ class SaveEncryption:
         """
         # Implementación de cifrado XOR
         # En producción, considerar usar una biblioteca de cifrado más robusta
+        if not data:
+            return b""
         key_bytes = self.encryption_key.encode()
-        encrypted = bytearray()
-
-        for i, byte in enumerate(data):
-            key_byte = key_bytes[i % len(key_bytes)]
-            encrypted.append(byte ^ key_byte)
-
-        return bytes(encrypted)
+        size = len(data)
+        key_stream = (key_bytes * (size // len(key_bytes) + 1))[:size]
+
+        # XOR de todo el bloque como entero: mismo resultado que byte a byte
+        encrypted = int.from_bytes(data, "little") ^ int.from_bytes(
+            key_stream, "little"
+        )
+        return encrypted.to_bytes(size, "little")
 
     def decrypt_data(self, encrypted_data: bytes) -> bytes:
         """
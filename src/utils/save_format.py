@@ -0,0 +1,221 @@
+"""
+Save Format - Formato binario versionado de partidas
+====================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Formato binario compacto común a los guardados en archivo y en
+SQLite. Cabecera fija seguida de una tabla de secciones y sus datos:
+
+    Cabecera  <4sHHHII  magic, versión, flags, nº secciones, longitud, CRC32
+    Sección   <4sBII    etiqueta, flags, longitud original, longitud guardada
+
+Cada sección es JSON compacto (nunca pickle) comprimido con zlib solo cuando
+compensa. El CRC32 cubre tabla y datos; el cifrado XOR opcional se aplica sobre
+todo el bloque tras la cabecera. Versiones antiguas se actualizan al leer.
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+MAGIC = b"SIKS"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHHII")
+SECTION = struct.Struct("<4sBII")
+
+# Flags de cabecera
+FLAG_ENCRYPTED = 0x01
+
+# Flags de sección
+SECTION_COMPRESSED = 0x01
+
+# Secciones estándar
+SECTION_META = b"META"
+SECTION_STATE = b"STAT"
+SECTION_EXTRA = b"EXTR"
+
+# Por debajo de este tamaño zlib no suele compensar
+COMPRESS_MIN_BYTES = 128
+
+
+class SaveFormatError(ValueError):
+    """Datos de guardado con formato inválido o corrupto."""
+
+
+def is_binary_save(data: bytes) -> bool:
+    """Indica si los datos están en el formato binario (frente a pickle/JSON antiguos)."""
+    return data[:4] == MAGIC
+
+
+def _pack_section(tag: bytes, value: Any, compress: bool) -> tuple[bytes, bytes]:
+    """Serializa una sección y devuelve (entrada de tabla, datos)."""
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+    stored, flags = raw, 0
+    if compress and len(raw) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(raw, 6)
+        if len(packed) < len(raw):
+            stored, flags = packed, SECTION_COMPRESSED
+    return SECTION.pack(tag, flags, len(raw), len(stored)), stored
+
+
+def encode(
+    sections: dict[bytes, Any],
+    encrypt: Callable[[bytes], bytes] | None = None,
+    compress: bool = True,
+) -> bytes:
+    """
+    Codifica secciones en el formato binario.
+
+    Args:
+        sections: Etiqueta de 4 bytes -> valor serializable en JSON
+        encrypt: Función de cifrado simétrico opcional para el cuerpo
+        compress: Permite comprimir las secciones grandes
+
+    Returns:
+        Bytes del guardado listos para archivo o BLOB
+    """
+    table, payload = [], []
+    for tag, value in sections.items():
+        entry, stored = _pack_section(tag, value, compress)
+        table.append(entry)
+        payload.append(stored)
+    body = b"".join(table) + b"".join(payload)
+    flags = 0
+    if encrypt is not None:
+        body = encrypt(body)
+        flags |= FLAG_ENCRYPTED
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, flags, len(table), len(body), zlib.crc32(body)
+    )
+    return header + body
+
+
+def read_header(data: bytes) -> dict[str, int]:
+    """
+    Lee y valida la cabecera sin tocar el cuerpo.
+
+    Raises:
+        SaveFormatError: Si la cabecera no es válida
+    """
+    if len(data) < HEADER.size or not is_binary_save(data):
+        raise SaveFormatError("Cabecera de guardado no reconocida")
+    _, version, flags, count, length, checksum = HEADER.unpack_from(data)
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Versión de guardado {version} no soportada")
+    return {
+        "version": version,
+        "flags": flags,
+        "sections": count,
+        "length": length,
+        "checksum": checksum,
+    }
+
+
+def verify(data: bytes) -> bool:
+    """Comprueba longitud y CRC32 del cuerpo sin descifrar ni decodificar."""
+    try:
+        header = read_header(data)
+    except SaveFormatError:
+        return False
+    body = data[HEADER.size :]
+    return len(body) == header["length"] and zlib.crc32(body) == header["checksum"]
+
+
+def decode(
+    data: bytes, decrypt: Callable[[bytes], bytes] | None = None
+) -> dict[bytes, Any]:
+    """
+    Decodifica un guardado binario y lo actualiza a la versión actual.
+
+    Args:
+        data: Bytes del guardado
+        decrypt: Función de descifrado (obligatoria si el guardado está cifrado)
+
+    Returns:
+        Etiqueta -> valor de cada sección
+
+    Raises:
+        SaveFormatError: Si los datos están truncados, corruptos o cifrados sin clave
+    """
+    header = read_header(data)
+    body = data[HEADER.size :]
+    if len(body) != header["length"] or zlib.crc32(body) != header["checksum"]:
+        raise SaveFormatError("Guardado truncado o corrupto (CRC32)")
+    if header["flags"] & FLAG_ENCRYPTED:
+        if decrypt is None:
+            raise SaveFormatError("Guardado cifrado sin función de descifrado")
+        body = decrypt(body)
+
+    sections = {}
+    offset = SECTION.size * header["sections"]
+    try:
+        for index in range(header["sections"]):
+            tag, flags, raw_len, stored_len = SECTION.unpack_from(
+                body, index * SECTION.size
+            )
+            raw = body[offset : offset + stored_len]
+            offset += stored_len
+            if flags & SECTION_COMPRESSED:
+                raw = zlib.decompress(raw)
+            if len(raw) != raw_len:
+                raise SaveFormatError(f"Sección {tag!r} con longitud incorrecta")
+            sections[tag] = json.loads(raw)
+    except (struct.error, zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise SaveFormatError(f"Sección de guardado ilegible: {e}") from e
+    return upgrade(header["version"], sections)
+
+
+# Migraciones hacia delante: versión de origen -> función que devuelve la siguiente
+MIGRATIONS: dict[int, Callable[[dict[bytes, Any]], dict[bytes, Any]]] = {}
+
+
+def upgrade(version: int, sections: dict[bytes, Any]) -> dict[bytes, Any]:
+    """Aplica en orden las migraciones desde ``version`` hasta la actual."""
+    while version < FORMAT_VERSION:
+        migrate = MIGRATIONS.get(version)
+        if migrate is None:
+            raise SaveFormatError(f"Sin migración desde la versión {version}")
+        sections = migrate(sections)
+        version += 1
+    return sections
+
+
+def encode_game_save(
+    game_state,
+    additional_data: dict[str, Any] | None,
+    metadata: dict[str, Any],
+    encrypt: Callable[[bytes], bytes] | None = None,
+) -> bytes:
+    """Codifica una partida con las secciones estándar META/STAT/EXTR."""
+    return encode(
+        {
+            SECTION_META: metadata,
+            SECTION_STATE: game_state.get_state_dict(),
+            SECTION_EXTRA: additional_data or {},
+        },
+        encrypt,
+    )
+
+
+def decode_game_save(
+    data: bytes, decrypt: Callable[[bytes], bytes] | None = None
+) -> dict[str, Any]:
+    """
+    Decodifica una partida al diccionario que devolvían los formatos antiguos.
+
+    Returns:
+        Diccionario con game_state, additional_data y save_metadata
+    """
+    sections = decode(data, decrypt)
+    metadata = sections.get(SECTION_META, {})
+    return {
+        "game_state": sections.get(SECTION_STATE, {}),
+        "additional_data": sections.get(SECTION_EXTRA, {}),
+        "save_timestamp": metadata.get("save_timestamp"),
+        "game_version": metadata.get("game_version"),
+        "save_metadata": metadata,
+    }
@@ -7,6 +7,7 @@ Fecha: 2025-07-30
 Descripción: Módulo especializado en carga de archivos de guardado y gestión de información.
 """
 
+import io
 import json
 import logging
 import pickle
@@ -14,9 +15,17 @@ import zlib
 from pathlib import Path
 from typing import Any
 
+from . import save_format
 from .config_manager import ConfigManager
 
 
+class _LegacySaveUnpickler(pickle.Unpickler):
+    """Unpickler que rechaza cualquier clase: los guardados solo usan tipos básicos."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Tipo no permitido en guardado: {module}.{name}")
+
+
 class SaveLoader:
     """
     Gestor especializado en carga de archivos de guardado.
@@ -111,24 +120,53 @@ class SaveLoader:
             with open(save_file, "rb") as f:
                 encrypted_data = f.read()
 
-            # Descifrar datos
-            decrypted_data = self.encryption_handler.decrypt_data(encrypted_data)
-
-            # Descomprimir y deserializar
-            decompressed_data = zlib.decompress(decrypted_data)
-            save_data = pickle.loads(decompressed_data)
+            if save_format.is_binary_save(encrypted_data):
+                save_data = save_format.decode_game_save(
+                    encrypted_data, self.encryption_handler.decrypt_data
+                )
+            else:
+                save_data = self._load_legacy_pickle(encrypted_data)
 
             self.logger.info(
                 "Archivo de guardado %d cargado correctamente", save_file_number
             )
             return save_data
 
-        except (OSError, ValueError, KeyError) as e:
+        except (OSError, ValueError, KeyError, zlib.error, pickle.UnpicklingError) as e:
             self.logger.error(
                 "Error al cargar archivo de guardado %d: %s", save_file_number, e
             )
             return None
 
+    def _load_legacy_pickle(self, encrypted_data: bytes) -> dict[str, Any]:
+        """
+        Lee un guardado del formato antiguo (pickle + zlib + XOR).
+
+        Solo se admiten tipos básicos: el siguiente guardado del slot se escribe
+        ya en el formato binario.
+        """
+        decrypted_data = self.encryption_handler.decrypt_data(encrypted_data)
+        decompressed_data = zlib.decompress(decrypted_data)
+        return _LegacySaveUnpickler(io.BytesIO(decompressed_data)).load()
+
+    def read_save_bytes(self, slot: int, header_only: bool = False) -> bytes | None:
+        """
+        Lee los bytes crudos de un guardado sin descifrarlo.
+
+        Args:
+            slot: Número de slot
+            header_only: Lee solo la cabecera del formato binario
+
+        Returns:
+            Bytes leídos o None si el archivo no existe
+        """
+        save_file = self.saves_path / f"save_{slot}.dat"
+        try:
+            with open(save_file, "rb") as f:
+                return f.read(save_format.HEADER.size) if header_only else f.read()
+        except FileNotFoundError:
+            return None
+
     def get_last_save_file(self, save_files: list[dict[str, Any]]) -> int | None:
         """
         Obtiene el número del último archivo de guardado utilizado.
@@ -1,13 +1,18 @@
 """Save Manager - Sistema de Guardado Refactorizado"""
 
 import logging
+import time
+from collections.abc import Callable
 from typing import Any
 
+from . import save_format
 from .config_manager import ConfigManager
 from .save_compatibility import SaveCompatibility
 from .save_database import SaveDatabase
 from .save_encryption import SaveEncryption
 from .save_loader import SaveLoader
+from .save_slot_index import SaveSlotIndex
+from .save_writer import SaveSnapshot, SaveWriter
 
 
 class SaveManager:
@@ -16,7 +21,18 @@ class SaveManager:
     def __init__(self, config: ConfigManager):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.writer = SaveWriter()
+        # Huella del último guardado escrito por slot (guardado incremental)
+        self._slot_digests: dict[int, str] = {}
+        self._dirty_since_backup = False
+        save_settings = self.config.get_section("save_system").get("save_system", {})
+        self.backup_enabled = save_settings.get("backup_enabled", True)
+        self.backup_interval = save_settings.get("backup_interval", 300)
+        self._last_backup = time.monotonic()
         self._init_components()
+        self.slot_index = SaveSlotIndex(
+            self.loader.saves_path, self._collect_saves_info
+        )
 
     def _init_components(self) -> None:
         try:
@@ -47,18 +63,141 @@ class SaveManager:
             raise
 
     def get_save_files_info(self) -> list[dict[str, Any]]:
-        """Obtiene información de todos los archivos de guardado."""
-        return self.compatibility.get_saves_info_unified()
+        """
+        Obtiene información de todos los archivos de guardado.
+
+        Se sirve desde el índice de slots en memoria, sin abrir las partidas.
+        """
+        self.writer.flush()
+        self.slot_index.ensure_loaded()
+        return self.slot_index.get_slots()
+
+    def get_latest_slot(self) -> int | None:
+        """Slot guardado más recientemente (para "Continuar")."""
+        self.get_save_files_info()
+        return self.slot_index.get_latest_slot()
+
+    def _collect_saves_info(self) -> list[dict[str, Any]]:
+        """Información de las partidas existentes para crear el índice de slots."""
+        saves_info = self.compatibility.get_saves_info_unified()
+        for info in saves_info:
+            if info.get("exists"):
+                info["checksum"], info["size"] = self._read_slot_checksum(
+                    info["file_number"]
+                )
+        return saves_info
+
+    def _read_slot_checksum(self, slot: int) -> tuple[int | None, int]:
+        """CRC32 y tamaño de un guardado leyendo solo su cabecera."""
+        header_bytes = self.compatibility.load_raw_save(slot, header_only=True)
+        try:
+            header = save_format.read_header(header_bytes or b"")
+        except save_format.SaveFormatError:
+            return None, 0
+        return header["checksum"], save_format.HEADER.size + header["length"]
 
     def save_game(
-        self, game_state, additional_data: dict[str, Any] | None = None
+        self,
+        game_state,
+        additional_data: dict[str, Any] | None = None,
+        on_complete: Callable[[bool], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        blocking: bool = False,
     ) -> bool:
-        """Guarda el estado del juego actual."""
+        """
+        Guarda el estado del juego actual.
+
+        En el hilo principal solo se captura una instantánea en memoria; la
+        serialización y escritura se hacen en el hilo escritor. Los callbacks se
+        entregan desde ``update()``.
+
+        Args:
+            game_state: Estado del juego a guardar
+            additional_data: Datos adicionales del guardado
+            on_complete: Callback al terminar la escritura
+            on_error: Callback si la escritura falla
+            blocking: Escribe en el hilo actual y devuelve el resultado real
+
+        Returns:
+            True si el guardado se escribió (o se encoló, en modo no bloqueante)
+        """
         slot = getattr(game_state, "active_slot", 1)
-        return self.compatibility.save_game_unified(slot, game_state, additional_data)
+        snapshot = SaveSnapshot.capture(game_state, slot, additional_data)
+        if blocking:
+            self.writer.flush()
+            try:
+                return self._write_snapshot(snapshot)
+            except OSError as e:
+                self.logger.error("Error guardando slot %d: %s", slot, e)
+                return False
+        self.writer.submit(
+            lambda: self._write_snapshot(snapshot),
+            on_complete=on_complete,
+            on_error=on_error,
+            key=f"slot_{slot}",
+        )
+        return True
+
+    def _write_snapshot(self, snapshot: SaveSnapshot) -> bool:
+        """Escribe una instantánea (hilo escritor); omite slots sin cambios."""
+        digest = snapshot.digest()
+        if self._slot_digests.get(snapshot.slot) == digest:
+            self.logger.debug("Slot %d sin cambios, guardado omitido", snapshot.slot)
+            return True
+        if not self.compatibility.save_game_unified(
+            snapshot.slot, snapshot, snapshot.additional_data
+        ):
+            raise OSError(f"No se pudo guardar el slot {snapshot.slot}")
+        checksum, size = self._read_slot_checksum(snapshot.slot)
+        self.slot_index.update(
+            snapshot.slot,
+            {
+                "player_name": snapshot.player_name,
+                "level": snapshot.level,
+                "score": snapshot.score,
+                "lives": snapshot.lives,
+                "play_time": snapshot.play_time,
+                "character": snapshot.selected_character,
+            },
+            checksum,
+            size,
+        )
+        self._slot_digests[snapshot.slot] = digest
+        self._dirty_since_backup = True
+        return True
+
+    def update(self) -> None:
+        """
+        Procesa el sistema de guardado desde el bucle principal.
+
+        Entrega los callbacks de escrituras terminadas y encola el backup
+        periódico (``backup_interval``) si hubo guardados desde el último.
+        """
+        self.writer.dispatch_callbacks()
+        if not self.backup_enabled or not self._dirty_since_backup:
+            return
+        if time.monotonic() - self._last_backup >= self.backup_interval:
+            self.schedule_backup()
+
+    def schedule_backup(
+        self,
+        on_complete: Callable[[bool], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Encola un backup en el hilo escritor, detrás de los guardados pendientes."""
+        self._last_backup = time.monotonic()
+        self._dirty_since_backup = False
+        self.writer.submit(
+            self.backup_saves, on_complete=on_complete, on_error=on_error, key="backup"
+        )
+
+    def shutdown(self) -> None:
+        """Termina las escrituras pendientes y detiene el hilo escritor."""
+        self.writer.shutdown()
 
     def load_save(self, save_file_number: int) -> dict[str, Any] | None:
         """Carga una partida guardada específica."""
+        self.writer.flush()
         return self.compatibility.load_game_unified(save_file_number)
 
     def create_new_save(self, save_file_number: int) -> bool:
@@ -89,6 +228,7 @@ class SaveManager:
                 save_info["last_used"] = datetime.now().isoformat()
                 with open(info_file, "w", encoding="utf-8") as f:
                     json.dump(save_info, f, indent=4, ensure_ascii=False)
+                self.slot_index.update(save_file_number, save_info)
                 self.logger.info("Nuevo save creado: slot %d", save_file_number)
                 return True
         except (OSError, PermissionError, ValueError) as e:
@@ -99,6 +239,9 @@ class SaveManager:
 
     def delete_save(self, save_file_number: int) -> bool:
         """Elimina una partida guardada."""
+        self.writer.flush()
+        self._slot_digests.pop(save_file_number, None)
+        self.slot_index.remove(save_file_number)
         try:
             success = False
             if self.database:
@@ -148,6 +291,8 @@ class SaveManager:
                 shutil.copy2(save_file, backup_path)
             for info_file in saves_path.glob("save_*_info.json"):
                 shutil.copy2(info_file, backup_path)
+            if self.slot_index.path.exists():
+                shutil.copy2(self.slot_index.path, backup_path)
             if self.database:
                 getattr(self.database, "backup_database", lambda x: None)(
                     str(backup_path / "game_database.db")
@@ -173,15 +318,27 @@ class SaveManager:
         }
 
     def validate_saves_integrity(self) -> dict[str, bool]:
-        """Valida la integridad de todas las partidas guardadas."""
+        """
+        Valida la integridad de todas las partidas guardadas.
+
+        En el formato binario basta con comprobar el CRC32 del cuerpo y que
+        coincide con el del índice; solo los formatos antiguos se cargan enteros.
+        """
         results = {}
         save_files = self.get_save_files_info()
         for save_info in save_files:
             if save_info["exists"]:
                 slot = save_info["file_number"]
                 try:
-                    data = self.load_save(slot)
-                    results[f"slot_{slot}"] = data is not None
+                    raw = self.compatibility.load_raw_save(slot)
+                    if raw is not None and save_format.is_binary_save(raw):
+                        expected = save_info.get("checksum")
+                        results[f"slot_{slot}"] = save_format.verify(raw) and (
+                            expected is None
+                            or save_format.read_header(raw)["checksum"] == expected
+                        )
+                    else:
+                        results[f"slot_{slot}"] = self.load_save(slot) is not None
                 except (OSError, ValueError, KeyError):
                     results[f"slot_{slot}"] = False
         return results
@@ -0,0 +1,193 @@
+"""
+Save Slot Index - Índice de metadatos de slots de guardado
+==========================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Índice ligero (``slots_index.json``) con los metadatos que muestran
+los menús (jugador, personaje, nivel, puntuación, fecha) y el CRC32/tamaño de
+cada guardado. Se mantiene en memoria y se reescribe de forma atómica en cada
+guardado, de modo que los menús y "Continuar" no abren ni descifran partidas.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .save_writer import write_atomic
+
+INDEX_VERSION = 1
+SLOT_NUMBERS = (1, 2, 3)
+
+
+def empty_slot_entry(slot: int) -> dict[str, Any]:
+    """Entrada de un slot vacío, con las claves que esperan los menús."""
+    return {
+        "file_number": slot,
+        "slot": slot,
+        "exists": False,
+        "player_name": "",
+        "level": 1,
+        "score": 0,
+        "lives": 0,
+        "play_time": 0,
+        "character": "",
+        "timestamp": None,
+        "last_used": None,
+        "checksum": None,
+        "size": 0,
+    }
+
+
+class SaveSlotIndex:
+    """Índice de slots en memoria respaldado por un archivo JSON atómico."""
+
+    def __init__(
+        self,
+        saves_path: Path,
+        rebuild_source: Callable[[], list[dict[str, Any]]] | None = None,
+    ):
+        """
+        Inicializa el índice.
+
+        Args:
+            saves_path: Carpeta de guardados donde vive ``slots_index.json``
+            rebuild_source: Información de los guardados existentes, para
+                reconstruir el índice si aún no existe (ver ``rebuild``)
+        """
+        self.path = Path(saves_path) / "slots_index.json"
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._rebuild_source = rebuild_source
+        self._entries: dict[int, dict[str, Any]] | None = self._read()
+
+    def _read(self) -> dict[int, dict[str, Any]] | None:
+        """Lee el índice de disco; None si no existe o no es válido."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return None
+            return {int(slot): entry for slot, entry in data["slots"].items()}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            self.logger.warning("Índice de slots ilegible, se reconstruirá: %s", e)
+            return None
+
+    def _write(self) -> None:
+        """Persiste el índice completo con renombrado atómico (con el lock tomado)."""
+        data = {"version": INDEX_VERSION, "slots": self._entries}
+        write_atomic(
+            self.path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """Indica si el índice existe (en disco o ya reconstruido)."""
+        return self._entries is not None
+
+    def ensure_loaded(self) -> None:
+        """Reconstruye el índice desde los guardados existentes si aún no existe."""
+        if self._entries is None and self._rebuild_source is not None:
+            self.rebuild(self._rebuild_source())
+
+    def get_slots(self) -> list[dict[str, Any]]:
+        """
+        Metadatos de todos los slots, sin tocar los guardados.
+
+        Returns:
+            Lista ordenada con una entrada por slot (siempre 3)
+        """
+        with self._lock:
+            entries = self._entries or {}
+            return [
+                dict(entries.get(slot) or empty_slot_entry(slot))
+                for slot in SLOT_NUMBERS
+            ]
+
+    def get_slot(self, slot: int) -> dict[str, Any]:
+        """Metadatos de un slot concreto."""
+        with self._lock:
+            return dict((self._entries or {}).get(slot) or empty_slot_entry(slot))
+
+    def rebuild(self, saves_info: list[dict[str, Any]]) -> None:
+        """
+        Reconstruye el índice desde la información de los sistemas de guardado.
+
+        Solo se usa una vez, cuando aún no existe índice (partidas anteriores).
+        """
+        with self._lock:
+            self._entries = {}
+            for info in saves_info:
+                slot = info.get("file_number", info.get("slot"))
+                if slot in SLOT_NUMBERS and info.get("exists"):
+                    entry = empty_slot_entry(slot)
+                    entry.update({k: v for k, v in info.items() if k in entry})
+                    entry["exists"] = True
+                    if not entry["timestamp"] and entry["last_used"]:
+                        try:
+                            entry["timestamp"] = datetime.fromisoformat(
+                                str(entry["last_used"])
+                            ).timestamp()
+                        except ValueError:
+                            pass
+                    self._entries[slot] = entry
+            self._write()
+        self.logger.info("Índice de slots reconstruido (%d partidas)", len(saves_info))
+
+    def update(
+        self,
+        slot: int,
+        metadata: dict[str, Any],
+        checksum: int | None = None,
+        size: int = 0,
+    ) -> None:
+        """
+        Registra los metadatos de un slot tras escribir su guardado.
+
+        Si el índice aún no existe se reconstruye antes, para no perder los
+        metadatos de los demás slots.
+
+        Args:
+            slot: Número de slot
+            metadata: player_name, level, score, lives, play_time, character
+            checksum: CRC32 de la cabecera del guardado
+            size: Tamaño en bytes del guardado
+        """
+        entry = empty_slot_entry(slot)
+        entry.update({k: v for k, v in metadata.items() if k in entry})
+        entry.update(
+            {
+                "exists": True,
+                "timestamp": time.time(),
+                "last_used": datetime.now().isoformat(),
+                "checksum": checksum,
+                "size": size,
+            }
+        )
+        self.ensure_loaded()
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+            self._entries[slot] = entry
+            self._write()
+
+    def remove(self, slot: int) -> None:
+        """Marca un slot como vacío."""
+        self.ensure_loaded()
+        with self._lock:
+            if self._entries is None or self._entries.pop(slot, None) is None:
+                return
+            self._write()
+
+    def get_latest_slot(self) -> int | None:
+        """Slot guardado más recientemente, o None si no hay partidas."""
+        latest = [s for s in self.get_slots() if s["exists"] and s["timestamp"]]
+        if not latest:
+            return None
+        return max(latest, key=lambda s: s["timestamp"])["file_number"]
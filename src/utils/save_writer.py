@@ -0,0 +1,245 @@
+"""
+Save Writer - Escritura de partidas en segundo plano
+====================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Cola de escritura en un hilo dedicado para el sistema de guardado.
+El hilo principal solo captura una instantánea en memoria del estado; la
+serialización, compresión, cifrado y escritura (renombrado atómico o SQLite)
+ocurren en el hilo escritor. Los callbacks se entregan en el hilo principal.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Escribe un archivo de forma atómica (archivo temporal + renombrado).
+
+    Un cierre inesperado nunca deja un guardado a medio escribir: o queda el
+    archivo anterior o el nuevo completo.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class SaveSnapshot:
+    """
+    Instantánea inmutable del estado del juego para el hilo escritor.
+
+    Expone la misma interfaz que GameState (``get_state_dict`` y atributos
+    de metadatos), por lo que los backends de guardado la aceptan sin cambios.
+    """
+
+    slot: int
+    state: dict[str, Any]
+    additional_data: dict[str, Any]
+    player_name: str
+    level: int
+    score: int
+    lives: int
+    play_time: float
+    selected_character: str
+    captured_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def capture(
+        cls, game_state, slot: int, additional_data: dict[str, Any] | None = None
+    ) -> "SaveSnapshot":
+        """Copia en memoria el estado actual; es lo único que hace el hilo principal."""
+        return cls(
+            slot=slot,
+            state=copy.deepcopy(game_state.get_state_dict()),
+            additional_data=copy.deepcopy(additional_data or {}),
+            player_name=getattr(game_state, "player_name", f"Jugador {slot}"),
+            level=getattr(game_state, "level", 1),
+            score=getattr(game_state, "score", 0),
+            lives=getattr(game_state, "lives", 3),
+            play_time=getattr(game_state, "play_time", 0),
+            selected_character=getattr(game_state, "selected_character", None)
+            or "guerrero",
+        )
+
+    def get_state_dict(self) -> dict[str, Any]:
+        """Estado capturado (interfaz compatible con GameState)."""
+        return self.state
+
+    def digest(self) -> str:
+        """Huella del contenido, para omitir escrituras sin cambios."""
+        payload = json.dumps(
+            [self.state, self.additional_data], sort_keys=True, default=str
+        )
+        return hashlib.md5(payload.encode()).hexdigest()
+
+
+@dataclass
+class _WriteJob:
+    """Trabajo pendiente en la cola del escritor."""
+
+    task: Callable[[], Any]
+    on_complete: Callable[[Any], None] | None
+    on_error: Callable[[Exception], None] | None
+    key: str | None
+    generation: int
+
+
+class SaveWriter:
+    """
+    Hilo escritor con cola FIFO para guardados y backups.
+
+    Los trabajos con la misma ``key`` se fusionan: si llega un guardado más
+    reciente del mismo slot antes de escribir el anterior, solo se escribe el
+    último, y los callbacks del trabajo sustituido se entregan con el resultado
+    (o el error) de esa escritura. Los callbacks se acumulan y se entregan al
+    llamar a ``dispatch_callbacks`` desde el bucle principal.
+    """
+
+    def __init__(self, name: str = "SaveWriter"):
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        self._jobs: queue.Queue[_WriteJob | None] = queue.Queue()
+        self._callbacks: queue.Queue[tuple[Callable, Any]] = queue.Queue()
+        self._generations: dict[str, int] = {}
+        # Callbacks de trabajos sustituidos, a la espera del último de su clave
+        self._waiting: dict[str, list[tuple[Callable | None, Callable | None]]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "coalesced": 0,
+            "last_write_ms": 0.0,
+        }
+
+    def submit(
+        self,
+        task: Callable[[], Any],
+        on_complete: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        key: str | None = None,
+    ) -> None:
+        """
+        Encola un trabajo para el hilo escritor.
+
+        Args:
+            task: Función sin argumentos que realiza la escritura
+            on_complete: Callback con el resultado (hilo principal)
+            on_error: Callback con la excepción (hilo principal)
+            key: Clave de fusión; solo se ejecuta el último trabajo de cada clave
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1 if key else 0
+            if key:
+                self._generations[key] = generation
+            self.stats["submitted"] += 1
+        self._ensure_thread()
+        self._jobs.put(_WriteJob(task, on_complete, on_error, key, generation))
+
+    def _ensure_thread(self) -> None:
+        """Arranca el hilo escritor la primera vez que se necesita."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Bucle del hilo escritor."""
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+                self._execute(job)
+            finally:
+                self._jobs.task_done()
+
+    def _execute(self, job: _WriteJob) -> None:
+        """Ejecuta un trabajo, salvo que uno más reciente de su clave lo sustituya."""
+        waiting = []
+        if job.key:
+            with self._lock:
+                superseded = self._generations.get(job.key, 0) != job.generation
+                if superseded:
+                    self._waiting.setdefault(job.key, []).append(
+                        (job.on_complete, job.on_error)
+                    )
+                else:
+                    waiting = self._waiting.pop(job.key, [])
+            if superseded:
+                self.stats["coalesced"] += 1
+                return
+        callbacks = [*waiting, (job.on_complete, job.on_error)]
+
+        started = time.perf_counter()
+        try:
+            result = job.task()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # El hilo escritor no debe morir: el error se entrega por callback
+            self.stats["failed"] += 1
+            self.logger.error("Error en escritura en segundo plano: %s", e)
+            for _, on_error in callbacks:
+                if on_error:
+                    self._callbacks.put((on_error, e))
+            return
+        finally:
+            self.stats["last_write_ms"] = (time.perf_counter() - started) * 1000
+
+        self.stats["completed"] += 1
+        for on_complete, _ in callbacks:
+            if on_complete:
+                self._callbacks.put((on_complete, result))
+
+    def dispatch_callbacks(self) -> int:
+        """
+        Entrega en el hilo actual los callbacks de trabajos terminados.
+
+        Returns:
+            Número de callbacks ejecutados
+        """
+        dispatched = 0
+        while True:
+            try:
+                callback, value = self._callbacks.get_nowait()
+            except queue.Empty:
+                return dispatched
+            callback(value)
+            dispatched += 1
+
+    def pending(self) -> int:
+        """Número aproximado de trabajos en cola."""
+        return self._jobs.qsize()
+
+    def flush(self) -> None:
+        """Bloquea hasta que todos los trabajos encolados se hayan escrito."""
+        if self._thread is not None and self._thread.is_alive():
+            self._jobs.join()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Escribe lo pendiente y detiene el hilo escritor."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._jobs.put(None)
+        self._thread.join(timeout)
+        self.dispatch_callbacks()
+        self.logger.info("SaveWriter detenido: %s", self.stats)
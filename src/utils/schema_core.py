@@ -10,6 +10,7 @@ Fase 1 de migración SQLite - Núcleo del sistema
 
 import logging
 import shutil
+import sqlite3
 from pathlib import Path
 from typing import Any
 
@@ -29,7 +30,7 @@ class SchemaCore:
     - Backup automático antes de cambios importantes
     """
 
-    SCHEMA_VERSION = "1.0.0"
+    SCHEMA_VERSION = "2.0.0"
 
     def __init__(self, database_manager: DatabaseManager):
         """
@@ -75,20 +76,27 @@ class SchemaCore:
         table_schemas = get_all_table_schemas()
 
         try:
+            # Llevar tablas existentes de versiones anteriores a la actual
+            self.migrations.apply_pending_migrations()
+
             with self.db_manager.transaction() as conn:
                 for table_name, schema_sql in table_schemas.items():
                     self._logger.info("Creando tabla: %s", table_name)
                     conn.execute(schema_sql)
+                self.migrations.create_indexes(conn)
 
                 # Registrar migración
                 self.migrations.record_migration(
-                    "Initial schema creation", "CREATE_ALL_TABLES", self.SCHEMA_VERSION
+                    "Initial schema creation",
+                    "CREATE_ALL_TABLES",
+                    self.SCHEMA_VERSION,
+                    conn,
                 )
 
             self._logger.info("✅ Todas las tablas creadas exitosamente")
             return True
 
-        except (ValueError, RuntimeError, OSError) as e:
+        except (ValueError, RuntimeError, OSError, sqlite3.Error) as e:
             self._logger.error("Error creando tablas: %s", e)
             return False
 
@@ -146,6 +154,15 @@ class SchemaCore:
             self._logger.error("Error creando backup: %s", e)
             return False
 
+    def get_query_plans(self) -> dict[str, list[str]]:
+        """
+        Obtiene los planes de ejecución de las consultas frecuentes.
+
+        Returns:
+            Diccionario nombre de consulta -> líneas del plan
+        """
+        return self.migrations.explain_hot_queries()
+
     def get_schema_info(self) -> dict[str, Any]:
         """
         Obtiene información completa del esquema actual.
@@ -128,6 +128,17 @@ class SchemaManager:
         self._logger.debug("Recopilando información completa del esquema")
         return self.schema_core.get_schema_info()
 
+    def get_query_plans(self) -> dict[str, list[str]]:
+        """
+        Obtiene los planes de ejecución de las consultas frecuentes del juego.
+
+        Delegado a SchemaCore; útil para comprobar que usan índices.
+
+        Returns:
+            Diccionario nombre de consulta -> líneas de EXPLAIN QUERY PLAN
+        """
+        return self.schema_core.get_query_plans()
+
     def get_database_info(self) -> dict[str, Any]:
         """
         Obtiene información de la base de datos subyacente.
@@ -5,32 +5,68 @@ Gestiona migraciones de esquema, validación de integridad y registro de cambios
 """
 
 import hashlib
+import json
 import logging
+import sqlite3
 from typing import Any
 
 from .database_manager import DatabaseManager
+from .schema_tables import (
+    TYPED_COLUMNS,
+    extract_typed_values,
+    get_all_index_schemas,
+    get_hot_path_queries,
+)
+
+
+def _version_key(version: str) -> tuple[int, ...]:
+    """Convierte '2.0.0' en (2, 0, 0) para comparar versiones."""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
 
 
 class SchemaMigrations:
     """Gestor de migraciones y validaciones de esquema SQLite."""
 
+    BASE_VERSION = "1.0.0"
+
+    # Revisiones en orden: (versión, descripción, método que la aplica)
+    REVISIONS = (
+        (
+            "2.0.0",
+            "Columnas tipadas e índices de consultas frecuentes",
+            "_migrate_typed_game_data",
+        ),
+    )
+
     def __init__(self, database_manager: DatabaseManager):
         self.db_manager = database_manager
         self._logger = logging.getLogger("SchemaMigrations")
 
     def record_migration(
-        self, description: str, operation: str, schema_version: str = "1.0.0"
+        self,
+        description: str,
+        operation: str,
+        schema_version: str = "1.0.0",
+        conn: sqlite3.Connection | None = None,
     ) -> None:
-        """Registra una migración en la tabla de metadatos."""
-        checksum = self._calculate_schema_checksum()
+        """
+        Registra una migración en la tabla de metadatos.
+
+        Si se pasa ``conn`` el registro se escribe dentro de esa transacción;
+        usar otra conexión del pool mientras la transacción sigue abierta
+        bloquearía hasta el timeout de SQLite.
+        """
+        checksum = self._calculate_schema_checksum(conn)
         query = "INSERT INTO schema_metadata (version, description, checksum) VALUES (?, ?, ?)"
+        params = (schema_version, f"{operation}: {description}", checksum)
 
         try:
-            self.db_manager.execute_query(
-                query, (schema_version, f"{operation}: {description}", checksum)
-            )
+            if conn is not None:
+                conn.execute(query, params)
+            else:
+                self.db_manager.execute_query(query, params, fetch_results=False)
             self._logger.info("Migración registrada: %s", description)
-        except (ValueError, RuntimeError) as e:
+        except (ValueError, RuntimeError, sqlite3.Error) as e:
             self._logger.error("Error registrando migración: %s", e)
             raise
 
@@ -89,8 +125,8 @@ class SchemaMigrations:
             query_result = self.db_manager.execute_query(
                 "SELECT version FROM schema_metadata ORDER BY id DESC LIMIT 1"
             )
-            if isinstance(query_result, dict):
-                return query_result.get("version")
+            if query_result:
+                return query_result[0].get("version")
             return None
         except (ValueError, RuntimeError) as e:
             self._logger.warning("No se pudo obtener versión del esquema: %s", e)
@@ -107,7 +143,7 @@ class SchemaMigrations:
             self._logger.warning("Error obteniendo historial: %s", e)
             return []
 
-    def _calculate_schema_checksum(self) -> str:
+    def _calculate_schema_checksum(self, conn: sqlite3.Connection | None = None) -> str:
         """Calcula un checksum del esquema actual."""
         try:
             # Obtener todas las tablas y sus esquemas
@@ -116,7 +152,10 @@ class SchemaMigrations:
             WHERE type='table' AND name NOT LIKE 'sqlite_%'
             ORDER BY name
             """
-            tables = self.db_manager.execute_query(tables_query, fetch_results=True)
+            if conn is not None:
+                tables = [dict(row) for row in conn.execute(tables_query)]
+            else:
+                tables = self.db_manager.execute_query(tables_query, fetch_results=True)
 
             # Crear string único del esquema
             schema_string = ""
@@ -127,10 +166,113 @@ class SchemaMigrations:
             # Calcular checksum MD5
             return hashlib.md5(schema_string.encode()).hexdigest()
 
-        except (ValueError, RuntimeError) as e:
+        except (ValueError, RuntimeError, sqlite3.Error) as e:
             self._logger.warning("Error calculando checksum: %s", e)
             return "unknown_checksum"
 
+    def apply_pending_migrations(self) -> list[str]:
+        """
+        Aplica en orden las revisiones posteriores a la versión registrada.
+
+        Cada revisión se ejecuta en su propia transacción junto con su registro
+        en ``schema_metadata``, de modo que un fallo no deja versiones a medias.
+
+        Returns:
+            Lista de versiones aplicadas (vacía si el esquema estaba al día)
+        """
+        current = self.get_schema_version() or self.BASE_VERSION
+        applied = []
+
+        for version, description, method_name in self.REVISIONS:
+            if _version_key(version) <= _version_key(current):
+                continue
+            try:
+                with self.db_manager.transaction() as conn:
+                    getattr(self, method_name)(conn)
+                    self.record_migration(description, "MIGRATE", version, conn)
+            except (sqlite3.Error, ValueError, RuntimeError) as e:
+                self._logger.error("Error aplicando migración %s: %s", version, e)
+                break
+            applied.append(version)
+            current = version
+
+        return applied
+
+    def create_indexes(self, conn: sqlite3.Connection) -> None:
+        """Crea los índices de consultas frecuentes sobre tablas existentes."""
+        existing = self._existing_tables(conn)
+        for index_name, index_sql in get_all_index_schemas().items():
+            table_name = index_sql.split(" ON ")[1].split("(")[0].strip()
+            if table_name in existing:
+                conn.execute(index_sql)
+                self._logger.debug("Índice verificado: %s", index_name)
+
+    def _migrate_typed_game_data(self, conn: sqlite3.Connection) -> None:
+        """Revisión 2.0.0: mueve stats JSON a columnas tipadas y crea índices."""
+        existing = self._existing_tables(conn)
+
+        for table_name, columns in TYPED_COLUMNS.items():
+            if table_name not in existing:
+                continue
+
+            current_columns = {
+                row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")
+            }
+            for column, (declaration, _, _) in columns.items():
+                if column not in current_columns:
+                    conn.execute(
+                        f"ALTER TABLE {table_name} ADD COLUMN {column} {declaration}"
+                    )
+
+            # Rellenar columnas desde el JSON de las filas antiguas
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            rows = conn.execute(f"SELECT id, stats FROM {table_name}").fetchall()
+            for row_id, stats_json in rows:
+                try:
+                    stats = json.loads(stats_json) if stats_json else {}
+                except json.JSONDecodeError:
+                    self._logger.warning(
+                        "Stats JSON inválido en %s id=%s", table_name, row_id
+                    )
+                    stats = {}
+                values = extract_typed_values(table_name, {"stats": stats})
+                conn.execute(
+                    f"UPDATE {table_name} SET {assignments} WHERE id = ?",
+                    (*values.values(), row_id),
+                )
+            self._logger.info(
+                "Tabla %s migrada a columnas tipadas (%d filas)", table_name, len(rows)
+            )
+
+        self.create_indexes(conn)
+        conn.execute("ANALYZE")
+
+    def explain_hot_queries(self) -> dict[str, list[str]]:
+        """
+        Obtiene el plan de ejecución de cada consulta frecuente del juego.
+
+        Returns:
+            Diccionario nombre de consulta -> líneas de EXPLAIN QUERY PLAN
+        """
+        plans = {}
+        for name, (query, params) in get_hot_path_queries().items():
+            try:
+                rows = self.db_manager.execute_query(
+                    f"EXPLAIN QUERY PLAN {query}", params
+                )
+                plans[name] = [row["detail"] for row in rows or []]
+            except RuntimeError as e:
+                plans[name] = [f"ERROR: {e}"]
+        return plans
+
+    @staticmethod
+    def _existing_tables(conn: sqlite3.Connection) -> set[str]:
+        """Nombres de las tablas presentes en la base de datos."""
+        return {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+
     def backup_schema(self, backup_path: str) -> bool:
         """Crea un backup del esquema actual."""
         try:
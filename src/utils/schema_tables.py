@@ -75,6 +75,10 @@ def _get_personajes_schema() -> str:
             stats TEXT NOT NULL,
             ataques TEXT NOT NULL,
             sprite_config TEXT,
+            vida INTEGER NOT NULL DEFAULT 0,
+            velocidad INTEGER NOT NULL DEFAULT 0,
+            dano INTEGER NOT NULL DEFAULT 0,
+            escudo INTEGER NOT NULL DEFAULT 0,
             activo BOOLEAN DEFAULT 1,
             creado_en DATETIME DEFAULT CURRENT_TIMESTAMP
         )
@@ -92,6 +96,11 @@ def _get_enemigos_schema() -> str:
             comportamiento TEXT NOT NULL,
             animaciones TEXT NOT NULL,
             variantes TEXT,
+            rareza TEXT NOT NULL DEFAULT 'normal',
+            probabilidad_spawn REAL NOT NULL DEFAULT 1.0,
+            vida INTEGER NOT NULL DEFAULT 0,
+            velocidad INTEGER NOT NULL DEFAULT 0,
+            dano INTEGER NOT NULL DEFAULT 0,
             activo BOOLEAN DEFAULT 1,
             creado_en DATETIME DEFAULT CURRENT_TIMESTAMP
         )
@@ -127,6 +136,137 @@ def _get_configuracion_gameplay_schema() -> str:
     """
 
 
+# Columnas tipadas extraídas del JSON de stats (esquema 2.0.0).
+# Formato: tabla -> {columna: (declaración SQL, clave JSON, valor por defecto)}
+TYPED_COLUMNS: dict[str, dict[str, tuple[str, str, object]]] = {
+    "personajes": {
+        "vida": ("INTEGER NOT NULL DEFAULT 0", "vida", 0),
+        "velocidad": ("INTEGER NOT NULL DEFAULT 0", "velocidad", 0),
+        "dano": ("INTEGER NOT NULL DEFAULT 0", "daño", 0),
+        "escudo": ("INTEGER NOT NULL DEFAULT 0", "escudo", 0),
+    },
+    "enemigos": {
+        "rareza": ("TEXT NOT NULL DEFAULT 'normal'", "rareza", "normal"),
+        "probabilidad_spawn": (
+            "REAL NOT NULL DEFAULT 1.0",
+            "probabilidad_spawn",
+            1.0,
+        ),
+        "vida": ("INTEGER NOT NULL DEFAULT 0", "vida", 0),
+        "velocidad": ("INTEGER NOT NULL DEFAULT 0", "velocidad", 0),
+        "dano": ("INTEGER NOT NULL DEFAULT 0", "daño", 0),
+    },
+}
+
+
+def extract_typed_values(table_name: str, data: dict) -> dict[str, object]:
+    """
+    Extrae los valores de las columnas tipadas desde los datos de una fila.
+
+    Busca primero en el nivel superior del registro y después en su JSON de stats.
+
+    Args:
+        table_name: Tabla con columnas tipadas ('personajes' o 'enemigos')
+        data: Registro con las claves del JSON original
+
+    Returns:
+        Diccionario columna -> valor listo para insertar
+    """
+    stats = data.get("stats") or {}
+    values = {}
+    for column, (declaration, json_key, default) in TYPED_COLUMNS[table_name].items():
+        value = data.get(json_key, stats.get(json_key, default))
+        if declaration.startswith("INTEGER"):
+            value = int(value or 0)
+        elif declaration.startswith("REAL"):
+            value = float(value if value is not None else default)
+        else:
+            value = str(value or default)
+        values[column] = value
+    return values
+
+
+def get_all_index_schemas() -> dict[str, str]:
+    """
+    Obtiene los índices de las consultas frecuentes del juego.
+
+    Returns:
+        Diccionario con nombre de índice y su SQL de creación
+    """
+    return {
+        "idx_personajes_activo_nombre": """
+            CREATE INDEX IF NOT EXISTS idx_personajes_activo_nombre
+            ON personajes(activo, nombre_mostrar)
+        """,
+        "idx_personajes_tipo": """
+            CREATE INDEX IF NOT EXISTS idx_personajes_tipo
+            ON personajes(tipo, activo, nombre_mostrar)
+        """,
+        "idx_enemigos_activo_nombre": """
+            CREATE INDEX IF NOT EXISTS idx_enemigos_activo_nombre
+            ON enemigos(activo, nombre_mostrar)
+        """,
+        "idx_enemigos_rareza": """
+            CREATE INDEX IF NOT EXISTS idx_enemigos_rareza
+            ON enemigos(activo, rareza, tipo, probabilidad_spawn)
+        """,
+        "idx_estadisticas_slot_tipo": """
+            CREATE INDEX IF NOT EXISTS idx_estadisticas_slot_tipo
+            ON estadisticas_juego(slot_partida, tipo_estadistica, valor)
+        """,
+        "idx_gameplay_categoria": """
+            CREATE INDEX IF NOT EXISTS idx_gameplay_categoria
+            ON configuracion_gameplay(categoria, activo)
+        """,
+    }
+
+
+def get_hot_path_queries() -> dict[str, tuple[str, tuple]]:
+    """
+    Consultas que el juego ejecuta en caliente, usadas para diagnosticar planes.
+
+    Returns:
+        Diccionario con nombre descriptivo y (SQL, parámetros de ejemplo)
+    """
+    return {
+        "personaje_por_nombre": (
+            "SELECT nombre, stats FROM personajes WHERE nombre = ? AND activo = 1",
+            ("guerrero",),
+        ),
+        "personajes_activos": (
+            "SELECT nombre FROM personajes WHERE activo = 1 ORDER BY nombre_mostrar",
+            (),
+        ),
+        "personajes_por_clase": (
+            "SELECT nombre FROM personajes WHERE tipo = ? AND activo = 1 "
+            "ORDER BY nombre_mostrar",
+            ("Melee",),
+        ),
+        "enemigo_por_tipo": (
+            "SELECT tipo, stats FROM enemigos WHERE tipo = ? AND activo = 1",
+            ("zombie_male",),
+        ),
+        "enemigos_activos": (
+            "SELECT tipo FROM enemigos WHERE activo = 1 ORDER BY nombre_mostrar",
+            (),
+        ),
+        "enemigos_por_rareza": (
+            "SELECT tipo, probabilidad_spawn FROM enemigos "
+            "WHERE activo = 1 AND rareza = ?",
+            ("normal",),
+        ),
+        "partida_por_slot": (
+            "SELECT * FROM partidas_guardadas WHERE slot = ?",
+            (1,),
+        ),
+        "estadisticas_por_slot": (
+            "SELECT tipo_estadistica, valor FROM estadisticas_juego "
+            "WHERE slot_partida = ? AND tipo_estadistica = ?",
+            (1, "enemigos_eliminados"),
+        ),
+    }
+
+
 def get_table_list() -> list:
     """
     Lista de todas las tablas definidas en el sistema.
@@ -0,0 +1,55 @@
+"""
+Seed Set - Semillas de la partida
+=================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Una semilla maestra de la que se deriva un generador aleatorio
+independiente por sistema (mundo, oleadas, enemigos, powerups). Guardar la
+semilla maestra basta para reproducir la partida, y que cada sistema tenga su
+propio flujo evita que un cambio en uno desplace los números de los demás.
+"""
+
+import random
+
+# Flujos de la simulación
+STREAMS = ("world", "waves", "enemies", "powerups")
+
+
+class SeedSet:
+    """Semilla maestra y generadores derivados por nombre."""
+
+    def __init__(self, master: int | None = None):
+        """
+        Inicializa el conjunto de semillas.
+
+        Args:
+            master: Semilla maestra (None: una aleatoria del sistema)
+        """
+        if master is None:
+            master = random.SystemRandom().getrandbits(32)
+        self.master = master
+        self._streams: dict[str, random.Random] = {}
+
+    def seed_for(self, name: str) -> int:
+        """Semilla derivada de un flujo (estable entre ejecuciones y versiones)."""
+        return random.Random(f"{self.master}:{name}").getrandbits(32)
+
+    def rng(self, name: str) -> random.Random:
+        """Generador de un flujo; se crea la primera vez y luego se comparte."""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(self.seed_for(name))
+        return stream
+
+    def to_dict(self) -> dict:
+        """Semillas para guardar junto a una repetición."""
+        return {
+            "master": self.master,
+            "streams": {name: self.seed_for(name) for name in STREAMS},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SeedSet":
+        """Reconstruye el conjunto guardado con ``to_dict``."""
+        return cls(int(data["master"]))
@@ -0,0 +1,44 @@
+"""
+Sim Clock - Reloj de simulación
+===============================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Tiempo de la partida medido en ticks de simulación en lugar del
+reloj de pared. Los temporizadores de juego (enfriamientos, efectos, oleadas)
+lo consultan para que la partida dependa solo de la entrada y de las semillas:
+en pausa no avanza y una repetición a máxima velocidad ve los mismos tiempos
+que la partida original.
+"""
+
+
+class SimClock:
+    """Tiempo de simulación acumulado por la escena de juego."""
+
+    def __init__(self):
+        self.time_ms = 0.0
+
+    def advance(self, delta_time: float):
+        """
+        Avanza el reloj.
+
+        Args:
+            delta_time: Segundos de simulación del tick
+        """
+        self.time_ms += delta_time * 1000.0
+
+    def reset(self):
+        """Vuelve a cero (al empezar una partida o una repetición)."""
+        self.time_ms = 0.0
+
+    def now(self) -> float:
+        """Tiempo de simulación en segundos (sustituye a ``time.time``)."""
+        return self.time_ms / 1000.0
+
+    def now_ms(self) -> int:
+        """Tiempo de simulación en ms (sustituye a ``pygame.time.get_ticks``)."""
+        return int(self.time_ms)
+
+
+# Reloj de la partida en curso
+sim_clock = SimClock()
@@ -5,12 +5,16 @@ Simple Desert Background - Fondo Simple de Desierto
 Autor: SiK Team
 Fecha: 2024
 Descripción: Fondo simple de desierto completamente plano.
+La textura de arena y la rejilla del mundo se prerenderizan en un patrón
+(utils.background_pattern) que se dibuja con un blit anclado a la cámara.
 """
 
 import logging
 
 import pygame
 
+from .background_pattern import BackgroundPalette, get_background_pattern
+
 
 class SimpleDesertBackground:
     """
@@ -41,6 +45,19 @@ class SimpleDesertBackground:
             (222, 184, 135),  # Arena dorada
         ]
 
+        # Líneas verticales ligeramente más oscuras y rejilla del mundo
+        column_color = tuple(max(0, c - 10) for c in self.desert_color)
+        grid_color = tuple(max(0, c - 24) for c in self.desert_color)
+        self.palette = BackgroundPalette(
+            base=self.desert_color,
+            stripes=tuple(self.desert_variations),
+            stripe_spacing=20,
+            column=column_color,
+            column_spacing=50,
+            grid=grid_color,
+            cell_size=100,
+        )
+
         self.logger.info("Fondo plano de desierto inicializado")
 
     def update(self, delta_time: float):
@@ -58,39 +75,10 @@ class SimpleDesertBackground:
 
         Args:
                 screen: Superficie donde renderizar
-                camera_x: Posición X de la cámara (no usado en esta versión)
-                camera_y: Posición Y de la cámara (no usado en esta versión)
-        """
-        # Rellenar todo el fondo con el color principal del desierto
-        screen.fill(self.desert_color)
-
-        # Añadir textura sutil con variaciones de color
-        self._add_desert_texture(screen)
-
-    def _add_desert_texture(self, screen: pygame.Surface):
-        """
-        Añade textura sutil al fondo del desierto.
-
-        Args:
-                screen: Superficie donde renderizar
+                camera_x: Posición X de la cámara en el mundo
+                camera_y: Posición Y de la cámara en el mundo
         """
-        # Crear líneas horizontales sutiles para simular ondulaciones de arena
-        for y in range(0, self.screen_height, 20):
-            # Seleccionar color de variación
-            variation_color = self.desert_variations[
-                y // 20 % len(self.desert_variations)
-            ]
-
-            # Dibujar línea horizontal sutil
-            pygame.draw.line(screen, variation_color, (0, y), (self.screen_width, y), 1)
-
-        # Añadir algunas líneas verticales muy sutiles para simular textura de arena
-        for x in range(0, self.screen_width, 50):
-            # Color ligeramente más oscuro para las líneas verticales
-            line_color = (
-                max(0, self.desert_color[0] - 10),
-                max(0, self.desert_color[1] - 10),
-                max(0, self.desert_color[2] - 10),
-            )
-
-            pygame.draw.line(screen, line_color, (x, 0), (x, self.screen_height), 1)
+        pattern = get_background_pattern(
+            (self.screen_width, self.screen_height), self.palette
+        )
+        pattern.render(screen, camera_x, camera_y)
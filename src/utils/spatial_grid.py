@@ -0,0 +1,71 @@
+"""
+Spatial Grid - Índice espacial de rejilla uniforme
+=================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Índice de rejilla para objetos estáticos del mundo (tiles). Cada
+objeto se guarda en todas las celdas que toca; una consulta por rectángulo
+devuelve los índices candidatos sin recorrer el mundo entero, y la cámara los
+recorta después con su prueba exacta en lote.
+"""
+
+import numpy as np
+import pygame
+
+# Lado de celda por defecto: del orden de la pantalla para pocas celdas por consulta
+DEFAULT_CELL_SIZE = 256
+
+
+class SpatialGrid:
+    """Rejilla uniforme de índices construida una vez a partir de arrays."""
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        sizes: np.ndarray,
+        cell_size: int = DEFAULT_CELL_SIZE,
+    ):
+        """
+        Construye el índice.
+
+        Args:
+            positions: Array (N, 2) con la esquina superior izquierda de cada objeto
+            sizes: Array (N, 2) con ancho y alto de cada objeto
+            cell_size: Lado de cada celda en píxeles de mundo
+        """
+        self.cell_size = cell_size
+        self.count = len(positions)
+
+        buckets: dict[tuple[int, int], list[int]] = {}
+        if self.count:
+            first = np.floor_divide(positions, cell_size).astype(np.int64)
+            last = np.floor_divide(positions + sizes, cell_size).astype(np.int64)
+            for index, (x0, y0, x1, y1) in enumerate(np.hstack((first, last)).tolist()):
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        buckets.setdefault((cx, cy), []).append(index)
+        self.cells = {
+            cell: np.array(indices, dtype=np.intp) for cell, indices in buckets.items()
+        }
+
+    def query(self, rect: pygame.Rect) -> np.ndarray:
+        """
+        Índices de los objetos que pueden tocar un rectángulo del mundo.
+
+        Args:
+            rect: Rectángulo en coordenadas de mundo
+
+        Returns:
+            Array ordenado y sin repetidos de índices candidatos
+        """
+        size = self.cell_size
+        found = [
+            self.cells[(cx, cy)]
+            for cx in range(rect.left // size, rect.right // size + 1)
+            for cy in range(rect.top // size, rect.bottom // size + 1)
+            if (cx, cy) in self.cells
+        ]
+        if not found:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(found))
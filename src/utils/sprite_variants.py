@@ -0,0 +1,123 @@
+"""
+Sprite Variants - Caché de variantes de sprites con efectos
+==========================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Genera una sola vez las variantes de un sprite (escalado y volteo,
+destello, tinte, transparencia) y las guarda por (sprite, efectos). Al dibujar
+se elige la variante en lugar de componer superposiciones cada frame, así que
+muchos enemigos parpadeando a la vez no disparan reservas de memoria.
+
+Los efectos son tuplas inmutables (ver ``fit``, ``flash``, ``tint`` y ``alpha``)
+y se aplican en el orden dado. La caché usa referencias débiles al sprite base:
+cuando sus fotogramas se liberan, sus variantes desaparecen con ellos.
+"""
+
+import weakref
+
+import pygame
+
+Effect = tuple
+
+
+def fit(size: tuple[int, int], flip_x: bool = False) -> Effect:
+    """Escala a ``size`` y, opcionalmente, voltea en horizontal."""
+    return ("fit", (int(size[0]), int(size[1])), flip_x)
+
+
+def flash(color: tuple[int, int, int] = (255, 255, 255), strength: int = 128) -> Effect:
+    """Mezcla el color del sprite hacia ``color`` (0-255), conservando su alfa."""
+    return ("flash", tuple(color), strength)
+
+
+def tint(color: tuple[int, int, int]) -> Effect:
+    """Multiplica el color del sprite por ``color`` (tinte de estado)."""
+    return ("tint", tuple(color))
+
+
+def alpha(value: int) -> Effect:
+    """Multiplica la transparencia del sprite por ``value`` / 255."""
+    return ("alpha", value)
+
+
+def _apply(sprite: pygame.Surface, effect: Effect) -> pygame.Surface:
+    """Genera la superficie de un efecto sobre ``sprite`` (siempre una copia)."""
+    kind = effect[0]
+    if kind == "fit":
+        _, size, flip_x = effect
+        variant = (
+            pygame.transform.scale(sprite, size)
+            if sprite.get_size() != size
+            else sprite.copy()
+        )
+        return pygame.transform.flip(variant, True, False) if flip_x else variant
+
+    variant = sprite.copy()
+    if kind == "flash":
+        _, color, strength = effect
+        keep = 255 - strength
+        variant.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+        variant.fill(
+            tuple(c * strength // 255 for c in color),
+            special_flags=pygame.BLEND_RGB_ADD,
+        )
+    elif kind == "tint":
+        variant.fill(effect[1], special_flags=pygame.BLEND_RGB_MULT)
+    elif kind == "alpha":
+        if not variant.get_flags() & pygame.SRCALPHA:
+            variant = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+            variant.blit(sprite, (0, 0))
+        variant.fill((255, 255, 255, effect[1]), special_flags=pygame.BLEND_RGBA_MULT)
+    else:
+        raise ValueError(f"Efecto de sprite desconocido: {kind}")
+    return variant
+
+
+class SpriteVariantCache:
+    """Variantes de sprites por (sprite base, efectos), generadas una vez."""
+
+    def __init__(self):
+        self._variants: weakref.WeakKeyDictionary[
+            pygame.Surface, dict[tuple[Effect, ...], pygame.Surface]
+        ] = weakref.WeakKeyDictionary()
+        self.stats = {"hits": 0, "generated": 0}
+
+    def get(self, sprite: pygame.Surface, *effects: Effect) -> pygame.Surface:
+        """
+        Variante de ``sprite`` con los efectos dados, en ese orden.
+
+        Args:
+            sprite: Sprite base
+            *effects: Efectos a aplicar; sin efectos devuelve el propio sprite
+
+        Returns:
+            Superficie cacheada (no debe modificarse)
+        """
+        if not effects:
+            return sprite
+        variants = self._variants.get(sprite)
+        if variants is None:
+            variants = self._variants[sprite] = {}
+        variant = variants.get(effects)
+        if variant is not None:
+            self.stats["hits"] += 1
+            return variant
+
+        variant = sprite
+        for effect in effects:
+            variant = _apply(variant, effect)
+        variants[effects] = variant
+        self.stats["generated"] += 1
+        return variant
+
+    def __len__(self) -> int:
+        return sum(len(variants) for variants in self._variants.values())
+
+    def clear(self):
+        """Descarta todas las variantes."""
+        self._variants.clear()
+
+
+# Caché compartida por entidades y renderizadores
+sprite_variants = SpriteVariantCache()
@@ -0,0 +1,225 @@
+"""
+Texture Atlas - Atlas de fotogramas de animación
+================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Empaquetado offline de los fotogramas de cada personaje/enemigo en
+pocas hojas grandes con un manifiesto JSON de rectángulos, y carga en tiempo de
+ejecución: se decodifica cada hoja una sola vez y los fotogramas son
+subsuperficies de ella (pocas aperturas de archivo y mejor localidad al dibujar).
+
+Manifiesto ``<personaje>_atlas.json``::
+
+    {"version": 1, "character": "guerrero", "scale": 1.0,
+     "sheets": ["guerrero_atlas_0.png"],
+     "animations": {"Idle": [[hoja, x, y, ancho, alto], ...]}}
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from .save_writer import write_atomic
+
+ATLAS_VERSION = 1
+MAX_SHEET_SIZE = 2048
+FRAME_PADDING = 1
+
+
+def pack_rects(
+    sizes: list[tuple[int, int]],
+    max_size: int = MAX_SHEET_SIZE,
+    padding: int = FRAME_PADDING,
+) -> list[tuple[int, int, int]]:
+    """
+    Empaqueta rectángulos en hojas por estanterías (de mayor a menor altura).
+
+    Args:
+        sizes: (ancho, alto) de cada fotograma
+        max_size: Lado máximo de cada hoja
+        padding: Separación entre fotogramas
+
+    Returns:
+        (hoja, x, y) de cada fotograma, en el mismo orden que ``sizes``
+
+    Raises:
+        ValueError: Si un fotograma no cabe en una hoja
+    """
+    placements: list[tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+    for index in order:
+        width, height = sizes[index]
+        if width > max_size or height > max_size:
+            raise ValueError(f"Fotograma de {width}x{height} mayor que la hoja")
+        if x + width > max_size:
+            # Nueva estantería
+            x, y = 0, y + shelf_height + padding
+            shelf_height = 0
+        if y + height > max_size:
+            # Nueva hoja
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+        placements[index] = (sheet, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+def build_atlas(
+    character: str,
+    animations: dict[str, list[pygame.Surface]],
+    scale: float = 1.0,
+    max_size: int = MAX_SHEET_SIZE,
+) -> tuple[list[pygame.Surface], dict[str, Any]]:
+    """
+    Construye las hojas y el manifiesto de un personaje.
+
+    Args:
+        character: Nombre del personaje
+        animations: Animación -> fotogramas en orden
+        scale: Escala ya aplicada a los fotogramas (se guarda en el manifiesto)
+        max_size: Lado máximo de cada hoja
+
+    Returns:
+        Tupla (hojas, manifiesto) con los nombres de hoja aún sin ruta
+    """
+    entries = [(name, frame) for name, frames in animations.items() for frame in frames]
+    placements = pack_rects([frame.get_size() for _, frame in entries], max_size)
+
+    sheet_count = max((sheet for sheet, _, _ in placements), default=-1) + 1
+    extents = [[0, 0] for _ in range(sheet_count)]
+    for (_, frame), (sheet, x, y) in zip(entries, placements, strict=True):
+        extents[sheet][0] = max(extents[sheet][0], x + frame.get_width())
+        extents[sheet][1] = max(extents[sheet][1], y + frame.get_height())
+    sheets = [pygame.Surface(size, pygame.SRCALPHA) for size in extents]
+
+    rects: dict[str, list[list[int]]] = {name: [] for name in animations}
+    for (name, frame), (sheet, x, y) in zip(entries, placements, strict=True):
+        sheets[sheet].blit(frame, (x, y))
+        rects[name].append([sheet, x, y, frame.get_width(), frame.get_height()])
+
+    manifest = {
+        "version": ATLAS_VERSION,
+        "character": character,
+        "scale": scale,
+        "sheets": [f"{character}_atlas_{i}.png" for i in range(sheet_count)],
+        "animations": rects,
+    }
+    return sheets, manifest
+
+
+def save_atlas(
+    output_dir: Path, sheets: list[pygame.Surface], manifest: dict[str, Any]
+) -> Path:
+    """
+    Escribe las hojas PNG y el manifiesto en ``output_dir``.
+
+    Returns:
+        Ruta del manifiesto
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for sheet, filename in zip(sheets, manifest["sheets"], strict=True):
+        pygame.image.save(sheet, str(output_dir / filename))
+    manifest_path = output_dir / f"{manifest['character']}_atlas.json"
+    # El manifiesto se escribe el último: sin él las hojas se ignoran
+    write_atomic(manifest_path, json.dumps(manifest, indent=1).encode("utf-8"))
+    return manifest_path
+
+
+class TextureAtlasLoader:
+    """Carga atlas de personajes y sirve sus fotogramas como subsuperficies."""
+
+    def __init__(self, atlas_path: Path):
+        """
+        Inicializa el cargador.
+
+        Args:
+            atlas_path: Carpeta con los manifiestos y hojas generados
+        """
+        self.atlas_path = Path(atlas_path)
+        self.logger = logging.getLogger(__name__)
+        self.characters: dict[str, dict[str, list[pygame.Surface]] | None] = {}
+        self.scales: dict[str, float] = {}
+        self.sheets_loaded = 0
+
+    def has_atlas(self, character: str) -> bool:
+        """Indica si existe un manifiesto de atlas para el personaje."""
+        return (self.atlas_path / f"{character}_atlas.json").exists()
+
+    def load_character(self, character: str) -> dict[str, list[pygame.Surface]] | None:
+        """
+        Carga (una vez) las hojas de un personaje.
+
+        Returns:
+            Animación -> fotogramas, o None si no hay atlas válido
+        """
+        if character in self.characters:
+            return self.characters[character]
+
+        animations = None
+        try:
+            manifest = json.loads(
+                (self.atlas_path / f"{character}_atlas.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            if manifest.get("version") != ATLAS_VERSION:
+                raise ValueError(f"versión de atlas {manifest.get('version')}")
+            sheets = [self._load_sheet(name) for name in manifest["sheets"]]
+            animations = {
+                name: [sheets[s].subsurface((x, y, w, h)) for s, x, y, w, h in rects]
+                for name, rects in manifest["animations"].items()
+            }
+            self.scales[character] = manifest.get("scale", 1.0)
+            self.logger.info(
+                "Atlas de %s cargado: %d hojas, %d animaciones",
+                character,
+                len(sheets),
+                len(animations),
+            )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, IndexError, pygame.error) as e:
+            self.logger.warning("Atlas de %s no válido: %s", character, e)
+            animations = None
+        self.characters[character] = animations
+        return animations
+
+    def _load_sheet(self, filename: str) -> pygame.Surface:
+        """Decodifica una hoja, convertida al formato de pantalla si existe."""
+        sheet = pygame.image.load(str(self.atlas_path / filename))
+        self.sheets_loaded += 1
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        return sheet
+
+    def get_frames(
+        self, character: str, animation: str, scale: float | None = None
+    ) -> list[pygame.Surface] | None:
+        """
+        Fotogramas de una animación desde el atlas.
+
+        Args:
+            character: Nombre del personaje
+            animation: Nombre de la animación
+            scale: Escala esperada; si no coincide con la del atlas devuelve None
+
+        Returns:
+            Lista de subsuperficies o None si el atlas no la cubre
+        """
+        animations = self.load_character(character)
+        if animations is None or animation not in animations:
+            return None
+        if scale is not None and self.scales.get(character, 1.0) != scale:
+            return None
+        return list(animations[animation])
+
+    def clear_cache(self):
+        """Libera las hojas cargadas."""
+        self.characters.clear()
+        self.scales.clear()
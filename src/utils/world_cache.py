@@ -0,0 +1,216 @@
+"""
+World Cache - Caché en disco de mundos generados
+================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Guarda la lista de elementos de un mundo generado (tipo, sprite,
+posición y tamaño) en un archivo compacto por clave: semilla del mundo, tamaño
+y huella del generador (``WorldGenerator.fingerprint``). Cargar una partida o
+repetir una semilla reconstruye los tiles desde el archivo sin volver a
+generar; si cambian la versión o los parámetros del generador cambia la clave
+y el mundo se regenera solo. La colisión no se guarda: sale del tipo de tile.
+
+    Cabecera  <4sBI   magic, versión, longitud de la cabecera JSON
+    Elemento  <BHddHH tipo, sprite (0xFFFF: sin sprite), x, y, ancho, alto
+"""
+
+import json
+import logging
+import struct
+import zlib
+from pathlib import Path
+
+import pygame
+
+from entities.tile import Tile, TileType
+
+from .world_validator import WorldValidator
+
+WORLD_CACHE_MAGIC = b"SIKW"
+WORLD_CACHE_VERSION = 1
+WORLD_CACHE_SUFFIX = ".sikw"
+
+_HEADER = struct.Struct("<4sBI")
+_ELEMENT = struct.Struct("<BHddHH")
+_NO_SPRITE = 0xFFFF
+_TILE_TYPES = list(TileType)
+_TYPE_INDEX = {tile_type: index for index, tile_type in enumerate(_TILE_TYPES)}
+
+SPRITES_PATH = "assets/objects/elementos"
+
+
+def world_key(seed: int, world_width: int, world_height: int, fingerprint: str) -> str:
+    """Clave de caché de un mundo."""
+    return f"{seed:08x}_{world_width}x{world_height}_{fingerprint}"
+
+
+def pack_world(tiles: list[Tile], meta: dict | None = None) -> bytes:
+    """
+    Serializa los elementos de un mundo.
+
+    Args:
+        tiles: Elementos generados
+        meta: Datos informativos para la cabecera (semilla, tamaño...)
+    """
+    sprites: dict[str, int] = {}
+    body = bytearray()
+    for tile in tiles:
+        sprite = _NO_SPRITE
+        if tile.sprite_name:
+            sprite = sprites.setdefault(tile.sprite_name, len(sprites))
+        body += _ELEMENT.pack(
+            _TYPE_INDEX[tile.tile_type],
+            sprite,
+            tile.x,
+            tile.y,
+            tile.width,
+            tile.height,
+        )
+    header = json.dumps(
+        {**(meta or {}), "elements": len(tiles), "sprites": list(sprites)},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return (
+        _HEADER.pack(WORLD_CACHE_MAGIC, WORLD_CACHE_VERSION, len(header))
+        + header
+        + zlib.compress(bytes(body), 6)
+    )
+
+
+def unpack_world(data: bytes) -> tuple[dict, list[tuple]]:
+    """
+    Lee un mundo serializado con ``pack_world``.
+
+    Returns:
+        Cabecera y registros (tipo, sprite, x, y, ancho, alto)
+
+    Raises:
+        ValueError: Si el archivo no es un mundo en caché válido
+    """
+    try:
+        magic, version, header_len = _HEADER.unpack_from(data)
+        if magic != WORLD_CACHE_MAGIC or version != WORLD_CACHE_VERSION:
+            raise ValueError("Mundo en caché no válido o de otra versión")
+        start = _HEADER.size
+        header = json.loads(data[start : start + header_len].decode("utf-8"))
+        body = zlib.decompress(data[start + header_len :])
+        records = [
+            (_TILE_TYPES[kind], *rest) for kind, *rest in _ELEMENT.iter_unpack(body)
+        ]
+    except (struct.error, zlib.error, UnicodeDecodeError, IndexError) as e:
+        raise ValueError(f"Mundo en caché corrupto: {e}") from e
+    if len(records) != header.get("elements"):
+        raise ValueError("Mundo en caché incompleto")
+    return header, records
+
+
+def build_tiles(header: dict, records: list[tuple]) -> list[Tile]:
+    """
+    Reconstruye los tiles de un mundo en caché.
+
+    Cada imagen de sprite se carga una sola vez aunque la usen muchos elementos.
+    """
+    sprite_names = header["sprites"]
+    images: dict[str, pygame.Surface | None] = {}
+    tiles = []
+    for tile_type, sprite, x, y, size, _ in records:
+        if sprite == _NO_SPRITE:
+            tiles.append(Tile(x, y, tile_type))
+            continue
+        filename = sprite_names[sprite]
+        if filename not in images:
+            try:
+                images[filename] = pygame.image.load(
+                    f"{SPRITES_PATH}/{filename}"
+                ).convert_alpha()
+            except (FileNotFoundError, pygame.error) as e:
+                logging.getLogger(__name__).warning(
+                    "No se pudo cargar sprite %s: %s", filename, e
+                )
+                images[filename] = None
+        image = images[filename]
+        if image is None:
+            tiles.append(Tile(x, y, tile_type))
+        else:
+            tiles.append(
+                WorldValidator.build_element(x, y, tile_type, image, filename, size)
+            )
+    return tiles
+
+
+class WorldCache:
+    """Mundos generados guardados en disco por semilla, tamaño y generador."""
+
+    def __init__(self, directory: str | Path = "cache/worlds", max_entries: int = 16):
+        """
+        Inicializa la caché.
+
+        Args:
+            directory: Directorio de los archivos de mundo
+            max_entries: Mundos guardados como máximo (se borran los más antiguos)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> Path:
+        """Archivo de un mundo."""
+        return self.directory / f"{key}{WORLD_CACHE_SUFFIX}"
+
+    def load(self, key: str) -> list[Tile] | None:
+        """
+        Reconstruye el mundo guardado con ``key``.
+
+        Returns:
+            Tiles del mundo o None si no está en caché o el archivo no es válido
+        """
+        path = self.path_for(key)
+        try:
+            header, records = unpack_world(path.read_bytes())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Mundo en caché descartado (%s): %s", path.name, e)
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        path.touch()  # Los más usados sobreviven a _prune
+        return build_tiles(header, records)
+
+    def store(self, key: str, tiles: list[Tile], meta: dict | None = None) -> bool:
+        """
+        Guarda un mundo generado (escritura atómica).
+
+        Returns:
+            True si se guardó
+        """
+        path = self.path_for(key)
+        temp = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp.write_bytes(pack_world(tiles, meta))
+            temp.replace(path)
+        except OSError as e:
+            self.logger.warning("No se pudo guardar el mundo en caché: %s", e)
+            return False
+        self._prune()
+        return True
+
+    def _prune(self):
+        """Borra los mundos más antiguos si hay más de ``max_entries``."""
+        entries = sorted(
+            self.directory.glob(f"*{WORLD_CACHE_SUFFIX}"),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in entries[: max(0, len(entries) - self.max_entries)]:
+            entry.unlink(missing_ok=True)
+
+    def clear(self):
+        """Borra todos los mundos en caché."""
+        for entry in self.directory.glob(f"*{WORLD_CACHE_SUFFIX}"):
+            entry.unlink(missing_ok=True)
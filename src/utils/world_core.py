@@ -11,7 +11,7 @@ import logging
 import os
 import random
 
-from entities.tile import TileType
+from entities.tile import Tile, TileType
 
 
 class WorldCore:
@@ -20,7 +20,12 @@ class WorldCore:
     """
 
     def __init__(
-        self, world_width: int, world_height: int, screen_width: int, screen_height: int
+        self,
+        world_width: int,
+        world_height: int,
+        screen_width: int,
+        screen_height: int,
+        rng: random.Random | None = None,
     ):
         """
         Inicializa el núcleo del generador de mundo.
@@ -30,8 +35,11 @@ class WorldCore:
             world_height: Alto del mundo (3-4 veces la pantalla)
             screen_width: Ancho de la pantalla
             screen_height: Alto de la pantalla
+            rng: Generador aleatorio del mundo (None: uno sin semilla)
         """
         self.logger = logging.getLogger(__name__)
+        # Todo el mundo sale de este generador: con la misma semilla, el mismo mundo
+        self.rng = rng or random.Random()
 
         # Dimensiones del mundo
         self.world_width = world_width
@@ -45,6 +53,8 @@ class WorldCore:
         )
         self.min_distance = 100  # Distancia mínima entre elementos
         self.safe_zone_radius = 300  # Radio libre alrededor del centro
+        # Centro de la zona segura (None: centro del mundo)
+        self.safe_zone_center: tuple[float, float] | None = None
 
         # Sprites disponibles
         self.available_sprites = self._load_available_sprites()
@@ -68,7 +78,8 @@ class WorldCore:
 
         try:
             if os.path.exists(elements_path):
-                for filename in os.listdir(elements_path):
+                # Orden estable: el sprite elegido no depende del sistema de archivos
+                for filename in sorted(os.listdir(elements_path)):
                     if filename.lower().endswith((".png", ".jpg", ".jpeg")):
                         sprites.append(filename)
                 self.logger.info("Cargados %s sprites de elementos", len(sprites))
@@ -79,6 +90,26 @@ class WorldCore:
 
         return sprites
 
+    def generation_params(self) -> dict:
+        """
+        Parámetros que determinan el mundo generado a partir de una semilla.
+
+        Si cambia cualquiera de ellos, el mismo generador produce otro mundo
+        (ver ``WorldGenerator.fingerprint``).
+        """
+        return {
+            "world_size": [self.world_width, self.world_height],
+            "element_density": self.element_density,
+            "min_distance": self.min_distance,
+            "safe_zone_radius": self.safe_zone_radius,
+            "safe_zone_center": self.safe_zone_center,
+            "sprites": self.available_sprites,
+            "tiles": {
+                tile_type.value: [config["width"], config["height"]]
+                for tile_type, config in Tile.TILE_CONFIGS.items()
+            },
+        }
+
     def get_tile_type_from_filename(self, filename: str) -> TileType:
         """
         Determina el tipo de tile basado en el nombre del archivo.
@@ -109,7 +140,7 @@ class WorldCore:
             return TileType.TREE
         else:
             # Por defecto, asignar aleatoriamente
-            return random.choice(list(TileType))
+            return self.rng.choice(list(TileType))
 
     def calculate_total_elements(self) -> int:
         """
@@ -123,7 +154,8 @@ class WorldCore:
 
     def is_in_safe_zone(self, x: float, y: float) -> bool:
         """
-        Verifica si una posición está en la zona segura (centro del mundo).
+        Verifica si una posición está en la zona segura (centro del mundo o
+        ``safe_zone_center`` si se ha fijado).
 
         Args:
             x: Posición X
@@ -132,8 +164,11 @@ class WorldCore:
         Returns:
             True si está en zona segura
         """
-        center_x = self.world_width // 2
-        center_y = self.world_height // 2
+        if self.safe_zone_center is None:
+            center_x = self.world_width // 2
+            center_y = self.world_height // 2
+        else:
+            center_x, center_y = self.safe_zone_center
         distance_to_center = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
         return distance_to_center < self.safe_zone_radius
 
@@ -8,6 +8,8 @@ Descripción: Fachada del sistema modular de generación de mundo.
 Mantiene API original para compatibilidad con delegación a módulos especializados.
 """
 
+import hashlib
+import json
 import logging
 import random
 
@@ -17,6 +19,9 @@ from .cluster_generator import ClusterGenerator
 from .world_core import WorldCore
 from .world_validator import WorldValidator
 
+# Subir al cambiar el algoritmo de generación: invalida los mundos en caché
+WORLD_GENERATOR_VERSION = 1
+
 
 class WorldGenerator:
     """
@@ -25,7 +30,12 @@ class WorldGenerator:
     """
 
     def __init__(
-        self, world_width: int, world_height: int, screen_width: int, screen_height: int
+        self,
+        world_width: int,
+        world_height: int,
+        screen_width: int,
+        screen_height: int,
+        rng: random.Random | None = None,
     ):
         """
         Inicializa el generador de mundo modular.
@@ -35,11 +45,14 @@ class WorldGenerator:
             world_height: Alto del mundo (3-4 veces la pantalla)
             screen_width: Ancho de la pantalla
             screen_height: Alto de la pantalla
+            rng: Generador aleatorio del mundo (None: uno sin semilla)
         """
         self.logger = logging.getLogger(__name__)
 
         # Inicializar módulos especializados
-        self.core = WorldCore(world_width, world_height, screen_width, screen_height)
+        self.core = WorldCore(
+            world_width, world_height, screen_width, screen_height, rng
+        )
         self.validator = WorldValidator(self.core)
         self.cluster_generator = ClusterGenerator(self.core)
 
@@ -58,6 +71,42 @@ class WorldGenerator:
         Args:
             element_types: Tipos de elementos permitidos (None = todos)
 
+        Returns:
+            Lista de elementos generados
+        """
+        self.logger.info(
+            "Generando %d elementos...", self.core.calculate_total_elements()
+        )
+        elements = self.generate_area(
+            0, 0, self.core.world_width, self.core.world_height, 0, element_types
+        )
+        self.logger.info("Mundo generado con %d elementos", len(elements))
+        return elements
+
+    def generate_area(
+        self,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        margin: int = 0,
+        element_types: list[TileType] | None = None,
+    ) -> list[Tile]:
+        """
+        Genera los elementos de un rectángulo del mundo con la densidad del núcleo.
+
+        Con ``margin`` los elementos quedan a esa distancia del borde del
+        rectángulo: dos áreas contiguas generadas por separado (los chunks de
+        ``WorldStreamer``) respetan entre sí la distancia mínima.
+
+        Args:
+            left: X de la esquina superior izquierda
+            top: Y de la esquina superior izquierda
+            width: Ancho del área
+            height: Alto del área
+            margin: Separación de los elementos con el borde del área
+            element_types: Tipos de elementos permitidos (None = todos)
+
         Returns:
             Lista de elementos generados
         """
@@ -66,9 +115,8 @@ class WorldGenerator:
         if element_types is None:
             element_types = list(TileType)
 
-        # Calcular número aproximado de elementos
-        num_elements = self.core.calculate_total_elements()
-        self.logger.info("Generando %d elementos...", num_elements)
+        # Número aproximado de elementos según el área
+        num_elements = int(width * height * self.core.element_density)
 
         # Generar elementos
         attempts = 0
@@ -78,8 +126,8 @@ class WorldGenerator:
             attempts += 1
 
             # Posición aleatoria
-            x = random.randint(0, self.core.world_width)
-            y = random.randint(0, self.core.world_height)
+            x = self.core.rng.randint(left + margin, left + width - margin)
+            y = self.core.rng.randint(top + margin, top + height - margin)
 
             # Verificar zona segura
             if self.core.is_in_safe_zone(x, y):
@@ -95,9 +143,26 @@ class WorldGenerator:
                     if len(elements) % 10 == 0:
                         self.logger.debug("Generados %d elementos...", len(elements))
 
-        self.logger.info("Mundo generado con %d elementos", len(elements))
         return elements
 
+    def fingerprint(self, features: tuple = ()) -> str:
+        """
+        Huella de la versión y los parámetros del generador.
+
+        Args:
+            features: Estructuras especiales que se generan tras el mundo base
+
+        Returns:
+            Resumen hexadecimal; cambia si cambia cualquier parámetro
+        """
+        params = {
+            "version": WORLD_GENERATOR_VERSION,
+            "core": self.core.generation_params(),
+            "features": features,
+        }
+        encoded = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+
     def generate_cluster(
         self,
         center_x: float,
@@ -0,0 +1,192 @@
+"""
+World Streamer - Mundo por chunks alrededor del jugador
+=======================================================
+
+Autor: SiK Team
+Fecha: 2025
+Descripción: Divide el mundo en chunks cuadrados que se generan cuando el
+jugador (y con él la cámara) se acerca y se retiran cuando se aleja, así que el
+mundo no tiene tamaño fijo. Cada chunk sale de su propio generador aleatorio,
+derivado de la semilla del mundo y de sus coordenadas: un chunk es siempre el
+mismo, se genere en el orden que se genere. Los elementos quedan a media
+distancia mínima del borde del chunk, de modo que chunks vecinos respetan la
+separación sin consultarse. Los chunks retirados se guardan serializados (el
+formato de ``world_cache``) hasta un límite; pasado el límite se regeneran.
+"""
+
+import logging
+import math
+import random
+import time
+from collections import OrderedDict
+
+from entities.tile import Tile
+
+from .world_cache import build_tiles, pack_world, unpack_world
+from .world_generator import WorldGenerator
+
+ChunkCoord = tuple[int, int]
+
+
+class WorldStreamer:
+    """Chunks del mundo cargados alrededor de un punto."""
+
+    def __init__(
+        self,
+        seed: int,
+        screen_width: int,
+        screen_height: int,
+        chunk_size: int = 1024,
+        view_radius: int = 1,
+        max_stored: int = 64,
+        safe_center: tuple[float, float] | None = None,
+    ):
+        """
+        Inicializa el mundo sin chunks cargados.
+
+        Args:
+            seed: Semilla del mundo (flujo "world" de la partida)
+            screen_width: Ancho de la pantalla
+            screen_height: Alto de la pantalla
+            chunk_size: Lado de cada chunk en píxeles
+            view_radius: Chunks cargados alrededor del chunk del jugador
+            max_stored: Chunks retirados que se guardan serializados
+            safe_center: Centro de la zona sin elementos (aparición del jugador)
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.view_radius = view_radius
+        self.max_stored = max_stored
+        self.logger = logging.getLogger(__name__)
+
+        # Un solo generador; cada chunk le asigna su propio rng
+        self.generator = WorldGenerator(
+            chunk_size, chunk_size, screen_width, screen_height
+        )
+        self.generator.core.safe_zone_center = safe_center
+        self.margin = self.generator.core.min_distance // 2
+
+        self.chunks: dict[ChunkCoord, list[Tile]] = {}
+        self._stored: OrderedDict[ChunkCoord, bytes] = OrderedDict()
+        # Elementos de todos los chunks cargados (lista nueva en cada cambio)
+        self.tiles: list[Tile] = []
+        self.stats = {"generated": 0, "restored": 0, "evicted": 0, "load_ms": 0.0}
+
+    def chunk_of(self, x: float, y: float) -> ChunkCoord:
+        """Chunk (columna, fila) que contiene un punto."""
+        return math.floor(x / self.chunk_size), math.floor(y / self.chunk_size)
+
+    def chunk_rng(self, cx: int, cy: int) -> random.Random:
+        """Generador de un chunk: depende solo de la semilla y las coordenadas."""
+        return random.Random(f"{self.seed}:{cx}:{cy}")
+
+    def generate_chunk(self, cx: int, cy: int) -> list[Tile]:
+        """Genera los elementos de un chunk."""
+        self.generator.core.rng = self.chunk_rng(cx, cy)
+        size = self.chunk_size
+        return self.generator.generate_area(
+            cx * size, cy * size, size, size, self.margin
+        )
+
+    def wanted_chunks(self, x: float, y: float) -> list[ChunkCoord]:
+        """Chunks a ``view_radius`` o menos del de (x, y), del más cercano al más lejano."""
+        cx, cy = self.chunk_of(x, y)
+        radius = self.view_radius
+        coords = [
+            (cx + dx, cy + dy)
+            for dy in range(-radius, radius + 1)
+            for dx in range(-radius, radius + 1)
+        ]
+        coords.sort(key=lambda coord: (coord[0] - cx) ** 2 + (coord[1] - cy) ** 2)
+        return coords
+
+    def update(self, x: float, y: float, max_new: int | None = 1) -> bool:
+        """
+        Carga los chunks que faltan cerca de (x, y) y retira los lejanos.
+
+        Args:
+            x: Posición X del jugador
+            y: Posición Y del jugador
+            max_new: Chunks cargados como máximo en esta llamada (None: todos);
+                con 1, el mundo cuesta como mucho un chunk por frame
+
+        Returns:
+            True si ha cambiado el conjunto de chunks (y con él ``tiles``)
+        """
+        loaded = 0
+        for coord in self.wanted_chunks(x, y):
+            if coord in self.chunks:
+                continue
+            if max_new is not None and loaded >= max_new:
+                break
+            self.chunks[coord] = self._load_chunk(coord)
+            loaded += 1
+        # Se retira después de cargar: lo recién retirado no desplaza del
+        # guardado a los chunks que se van a restaurar
+        evicted = self._evict_far(self.chunk_of(x, y))
+        if not (loaded or evicted):
+            return False
+        self.tiles = [tile for tiles in self.chunks.values() for tile in tiles]
+        return True
+
+    def contains(self, x: float, y: float) -> bool:
+        """True si el punto está en un chunk cargado."""
+        return self.chunk_of(x, y) in self.chunks
+
+    def view_bounds(self, x: float, y: float) -> tuple[int, int, int, int]:
+        """Rectángulo (x, y, ancho, alto) de los chunks alrededor de (x, y)."""
+        cx, cy = self.chunk_of(x, y)
+        size = self.chunk_size
+        side = (2 * self.view_radius + 1) * size
+        return (
+            (cx - self.view_radius) * size,
+            (cy - self.view_radius) * size,
+            side,
+            side,
+        )
+
+    def get_stats(self) -> dict:
+        """Chunks cargados y guardados, elementos y coste de carga."""
+        return {
+            **self.stats,
+            "loaded": len(self.chunks),
+            "stored": len(self._stored),
+            "tiles": len(self.tiles),
+        }
+
+    def _evict_far(self, center: ChunkCoord) -> bool:
+        """Retira los chunks a más de ``view_radius + 1`` del centro."""
+        # Un anillo de margen: ir y venir por un borde no carga y retira en bucle
+        keep = self.view_radius + 1
+        far = [
+            coord
+            for coord in self.chunks
+            if max(abs(coord[0] - center[0]), abs(coord[1] - center[1])) > keep
+        ]
+        for coord in far:
+            self._store(coord, self.chunks.pop(coord))
+        return bool(far)
+
+    def _store(self, coord: ChunkCoord, tiles: list[Tile]):
+        """Guarda un chunk retirado; se descartan los guardados más antiguos."""
+        self._stored[coord] = pack_world(tiles, {"chunk": list(coord)})
+        while len(self._stored) > self.max_stored:
+            self._stored.popitem(last=False)
+        self.stats["evicted"] += 1
+
+    def _load_chunk(self, coord: ChunkCoord) -> list[Tile]:
+        """Restaura un chunk guardado o lo genera."""
+        started = time.perf_counter()
+        data = self._stored.pop(coord, None)
+        if data is not None:
+            tiles = build_tiles(*unpack_world(data))
+            self.stats["restored"] += 1
+        else:
+            tiles = self.generate_chunk(*coord)
+            self.stats["generated"] += 1
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stats["load_ms"] += elapsed
+        self.logger.debug(
+            "Chunk %s cargado: %d elementos en %.1f ms", coord, len(tiles), elapsed
+        )
+        return tiles
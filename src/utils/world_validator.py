@@ -8,7 +8,6 @@ Descripción: Valida posiciones y crea elementos con sprites del mundo.
 """
 
 import logging
-import random
 
 import pygame
 
@@ -65,11 +64,11 @@ class WorldValidator:
         """
         if not self.world_core.available_sprites:
             # Fallback: crear elemento básico
-            tile_type = random.choice(list(TileType))
+            tile_type = self.world_core.rng.choice(list(TileType))
             return Tile(x, y, tile_type)
 
         # Seleccionar sprite aleatorio
-        sprite_filename = random.choice(self.world_core.available_sprites)
+        sprite_filename = self.world_core.rng.choice(self.world_core.available_sprites)
         sprite_path = f"assets/objects/elementos/{sprite_filename}"
 
         try:
@@ -79,29 +78,43 @@ class WorldValidator:
             # Determinar tipo de elemento basado en el nombre del archivo
             tile_type = self.world_core.get_tile_type_from_filename(sprite_filename)
 
-            # Crear elemento
-            element = Tile(x, y, tile_type)
-
             # Escalar sprite a tamaño apropiado (entre 32 y 64 píxeles)
-            target_size = random.randint(32, 64)
-            scaled_sprite = pygame.transform.scale(sprite, (target_size, target_size))
-            element.sprite = scaled_sprite
-            element.width = target_size
-            element.height = target_size
-            element.sprite_name = sprite_filename
-
-            # Configurar colisión según el tipo
+            target_size = self.world_core.rng.randint(32, 64)
+
             # Los elementos se crean con el tipo correcto,
             # la colisión se maneja en el método has_collision()
-
-            return element
+            return self.build_element(
+                x, y, tile_type, sprite, sprite_filename, target_size
+            )
 
         except (FileNotFoundError, AttributeError, ValueError) as e:
             self.logger.warning("No se pudo cargar sprite %s: %s", sprite_filename, e)
             # Fallback: crear elemento básico
-            tile_type = random.choice(list(TileType))
+            tile_type = self.world_core.rng.choice(list(TileType))
             return Tile(x, y, tile_type)
 
+    @staticmethod
+    def build_element(
+        x: float,
+        y: float,
+        tile_type: TileType,
+        sprite: pygame.Surface,
+        sprite_filename: str,
+        size: int,
+    ) -> Tile:
+        """
+        Crea un elemento con un sprite real escalado a ``size`` píxeles.
+
+        Lo usan la generación y la caché de mundos (``WorldCache``), así que un
+        mundo leído de caché es idéntico al generado.
+        """
+        element = Tile(x, y, tile_type)
+        element.sprite = pygame.transform.scale(sprite, (size, size))
+        element.width = size
+        element.height = size
+        element.sprite_name = sprite_filename
+        return element
+
     def validate_world_bounds(self, elements: list[Tile]) -> list[Tile]:
         """Valida que todos los elementos estén dentro de los límites del mundo."""
         valid_elements = []